@@ -6,11 +6,13 @@ Provides RESTful API access to all AHAII assessment components
 
 import asyncio
 import logging
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query
-from pydantic import BaseModel
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
 import sys
 
 # Add backend directory to path for imports
@@ -22,6 +24,7 @@ from app.data_collection.worldbank_collector import WorldBankCollector
 from app.data_collection.policy_indicator_collector import PolicyIndicatorCollector
 from app.data_collection.health_ai_ecosystem_mapper import HealthAIEcosystemMapper
 from app.scoring.enhanced_ahaii_calculator import EnhancedAHAIICalculator
+from app.scoring.scenario_engine import ScenarioConfig, ScenarioEngine
 from app.validation.data_quality_report import DataQualityReporter
 from app.validation.expert_validation_system import ExpertValidationSystem
 from app.analysis.pilot_assessment.ahaii_pilot_report import AHAIIPilotReportGenerator
@@ -82,6 +85,17 @@ class AHAIIAssessmentResponse(BaseModel):
     report_url: Optional[str] = None
 
 
+class ScenarioAnalysisRequest(BaseModel):
+    weights: Optional[Dict[str, Dict[str, float]]] = None
+    bounds: Optional[Dict[str, Dict[str, Tuple[float, float]]]] = None
+    n_weight_samples: int = Field(1000, ge=0, le=ScenarioEngine.MAX_SCENARIOS)
+    weight_concentration: float = 50.0
+    n_bound_variants: int = Field(0, ge=0, le=ScenarioEngine.MAX_BOUND_VARIANTS)
+    bound_jitter: float = 0.10
+    seed: int = 42
+    run_id: Optional[str] = None
+
+
 class DataCollectionStatus(BaseModel):
     world_bank_status: str
     policy_indicators_status: str
@@ -93,6 +107,9 @@ class DataCollectionStatus(BaseModel):
 # Global integration manager instance
 integration_manager = None
 
+# Scenario engine for the most recently requested collection run
+scenario_engine_cache: Dict[str, ScenarioEngine] = {}
+
 
 def get_integration_manager() -> AHAIIIntegrationManager:
     """Get or create AHAII integration manager instance"""
@@ -102,6 +119,25 @@ def get_integration_manager() -> AHAIIIntegrationManager:
     return integration_manager
 
 
+def get_scenario_engine(run_id: Optional[str] = None) -> Optional[ScenarioEngine]:
+    """Get the scenario engine for a collection run, building it on first use"""
+    calculator = get_integration_manager().calculator
+    run_id = run_id or calculator.lake.latest_run_id(
+        calculator.INDICATOR_DATASET, sources=["world_bank"]
+    )
+    if run_id is None:
+        return None
+
+    if run_id not in scenario_engine_cache:
+        data = calculator.load_indicator_data(run_id=run_id)
+        if data.empty:
+            return None
+        scenario_engine_cache.clear()
+        scenario_engine_cache[run_id] = ScenarioEngine.from_data(data, calculator)
+
+    return scenario_engine_cache[run_id]
+
+
 @router.get("/health", summary="Health check for AHAII assessment system")
 async def health_check():
     """Check health and connectivity of AHAII assessment system"""
@@ -401,6 +437,53 @@ async def get_ahaii_scores(
         )
 
 
+@router.post("/scenarios", summary="Run weight and normalization scenarios")
+async def run_scenario_analysis(request: ScenarioAnalysisRequest):
+    """
+    Score alternative pillar weightings and normalization bounds
+
+    - **weights**: Named pillar weightings, e.g. {"equal": {"human_capital": 1, ...}}
+    - **bounds**: Named indicator bound overrides, e.g. {"wide": {"gdp_per_capita_current_usd": [0, 200000]}}
+    - **n_weight_samples**: Random weightings sampled around the framework weights
+    - **n_bound_variants**: Random normalization bound variants
+    - **run_id**: Collection run to score (default: latest)
+
+    Building the engine and scoring are CPU-bound, so both run in the
+    threadpool rather than on the event loop.
+    """
+    try:
+        engine = await run_in_threadpool(get_scenario_engine, request.run_id)
+        if engine is None:
+            raise HTTPException(
+                status_code=404,
+                detail="No indicator data available. Run data collection first.",
+            )
+
+        result = await run_in_threadpool(
+            engine.run,
+            weights=request.weights,
+            bounds=request.bounds,
+            config=ScenarioConfig(
+                n_weight_samples=request.n_weight_samples,
+                weight_concentration=request.weight_concentration,
+                n_bound_variants=request.n_bound_variants,
+                bound_jitter=request.bound_jitter,
+                seed=request.seed,
+            ),
+        )
+        return asdict(result)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Scenario analysis failed: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Scenario analysis failed: {str(e)}"
+        )
+
+
 @router.post("/validate", summary="Run expert validation")
 async def run_expert_validation(background_tasks: BackgroundTasks):
     """Run expert validation for uncertain indicators"""
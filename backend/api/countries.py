@@ -4,8 +4,8 @@ Generates country profiles and scores from ETL pipeline data
 """
 
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date, datetime, time, timedelta
 import asyncio
 from dataclasses import dataclass, asdict
 from decimal import Decimal
@@ -630,6 +630,174 @@ async def refresh_country_score(
         raise HTTPException(status_code=500, detail=f"Error refreshing score: {str(e)}")
 
 
+def _end_of_day(day: date) -> datetime:
+    return datetime.combine(day, time.max)
+
+
+async def _resolve_history_countries(
+    countries: Optional[str],
+) -> Tuple[Dict[str, Dict], Optional[List[str]]]:
+    """Map comma-separated country IDs or ISO codes to country IDs
+
+    Returns the id -> country lookup used to label history rows, and the
+    requested IDs (None for all countries).
+    """
+    response = supabase.table("countries").select("id, name, iso_code_alpha3").execute()
+    lookup = {country["id"]: country for country in response.data or []}
+    if not countries:
+        return lookup, None
+
+    requested = {code.strip().upper() for code in countries.split(",") if code}
+    country_ids = [
+        country_id
+        for country_id, country in lookup.items()
+        if country_id.upper() in requested
+        or (country.get("iso_code_alpha3") or "").upper() in requested
+    ]
+    if not country_ids:
+        raise HTTPException(status_code=404, detail="No matching countries found")
+    return lookup, country_ids
+
+
+def _label_history_rows(rows: List[Dict], lookup: Dict[str, Dict]) -> List[Dict]:
+    """Attach country name and ISO code to score history rows"""
+    return [
+        {
+            "country_name": lookup.get(row["country_id"], {}).get("name"),
+            "iso_code_alpha3": lookup.get(row["country_id"], {}).get("iso_code_alpha3"),
+            **row,
+        }
+        for row in rows
+    ]
+
+
+@router.get("/score-history/as-of")
+async def get_scores_as_of(
+    as_of: date = Query(..., description="Return scores as they stood on this date"),
+    countries: Optional[str] = Query(
+        None, description="Comma-separated country IDs or ISO3 codes"
+    ),
+):
+    """Get AHAII scores as of a given date from the score history"""
+    try:
+        lookup, country_ids = await _resolve_history_countries(countries)
+        rows = await db_service.get_scores_as_of(_end_of_day(as_of), country_ids)
+        rows.sort(key=lambda row: float(row["total_score"]), reverse=True)
+
+        return {
+            "as_of": as_of.isoformat(),
+            "scores": _label_history_rows(rows, lookup),
+            "total_countries": len(rows),
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Error fetching historical scores: {str(e)}"
+        )
+
+
+@router.get("/score-history/deltas")
+async def get_score_deltas(
+    start: date = Query(..., description="Baseline date"),
+    end: Optional[date] = Query(None, description="Comparison date (default: today)"),
+    countries: Optional[str] = Query(
+        None, description="Comma-separated country IDs or ISO3 codes"
+    ),
+):
+    """Get the change in AHAII scores between two dates"""
+    try:
+        end = end or date.today()
+        if end < start:
+            raise HTTPException(status_code=400, detail="end must not precede start")
+
+        lookup, country_ids = await _resolve_history_countries(countries)
+        deltas = await db_service.get_score_deltas(
+            _end_of_day(start), _end_of_day(end), country_ids
+        )
+        deltas.sort(
+            key=lambda row: (
+                row["total_score_change"] is not None,
+                row["total_score_change"] or 0,
+            ),
+            reverse=True,
+        )
+
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "deltas": _label_history_rows(deltas, lookup),
+            "total_countries": len(deltas),
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Error fetching score deltas: {str(e)}"
+        )
+
+
+@router.get("/score-history/series")
+async def get_score_history_series(
+    interval: str = Query("month", pattern="^(week|month)$"),
+    start: Optional[date] = Query(None, description="First date (default: 1 year ago)"),
+    end: Optional[date] = Query(None, description="Last date (default: today)"),
+    countries: Optional[str] = Query(
+        None, description="Comma-separated country IDs or ISO3 codes"
+    ),
+):
+    """Get AHAII score history downsampled to weekly or monthly points"""
+    try:
+        end = end or date.today()
+        start = start or end - timedelta(days=365)
+
+        lookup, country_ids = await _resolve_history_countries(countries)
+        rows = await db_service.get_score_history_downsampled(
+            interval,
+            datetime.combine(start, time.min),
+            _end_of_day(end),
+            country_ids,
+        )
+
+        series: Dict[str, Dict[str, Any]] = {}
+        for row in _label_history_rows(rows, lookup):
+            entry = series.setdefault(
+                row["country_id"],
+                {
+                    "country_id": row["country_id"],
+                    "country_name": row["country_name"],
+                    "iso_code_alpha3": row["iso_code_alpha3"],
+                    "points": [],
+                },
+            )
+            entry["points"].append(
+                {
+                    key: value
+                    for key, value in row.items()
+                    if key not in ("country_id", "country_name", "iso_code_alpha3")
+                }
+            )
+
+        for entry in series.values():
+            entry["points"].sort(key=lambda point: point["bucket_start"])
+
+        return {
+            "interval": interval,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "series": list(series.values()),
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Error fetching score history: {str(e)}"
+        )
+
+
 @router.get("/statistics")
 async def get_country_statistics(db_session=Depends(get_database_session)):
     """Get overall statistics about country coverage and data quality"""
@@ -5,9 +5,12 @@ ranking justification, methodology transparency documentation,
 and identification of data gaps requiring ongoing monitoring
 """
 
+import hashlib
 import json
 import logging
-from datetime import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
@@ -15,11 +18,18 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+import plotly
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import plotly.offline as pyo
 
+from app.analysis.pilot_assessment.report_pipeline import (
+    ReportStage,
+    StagedReportPipeline,
+)
+from app.data_lake import DataLake
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -111,12 +121,59 @@ class AHAIIPilotReportGenerator:
         },
     }
 
-    def __init__(self, output_dir: str = "analysis/pilot_assessment"):
+    # Report figures: name -> (builder method, HTML filename, assessment fields used)
+    VISUALIZATIONS = {
+        "scores_comparison": (
+            "_create_score_comparison_chart",
+            "ahaii_scores_comparison.html",
+            [
+                "country_name",
+                "final_score",
+                "confidence_interval",
+                "tier_classification",
+            ],
+        ),
+        "pillar_radar": (
+            "_create_pillar_radar_chart",
+            "pillar_performance_radar.html",
+            ["country_name", "pillar_breakdown"],
+        ),
+        "regional_ranking": (
+            "_create_ranking_visualization",
+            "regional_ranking.html",
+            ["country_name", "final_score", "regional_rank", "tier_classification"],
+        ),
+        "data_quality": (
+            "_create_data_quality_heatmap",
+            "data_quality_assessment.html",
+            [
+                "country_name",
+                "final_score",
+                "confidence_interval",
+                "data_quality_grade",
+                "expert_validation_status",
+            ],
+        ),
+    }
+
+    # Bump when chart code changes so cached figures are re-rendered
+    RENDER_VERSION = "1"
+    RENDER_MANIFEST = "render_manifest.json"
+
+    # Data lake dataset for per-country summary rows of every report
+    SUMMARY_DATASET = "pilot_summary"
+
+    def __init__(
+        self,
+        output_dir: str = "analysis/pilot_assessment",
+        lake_dir: Optional[str] = None,
+    ):
         """
         Initialize AHAII pilot report generator
 
         Args:
             output_dir: Directory for saving reports and visualizations
+            lake_dir: Data lake directory (default: "lake" under output_dir)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -129,6 +186,10 @@ class AHAIIPilotReportGenerator:
         for directory in [self.reports_dir, self.visualizations_dir, self.data_dir]:
             directory.mkdir(exist_ok=True)
 
+        # Cached intermediate outputs of the report stages
+        self.pipeline = StagedReportPipeline(self.output_dir / "stages")
+        self.lake = DataLake(lake_dir or self.output_dir / "lake")
+
     def compile_country_assessments(
         self,
         enhanced_results: List,
@@ -546,49 +607,120 @@ class AHAIIPilotReportGenerator:
         self,
         country_assessments: List[CountryAssessment],
         regional_analysis: Dict[str, Any],
+        max_workers: Optional[int] = None,
     ) -> Dict[str, str]:
         """
         Create comprehensive visualizations for the report
 
+        Figures are rendered in a process pool and written as HTML that loads
+        one shared plotly.js file from the visualizations directory. A figure
+        is only re-rendered when the hash of its input data changed since the
+        last run (or its HTML file is missing).
+
         Args:
             country_assessments: List of country assessments
             regional_analysis: Regional analysis results
+            max_workers: Worker processes for rendering (1 renders in-process)
 
         Returns:
             Dictionary mapping visualization names to file paths
         """
         logger.info("Creating comprehensive visualizations for AHAII pilot report")
 
-        visualization_paths = {}
-
-        # 1. Overall AHAII Scores with Confidence Intervals
-        fig_scores = self._create_score_comparison_chart(country_assessments)
-        scores_path = self.visualizations_dir / "ahaii_scores_comparison.html"
-        fig_scores.write_html(str(scores_path))
-        visualization_paths["scores_comparison"] = str(scores_path)
-
-        # 2. Pillar Performance Radar Chart
-        fig_radar = self._create_pillar_radar_chart(country_assessments)
-        radar_path = self.visualizations_dir / "pillar_performance_radar.html"
-        fig_radar.write_html(str(radar_path))
-        visualization_paths["pillar_radar"] = str(radar_path)
+        plotlyjs_filename = self._write_shared_plotlyjs()
+        manifest_path = self.visualizations_dir / self.RENDER_MANIFEST
+        manifest = (
+            json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+        )
 
-        # 3. Regional Ranking and Tier Distribution
-        fig_ranking = self._create_ranking_visualization(country_assessments)
-        ranking_path = self.visualizations_dir / "regional_ranking.html"
-        fig_ranking.write_html(str(ranking_path))
-        visualization_paths["regional_ranking"] = str(ranking_path)
+        assessment_records = [asdict(a) for a in country_assessments]
 
-        # 4. Data Quality Heatmap
-        fig_quality = self._create_data_quality_heatmap(country_assessments)
-        quality_path = self.visualizations_dir / "data_quality_assessment.html"
-        fig_quality.write_html(str(quality_path))
-        visualization_paths["data_quality"] = str(quality_path)
+        visualization_paths = {}
+        pending = {}
+        for name, (builder, filename, fields) in self.VISUALIZATIONS.items():
+            output_path = self.visualizations_dir / filename
+            input_data = json.dumps(
+                [
+                    {field: record[field] for field in fields}
+                    for record in assessment_records
+                ],
+                sort_keys=True,
+                default=str,
+            )
+            input_hash = hashlib.sha256(
+                "|".join(
+                    [builder, plotlyjs_filename, self.RENDER_VERSION, input_data]
+                ).encode()
+            ).hexdigest()
+
+            if manifest.get(name) == input_hash and output_path.exists():
+                visualization_paths[name] = str(output_path)
+            else:
+                pending[name] = (builder, output_path, input_hash)
+
+        if pending:
+            logger.info(
+                f"Rendering {len(pending)} visualizations "
+                f"({len(visualization_paths)} unchanged)"
+            )
+            tasks = [
+                (
+                    builder,
+                    country_assessments,
+                    str(output_path),
+                    plotlyjs_filename,
+                )
+                for builder, output_path, _ in pending.values()
+            ]
+            workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+            if workers <= 1:
+                outcomes = []
+                for task in tasks:
+                    try:
+                        outcomes.append(_render_visualization(*task))
+                    except Exception as e:
+                        outcomes.append(e)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(_render_visualization, *task) for task in tasks
+                    ]
+                    outcomes = []
+                    for future in futures:
+                        try:
+                            outcomes.append(future.result())
+                        except Exception as e:
+                            outcomes.append(e)
+
+            for (name, (_, output_path, input_hash)), outcome in zip(
+                pending.items(), outcomes
+            ):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error rendering visualization {name}: {outcome}")
+                    manifest.pop(name, None)
+                    continue
+                manifest[name] = input_hash
+                visualization_paths[name] = str(output_path)
+
+            manifest_path.write_text(json.dumps(manifest, indent=2))
+
+        return {
+            name: visualization_paths[name]
+            for name in self.VISUALIZATIONS
+            if name in visualization_paths
+        }
 
-        return visualization_paths
+    def _write_shared_plotlyjs(self) -> str:
+        """Write the plotly.js bundle once per plotly version; returns its filename"""
+        filename = f"plotly-{plotly.__version__}.min.js"
+        bundle_path = self.visualizations_dir / filename
+        if not bundle_path.exists():
+            bundle_path.write_text(pyo.get_plotlyjs(), encoding="utf-8")
+        return filename
 
+    @staticmethod
     def _create_score_comparison_chart(
-        self, assessments: List[CountryAssessment]
+        assessments: List[CountryAssessment],
     ) -> go.Figure:
         """Create AHAII scores comparison with confidence intervals"""
         sorted_assessments = sorted(
@@ -649,9 +781,8 @@ class AHAIIPilotReportGenerator:
 
         return fig
 
-    def _create_pillar_radar_chart(
-        self, assessments: List[CountryAssessment]
-    ) -> go.Figure:
+    @staticmethod
+    def _create_pillar_radar_chart(assessments: List[CountryAssessment]) -> go.Figure:
         """Create pillar performance radar chart"""
         pillars = [
             "Human Capital",
@@ -689,8 +820,9 @@ class AHAIIPilotReportGenerator:
 
         return fig
 
+    @staticmethod
     def _create_ranking_visualization(
-        self, assessments: List[CountryAssessment]
+        assessments: List[CountryAssessment],
     ) -> go.Figure:
         """Create regional ranking and tier distribution visualization"""
         sorted_assessments = sorted(
@@ -734,9 +866,8 @@ class AHAIIPilotReportGenerator:
 
         return fig
 
-    def _create_data_quality_heatmap(
-        self, assessments: List[CountryAssessment]
-    ) -> go.Figure:
+    @staticmethod
+    def _create_data_quality_heatmap(assessments: List[CountryAssessment]) -> go.Figure:
         """Create data quality assessment heatmap"""
         countries = [a.country_name for a in assessments]
         quality_dimensions = [
@@ -786,38 +917,117 @@ class AHAIIPilotReportGenerator:
         enhanced_results: List,
         validation_results: List,
         data_quality_metrics: List,
+        force_recompute: bool = False,
+        run_id: Optional[str] = None,
     ) -> str:
         """
         Generate comprehensive final AHAII pilot assessment report
 
+        The report is built by a staged pipeline (see _build_report_stages):
+        each analysis stage's output is cached on disk against a hash of its
+        inputs and of its own and its helpers' code, so a rerun only
+        recomputes the stages affected by a change. Writing the report
+        documents always runs.
+
         Args:
             enhanced_results: Enhanced AHAII calculation results
             validation_results: Expert validation results
             data_quality_metrics: Data quality assessment results
+            force_recompute: Ignore cached stage outputs
+            run_id: Pipeline run ID recorded with the summary in the data lake
 
         Returns:
             Path to generated final report
         """
         logger.info("Generating comprehensive final AHAII pilot assessment report")
 
-        # Compile country assessments
-        country_assessments = self.compile_country_assessments(
-            enhanced_results, validation_results, data_quality_metrics
+        outputs = self.pipeline.run(
+            self._build_report_stages(),
+            {
+                "enhanced_results": enhanced_results,
+                "validation_results": validation_results,
+                "data_quality_metrics": data_quality_metrics,
+                "run_id": run_id,
+            },
+            force=force_recompute,
         )
 
-        # Generate regional analysis
-        regional_analysis = self.generate_regional_analysis(country_assessments)
+        return outputs["report"]
 
-        # Document methodology
-        methodology_documentation = self.document_methodology(enhanced_results)
+    def _build_report_stages(self) -> List[ReportStage]:
+        """Declare the report stages and their inputs, in dependency order
 
-        # Create visualizations
-        visualization_paths = self.create_visualizations(
-            country_assessments, regional_analysis
-        )
+        ``deps`` lists the helper methods each cached stage calls, so their
+        code is part of the stage's cache key.
+        """
+        return [
+            ReportStage(
+                "country_assessments",
+                self.compile_country_assessments,
+                ["enhanced_results", "validation_results", "data_quality_metrics"],
+                deps=[
+                    self._get_validation_summary,
+                    self._get_data_quality_grade,
+                    self._pillar_to_strength_description,
+                    self._pillar_to_gap_description,
+                    self._create_improvement_roadmap,
+                ],
+            ),
+            ReportStage(
+                "regional_analysis",
+                self.generate_regional_analysis,
+                ["country_assessments"],
+            ),
+            ReportStage(
+                "methodology_documentation",
+                self.document_methodology,
+                ["enhanced_results"],
+            ),
+            # Keeps its own per-figure render manifest; always checked so a
+            # deleted HTML file is re-rendered
+            ReportStage(
+                "visualizations",
+                self.create_visualizations,
+                ["country_assessments", "regional_analysis"],
+                cache=False,
+            ),
+            ReportStage(
+                "data_quality_assessment",
+                self._compile_data_quality_assessment,
+                ["data_quality_metrics", "country_assessments"],
+                deps=[
+                    self._calculate_overall_data_quality,
+                    self._identify_critical_data_gaps,
+                ],
+            ),
+            ReportStage(
+                "expert_validation_summary",
+                self._compile_expert_validation_summary,
+                ["validation_results", "country_assessments"],
+            ),
+            ReportStage(
+                "report",
+                self._write_final_report,
+                [
+                    "country_assessments",
+                    "regional_analysis",
+                    "methodology_documentation",
+                    "data_quality_assessment",
+                    "expert_validation_summary",
+                    "visualizations",
+                    "run_id",
+                ],
+                cache=False,
+            ),
+        ]
 
-        # Compile data quality assessment
-        data_quality_assessment = {
+    def _compile_data_quality_assessment(
+        self,
+        data_quality_metrics: List,
+        country_assessments: List[CountryAssessment],
+    ) -> Dict[str, Any]:
+        """Compile data quality assessment section"""
+        return {
             "overall_grade": self._calculate_overall_data_quality(data_quality_metrics),
             "country_grades": {
                 a.country_name: a.data_quality_grade for a in country_assessments
@@ -831,8 +1041,13 @@ class AHAIIPilotReportGenerator:
             ],
         }
 
-        # Compile expert validation summary
-        expert_validation_summary = {
+    def _compile_expert_validation_summary(
+        self,
+        validation_results: List,
+        country_assessments: List[CountryAssessment],
+    ) -> Dict[str, Any]:
+        """Compile expert validation summary section"""
+        return {
             "validation_coverage": len(validation_results),
             "consensus_rate": (
                 len(
@@ -857,6 +1072,17 @@ class AHAIIPilotReportGenerator:
             ],
         }
 
+    def _write_final_report(
+        self,
+        country_assessments: List[CountryAssessment],
+        regional_analysis: Dict[str, Any],
+        methodology_documentation: Dict[str, Any],
+        data_quality_assessment: Dict[str, Any],
+        expert_validation_summary: Dict[str, Any],
+        visualization_paths: Dict[str, str],
+        run_id: Optional[str] = None,
+    ) -> str:
+        """Assemble findings and recommendations and write the report files"""
         # Generate key findings
         key_findings = [
             f"Regional average AHAII score: {regional_analysis['summary_statistics']['mean_score']:.1f}/100",
@@ -957,8 +1183,12 @@ class AHAIIPilotReportGenerator:
             )
 
         summary_df = pd.DataFrame(summary_data)
-        summary_path = self.data_dir / f"ahaii_pilot_summary_{timestamp}.csv"
-        summary_df.to_csv(summary_path, index=False)
+        summary_path = self.lake.append(
+            self.SUMMARY_DATASET,
+            summary_df,
+            source="pilot_report",
+            run_id=run_id or timestamp,
+        )
 
         # Generate executive summary
         executive_summary_path = self._generate_executive_summary(
@@ -973,6 +1203,32 @@ class AHAIIPilotReportGenerator:
 
         return str(report_path)
 
+    def load_summary_history(
+        self,
+        columns: Optional[List[str]] = None,
+        countries: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+    ) -> pd.DataFrame:
+        """
+        Load the per-country summaries of earlier reports from the data lake
+
+        Args:
+            columns: Summary columns to load (default: all, with run_id and
+                run_date)
+            countries: Restrict to these country names
+            start_date: Earliest report date to include
+
+        Returns:
+            DataFrame with one row per country per report run
+        """
+        return self.lake.read(
+            self.SUMMARY_DATASET,
+            columns=columns,
+            sources=["pilot_report"],
+            start_date=start_date,
+            filters={"Country": countries} if countries else None,
+        )
+
     def _calculate_overall_data_quality(self, data_quality_metrics: List) -> str:
         """Calculate overall data quality grade"""
         if not data_quality_metrics:
@@ -1064,6 +1320,22 @@ class AHAIIPilotReportGenerator:
         return str(summary_path)
 
 
+def _render_visualization(
+    builder: str,
+    country_assessments: List[CountryAssessment],
+    output_path: str,
+    plotlyjs_filename: str,
+) -> str:
+    """Build one report figure and write it as HTML; runs in a worker process
+
+    Figure builders are static, so no generator (and none of its output,
+    stage or lake directories) is created in the worker.
+    """
+    fig = getattr(AHAIIPilotReportGenerator, builder)(country_assessments)
+    fig.write_html(output_path, include_plotlyjs=plotlyjs_filename)
+    return output_path
+
+
 def main():
     """Main function for generating final AHAII pilot assessment report"""
     # This would typically import results from previous phases
@@ -0,0 +1,216 @@
+"""
+Staged Report Pipeline for AHAII Pilot Assessment
+Runs the report chain as named stages with declared inputs, storing each
+stage's output on disk keyed by a hash of its inputs so reruns only
+recompute the stages whose inputs (or code) changed
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import math
+import pickle
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReportStage:
+    """A single step of the report pipeline"""
+
+    name: str
+    func: Callable[..., Any]
+    inputs: List[str]  # Pipeline inputs or earlier stage names, in call order
+    version: str = "1"  # Bump when logic outside func and deps changes
+    cache: bool = True  # False for stages with side effects that must always run
+    deps: List[Callable[..., Any]] = field(default_factory=list)  # Helpers func calls
+
+
+class StagedReportPipeline:
+    """
+    Content-addressed artifact cache for report stages
+
+    A stage's cache key hashes its name, version, the source of its function
+    and of the helpers it declares in ``deps``, and the content hashes of its
+    inputs, so editing one stage (or the report writer) leaves the others
+    cached. Outputs are pickled under ``<artifact_dir>/<stage>/`` and the
+    content hash of each output is recorded in the manifest, so a stage that
+    is recomputed but yields identical output leaves every downstream stage
+    cached.
+    """
+
+    MANIFEST = "stage_manifest.json"
+
+    def __init__(self, artifact_dir: Path):
+        """
+        Initialize staged pipeline
+
+        Args:
+            artifact_dir: Directory for stage artifacts and the manifest
+        """
+        self.artifact_dir = Path(artifact_dir)
+        self.artifact_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.artifact_dir / self.MANIFEST
+
+        # Stage name -> "cached" / "computed" for the most recent run
+        self.last_run: Dict[str, str] = {}
+
+    def run(
+        self,
+        stages: List[ReportStage],
+        inputs: Dict[str, Any],
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Execute stages in order, reusing stored outputs where possible
+
+        Args:
+            stages: Stages in dependency order
+            inputs: Named pipeline inputs available to every stage
+            force: Recompute every stage regardless of the cache
+
+        Returns:
+            Dictionary of pipeline inputs and stage outputs by name
+        """
+        manifest = self._load_manifest()
+        values = dict(inputs)
+        hashes = {name: content_hash(value) for name, value in inputs.items()}
+        self.last_run = {}
+
+        for stage in stages:
+            missing = [name for name in stage.inputs if name not in values]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' is missing inputs: {missing}")
+
+            key = self._stage_key(stage, [hashes[name] for name in stage.inputs])
+            entry = manifest.get(stage.name, {})
+            artifact_path = self.artifact_dir / stage.name / f"{key}.pkl"
+
+            if (
+                stage.cache
+                and not force
+                and entry.get("key") == key
+                and artifact_path.exists()
+            ):
+                try:
+                    with open(artifact_path, "rb") as f:
+                        values[stage.name] = pickle.load(f)
+                    hashes[stage.name] = entry["output_hash"]
+                    self.last_run[stage.name] = "cached"
+                    continue
+                except Exception as e:
+                    logger.warning(
+                        f"Discarding unreadable artifact {artifact_path}: {e}"
+                    )
+
+            output = stage.func(*(values[name] for name in stage.inputs))
+            values[stage.name] = output
+            hashes[stage.name] = content_hash(output)
+            self.last_run[stage.name] = "computed"
+
+            if stage.cache:
+                self._store_artifact(artifact_path, output)
+                manifest[stage.name] = {
+                    "key": key,
+                    "output_hash": hashes[stage.name],
+                    "updated_at": datetime.now().isoformat(),
+                }
+
+        self.manifest_path.write_text(json.dumps(manifest, indent=2))
+
+        computed = [
+            name for name, status in self.last_run.items() if status == "computed"
+        ]
+        logger.info(
+            f"Report pipeline: {len(stages) - len(computed)} stages cached, "
+            f"recomputed {computed}"
+        )
+
+        return values
+
+    def _stage_key(self, stage: ReportStage, input_hashes: List[str]) -> str:
+        """Hash stage identity, code and input hashes into a cache key"""
+        sources = [_code_source(func) for func in [stage.func, *stage.deps]]
+        payload = "|".join([stage.name, stage.version, *sources, *input_hashes])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _store_artifact(self, artifact_path: Path, output: Any):
+        """Write a stage output, replacing earlier artifacts for that stage"""
+        artifact_path.parent.mkdir(exist_ok=True)
+        for stale in artifact_path.parent.glob("*.pkl"):
+            stale.unlink()
+
+        tmp_path = artifact_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(artifact_path)
+
+    def _load_manifest(self) -> Dict[str, Dict[str, str]]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring corrupt stage manifest {self.manifest_path}")
+            return {}
+
+
+def _code_source(func: Callable[..., Any]) -> str:
+    """Source of ``func``, falling back to its qualified name"""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return getattr(func, "__qualname__", repr(func))
+
+
+def content_hash(value: Any) -> str:
+    """Stable sha256 of a value's content (dataclasses, enums, pandas, numpy)"""
+    canonical = json.dumps(_canonicalize(value), sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _canonicalize(value: Any) -> Any:
+    """Reduce a value to JSON-compatible primitives with a deterministic layout"""
+    if isinstance(value, Enum):
+        return _canonicalize(value.value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__type__": type(value).__qualname__,
+            **{f.name: _canonicalize(getattr(value, f.name)) for f in fields(value)},
+        }
+    if isinstance(value, dict):
+        return {str(k): _canonicalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            (_canonicalize(v) for v in value), key=lambda v: json.dumps(v, default=str)
+        )
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return {
+            "__type__": type(value).__name__,
+            "columns": [str(c) for c in getattr(value, "columns", [value.name])],
+            "rows": pd.util.hash_pandas_object(value, index=True).to_numpy().tolist(),
+        }
+    if isinstance(value, np.ndarray):
+        return _canonicalize(value.tolist())
+    if isinstance(value, np.generic):
+        return _canonicalize(value.item())
+    if isinstance(value, float) and not math.isfinite(value):
+        return repr(value)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, "__dict__"):
+        return {"__type__": type(value).__qualname__, **_canonicalize(vars(value))}
+    return repr(value)
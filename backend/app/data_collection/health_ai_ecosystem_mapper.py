@@ -7,21 +7,24 @@ Maps health AI organizations and initiatives including:
 - Builds confidence scoring for ecosystem maturity indicators
 """
 
+import asyncio
 import json
 import logging
 import re
-import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
+from urllib.parse import urlparse
+import aiohttp
+import lxml.html
 import pandas as pd
 import numpy as np
-import requests
-from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+from app.data_lake import DataLake
+from app.local_cache import LocalCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -73,6 +76,22 @@ class HealthAIEcosystemMapper:
     Health AI ecosystem mapping system for economic/market pillar assessment
     """
 
+    # Natural key for cached organizations (repeat mappings update in place)
+    ORGANIZATION_KEY = ["country_code", "name", "organization_type"]
+
+    # University website verification
+    VERIFICATION_TTL = timedelta(days=7)  # Reuse cached results within this window
+    VERIFICATION_MAX_CONCURRENT = 8
+    VERIFICATION_HOST_DELAY = 1.0  # Seconds between requests to the same host
+    VERIFICATION_TIMEOUT = 10
+    VERIFICATION_RETRIES = 2
+    PROGRAM_KEYWORDS = [
+        "health informatics",
+        "biomedical",
+        "medical informatics",
+        "health technology",
+    ]
+
     # University search patterns for health AI programs
     UNIVERSITY_PATTERNS = {
         "health_ai_keywords": [
@@ -282,30 +301,28 @@ class HealthAIEcosystemMapper:
         ],
     }
 
-    def __init__(self, cache_dir: str = "data/raw"):
+    # Data lake datasets for mapped organizations and per-country metrics
+    LAKE_ORGANIZATIONS_DATASET = "ecosystem_organizations"
+    LAKE_METRICS_DATASET = "ecosystem_metrics"
+
+    def __init__(self, cache_dir: str = "data/raw", lake_dir: Optional[str] = None):
         """
         Initialize health AI ecosystem mapper
 
         Args:
             cache_dir: Directory for caching ecosystem data
+            lake_dir: Data lake directory (default: "lake" next to cache_dir)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.lake = DataLake(lake_dir or self.cache_dir.parent / "lake")
 
         # Create ecosystem mapping subdirectory
         self.ecosystem_cache_dir = self.cache_dir / "ecosystem_mapping"
         self.ecosystem_cache_dir.mkdir(exist_ok=True)
 
-        # Setup requests session
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Earliest time (monotonic) the next verification request may hit a host
+        self._host_next_request: Dict[str, float] = {}
 
         # Initialize ecosystem database
         self._init_ecosystem_db()
@@ -314,48 +331,65 @@ class HealthAIEcosystemMapper:
         """Initialize ecosystem mapping database"""
         cache_db_path = self.ecosystem_cache_dir / "ecosystem_cache.db"
 
-        with sqlite3.connect(cache_db_path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS health_ai_organizations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT,
-                    country_code TEXT,
-                    country_name TEXT,
-                    organization_type TEXT,
-                    focus_areas TEXT,
-                    founded_year INTEGER,
-                    description TEXT,
-                    website_url TEXT,
-                    funding_stage TEXT,
-                    evidence_source TEXT,
-                    confidence_score REAL,
-                    extraction_date TEXT
-                )
+        self.cache = LocalCache(cache_db_path)
+
+        self.cache.create_table(
             """
+            CREATE TABLE IF NOT EXISTS health_ai_organizations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                country_code TEXT,
+                country_name TEXT,
+                organization_type TEXT,
+                focus_areas TEXT,
+                founded_year INTEGER,
+                description TEXT,
+                website_url TEXT,
+                funding_stage TEXT,
+                evidence_source TEXT,
+                confidence_score REAL,
+                extraction_date TEXT
             )
+        """,
+            unique_indexes=[("health_ai_organizations", self.ORGANIZATION_KEY)],
+            indexes=[("health_ai_organizations", ["organization_type"])],
+        )
 
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS ecosystem_metrics (
-                    country_code TEXT PRIMARY KEY,
-                    country_name TEXT,
-                    total_organizations INTEGER,
-                    universities_with_programs INTEGER,
-                    active_startups INTEGER,
-                    research_institutes INTEGER,
-                    hospital_ai_programs INTEGER,
-                    government_initiatives INTEGER,
-                    estimated_ecosystem_maturity REAL,
-                    funding_activity_score REAL,
-                    academic_activity_score REAL,
-                    clinical_deployment_score REAL,
-                    overall_ecosystem_score REAL,
-                    confidence_score REAL,
-                    last_updated TEXT
-                )
+        self.cache.create_table(
             """
+            CREATE TABLE IF NOT EXISTS ecosystem_metrics (
+                country_code TEXT PRIMARY KEY,
+                country_name TEXT,
+                total_organizations INTEGER,
+                universities_with_programs INTEGER,
+                active_startups INTEGER,
+                research_institutes INTEGER,
+                hospital_ai_programs INTEGER,
+                government_initiatives INTEGER,
+                estimated_ecosystem_maturity REAL,
+                funding_activity_score REAL,
+                academic_activity_score REAL,
+                clinical_deployment_score REAL,
+                overall_ecosystem_score REAL,
+                confidence_score REAL,
+                last_updated TEXT
             )
+        """
+        )
+
+        self.cache.create_table(
+            """
+            CREATE TABLE IF NOT EXISTS university_verifications (
+                url TEXT PRIMARY KEY,
+                verified INTEGER,
+                etag TEXT,
+                last_modified TEXT,
+                last_status INTEGER,
+                checked_at TEXT
+            )
+        """,
+            indexes=[("university_verifications", ["checked_at"])],
+        )
 
         self.cache_db_path = cache_db_path
 
@@ -387,6 +421,13 @@ class HealthAIEcosystemMapper:
         }
         country_name = country_names.get(country_code, country_code)
 
+        # Verify all university websites concurrently (cached results reused)
+        verifications = self._run_async(
+            self.verify_university_programs(
+                [f"https://{university['url']}" for university in universities]
+            )
+        )
+
         for university in universities:
             try:
                 # Check university website for health AI programs
@@ -410,15 +451,11 @@ class HealthAIEcosystemMapper:
 
                 organizations.append(org)
 
-                # Try to verify programs exist (web scraping)
-                if self._verify_university_program(
-                    university["url"], university["programs"]
-                ):
+                # Programs confirmed on the university website
+                if verifications.get(org.website_url):
                     org.confidence_score = 0.9
                     org.evidence_source = "website_verification"
 
-                time.sleep(1)  # Be respectful to university websites
-
             except Exception as e:
                 logger.warning(f"Error processing {university['name']}: {e}")
                 continue
@@ -429,30 +466,177 @@ class HealthAIEcosystemMapper:
         self, university_url: str, programs: List[str]
     ) -> bool:
         """Verify university programs exist through web scraping"""
-        try:
-            url = f"https://{university_url}"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+        url = f"https://{university_url}"
+        return self._run_async(self.verify_university_programs([url])).get(url, False)
+
+    async def verify_university_programs(
+        self, urls: List[str], force: bool = False
+    ) -> Dict[str, bool]:
+        """
+        Verify university websites mention health AI programs
 
-            soup = BeautifulSoup(response.content, "html.parser")
-            page_text = soup.get_text().lower()
+        Results younger than VERIFICATION_TTL are served from the ecosystem
+        cache. Stale entries are revalidated with a conditional GET, so an
+        unchanged page returns 304 and is not downloaded again. Fetches run
+        concurrently, capped globally and spaced per host.
 
-            # Look for program-related keywords
-            program_keywords = [
-                "health informatics",
-                "biomedical",
-                "medical informatics",
-                "health technology",
-            ]
+        Args:
+            urls: Website URLs to verify
+            force: Revalidate even if the cached result is still fresh
 
-            for keyword in program_keywords:
-                if keyword in page_text:
-                    return True
+        Returns:
+            Mapping of URL to whether program keywords were found
+        """
+        urls = list(dict.fromkeys(urls))
+        cached = self._get_cached_verifications(urls)
+        fresh_after = (datetime.now() - self.VERIFICATION_TTL).isoformat()
+
+        results = {}
+        to_fetch = []
+        for url in urls:
+            entry = cached.get(url)
+            if entry and not force and entry["checked_at"] >= fresh_after:
+                results[url] = entry["verified"]
+            else:
+                to_fetch.append(url)
 
-            return False
+        if not to_fetch:
+            return results
+
+        logger.info(
+            f"Verifying {len(to_fetch)} university websites ({len(results)} cached)"
+        )
+        semaphore = asyncio.Semaphore(self.VERIFICATION_MAX_CONCURRENT)
+        host_locks: Dict[str, asyncio.Lock] = {}
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.VERIFICATION_TIMEOUT),
+            headers={"User-Agent": "AHAII Ecosystem Mapper/1.0 (Research Bot)"},
+        ) as session:
+            fetched = await asyncio.gather(
+                *[
+                    self._fetch_verification(
+                        session, semaphore, host_locks, url, cached.get(url)
+                    )
+                    for url in to_fetch
+                ]
+            )
+
+        checked_at = datetime.now().isoformat()
+        rows = []
+        for url, (verified, status, etag, last_modified) in zip(to_fetch, fetched):
+            results[url] = verified
+            if status is not None:  # Transient failures are retried next run
+                rows.append(
+                    (url, int(verified), etag, last_modified, status, checked_at)
+                )
+        self.cache.upsert_many(
+            "university_verifications",
+            ["url", "verified", "etag", "last_modified", "last_status", "checked_at"],
+            rows,
+            conflict_columns=["url"],
+        )
+
+        return results
+
+    async def _fetch_verification(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        host_locks: Dict[str, asyncio.Lock],
+        url: str,
+        cached: Optional[Dict[str, Any]],
+    ) -> Tuple[bool, Optional[int], Optional[str], Optional[str]]:
+        """Fetch one website; returns (verified, status, etag, last_modified)"""
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        for attempt in range(self.VERIFICATION_RETRIES + 1):
+            try:
+                async with semaphore:
+                    await self._wait_for_host(url, host_locks)
+                    async with session.get(url, headers=headers) as response:
+                        if response.status == 304 and cached:
+                            return (
+                                cached["verified"],
+                                304,
+                                cached["etag"],
+                                cached["last_modified"],
+                            )
+                        if response.status == 200:
+                            content = await response.read()
+                            return (
+                                self._page_mentions_programs(content),
+                                200,
+                                response.headers.get("ETag"),
+                                response.headers.get("Last-Modified"),
+                            )
+                        if response.status not in (429, 500, 502, 503, 504):
+                            return False, response.status, None, None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.debug(f"Verification request failed for {url}: {e}")
+
+            if attempt < self.VERIFICATION_RETRIES:
+                await asyncio.sleep(2**attempt)
+
+        return False, None, None, None
+
+    async def _wait_for_host(self, url: str, host_locks: Dict[str, asyncio.Lock]):
+        """Space requests to the same host by VERIFICATION_HOST_DELAY"""
+        host = urlparse(url).netloc.lower()
+        lock = host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            wait = self._host_next_request.get(host, 0.0) - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_next_request[host] = (
+                max(now, now + wait) + self.VERIFICATION_HOST_DELAY
+            )
 
-        except Exception:
+    def _page_mentions_programs(self, content: bytes) -> bool:
+        """Check page text for program keywords"""
+        try:
+            page_text = lxml.html.fromstring(content).text_content().lower()
+        except (ValueError, lxml.etree.ParserError):
             return False
+        return any(keyword in page_text for keyword in self.PROGRAM_KEYWORDS)
+
+    def _get_cached_verifications(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load cached verification results for the given URLs"""
+        if not urls:
+            return {}
+
+        cached = {}
+        with self.cache.transaction() as conn:
+            for i in range(0, len(urls), 500):
+                chunk = urls[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for url, verified, etag, last_modified, checked_at in conn.execute(
+                    "SELECT url, verified, etag, last_modified, checked_at "
+                    f"FROM university_verifications WHERE url IN ({placeholders})",
+                    chunk,
+                ):
+                    cached[url] = {
+                        "verified": bool(verified),
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "checked_at": checked_at,
+                    }
+        return cached
+
+    @staticmethod
+    def _run_async(coro):
+        """Run a coroutine from sync code, even if an event loop is running"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
 
     def map_health_ai_startups(self, country_code: str) -> List[HealthAIOrganization]:
         """
@@ -771,47 +955,65 @@ class HealthAIEcosystemMapper:
         return all_organizations, ecosystem_metrics
 
     def _cache_organizations(self, organizations: List[HealthAIOrganization]):
-        """Cache organizations to database"""
-        with sqlite3.connect(self.cache_db_path) as conn:
-            for org in organizations:
-                focus_areas_json = json.dumps(org.focus_areas)
-
-                conn.execute(
-                    """
-                    INSERT INTO health_ai_organizations 
-                    (name, country_code, country_name, organization_type, focus_areas,
-                     founded_year, description, website_url, funding_stage, 
-                     evidence_source, confidence_score, extraction_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        org.name,
-                        org.country_code,
-                        org.country_name,
-                        org.organization_type,
-                        focus_areas_json,
-                        org.founded_year,
-                        org.description,
-                        org.website_url,
-                        org.funding_stage,
-                        org.evidence_source,
-                        org.confidence_score,
-                        org.extraction_date,
-                    ),
+        """Cache organizations to database (re-mapped organizations are updated)"""
+        self.cache.upsert_many(
+            "health_ai_organizations",
+            [
+                "name",
+                "country_code",
+                "country_name",
+                "organization_type",
+                "focus_areas",
+                "founded_year",
+                "description",
+                "website_url",
+                "funding_stage",
+                "evidence_source",
+                "confidence_score",
+                "extraction_date",
+            ],
+            (
+                (
+                    org.name,
+                    org.country_code,
+                    org.country_name,
+                    org.organization_type,
+                    json.dumps(org.focus_areas),
+                    org.founded_year,
+                    org.description,
+                    org.website_url,
+                    org.funding_stage,
+                    org.evidence_source,
+                    org.confidence_score,
+                    org.extraction_date,
                 )
+                for org in organizations
+            ),
+            conflict_columns=self.ORGANIZATION_KEY,
+        )
 
     def _cache_metrics(self, metrics: EcosystemMetrics):
         """Cache ecosystem metrics to database"""
-        with sqlite3.connect(self.cache_db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO ecosystem_metrics 
-                (country_code, country_name, total_organizations, universities_with_programs,
-                 active_startups, research_institutes, hospital_ai_programs, government_initiatives,
-                 estimated_ecosystem_maturity, funding_activity_score, academic_activity_score,
-                 clinical_deployment_score, overall_ecosystem_score, confidence_score, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        self.cache.upsert_many(
+            "ecosystem_metrics",
+            [
+                "country_code",
+                "country_name",
+                "total_organizations",
+                "universities_with_programs",
+                "active_startups",
+                "research_institutes",
+                "hospital_ai_programs",
+                "government_initiatives",
+                "estimated_ecosystem_maturity",
+                "funding_activity_score",
+                "academic_activity_score",
+                "clinical_deployment_score",
+                "overall_ecosystem_score",
+                "confidence_score",
+                "last_updated",
+            ],
+            [
                 (
                     metrics.country_code,
                     metrics.country_name,
@@ -828,13 +1030,28 @@ class HealthAIEcosystemMapper:
                     metrics.overall_ecosystem_score,
                     metrics.confidence_score,
                     datetime.now().isoformat(),
-                ),
-            )
+                )
+            ],
+            conflict_columns=["country_code"],
+        )
 
-    def map_all_countries(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def map_all_countries(
+        self,
+        max_workers: int = 1,
+        on_country_complete: Optional[
+            Callable[[str, Dict[str, pd.DataFrame]], None]
+        ] = None,
+        run_id: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Map health AI ecosystem for all pilot countries
 
+        Args:
+            max_workers: Countries mapped concurrently
+            on_country_complete: Called with (country_code, {"organizations":
+                df, "metrics": df}) as each country finishes
+            run_id: Pipeline run ID recorded with the rows in the data lake
+
         Returns:
             Tuple of (organizations DataFrame, metrics DataFrame)
         """
@@ -844,14 +1061,43 @@ class HealthAIEcosystemMapper:
         all_metrics = []
         pilot_countries = ["ZAF", "KEN", "NGA", "GHA", "EGY"]
 
-        for country_code in pilot_countries:
+        # Verify every pilot country's universities in one concurrent batch;
+        # the per-country mapping below then reads the fresh cached results
+        self._run_async(
+            self.verify_university_programs(
+                [
+                    f"https://{university['url']}"
+                    for country_code in pilot_countries
+                    for university in self.KNOWN_UNIVERSITIES.get(country_code, [])
+                ]
+            )
+        )
+
+        def map_country(country_code: str):
             try:
                 organizations, metrics = self.map_country_ecosystem(country_code)
-                all_organizations.extend(organizations)
-                all_metrics.append(metrics)
             except Exception as e:
                 logger.error(f"Error mapping ecosystem for {country_code}: {e}")
-                continue
+                return None
+
+            if on_country_complete is not None:
+                on_country_complete(
+                    country_code,
+                    {
+                        "organizations": pd.DataFrame(
+                            [asdict(org) for org in organizations]
+                        ),
+                        "metrics": pd.DataFrame([asdict(metrics)]),
+                    },
+                )
+            return organizations, metrics
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            # map() keeps the pilot country order in the combined output
+            for mapped in executor.map(map_country, pilot_countries):
+                if mapped is not None:
+                    all_organizations.extend(mapped[0])
+                    all_metrics.append(mapped[1])
 
         # Convert to DataFrames
         org_data = [asdict(org) for org in all_organizations]
@@ -860,18 +1106,14 @@ class HealthAIEcosystemMapper:
         metrics_data = [asdict(metrics) for metrics in all_metrics]
         metrics_df = pd.DataFrame(metrics_data)
 
-        # Export to CSV
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        org_output_path = (
-            self.ecosystem_cache_dir / f"health_ai_organizations_{timestamp}.csv"
+        # Export to the data lake
+        run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        org_output_path = self.lake.append(
+            self.LAKE_ORGANIZATIONS_DATASET, org_df, source="ecosystem", run_id=run_id
         )
-        org_df.to_csv(org_output_path, index=False)
-
-        metrics_output_path = (
-            self.ecosystem_cache_dir / f"ecosystem_metrics_{timestamp}.csv"
+        metrics_output_path = self.lake.append(
+            self.LAKE_METRICS_DATASET, metrics_df, source="ecosystem", run_id=run_id
         )
-        metrics_df.to_csv(metrics_output_path, index=False)
 
         logger.info(f"Organizations data saved to: {org_output_path}")
         logger.info(f"Ecosystem metrics saved to: {metrics_output_path}")
@@ -10,9 +10,10 @@ import re
 import sqlite3
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 import pandas as pd
 import numpy as np
@@ -25,6 +26,8 @@ from urllib3.util.retry import Retry
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.json_serialization import make_json_serializable, save_json
 
+from app.data_lake import DataLake
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -162,15 +165,20 @@ class PolicyIndicatorCollector:
         }
     }
 
-    def __init__(self, cache_dir: str = "data/raw"):
+    # Data lake dataset for collected policy indicators
+    LAKE_DATASET = "policy_indicators"
+
+    def __init__(self, cache_dir: str = "data/raw", lake_dir: Optional[str] = None):
         """
         Initialize policy indicator collector
 
         Args:
             cache_dir: Directory for caching policy documents and evidence
+            lake_dir: Data lake directory (default: "lake" next to cache_dir)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.lake = DataLake(lake_dir or self.cache_dir.parent / "lake")
 
         # Create policy evidence subdirectory
         self.policy_cache_dir = self.cache_dir / "policy_evidence"
@@ -558,27 +566,51 @@ class PolicyIndicatorCollector:
                     ),
                 )
 
-    def collect_all_countries(self) -> pd.DataFrame:
+    def collect_all_countries(
+        self,
+        max_workers: int = 1,
+        on_country_complete: Optional[
+            Callable[[str, Dict[str, pd.DataFrame]], None]
+        ] = None,
+        run_id: Optional[str] = None,
+    ) -> pd.DataFrame:
         """
         Collect policy indicators for all pilot countries
 
+        Args:
+            max_workers: Countries collected concurrently
+            on_country_complete: Called with (country_code, {"data": df}) as
+                each country finishes
+            run_id: Pipeline run ID recorded with the rows in the data lake
+
         Returns:
             DataFrame with all policy indicators
         """
         logger.info("Collecting policy indicators for all pilot countries")
 
-        all_indicators = []
         pilot_countries = ["ZAF", "KEN", "NGA", "GHA", "EGY"]
 
-        for country_code in pilot_countries:
+        def collect_country(country_code: str) -> List[PolicyIndicator]:
             try:
                 country_indicators = self.collect_country_policy_indicators(
                     country_code
                 )
-                all_indicators.extend(country_indicators)
             except Exception as e:
                 logger.error(f"Error collecting indicators for {country_code}: {e}")
-                continue
+                return []
+
+            if on_country_complete is not None:
+                on_country_complete(
+                    country_code,
+                    {"data": pd.DataFrame([asdict(i) for i in country_indicators])},
+                )
+            return country_indicators
+
+        all_indicators = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            # map() keeps the pilot country order in the combined output
+            for country_indicators in executor.map(collect_country, pilot_countries):
+                all_indicators.extend(country_indicators)
 
         # Convert to DataFrame
         indicator_data = []
@@ -590,12 +622,10 @@ class PolicyIndicatorCollector:
         # Save to cache database
         self._save_indicators_to_cache(all_indicators)
 
-        # Export to CSV
-        output_path = (
-            self.policy_cache_dir
-            / f"policy_indicators_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        # Export to the data lake
+        output_path = self.lake.append(
+            self.LAKE_DATASET, df, source="policy", run_id=run_id
         )
-        df.to_csv(output_path, index=False)
         logger.info(f"Policy indicators saved to: {output_path}")
 
         return df
@@ -12,10 +12,12 @@ import json
 import logging
 import sqlite3
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
@@ -25,6 +27,8 @@ from urllib3.util.retry import Retry
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.json_serialization import save_json
 
+from app.data_lake import DataLake
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -63,17 +67,27 @@ class WorldBankCollector:
         "EGY": "Egypt",
     }
 
-    def __init__(self, cache_dir: str = "data/raw", db_path: Optional[str] = None):
+    # Data lake dataset for collected indicator panels
+    LAKE_DATASET = "worldbank_indicators"
+
+    def __init__(
+        self,
+        cache_dir: str = "data/raw",
+        db_path: Optional[str] = None,
+        lake_dir: Optional[str] = None,
+    ):
         """
         Initialize World Bank data collector
 
         Args:
             cache_dir: Directory for caching downloaded data
             db_path: Path to database connection (if None, uses local cache)
+            lake_dir: Data lake directory (default: "lake" next to cache_dir)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
+        self.lake = DataLake(lake_dir or self.cache_dir.parent / "lake")
 
         # Setup requests session with retry strategy
         self.session = requests.Session()
@@ -350,7 +364,14 @@ class WorldBankCollector:
         return df
 
     def collect_all_indicators(
-        self, start_year: int = 2020, end_year: int = 2023
+        self,
+        start_year: int = 2020,
+        end_year: int = 2023,
+        max_workers: int = 1,
+        on_country_complete: Optional[
+            Callable[[str, Dict[str, pd.DataFrame]], None]
+        ] = None,
+        run_id: Optional[str] = None,
     ) -> pd.DataFrame:
         """
         Collect all priority indicators for all pilot countries
@@ -358,20 +379,27 @@ class WorldBankCollector:
         Args:
             start_year: Starting year for data collection
             end_year: Ending year for data collection
+            max_workers: Countries fetched concurrently (indicators within a
+                country are fetched sequentially with the usual rate limit)
+            on_country_complete: Called with (country_code, {"data": df}) as
+                each country finishes
+            run_id: Pipeline run ID recorded with the rows in the data lake
 
         Returns:
             Complete DataFrame with all indicator data
         """
         logger.info("Starting comprehensive World Bank data collection for AHAII")
 
-        all_data = []
         total_requests = len(self.PILOT_COUNTRIES) * len(self.KEY_INDICATORS)
         completed_requests = 0
+        progress_lock = threading.Lock()
 
-        for country_code in self.PILOT_COUNTRIES:
+        def collect_country(country_code: str) -> pd.DataFrame:
+            nonlocal completed_requests
             country_name = self.COUNTRY_NAMES[country_code]
             logger.info(f"Collecting data for {country_name} ({country_code})")
 
+            country_data = []
             for indicator_code, indicator_name in self.KEY_INDICATORS.items():
                 logger.info(f"  Fetching {indicator_name} ({indicator_code})")
 
@@ -386,23 +414,31 @@ class WorldBankCollector:
                 df["indicator_name"] = indicator_name
                 df["country_name"] = country_name
 
-                all_data.append(df)
-                completed_requests += 1
+                country_data.append(df)
 
-                progress = (completed_requests / total_requests) * 100
-                logger.info(
-                    f"  Progress: {progress:.1f}% ({completed_requests}/{total_requests})"
-                )
+                with progress_lock:
+                    completed_requests += 1
+                    progress = (completed_requests / total_requests) * 100
+                    logger.info(
+                        f"  Progress: {progress:.1f}% ({completed_requests}/{total_requests})"
+                    )
+
+            country_df = pd.concat(country_data, ignore_index=True)
+            if on_country_complete is not None:
+                on_country_complete(country_code, {"data": country_df})
+            return country_df
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            # map() keeps the pilot country order in the combined output
+            all_data = list(executor.map(collect_country, self.PILOT_COUNTRIES))
 
         # Combine all data
         combined_df = pd.concat(all_data, ignore_index=True)
 
         # Save raw data
-        output_path = (
-            self.cache_dir
-            / f"worldbank_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        output_path = self.lake.append(
+            self.LAKE_DATASET, combined_df, source="world_bank", run_id=run_id
         )
-        combined_df.to_csv(output_path, index=False)
         logger.info(f"Raw data saved to: {output_path}")
 
         return combined_df
@@ -0,0 +1,387 @@
+"""
+Columnar Data Lake for AHAII
+Partitioned Parquet datasets (by source and run date) with a SQLite manifest
+index, replacing the timestamped CSV files written on every pipeline run.
+Readers prune partitions through the manifest and load only the columns
+they need.
+
+Usage:
+    python -m app.data_lake manifest [dataset]
+    python -m app.data_lake compact [dataset]
+"""
+
+import json
+import logging
+import sys
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from app.local_cache import LocalCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class DataLake:
+    """
+    Append-only Parquet datasets with a manifest index
+
+    Files are laid out as
+    ``<lake_dir>/<dataset>/source=<source>/run_date=<YYYY-MM-DD>/part-*.parquet``
+    and every appended row carries the ``run_id`` of the run that wrote it,
+    so compacting a partition into one file never loses run boundaries.
+    ``source``, ``run_date`` and ``run_id`` are reserved column names.
+    """
+
+    PARTITION_COLUMNS = ["source", "run_date"]
+    MANIFEST_DB = "_manifest.db"
+
+    # Partitions with at least this many files are merged by compact()
+    COMPACT_MIN_FILES = 2
+
+    def __init__(self, lake_dir: Union[str, Path] = "data/lake"):
+        """
+        Initialize data lake
+
+        Args:
+            lake_dir: Root directory of the lake
+        """
+        self.lake_dir = Path(lake_dir)
+        self.lake_dir.mkdir(parents=True, exist_ok=True)
+
+        self.cache = LocalCache(self.lake_dir / self.MANIFEST_DB)
+        self.cache.create_table(
+            """
+            CREATE TABLE IF NOT EXISTS lake_files (
+                path TEXT PRIMARY KEY,
+                dataset TEXT,
+                source TEXT,
+                run_date TEXT,
+                run_ids TEXT,
+                rows INTEGER,
+                columns TEXT,
+                bytes INTEGER,
+                created_at TEXT
+            )
+            """,
+            indexes=[("lake_files", ["dataset", "source", "run_date"])],
+        )
+
+    def append(
+        self,
+        dataset: str,
+        df: pd.DataFrame,
+        source: str,
+        run_id: Optional[str] = None,
+        run_date: Optional[date] = None,
+    ) -> Optional[Path]:
+        """
+        Append a DataFrame as a new file in its partition
+
+        Args:
+            dataset: Dataset name (e.g. "worldbank_indicators")
+            df: Rows to append
+            source: Source partition (e.g. "world_bank")
+            run_id: Run that produced the rows (default: a new timestamp ID)
+            run_date: Date partition (default: today)
+
+        Returns:
+            Path of the written file, or None if df was empty
+        """
+        if df.empty:
+            logger.info(f"Nothing to append to {dataset} ({source})")
+            return None
+
+        run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        run_date = (run_date or date.today()).isoformat()
+
+        reserved = [c for c in [*self.PARTITION_COLUMNS, "run_id"] if c in df.columns]
+        if reserved:
+            raise ValueError(f"Columns {reserved} are reserved by the data lake")
+
+        partition_dir = self._partition_dir(dataset, source, run_date)
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        path = partition_dir / f"part-{run_id}-{uuid.uuid4().hex[:8]}.parquet"
+
+        df.assign(run_id=run_id).to_parquet(path, index=False)
+        self._register_files([(path, dataset, source, run_date, [run_id], df)])
+
+        logger.info(f"Appended {len(df)} rows to {dataset}/{source}/{run_date}")
+        return path
+
+    def read(
+        self,
+        dataset: str,
+        columns: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        run_id: Optional[str] = None,
+        latest: bool = False,
+        filters: Optional[Dict[str, Sequence[Any]]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read rows from a dataset
+
+        Partitions are pruned through the manifest before any file is opened,
+        and only the requested columns are read from the files that remain.
+
+        Args:
+            dataset: Dataset name
+            columns: Columns to load (default: all, including partition keys)
+            sources: Source partitions to include
+            start_date: Earliest run date to include
+            end_date: Latest run date to include
+            run_id: Only rows written by this run
+            latest: Only rows written by the most recent run that matches
+                the other partition filters
+            filters: Column -> allowed values, pushed down to the Parquet scan
+
+        Returns:
+            DataFrame with the selected rows and columns
+        """
+        files = self._select_files(dataset, sources, start_date, end_date)
+
+        if latest and files and run_id is None:
+            run_id = self._latest_run_id(files)
+        if run_id is not None:
+            files = [f for f in files if run_id in json.loads(f["run_ids"])]
+
+        if not files:
+            return pd.DataFrame(columns=list(columns or []))
+
+        # Files written by different runs may type a column differently
+        # (e.g. all-null in one run), so scan them under a unified schema
+        paths = [str(self.lake_dir / f["path"]) for f in files]
+        partition_schema = pa.schema(
+            [(column, pa.string()) for column in self.PARTITION_COLUMNS]
+        )
+        schema = pa.unify_schemas(
+            [pq.read_schema(path) for path in paths] + [partition_schema],
+            promote_options="permissive",
+        )
+        lake_dataset = ds.dataset(
+            paths,
+            schema=schema,
+            format="parquet",
+            partitioning=ds.partitioning(partition_schema, flavor="hive"),
+            partition_base_dir=str(self.lake_dir / dataset),
+        )
+
+        expression = None
+        conditions = dict(filters or {})
+        if run_id is not None:
+            conditions["run_id"] = [run_id]
+        for column, values in conditions.items():
+            condition = ds.field(column).isin(list(values))
+            expression = condition if expression is None else expression & condition
+
+        table = lake_dataset.to_table(
+            columns=list(columns) if columns is not None else None,
+            filter=expression,
+        )
+        return table.to_pandas()
+
+    def compact(
+        self, dataset: Optional[str] = None, min_files: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Merge the files of each partition into a single file
+
+        Args:
+            dataset: Dataset to compact (default: all datasets)
+            min_files: Only compact partitions with at least this many files
+
+        Returns:
+            Dictionary with partitions compacted and files removed
+        """
+        min_files = min_files or self.COMPACT_MIN_FILES
+        query = (
+            "SELECT dataset, source, run_date, COUNT(*) FROM lake_files "
+            + ("WHERE dataset = ? " if dataset else "")
+            + "GROUP BY dataset, source, run_date HAVING COUNT(*) >= ?"
+        )
+        params = ([dataset] if dataset else []) + [min_files]
+
+        with self.cache.transaction() as conn:
+            partitions = conn.execute(query, params).fetchall()
+
+        stats = {"partitions_compacted": 0, "files_removed": 0}
+        for part_dataset, source, run_date, _ in partitions:
+            files = self._select_files(
+                part_dataset,
+                [source],
+                date.fromisoformat(run_date),
+                date.fromisoformat(run_date),
+            )
+            frames = [pd.read_parquet(self.lake_dir / f["path"]) for f in files]
+            merged = pd.concat(frames, ignore_index=True)
+            run_ids = sorted({rid for f in files for rid in json.loads(f["run_ids"])})
+
+            path = self._partition_dir(part_dataset, source, run_date) / (
+                f"part-compacted-{uuid.uuid4().hex[:8]}.parquet"
+            )
+            merged.to_parquet(path, index=False)
+
+            old_paths = [f["path"] for f in files]
+            self._register_files(
+                [(path, part_dataset, source, run_date, run_ids, merged)],
+                replaces=old_paths,
+            )
+            for old_path in old_paths:
+                (self.lake_dir / old_path).unlink(missing_ok=True)
+
+            stats["partitions_compacted"] += 1
+            stats["files_removed"] += len(old_paths)
+            logger.info(
+                f"Compacted {len(old_paths)} files in {part_dataset}/{source}/{run_date}"
+            )
+
+        return stats
+
+    def latest_run_id(
+        self, dataset: str, sources: Optional[Sequence[str]] = None
+    ) -> Optional[str]:
+        """
+        Get the most recent run that wrote to a dataset
+
+        Args:
+            dataset: Dataset name
+            sources: Restrict to these source partitions
+
+        Returns:
+            Run ID, or None if the dataset is empty
+        """
+        files = self._select_files(dataset, sources, None, None)
+        return self._latest_run_id(files) if files else None
+
+    def manifest(self, dataset: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get the manifest index
+
+        Args:
+            dataset: Restrict to one dataset
+
+        Returns:
+            DataFrame with one row per data file
+        """
+        query = "SELECT * FROM lake_files"
+        params = []
+        if dataset:
+            query += " WHERE dataset = ?"
+            params.append(dataset)
+
+        with self.cache.transaction() as conn:
+            return pd.read_sql_query(
+                query + " ORDER BY dataset, source, run_date, created_at",
+                conn,
+                params=params,
+            )
+
+    def _partition_dir(self, dataset: str, source: str, run_date: str) -> Path:
+        return self.lake_dir / dataset / f"source={source}" / f"run_date={run_date}"
+
+    def _select_files(
+        self,
+        dataset: str,
+        sources: Optional[Sequence[str]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> List[Dict[str, Any]]:
+        """Prune partitions through the manifest; returns matching file rows"""
+        query = (
+            "SELECT path, source, run_date, run_ids FROM lake_files WHERE dataset = ?"
+        )
+        params: List[Any] = [dataset]
+
+        if sources:
+            query += f" AND source IN ({', '.join('?' * len(sources))})"
+            params.extend(sources)
+        if start_date:
+            query += " AND run_date >= ?"
+            params.append(start_date.isoformat())
+        if end_date:
+            query += " AND run_date <= ?"
+            params.append(end_date.isoformat())
+
+        with self.cache.transaction() as conn:
+            rows = conn.execute(query + " ORDER BY created_at", params).fetchall()
+
+        return [
+            {"path": path, "source": source, "run_date": run_date, "run_ids": run_ids}
+            for path, source, run_date, run_ids in rows
+        ]
+
+    def _latest_run_id(self, files: List[Dict[str, Any]]) -> str:
+        return max(rid for f in files for rid in json.loads(f["run_ids"]))
+
+    def _register_files(self, entries: List[tuple], replaces: Sequence[str] = ()):
+        """Add files to the manifest (and drop replaced ones) in one transaction"""
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                str(path.relative_to(self.lake_dir)),
+                dataset,
+                source,
+                run_date,
+                json.dumps(run_ids),
+                len(df),
+                json.dumps([str(c) for c in df.columns]),
+                path.stat().st_size,
+                now,
+            )
+            for path, dataset, source, run_date, run_ids, df in entries
+        ]
+
+        with self.cache.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO lake_files (path, dataset, source, run_date, "
+                "run_ids, rows, columns, bytes, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "DELETE FROM lake_files WHERE path = ?",
+                [(path,) for path in replaces],
+            )
+
+
+def main():
+    """Inspect or compact the data lake"""
+    command = sys.argv[1] if len(sys.argv) > 1 else "manifest"
+    dataset = sys.argv[2] if len(sys.argv) > 2 else None
+
+    lake = DataLake()
+
+    if command == "compact":
+        stats = lake.compact(dataset)
+        print(
+            f"Compacted {stats['partitions_compacted']} partitions, "
+            f"removed {stats['files_removed']} files"
+        )
+    elif command == "manifest":
+        manifest = lake.manifest(dataset)
+        if manifest.empty:
+            print("Data lake is empty")
+            return
+        summary = manifest.groupby(["dataset", "source"]).agg(
+            files=("path", "count"),
+            rows=("rows", "sum"),
+            first_run=("run_date", "min"),
+            last_run=("run_date", "max"),
+        )
+        print(summary.to_string())
+    else:
+        print(__doc__)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Local SQLite Cache Helper for AHAII
+Shared connection setup and batched write helpers for the on-disk caches
+used by the data collection and validation components
+"""
+
+import logging
+import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class LocalCache:
+    """
+    SQLite cache with WAL journaling and transactional batch writes
+
+    Every write helper runs a single executemany inside one transaction, and
+    the generated INSERT/UPSERT statements are built once and reused so
+    SQLite's statement cache can keep them prepared.
+    """
+
+    # Applied on every connection (journal_mode is persisted in the file)
+    CONNECTION_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",  # Safe with WAL, avoids an fsync per commit
+        "temp_store": "MEMORY",
+        "cache_size": -16000,  # ~16 MB page cache
+        "busy_timeout": 5000,  # ms to wait on a concurrent writer
+    }
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize local cache
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection with the cache pragmas applied"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        for pragma, value in self.CONNECTION_PRAGMAS.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection inside a single transaction, then close it"""
+        conn = self.connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def create_table(
+        self,
+        schema: str,
+        indexes: Optional[Iterable[Tuple[str, Sequence[str]]]] = None,
+        unique_indexes: Optional[Iterable[Tuple[str, Sequence[str]]]] = None,
+    ):
+        """
+        Create a table and its lookup indexes if they do not exist
+
+        Args:
+            schema: CREATE TABLE IF NOT EXISTS statement
+            indexes: (table, columns) pairs for secondary indexes
+            unique_indexes: (table, columns) pairs used as UPSERT conflict
+                targets; rows duplicating the key are collapsed to the latest
+                one before the index is created
+        """
+        with self.transaction() as conn:
+            conn.execute(schema)
+
+            for table, columns in unique_indexes or []:
+                name = _index_name(table, columns, unique=True)
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+                    (name,),
+                ).fetchone()
+                if not exists:
+                    key = ", ".join(columns)
+                    removed = conn.execute(
+                        f"DELETE FROM {table} WHERE rowid NOT IN "
+                        f"(SELECT MAX(rowid) FROM {table} GROUP BY {key})"
+                    ).rowcount
+                    if removed:
+                        logger.info(
+                            f"Removed {removed} duplicate rows from {table} before indexing"
+                        )
+                    conn.execute(f"CREATE UNIQUE INDEX {name} ON {table} ({key})")
+
+            for table, columns in indexes or []:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_index_name(table, columns)} "
+                    f"ON {table} ({', '.join(columns)})"
+                )
+
+    def upsert_many(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Insert or update rows in a single transaction
+
+        Args:
+            table: Target table
+            columns: Column names, in the order values appear in each row
+            rows: Row tuples
+            conflict_columns: Primary key or unique index columns
+            update_columns: Columns refreshed on conflict (default: all others)
+
+        Returns:
+            Number of rows written
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        if update_columns is None:
+            update_columns = [c for c in columns if c not in conflict_columns]
+
+        sql = _upsert_sql(
+            table, tuple(columns), tuple(conflict_columns), tuple(update_columns)
+        )
+        with self.transaction() as conn:
+            conn.executemany(sql, rows)
+        return len(rows)
+
+
+@lru_cache(maxsize=None)
+def _upsert_sql(
+    table: str,
+    columns: Tuple[str, ...],
+    conflict_columns: Tuple[str, ...],
+    update_columns: Tuple[str, ...],
+) -> str:
+    """Build (once) the INSERT ... ON CONFLICT statement for a column set"""
+    placeholders = ", ".join("?" * len(columns))
+    conflict_action = (
+        "DO UPDATE SET "
+        + ", ".join(f"{column} = excluded.{column}" for column in update_columns)
+        if update_columns
+        else "DO NOTHING"
+    )
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT({', '.join(conflict_columns)}) {conflict_action}"
+    )
+
+
+def _index_name(table: str, columns: Sequence[str], unique: bool = False) -> str:
+    prefix = "uq" if unique else "idx"
+    return f"{prefix}_{table}_{'_'.join(columns)}"
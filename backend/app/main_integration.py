@@ -7,9 +7,10 @@ and orchestrates the complete AHAII assessment pipeline
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 # Import centralized serialization utility
 sys.path.append(str(Path(__file__).parent.parent))
@@ -21,6 +22,7 @@ from app.data_collection.policy_indicator_collector import PolicyIndicatorCollec
 
 # Import AHAII components
 from app.data_collection.worldbank_collector import WorldBankCollector
+from app.run_store import PipelineRunStore
 from app.scoring.ahaii_calculator import AHAIICalculator
 from app.scoring.enhanced_ahaii_calculator import EnhancedAHAIICalculator
 from app.validation.data_quality_report import DataQualityReporter
@@ -44,6 +46,13 @@ class AHAIIIntegrationManager:
     Main integration manager for AHAII Phase 2 implementation
     """
 
+    # Countries fetched concurrently per collection source
+    COLLECTION_CONCURRENCY = {
+        "world_bank": 4,  # Each worker keeps the collector's per-request delay
+        "policy": 3,
+        "ecosystem": 2,
+    }
+
     def __init__(self, output_dir: str = "data"):
         """
         Initialize AHAII integration manager
@@ -54,19 +63,22 @@ class AHAIIIntegrationManager:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-        # Initialize components
-        self.wb_collector = WorldBankCollector(cache_dir=str(self.output_dir / "raw"))
+        # Initialize components (tabular outputs share one Parquet data lake)
+        lake_dir = str(self.output_dir / "lake")
+        self.wb_collector = WorldBankCollector(
+            cache_dir=str(self.output_dir / "raw"), lake_dir=lake_dir
+        )
         self.policy_collector = PolicyIndicatorCollector(
-            cache_dir=str(self.output_dir / "raw")
+            cache_dir=str(self.output_dir / "raw"), lake_dir=lake_dir
         )
         self.ecosystem_mapper = HealthAIEcosystemMapper(
-            cache_dir=str(self.output_dir / "raw")
+            cache_dir=str(self.output_dir / "raw"), lake_dir=lake_dir
         )
         self.calculator = AHAIICalculator(
-            output_dir=str(self.output_dir / "indicators")
+            output_dir=str(self.output_dir / "indicators"), lake_dir=lake_dir
         )
         self.enhanced_calculator = EnhancedAHAIICalculator(
-            output_dir=str(self.output_dir / "indicators")
+            output_dir=str(self.output_dir / "indicators"), lake_dir=lake_dir
         )
         self.quality_reporter = DataQualityReporter(
             output_dir=str(self.output_dir / "processed")
@@ -75,11 +87,14 @@ class AHAIIIntegrationManager:
             validation_dir=str(self.output_dir / "processed")
         )
         self.report_generator = AHAIIPilotReportGenerator(
-            output_dir=str(self.output_dir / "analysis" / "pilot_assessment")
+            output_dir=str(self.output_dir / "analysis" / "pilot_assessment"),
+            lake_dir=lake_dir,
         )
 
-        # Pipeline results storage
+        # Pipeline results storage; each phase is also persisted under run_id
         self.pipeline_results = {}
+        self.run_store = PipelineRunStore(self.output_dir / "runs")
+        self.run_id = None
 
     def test_system_connectivity(self) -> Dict[str, bool]:
         """
@@ -166,20 +181,79 @@ class AHAIIIntegrationManager:
         """
         Execute data collection phase of AHAII pipeline
 
+        The World Bank, policy and ecosystem collectors run concurrently,
+        each fetching up to COLLECTION_CONCURRENCY[source] countries at a
+        time. Every finished country is written to the run store as it
+        arrives, and a failing source is recorded without stopping the
+        others.
+
         Returns:
             Dictionary with collected data and metadata
         """
         logger.info("=== Starting Data Collection Phase ===")
 
+        if self.run_id is None:
+            self.run_id = self.run_store.create_run()
+
         collection_results = {}
+        self._wb_data = None
+
+        sources = {
+            "world_bank": self._collect_world_bank,
+            "policy": self._collect_policy,
+            "ecosystem": self._collect_ecosystem,
+        }
+
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {
+                executor.submit(
+                    collect,
+                    self.COLLECTION_CONCURRENCY[source],
+                    self._partial_result_recorder(source),
+                ): source
+                for source, collect in sources.items()
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    collection_results[source] = future.result()
+                except Exception as e:
+                    logger.error(f"✗ {source} collection failed: {e}")
+                    collection_results[source] = {"status": "failed", "error": str(e)}
+                self._record_source_progress(source, collection_results[source])
+
+        # Keep the usual source order regardless of completion order
+        collection_results = {source: collection_results[source] for source in sources}
+
+        self.pipeline_results["data_collection"] = collection_results
+        self._persist_phase(
+            "data_collection",
+            {
+                **collection_results,
+                "world_bank": {
+                    **collection_results["world_bank"],
+                    "data": self._wb_data,
+                },
+            },
+        )
+        logger.info("=== Data Collection Phase Complete ===")
 
-        # 1. World Bank Indicator Collection
+        return collection_results
+
+    def _collect_world_bank(
+        self, max_workers: int, on_country_complete: Callable
+    ) -> Dict[str, Any]:
+        """Collect World Bank indicators (data kept in _wb_data for scoring)"""
         try:
             logger.info("Collecting World Bank indicators...")
-            wb_data = self.wb_collector.collect_all_indicators()
+            wb_data = self.wb_collector.collect_all_indicators(
+                max_workers=max_workers,
+                on_country_complete=on_country_complete,
+                run_id=self.run_id,
+            )
             wb_report = self.wb_collector.generate_data_completeness_report(wb_data)
 
-            collection_results["world_bank"] = {
+            result = {
                 "status": "success",
                 "data_points": len(wb_data),
                 "report_summary": {
@@ -193,58 +267,98 @@ class AHAIIIntegrationManager:
             logger.info(
                 f"✓ World Bank collection: {len(wb_data)} data points collected"
             )
+            return result
 
         except Exception as e:
             logger.error(f"✗ World Bank collection failed: {e}")
-            collection_results["world_bank"] = {"status": "failed", "error": str(e)}
+            return {"status": "failed", "error": str(e)}
 
-        # 2. Policy Indicator Collection
+    def _collect_policy(
+        self, max_workers: int, on_country_complete: Callable
+    ) -> Dict[str, Any]:
+        """Collect policy indicators"""
         try:
             logger.info("Collecting policy indicators...")
-            policy_data = self.policy_collector.collect_all_countries()
+            policy_data = self.policy_collector.collect_all_countries(
+                max_workers=max_workers,
+                on_country_complete=on_country_complete,
+                run_id=self.run_id,
+            )
             policy_report = self.policy_collector.generate_policy_matrix_report(
                 policy_data
             )
 
-            collection_results["policy"] = {
+            logger.info(
+                f"✓ Policy indicator collection: {len(policy_data)} indicators collected"
+            )
+            return {
                 "data": policy_data,
                 "report": policy_report,
                 "status": "success",
                 "indicators": len(policy_data),
             }
-            logger.info(
-                f"✓ Policy indicator collection: {len(policy_data)} indicators collected"
-            )
 
         except Exception as e:
             logger.error(f"✗ Policy indicator collection failed: {e}")
-            collection_results["policy"] = {"status": "failed", "error": str(e)}
+            return {"status": "failed", "error": str(e)}
 
-        # 3. Health AI Ecosystem Mapping
+    def _collect_ecosystem(
+        self, max_workers: int, on_country_complete: Callable
+    ) -> Dict[str, Any]:
+        """Map the health AI ecosystem"""
         try:
             logger.info("Mapping health AI ecosystem...")
-            org_data, ecosystem_metrics = self.ecosystem_mapper.map_all_countries()
+            org_data, ecosystem_metrics = self.ecosystem_mapper.map_all_countries(
+                max_workers=max_workers,
+                on_country_complete=on_country_complete,
+                run_id=self.run_id,
+            )
             ecosystem_report = self.ecosystem_mapper.generate_ecosystem_report(
                 org_data, ecosystem_metrics
             )
 
-            collection_results["ecosystem"] = {
+            logger.info(f"✓ Ecosystem mapping: {len(org_data)} organizations mapped")
+            return {
                 "organizations": org_data,
                 "metrics": ecosystem_metrics,
                 "report": ecosystem_report,
                 "status": "success",
                 "organizations_mapped": len(org_data),
             }
-            logger.info(f"✓ Ecosystem mapping: {len(org_data)} organizations mapped")
 
         except Exception as e:
             logger.error(f"✗ Ecosystem mapping failed: {e}")
-            collection_results["ecosystem"] = {"status": "failed", "error": str(e)}
+            return {"status": "failed", "error": str(e)}
 
-        self.pipeline_results["data_collection"] = collection_results
-        logger.info("=== Data Collection Phase Complete ===")
+    def _partial_result_recorder(self, source: str) -> Callable:
+        """Build the per-country callback that streams a source into the run store"""
+        run_id = self.run_id
 
-        return collection_results
+        def record(country_code: str, frames: Dict[str, Any]):
+            try:
+                self.run_store.save_partial(
+                    run_id, "data_collection", source, country_code, frames
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to store partial {source} results for {country_code}: {e}"
+                )
+
+        return record
+
+    def _record_source_progress(self, source: str, result: Dict[str, Any]):
+        """Record a collection source's final status in the run store"""
+        try:
+            self.run_store.record_progress(
+                self.run_id,
+                "data_collection",
+                source,
+                "*",
+                result["status"],
+                detail=result.get("error"),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record {source} progress: {e}")
 
     def run_scoring_phase(self, collection_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -265,6 +379,13 @@ class AHAIIIntegrationManager:
         policy_data = collection_results.get("policy", {}).get("data")
         ecosystem_metrics = collection_results.get("ecosystem", {}).get("metrics")
 
+        if wb_data is None and self.run_id is not None:
+            # Fall back to this run's indicator panel in the data lake
+            lake_data = self.calculator.load_indicator_data(run_id=self.run_id)
+            if not lake_data.empty:
+                logger.info(f"Loaded World Bank data for run {self.run_id} from the data lake")
+                wb_data = lake_data
+
         if wb_data is None:
             logger.error("World Bank data not available for scoring")
             return {"status": "failed", "error": "Missing World Bank data"}
@@ -349,6 +470,7 @@ class AHAIIIntegrationManager:
             }
 
         self.pipeline_results["scoring"] = scoring_results
+        self._persist_phase("scoring", scoring_results)
         logger.info("=== Scoring Phase Complete ===")
 
         return scoring_results
@@ -447,6 +569,7 @@ class AHAIIIntegrationManager:
                 }
 
         self.pipeline_results["validation"] = validation_results
+        self._persist_phase("validation", validation_results)
         logger.info("=== Validation Phase Complete ===")
 
         return validation_results
@@ -475,7 +598,10 @@ class AHAIIIntegrationManager:
 
                 # Generate comprehensive final report
                 final_report_path = self.report_generator.generate_final_report(
-                    enhanced_results, validation_consensus, quality_metrics
+                    enhanced_results,
+                    validation_consensus,
+                    quality_metrics,
+                    run_id=self.run_id,
                 )
 
                 reporting_results["final_report"] = {
@@ -500,6 +626,7 @@ class AHAIIIntegrationManager:
             }
 
         self.pipeline_results["reporting"] = reporting_results
+        self._persist_phase("reporting", reporting_results)
         logger.info("=== Reporting Phase Complete ===")
 
         return reporting_results
@@ -508,13 +635,90 @@ class AHAIIIntegrationManager:
         """
         Execute complete AHAII assessment pipeline
 
+        Every phase's results are persisted under a new run ID (see
+        resume_run to rerun the later phases from a stored run).
+
         Returns:
             Dictionary with complete pipeline results
         """
         logger.info("=== Starting Complete AHAII Assessment Pipeline ===")
+        self.run_id = self.run_store.create_run()
+        self.pipeline_results = {}
+
+        return self._execute_pipeline()
+
+    def resume_run(self, run_id: str) -> Dict[str, Any]:
+        """
+        Rerun scoring, validation and reporting for a stored run
+
+        Loads the run's data collection snapshot from the run store, so no
+        collection (and no network access) takes place. A run interrupted
+        before the snapshot was written is rebuilt from the per-country
+        partials stored during collection. The rerun phases replace the
+        run's stored results.
+
+        Args:
+            run_id: ID of a run whose data collection phase was stored
+
+        Returns:
+            Dictionary with complete pipeline results
+        """
+        collection_results = self.run_store.load_phase(run_id, "data_collection")
+        if collection_results is None:
+            collection_results = self._collection_from_partials(run_id)
+        if collection_results is None:
+            raise ValueError(f"No stored data collection results for run {run_id}")
+
+        logger.info(f"=== Resuming AHAII Assessment Pipeline from run {run_id} ===")
+        self.run_id = run_id
+        self._wb_data = collection_results.get("world_bank", {}).pop("data", None)
+        self.pipeline_results = {"data_collection": collection_results}
+
+        return self._execute_pipeline(collection_results)
+
+    def _collection_from_partials(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Rebuild data collection results from a run's stored partials"""
+        partials = self.run_store.load_partials(run_id, "data_collection")
+        if not partials:
+            return None
+
+        # Partial frames use the same names as the snapshot (data,
+        # organizations, metrics); sources that never finished are "partial"
+        statuses = {
+            record["source"]: record["status"]
+            for record in self.run_store.get_progress(run_id, "data_collection")
+            if record["item"] == "*"
+        }
+        logger.info(
+            f"Rebuilding data collection for run {run_id} from partials: "
+            f"{', '.join(sorted(partials))}"
+        )
+        return {
+            source: {
+                **frames,
+                "status": statuses.get(source, "partial"),
+                "recovered_from_partials": True,
+            }
+            for source, frames in partials.items()
+        }
+
+    def _execute_pipeline(
+        self, collection_results: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the pipeline phases for the current run
+
+        Args:
+            collection_results: Stored collection results to reuse; the data
+                collection phase runs when omitted
+
+        Returns:
+            Dictionary with complete pipeline results
+        """
         start_time = time.time()
 
         pipeline_summary = {
+            "run_id": self.run_id,
             "start_time": datetime.now().isoformat(),
             "phases_completed": [],
             "phases_failed": [],
@@ -523,12 +727,16 @@ class AHAIIIntegrationManager:
 
         try:
             # Phase 1: Data Collection
-            logger.info("🔄 Phase 1: Data Collection")
-            collection_results = self.run_data_collection_phase()
-            if any(result.get("status") == "success" for result in collection_results.values()):
-                pipeline_summary["phases_completed"].append("data_collection")
+            if collection_results is None:
+                logger.info("🔄 Phase 1: Data Collection")
+                collection_results = self.run_data_collection_phase()
+                if any(result.get("status") == "success" for result in collection_results.values()):
+                    pipeline_summary["phases_completed"].append("data_collection")
+                else:
+                    pipeline_summary["phases_failed"].append("data_collection")
             else:
-                pipeline_summary["phases_failed"].append("data_collection")
+                logger.info(f"⏩ Phase 1: Data Collection (stored snapshot of run {self.run_id})")
+                pipeline_summary["phases_completed"].append("data_collection")
 
             # Phase 2: Scoring
             logger.info("🔄 Phase 2: Scoring")
@@ -573,6 +781,12 @@ class AHAIIIntegrationManager:
 
         # Store complete results
         self.pipeline_results["summary"] = pipeline_summary
+        try:
+            self.run_store.finish_run(
+                self.run_id, pipeline_summary["overall_status"], pipeline_summary
+            )
+        except Exception as e:
+            logger.error(f"Failed to record run {self.run_id}: {e}")
 
         # Save pipeline results
         results_path = (
@@ -594,6 +808,16 @@ class AHAIIIntegrationManager:
 
         return self.pipeline_results
 
+    def _persist_phase(self, phase: str, results: Dict[str, Any]):
+        """Store a phase's results in the run store under the current run ID"""
+        if self.run_id is None:
+            self.run_id = self.run_store.create_run()
+
+        try:
+            self.run_store.save_phase(self.run_id, phase, results)
+        except Exception as e:
+            logger.error(f"Failed to persist {phase} results for run {self.run_id}: {e}")
+
 
 
 def main():
@@ -0,0 +1,528 @@
+"""
+Persistent Run Store for the AHAII Pipeline
+Keeps every pipeline run's phase results on disk under a run ID: DataFrames
+as Parquet files and all remaining metadata as JSON in SQLite, so a run
+survives a crash and can be reloaded by another process
+"""
+
+import json
+import logging
+import shutil
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from app.local_cache import LocalCache
+
+# Add backend directory to path for utils import
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.json_serialization import make_json_serializable
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class PipelineRunStore:
+    """
+    Run-scoped storage for pipeline phase results
+
+    A phase result is a nested dictionary (e.g. ``{"policy": {"data": df,
+    "status": "success"}}``). DataFrames found anywhere in it are written to
+    ``<store_dir>/<run_id>/<phase>/<path>.parquet``; everything else is kept
+    as the phase's JSON metadata. Loading a phase rebuilds the same nested
+    structure with the DataFrames (and their indexes) put back in place.
+    """
+
+    # Separator between nested keys in Parquet file names; the key path
+    # itself is stored as a list, so keys may contain the separator
+    KEY_SEPARATOR = "__"
+
+    def __init__(self, store_dir: Union[str, Path]):
+        """
+        Initialize run store
+
+        Args:
+            store_dir: Directory for Parquet files and the run database
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+        self.cache = LocalCache(self.store_dir / "pipeline_runs.db")
+        self.cache.create_table(
+            """
+            CREATE TABLE IF NOT EXISTS pipeline_runs (
+                run_id TEXT PRIMARY KEY,
+                status TEXT,
+                created_at TEXT,
+                updated_at TEXT,
+                summary TEXT
+            )
+            """
+        )
+        self.cache.create_table(
+            """
+            CREATE TABLE IF NOT EXISTS run_phases (
+                run_id TEXT,
+                phase TEXT,
+                metadata TEXT,
+                frames TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (run_id, phase)
+            )
+            """
+        )
+        self.cache.create_table(
+            """
+            CREATE TABLE IF NOT EXISTS run_progress (
+                run_id TEXT,
+                phase TEXT,
+                source TEXT,
+                item TEXT,
+                status TEXT,
+                rows INTEGER,
+                detail TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (run_id, phase, source, item)
+            )
+            """
+        )
+        self.cache.create_table(
+            """
+            CREATE TABLE IF NOT EXISTS run_partials (
+                run_id TEXT,
+                phase TEXT,
+                source TEXT,
+                item TEXT,
+                frames TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (run_id, phase, source, item)
+            )
+            """
+        )
+
+    def create_run(self) -> str:
+        """
+        Register a new pipeline run
+
+        Returns:
+            Run ID (timestamp plus a short random suffix)
+        """
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        now = datetime.now().isoformat()
+        self.cache.upsert_many(
+            "pipeline_runs",
+            ["run_id", "status", "created_at", "updated_at", "summary"],
+            [(run_id, "running", now, now, None)],
+            ["run_id"],
+        )
+        logger.info(f"Created pipeline run {run_id}")
+        return run_id
+
+    def finish_run(self, run_id: str, status: str, summary: Dict[str, Any]):
+        """
+        Record the final status and summary of a run
+
+        Args:
+            run_id: Run ID
+            status: Overall pipeline status
+            summary: Pipeline summary dictionary
+        """
+        self.cache.upsert_many(
+            "pipeline_runs",
+            ["run_id", "status", "updated_at", "summary"],
+            [
+                (
+                    run_id,
+                    status,
+                    datetime.now().isoformat(),
+                    json.dumps(make_json_serializable(summary)),
+                )
+            ],
+            ["run_id"],
+        )
+
+    def save_phase(self, run_id: str, phase: str, results: Dict[str, Any]):
+        """
+        Persist one phase's results, replacing any earlier copy
+
+        Args:
+            run_id: Run ID
+            phase: Phase name (e.g. "data_collection")
+            results: Nested phase results
+        """
+        phase_dir = self.store_dir / run_id / phase
+        if phase_dir.exists():
+            shutil.rmtree(phase_dir)
+        phase_dir.mkdir(parents=True)
+
+        frames = {}
+        metadata = self._extract_frames(results, [], frames)
+
+        frame_index = {
+            name: {
+                **self._write_frame(df, phase_dir / f"{name}.parquet"),
+                "key_path": key_path,
+            }
+            for name, (key_path, df) in frames.items()
+        }
+
+        now = datetime.now().isoformat()
+        with self.cache.transaction() as conn:
+            conn.execute(
+                "INSERT INTO run_phases (run_id, phase, metadata, frames, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(run_id, phase) DO UPDATE SET "
+                "metadata = excluded.metadata, frames = excluded.frames, "
+                "updated_at = excluded.updated_at",
+                (
+                    run_id,
+                    phase,
+                    json.dumps(make_json_serializable(metadata)),
+                    json.dumps(frame_index),
+                    now,
+                ),
+            )
+            conn.execute(
+                "UPDATE pipeline_runs SET updated_at = ? WHERE run_id = ?",
+                (now, run_id),
+            )
+
+        logger.info(
+            f"Stored phase '{phase}' for run {run_id} ({len(frames)} DataFrames)"
+        )
+
+    def load_phase(self, run_id: str, phase: str) -> Optional[Dict[str, Any]]:
+        """
+        Load one phase's results with its DataFrames restored
+
+        Args:
+            run_id: Run ID
+            phase: Phase name
+
+        Returns:
+            Nested phase results, or None if the phase was not stored
+        """
+        with self.cache.transaction() as conn:
+            row = conn.execute(
+                "SELECT metadata, frames FROM run_phases WHERE run_id = ? AND phase = ?",
+                (run_id, phase),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        results = json.loads(row[0])
+        for name, info in json.loads(row[1]).items():
+            df = self._read_frame(info)
+
+            # Runs stored before key paths were recorded only have the name
+            *parents, key = info.get("key_path") or name.split(self.KEY_SEPARATOR)
+            target = results
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[key] = df
+
+        return results
+
+    def save_partial(
+        self,
+        run_id: str,
+        phase: str,
+        source: str,
+        item: str,
+        frames: Dict[str, pd.DataFrame],
+    ):
+        """
+        Persist a partial result (e.g. one country of one source) as it arrives
+
+        Partials live under ``<run_id>/partials/<phase>/<source>/`` and are
+        kept alongside the phase snapshot written by save_phase, so an
+        interrupted phase can be rebuilt with load_partials.
+
+        Args:
+            run_id: Run ID
+            phase: Phase name
+            source: Source within the phase (e.g. "world_bank")
+            item: Unit of work within the source (e.g. a country code)
+            frames: DataFrames produced for the item, by name
+        """
+        partial_dir = self.store_dir / run_id / "partials" / phase / source
+        partial_dir.mkdir(parents=True, exist_ok=True)
+
+        frame_index = {
+            name: self._write_frame(
+                df, partial_dir / f"{item}{self.KEY_SEPARATOR}{name}.parquet"
+            )
+            for name, df in frames.items()
+        }
+        self.cache.upsert_many(
+            "run_partials",
+            ["run_id", "phase", "source", "item", "frames", "updated_at"],
+            [
+                (
+                    run_id,
+                    phase,
+                    source,
+                    item,
+                    json.dumps(frame_index),
+                    datetime.now().isoformat(),
+                )
+            ],
+            ["run_id", "phase", "source", "item"],
+        )
+
+        self.record_progress(
+            run_id,
+            phase,
+            source,
+            item,
+            "complete",
+            rows=sum(len(df) for df in frames.values()),
+        )
+
+    def load_partials(
+        self, run_id: str, phase: str
+    ) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """
+        Load the partial results stored for a phase
+
+        Args:
+            run_id: Run ID
+            phase: Phase name
+
+        Returns:
+            DataFrames by source and name, each combining the source's items
+            in the order they were stored; empty if there are no partials
+        """
+        with self.cache.transaction() as conn:
+            rows = conn.execute(
+                "SELECT source, frames FROM run_partials "
+                "WHERE run_id = ? AND phase = ? ORDER BY updated_at",
+                (run_id, phase),
+            ).fetchall()
+
+        parts: Dict[str, Dict[str, List[pd.DataFrame]]] = {}
+        for source, frames in rows:
+            for name, info in json.loads(frames).items():
+                df = self._read_frame(info)
+                parts.setdefault(source, {}).setdefault(name, []).append(df)
+
+        return {
+            source: {
+                name: pd.concat(dfs, ignore_index=True) for name, dfs in named.items()
+            }
+            for source, named in parts.items()
+        }
+
+    def record_progress(
+        self,
+        run_id: str,
+        phase: str,
+        source: str,
+        item: str,
+        status: str,
+        rows: Optional[int] = None,
+        detail: Optional[str] = None,
+    ):
+        """
+        Record the status of one unit of work within a phase
+
+        Args:
+            run_id: Run ID
+            phase: Phase name
+            source: Source within the phase
+            item: Unit of work (``"*"`` for the source as a whole)
+            status: Status label (e.g. "complete", "success", "failed")
+            rows: Number of rows produced
+            detail: Error message or other detail
+        """
+        self.cache.upsert_many(
+            "run_progress",
+            [
+                "run_id",
+                "phase",
+                "source",
+                "item",
+                "status",
+                "rows",
+                "detail",
+                "updated_at",
+            ],
+            [
+                (
+                    run_id,
+                    phase,
+                    source,
+                    item,
+                    status,
+                    rows,
+                    detail,
+                    datetime.now().isoformat(),
+                )
+            ],
+            ["run_id", "phase", "source", "item"],
+        )
+
+    def get_progress(
+        self, run_id: str, phase: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the recorded progress of a run
+
+        Args:
+            run_id: Run ID
+            phase: Restrict to one phase
+
+        Returns:
+            Progress records in the order they were last updated
+        """
+        query = (
+            "SELECT phase, source, item, status, rows, detail, updated_at "
+            "FROM run_progress WHERE run_id = ?"
+        )
+        params = [run_id]
+        if phase is not None:
+            query += " AND phase = ?"
+            params.append(phase)
+
+        with self.cache.transaction() as conn:
+            rows = conn.execute(query + " ORDER BY updated_at", params).fetchall()
+
+        columns = ["phase", "source", "item", "status", "rows", "detail", "updated_at"]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get run status, summary and stored phases
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Run record, or None if the run does not exist
+        """
+        with self.cache.transaction() as conn:
+            row = conn.execute(
+                "SELECT run_id, status, created_at, updated_at, summary "
+                "FROM pipeline_runs WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+            phases = [
+                phase
+                for (phase,) in conn.execute(
+                    "SELECT phase FROM run_phases WHERE run_id = ? ORDER BY updated_at",
+                    (run_id,),
+                )
+            ]
+
+        if row is None:
+            return None
+
+        return {
+            "run_id": row[0],
+            "status": row[1],
+            "created_at": row[2],
+            "updated_at": row[3],
+            "summary": json.loads(row[4]) if row[4] else None,
+            "phases": phases,
+        }
+
+    def list_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        List the most recent runs
+
+        Args:
+            limit: Maximum number of runs to return
+
+        Returns:
+            List of run records without summaries, newest first
+        """
+        with self.cache.transaction() as conn:
+            rows = conn.execute(
+                "SELECT run_id, status, created_at, updated_at FROM pipeline_runs "
+                "ORDER BY created_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+
+        return [
+            {
+                "run_id": run_id,
+                "status": status,
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
+            for run_id, status, created_at, updated_at in rows
+        ]
+
+    def _extract_frames(
+        self,
+        value: Any,
+        path: List[str],
+        frames: Dict[str, Tuple[List[str], pd.DataFrame]],
+    ) -> Any:
+        """
+        Move DataFrames out of nested results; returns the remaining metadata
+
+        Frames are collected by a unique file name, with their key path.
+        """
+        if not isinstance(value, dict):
+            return value
+
+        metadata = {}
+        for key, item in value.items():
+            item_path = path + [str(key)]
+            if isinstance(item, pd.DataFrame):
+                name = self.KEY_SEPARATOR.join(item_path)
+                if name in frames:
+                    name = f"{name}_{len(frames)}"
+                frames[name] = (item_path, item)
+            else:
+                metadata[key] = self._extract_frames(item, item_path, frames)
+        return metadata
+
+    def _write_frame(self, df: pd.DataFrame, path: Path) -> Dict[str, Any]:
+        """Write a DataFrame and return its frame index entry"""
+        return {
+            "path": str(path.relative_to(self.store_dir)),
+            "rows": len(df),
+            "json_columns": self._write_parquet(df, path),
+        }
+
+    def _read_frame(self, info: Dict[str, Any]) -> pd.DataFrame:
+        """Read a DataFrame from its frame index entry"""
+        df = pd.read_parquet(self.store_dir / info["path"])
+        for column in info["json_columns"]:
+            df[column] = df[column].map(
+                lambda value: json.loads(value) if value is not None else None
+            )
+        return df
+
+    def _write_parquet(self, df: pd.DataFrame, path: Path) -> List[str]:
+        """
+        Write a DataFrame to Parquet, keeping its index
+
+        Object columns Arrow cannot type (mixed scalars, dicts of varying
+        shape) are stored as JSON text and listed in the return value so
+        they can be decoded on load.
+
+        Returns:
+            Names of columns stored as JSON text
+        """
+        try:
+            df.to_parquet(path)
+            return []
+        except Exception as e:
+            logger.debug(f"Falling back to JSON-encoded columns for {path.name}: {e}")
+
+        df = df.copy()
+        json_columns = [column for column in df.columns if df[column].dtype == object]
+        for column in json_columns:
+            df[column] = df[column].map(
+                lambda value: json.dumps(make_json_serializable(value))
+            )
+        df.to_parquet(path)
+        return json_columns
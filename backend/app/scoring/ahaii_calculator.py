@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from app.data_lake import DataLake
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -113,15 +115,55 @@ class AHAIICalculator:
         AHAIITier.DEVELOPMENT: 0.4,
     }
 
-    def __init__(self, output_dir: str = "data/indicators"):
+    # Data lake dataset and the indicator panel columns scoring reads
+    INDICATOR_DATASET = "worldbank_indicators"
+    INDICATOR_COLUMNS = [
+        "country_code",
+        "country_name",
+        "indicator_name",
+        "year",
+        "value",
+        "confidence_score",
+    ]
+
+    def __init__(
+        self, output_dir: str = "data/indicators", lake_dir: Optional[str] = None
+    ):
         """
         Initialize AHAII calculator
 
         Args:
             output_dir: Directory for saving calculated scores
+            lake_dir: Data lake directory (default: "lake" next to output_dir)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.lake = DataLake(lake_dir or self.output_dir.parent / "lake")
+
+    def load_indicator_data(
+        self, run_id: Optional[str] = None, countries: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Load the indicator panel for scoring from the data lake
+
+        Only the columns used by scoring are read, from the partitions of a
+        single collection run.
+
+        Args:
+            run_id: Collection run to load (default: the most recent run)
+            countries: Restrict to these country codes
+
+        Returns:
+            DataFrame in the layout expected by calculate_all_countries
+        """
+        return self.lake.read(
+            self.INDICATOR_DATASET,
+            columns=self.INDICATOR_COLUMNS,
+            sources=["world_bank"],
+            run_id=run_id,
+            latest=run_id is None,
+            filters={"country_code": countries} if countries else None,
+        )
 
     def normalize_indicator(
         self, value: float, indicator_name: str, confidence: float = 1.0
@@ -175,11 +175,44 @@ class EnhancedAHAIICalculator(AHAIICalculator):
         "digital_health_strategy": 0.05,
     }
 
-    def __init__(self, output_dir: str = "data/indicators"):
+    # Data lake dataset and the policy indicator columns scoring reads
+    POLICY_DATASET = "policy_indicators"
+    POLICY_COLUMNS = [
+        "country_code",
+        "indicator_name",
+        "indicator_value",
+        "confidence_score",
+    ]
+
+    def __init__(
+        self, output_dir: str = "data/indicators", lake_dir: Optional[str] = None
+    ):
         """Initialize enhanced calculator"""
-        super().__init__(output_dir)
+        super().__init__(output_dir, lake_dir)
         self.proxy_applications = {}  # Track proxy usage
 
+    def load_policy_data(
+        self, run_id: Optional[str] = None, countries: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Load policy indicators for scoring from the data lake
+
+        Args:
+            run_id: Collection run to load (default: the most recent run)
+            countries: Restrict to these country codes
+
+        Returns:
+            DataFrame with the policy columns used by integrate_policy_indicators
+        """
+        return self.lake.read(
+            self.POLICY_DATASET,
+            columns=self.POLICY_COLUMNS,
+            sources=["policy"],
+            run_id=run_id,
+            latest=run_id is None,
+            filters={"country_code": countries} if countries else None,
+        )
+
     def apply_proxy_indicators(
         self, country_data: pd.DataFrame, country_code: str
     ) -> pd.DataFrame:
@@ -750,18 +783,23 @@ def main():
     from app.data_collection.worldbank_collector import WorldBankCollector
     from app.data_collection.policy_indicator_collector import PolicyIndicatorCollector
 
-    # Collect all data
-    logger.info("Collecting World Bank data...")
-    wb_collector = WorldBankCollector()
-    wb_data = wb_collector.collect_all_indicators()
+    calculator = EnhancedAHAIICalculator()
+
+    # Reuse the latest collection in the data lake, collecting only if empty
+    wb_data = calculator.load_indicator_data()
+    if wb_data.empty:
+        logger.info("Collecting World Bank data...")
+        wb_collector = WorldBankCollector()
+        wb_data = wb_collector.collect_all_indicators()
 
-    logger.info("Collecting policy indicators...")
-    policy_collector = PolicyIndicatorCollector()
-    policy_data = policy_collector.collect_all_countries()
+    policy_data = calculator.load_policy_data()
+    if policy_data.empty:
+        logger.info("Collecting policy indicators...")
+        policy_collector = PolicyIndicatorCollector()
+        policy_data = policy_collector.collect_all_countries()
 
     # Calculate enhanced AHAII scores
     logger.info("Calculating enhanced AHAII scores...")
-    calculator = EnhancedAHAIICalculator()
 
     enhanced_results = []
     pilot_countries = ["ZAF", "KEN", "NGA", "GHA", "EGY"]
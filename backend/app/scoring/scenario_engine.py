@@ -0,0 +1,504 @@
+"""
+Weight and Normalization Scenario Engine for AHAII Scores
+Normalizes the indicator panel once, then scores thousands of alternative
+pillar weightings and normalization bounds as batched matrix products to
+show how sensitive country scores and ranks are to those choices
+
+Usage:
+    python -m app.scoring.scenario_engine [--samples N] [--bound-variants N]
+        [--scenario name=pillar:weight,...] [--run-id RUN_ID] [--json]
+"""
+
+import argparse
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.scoring.ahaii_calculator import AHAIICalculator
+from app.scoring.uncertainty_engine import (
+    AHAIIUncertaintyEngine,
+    ScoringModel,
+    UncertaintyConfig,
+    _normalize,
+    _rank_descending,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScenarioConfig:
+    """Sampling settings for scenario analysis"""
+
+    n_weight_samples: int = 1000  # Dirichlet weight vectors around the framework
+    weight_concentration: float = 50.0  # Lower = wider spread of sampled weights
+    n_bound_variants: int = 0  # Random bound variants besides the framework bounds
+    bound_jitter: float = 0.10  # Bound shift as a fraction of the bound range
+    seed: int = 42
+
+
+@dataclass
+class CountryScenarioSummary:
+    """Score and rank distribution of one country across all scenarios"""
+
+    country_code: str
+    country_name: str
+    base_score: float
+    base_rank: int
+    mean_score: float
+    std_score: float
+    score_p5: float
+    score_median: float
+    score_p95: float
+    best_rank: int
+    worst_rank: int
+    median_rank: float
+    rank_probability: float  # Share of scenarios that reproduce the base rank
+    rank_distribution: Dict[int, float] = field(default_factory=dict)
+
+
+@dataclass
+class NamedScenarioResult:
+    """Scores and ranks under one explicitly requested scenario"""
+
+    name: str
+    weights: Dict[str, float]
+    bounds: Dict[str, Tuple[float, float]]  # Indicator bound overrides
+    scores: Dict[str, float]
+    ranks: Dict[str, int]
+
+
+@dataclass
+class ScenarioResult:
+    """Output of a scenario analysis run"""
+
+    n_scenarios: int
+    n_weight_vectors: int
+    n_bound_variants: int
+    seed: int
+    pillars: List[str]
+    base_weights: Dict[str, float]
+    mean_rank_correlation: float  # Mean Spearman correlation with base ranks
+    elapsed_ms: float
+    countries: List[CountryScenarioSummary] = field(default_factory=list)
+    named_scenarios: List[NamedScenarioResult] = field(default_factory=list)
+
+
+class ScenarioEngine:
+    """
+    Batched what-if scoring over pillar weights and normalization bounds
+
+    The latest value of every indicator is normalized under the framework
+    bounds when the engine is built, and reduced to pillar scores. A
+    weight scenario is then just a row of a (weights x pillars) matrix, so
+    all of them are scored with one product against the pillar scores.
+    Bound variants are normalized together as one (variants x countries x
+    indicators) tensor, and every variant is crossed with every weight
+    vector.
+    """
+
+    # Upper limit on weight vectors x bound variants for a single run
+    MAX_SCENARIOS = 100000
+    # Bound variants are normalized as a (variants x countries x indicators)
+    # tensor, so they are capped separately
+    MAX_BOUND_VARIANTS = 1000
+
+    def __init__(self, model: ScoringModel):
+        """
+        Initialize scenario engine
+
+        Args:
+            model: ScoringModel from AHAIIUncertaintyEngine.build_model
+        """
+        self.model = model
+        self.values = np.where(
+            model.observation_counts > 0, model.observations[:, :, 0], np.nan
+        )
+        self.base_pillar_scores = (
+            _normalize(
+                self.values,
+                model.lower_bounds,
+                model.upper_bounds,
+                model.log_scale,
+            )
+            @ model.pillar_matrix
+        )
+        self.base_weights = model.pillar_weights / model.pillar_weights.sum()
+
+    @classmethod
+    def from_data(
+        cls, data: pd.DataFrame, calculator: Optional[AHAIICalculator] = None
+    ) -> "ScenarioEngine":
+        """
+        Build an engine from an indicator panel
+
+        Args:
+            data: Indicator data (same format as AHAIICalculator input)
+            calculator: Calculator providing weights, pillar mapping and bounds
+
+        Returns:
+            ScenarioEngine over the latest observation of each indicator
+        """
+        builder = AHAIIUncertaintyEngine(
+            calculator, UncertaintyConfig(resample_years=1)
+        )
+        return cls(builder.build_model(data))
+
+    def run(
+        self,
+        weights: Optional[Dict[str, Dict[str, float]]] = None,
+        bounds: Optional[Dict[str, Dict[str, Tuple[float, float]]]] = None,
+        config: Optional[ScenarioConfig] = None,
+    ) -> ScenarioResult:
+        """
+        Score every combination of weight vector and bound variant
+
+        The framework weights and bounds are always included. Named weight
+        scenarios are reported under the framework bounds and named bound
+        variants under the framework weights; all scenarios feed the
+        score and rank distributions.
+
+        Args:
+            weights: Scenario name -> pillar weights (missing pillars get 0,
+                weights are rescaled to sum to 1)
+            bounds: Variant name -> indicator -> (min, max) in raw units
+            config: Sampling settings
+
+        Returns:
+            ScenarioResult with per-country distributions and named results
+        """
+        start = time.perf_counter()
+        config = config or ScenarioConfig()
+        model = self.model
+        weights = weights or {}
+        bounds = bounds or {}
+        rng = np.random.default_rng(config.seed)
+
+        # Check the sizes before anything is allocated
+        n_weight_vectors = 1 + len(weights) + max(0, config.n_weight_samples)
+        n_bound_variants = 1 + len(bounds) + max(0, config.n_bound_variants)
+        if n_bound_variants > self.MAX_BOUND_VARIANTS:
+            raise ValueError(
+                f"{n_bound_variants} bound variants requested, "
+                f"limit is {self.MAX_BOUND_VARIANTS}"
+            )
+        n_scenarios = n_weight_vectors * n_bound_variants
+        if n_scenarios > self.MAX_SCENARIOS:
+            raise ValueError(
+                f"{n_scenarios} scenarios requested, limit is {self.MAX_SCENARIOS}"
+            )
+
+        weight_matrix = np.vstack(
+            [
+                self.base_weights,
+                *(self._weight_vector(name, w) for name, w in weights.items()),
+                self._sample_weights(config, rng),
+            ]
+        )
+        lower, upper = self._bound_variants(bounds, config, rng)
+
+        # (variants, countries, pillars) @ (pillars, weights) -> scenario scores
+        pillar_scores = self._pillar_scores(lower, upper)
+        scores = np.matmul(pillar_scores, weight_matrix.T).transpose(0, 2, 1)
+        scores = scores.reshape(-1, len(model.country_codes))
+
+        ranks = _rank_descending(scores)
+        countries, mean_rank_correlation = self._summarize(scores, ranks)
+
+        named = [
+            self._named_result(name, weights[name], {}, scores[1 + i], ranks[1 + i])
+            for i, name in enumerate(weights)
+        ]
+        named += [
+            self._named_result(
+                name,
+                {},
+                bounds[name],
+                scores[(1 + i) * weight_matrix.shape[0]],
+                ranks[(1 + i) * weight_matrix.shape[0]],
+            )
+            for i, name in enumerate(bounds)
+        ]
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Scored {n_scenarios} scenarios in {elapsed_ms:.0f} ms")
+
+        return ScenarioResult(
+            n_scenarios=n_scenarios,
+            n_weight_vectors=int(weight_matrix.shape[0]),
+            n_bound_variants=int(lower.shape[0]),
+            seed=config.seed,
+            pillars=list(model.pillars),
+            base_weights=dict(zip(model.pillars, self.base_weights.round(4).tolist())),
+            mean_rank_correlation=round(mean_rank_correlation, 4),
+            elapsed_ms=round(elapsed_ms, 1),
+            countries=countries,
+            named_scenarios=named,
+        )
+
+    def _weight_vector(self, name: str, weights: Dict[str, float]) -> np.ndarray:
+        """Validate one named weighting and rescale it to sum to 1"""
+        unknown = set(weights) - set(self.model.pillars)
+        if unknown:
+            raise ValueError(
+                f"Scenario '{name}' has unknown pillars: {sorted(unknown)}"
+            )
+
+        vector = np.array([float(weights.get(p, 0.0)) for p in self.model.pillars])
+        if (vector < 0).any() or vector.sum() <= 0:
+            raise ValueError(
+                f"Scenario '{name}' weights must be non-negative with a positive sum"
+            )
+        return vector / vector.sum()
+
+    def _sample_weights(self, config: ScenarioConfig, rng) -> np.ndarray:
+        """Dirichlet weight vectors centred on the framework weights"""
+        return rng.dirichlet(
+            self.base_weights * config.weight_concentration,
+            size=max(0, config.n_weight_samples),
+        )
+
+    def _bound_variants(
+        self,
+        bounds: Dict[str, Dict[str, Tuple[float, float]]],
+        config: ScenarioConfig,
+        rng,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lower and upper bounds per variant, framework bounds first
+
+        Returns:
+            Tuple of (variants, indicators) arrays in model (log) scale
+        """
+        model = self.model
+        lower = [model.lower_bounds]
+        upper = [model.upper_bounds]
+
+        for name, overrides in bounds.items():
+            low, high = model.lower_bounds.copy(), model.upper_bounds.copy()
+            for indicator, (min_val, max_val) in overrides.items():
+                if indicator not in model.indicators:
+                    raise ValueError(
+                        f"Bound variant '{name}' has unknown indicator: {indicator}"
+                    )
+                i = model.indicators.index(indicator)
+                if model.log_scale[i]:
+                    if min_val <= 0:
+                        raise ValueError(
+                            f"Bound variant '{name}': {indicator} is log-scaled "
+                            "and needs a positive minimum"
+                        )
+                    min_val, max_val = np.log10(min_val), np.log10(max_val)
+                if max_val <= min_val:
+                    raise ValueError(
+                        f"Bound variant '{name}': {indicator} max must exceed min"
+                    )
+                low[i], high[i] = min_val, max_val
+            lower.append(low)
+            upper.append(high)
+
+        n_random = max(0, config.n_bound_variants)
+        if n_random:
+            span = model.upper_bounds - model.lower_bounds
+            jitter = config.bound_jitter * span
+            random_lower = model.lower_bounds + jitter * rng.uniform(
+                -1, 1, (n_random, len(span))
+            )
+            random_upper = model.upper_bounds + jitter * rng.uniform(
+                -1, 1, (n_random, len(span))
+            )
+            lower.extend(random_lower)
+            upper.extend(np.maximum(random_upper, random_lower + 0.5 * span))
+
+        return np.vstack(lower), np.vstack(upper)
+
+    def _pillar_scores(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Pillar scores per bound variant, reusing the precomputed framework set"""
+        if lower.shape[0] == 1:
+            return self.base_pillar_scores[None]
+
+        normalized = _normalize(
+            self.values[None],
+            lower[1:, None, :],
+            upper[1:, None, :],
+            self.model.log_scale,
+        )
+        variants = normalized @ self.model.pillar_matrix
+        return np.concatenate([self.base_pillar_scores[None], variants])
+
+    def _summarize(
+        self, scores: np.ndarray, ranks: np.ndarray
+    ) -> Tuple[List[CountryScenarioSummary], float]:
+        """Per-country score percentiles and rank distributions"""
+        model = self.model
+        n_scenarios, n_countries = scores.shape
+
+        # Row 0 is the framework scenario
+        base_scores, base_ranks = scores[0], ranks[0]
+        p5, median, p95 = np.percentile(scores, [5, 50, 95], axis=0)
+        median_rank = np.median(ranks, axis=0)
+
+        # rank_counts[c, r] = scenarios that put country c at rank r + 1
+        rank_counts = np.bincount(
+            (np.arange(n_countries)[None, :] * n_countries + ranks - 1).ravel(),
+            minlength=n_countries * n_countries,
+        ).reshape(n_countries, n_countries)
+        rank_shares = rank_counts / n_scenarios
+
+        if n_countries > 1:
+            rank_shift = ranks - base_ranks
+            rank_corr = 1 - 6 * (rank_shift**2).sum(axis=1) / (
+                n_countries * (n_countries**2 - 1)
+            )
+            mean_rank_correlation = float(rank_corr.mean())
+        else:
+            mean_rank_correlation = 1.0
+
+        countries = [
+            CountryScenarioSummary(
+                country_code=code,
+                country_name=name,
+                base_score=round(float(base_scores[c]), 2),
+                base_rank=int(base_ranks[c]),
+                mean_score=round(float(scores[:, c].mean()), 2),
+                std_score=round(float(scores[:, c].std()), 2),
+                score_p5=round(float(p5[c]), 2),
+                score_median=round(float(median[c]), 2),
+                score_p95=round(float(p95[c]), 2),
+                best_rank=int(ranks[:, c].min()),
+                worst_rank=int(ranks[:, c].max()),
+                median_rank=float(median_rank[c]),
+                rank_probability=round(float(rank_shares[c, base_ranks[c] - 1]), 3),
+                rank_distribution={
+                    int(r + 1): round(float(rank_shares[c, r]), 4)
+                    for r in np.flatnonzero(rank_counts[c])
+                },
+            )
+            for c, (code, name) in enumerate(
+                zip(model.country_codes, model.country_names)
+            )
+        ]
+        countries.sort(key=lambda item: item.base_rank)
+
+        return countries, mean_rank_correlation
+
+    def _named_result(
+        self,
+        name: str,
+        weights: Dict[str, float],
+        bounds: Dict[str, Tuple[float, float]],
+        scores: np.ndarray,
+        ranks: np.ndarray,
+    ) -> NamedScenarioResult:
+        pillars = self.model.pillars
+        vector = self._weight_vector(name, weights) if weights else self.base_weights
+        return NamedScenarioResult(
+            name=name,
+            weights=dict(zip(pillars, vector.round(4).tolist())),
+            bounds={k: tuple(v) for k, v in bounds.items()},
+            scores={
+                code: round(float(score), 2)
+                for code, score in zip(self.model.country_codes, scores)
+            },
+            ranks={
+                code: int(rank) for code, rank in zip(self.model.country_codes, ranks)
+            },
+        )
+
+
+def parse_weight_scenario(spec: str) -> Tuple[str, Dict[str, float]]:
+    """
+    Parse a ``name=pillar:weight,pillar:weight`` scenario specification
+
+    Args:
+        spec: Scenario specification string
+
+    Returns:
+        Tuple of (scenario name, pillar weights)
+    """
+    name, _, body = spec.partition("=")
+    if not name or not body:
+        raise ValueError(f"Expected name=pillar:weight,... but got '{spec}'")
+
+    weights = {}
+    for part in body.split(","):
+        pillar, _, weight = part.partition(":")
+        weights[pillar.strip()] = float(weight)
+    return name.strip(), weights
+
+
+def main():
+    """Run scenario analysis on the latest indicator data in the data lake"""
+    parser = argparse.ArgumentParser(
+        description="AHAII weight and normalization scenario analysis"
+    )
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--concentration", type=float, default=50.0)
+    parser.add_argument("--bound-variants", type=int, default=0)
+    parser.add_argument("--bound-jitter", type=float, default=0.10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        default=[],
+        help="Named weighting, e.g. equal=human_capital:1,physical_infrastructure:1",
+    )
+    parser.add_argument("--run-id", help="Collection run to score (default: latest)")
+    parser.add_argument("--lake-dir", default="data/lake")
+    parser.add_argument("--json", action="store_true", help="Print the full result")
+    args = parser.parse_args()
+
+    calculator = AHAIICalculator(lake_dir=args.lake_dir)
+    data = calculator.load_indicator_data(run_id=args.run_id)
+    if data.empty:
+        print("No indicator data in the data lake; run data collection first")
+        return
+
+    engine = ScenarioEngine.from_data(data, calculator)
+    result = engine.run(
+        weights=dict(parse_weight_scenario(spec) for spec in args.scenario),
+        config=ScenarioConfig(
+            n_weight_samples=args.samples,
+            weight_concentration=args.concentration,
+            n_bound_variants=args.bound_variants,
+            bound_jitter=args.bound_jitter,
+            seed=args.seed,
+        ),
+    )
+
+    if args.json:
+        print(json.dumps(asdict(result), indent=2))
+        return
+
+    print(
+        f"{result.n_scenarios} scenarios ({result.n_weight_vectors} weightings x "
+        f"{result.n_bound_variants} bound sets) in {result.elapsed_ms:.0f} ms, "
+        f"mean rank correlation {result.mean_rank_correlation:.3f}\n"
+    )
+    print(
+        f"{'Rank':>4}  {'Country':<8} {'Score':>6}  {'P5-P95':>13}  "
+        f"{'Ranks':>7}  {'P(rank)':>7}"
+    )
+    for country in result.countries:
+        print(
+            f"{country.base_rank:>4}  {country.country_code:<8} "
+            f"{country.base_score:>6.1f}  "
+            f"{country.score_p5:>6.1f}-{country.score_p95:<6.1f}  "
+            f"{country.best_rank:>3}-{country.worst_rank:<3}  "
+            f"{country.rank_probability:>7.1%}"
+        )
+
+    for scenario in result.named_scenarios:
+        top = sorted(scenario.ranks, key=scenario.ranks.get)[:5]
+        print(f"\n{scenario.name}: top 5 {', '.join(top)}")
+
+
+if __name__ == "__main__":
+    main()
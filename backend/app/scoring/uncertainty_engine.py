@@ -0,0 +1,409 @@
+"""
+Monte Carlo Uncertainty Engine for AHAII Scores
+Resamples indicator observations, perturbs pillar weights and normalization
+bounds, and recomputes scores in vectorized batches to produce percentile
+confidence intervals and rank-stability statistics for every country
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.scoring.ahaii_calculator import AHAIICalculator
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UncertaintyConfig:
+    """Simulation settings for the uncertainty engine"""
+
+    n_draws: int = 10000
+    batch_size: int = 2000
+    n_workers: Optional[int] = None  # None = one per CPU, 1 = run in-process
+    seed: int = 42
+    confidence_level: float = 0.95
+    resample_years: int = 5  # Bootstrap from the most recent observations
+    confidence_noise: float = 0.25  # Relative noise at zero data confidence
+    weight_concentration: float = 200.0  # Dirichlet concentration around weights
+    bound_jitter: float = 0.10  # Bound shift as a fraction of the bound range
+
+
+@dataclass
+class CountryUncertainty:
+    """Score interval and rank stability for a single country"""
+
+    country_code: str
+    country_name: str
+    point_estimate: float
+    mean_score: float
+    std_score: float
+    lower_bound: float
+    upper_bound: float
+    confidence_level: float
+    point_rank: int
+    median_rank: float
+    rank_lower: int
+    rank_upper: int
+    rank_probability: float  # Share of draws that reproduce the point rank
+    rank_within_one: float  # Share of draws within one place of the point rank
+
+
+@dataclass
+class UncertaintyResult:
+    """Output of a Monte Carlo uncertainty run"""
+
+    n_draws: int
+    seed: int
+    confidence_level: float
+    mean_rank_correlation: float  # Mean Spearman correlation with point ranks
+    countries: List[CountryUncertainty] = field(default_factory=list)
+
+
+@dataclass
+class ScoringModel:
+    """Array form of the AHAII scoring model for one indicator panel"""
+
+    country_codes: List[str]
+    country_names: List[str]
+    indicators: List[str]
+    pillars: List[str]
+    observations: np.ndarray  # (countries, indicators, resample_years)
+    confidences: np.ndarray  # (countries, indicators, resample_years)
+    observation_counts: np.ndarray  # (countries, indicators)
+    lower_bounds: np.ndarray  # (indicators,)
+    upper_bounds: np.ndarray  # (indicators,)
+    log_scale: np.ndarray  # (indicators,) bool
+    pillar_matrix: np.ndarray  # (indicators, pillars) equal-weight averaging
+    pillar_weights: np.ndarray  # (pillars,)
+
+
+class AHAIIUncertaintyEngine:
+    """
+    Monte Carlo uncertainty analysis for AHAII scores
+
+    Each draw:
+      - bootstraps every indicator from the country's most recent
+        observations and adds confidence-scaled measurement noise
+      - shifts each indicator's normalization bounds
+      - samples pillar weights from a Dirichlet centred on the framework weights
+
+    Draws are computed in NumPy batches and the batches are spread across
+    worker processes. Every batch gets its own child seed from a
+    SeedSequence, so results are reproducible for a given seed regardless
+    of the number of workers.
+    """
+
+    LOG_SCALE_INDICATORS = {"total_population"}
+
+    def __init__(
+        self,
+        calculator: Optional[AHAIICalculator] = None,
+        config: Optional[UncertaintyConfig] = None,
+    ):
+        """
+        Initialize uncertainty engine
+
+        Args:
+            calculator: Calculator providing weights, pillar mapping and bounds
+            config: Simulation settings
+        """
+        self.calculator = calculator or AHAIICalculator()
+        self.config = config or UncertaintyConfig()
+
+    def build_model(self, data: pd.DataFrame) -> ScoringModel:
+        """
+        Convert an indicator panel into padded NumPy arrays
+
+        Args:
+            data: Indicator data with country_code, country_name,
+                indicator_name, year, value and confidence_score columns
+
+        Returns:
+            ScoringModel ready for simulation
+        """
+        calculator = self.calculator
+        pillars = list(calculator.PILLAR_WEIGHTS.keys())
+        indicators = [
+            indicator
+            for indicator, pillar in calculator.INDICATOR_PILLAR_MAPPING.items()
+            if pillar in calculator.PILLAR_WEIGHTS
+        ]
+        countries = (
+            data.drop_duplicates("country_code")
+            .sort_values("country_code")[["country_code", "country_name"]]
+            .reset_index(drop=True)
+        )
+
+        n_countries, n_indicators = len(countries), len(indicators)
+        depth = max(1, self.config.resample_years)
+
+        observations = np.zeros((n_countries, n_indicators, depth))
+        confidences = np.zeros((n_countries, n_indicators, depth))
+        counts = np.zeros((n_countries, n_indicators), dtype=np.int64)
+
+        valid = data[
+            data["value"].notna() & data["indicator_name"].isin(indicators)
+        ].sort_values(["country_code", "indicator_name", "year"], kind="stable")
+        recent = valid.groupby(["country_code", "indicator_name"]).tail(depth)
+
+        if not recent.empty:
+            country_pos = pd.Index(countries["country_code"]).get_indexer(
+                recent["country_code"]
+            )
+            indicator_pos = pd.Index(indicators).get_indexer(recent["indicator_name"])
+            # Slot 0 holds the latest observation, matching the point estimate
+            slot = (
+                recent.groupby(["country_code", "indicator_name"])
+                .cumcount(ascending=False)
+                .to_numpy()
+            )
+            observations[country_pos, indicator_pos, slot] = recent["value"].to_numpy(
+                dtype=float
+            )
+            confidences[country_pos, indicator_pos, slot] = (
+                recent["confidence_score"]
+                .fillna(0.0)
+                .clip(0.0, 1.0)
+                .to_numpy(dtype=float)
+            )
+            np.add.at(counts, (country_pos, indicator_pos), 1)
+
+        lower_bounds = np.zeros(n_indicators)
+        upper_bounds = np.full(n_indicators, 100.0)
+        log_scale = np.zeros(n_indicators, dtype=bool)
+        for i, indicator in enumerate(indicators):
+            if indicator not in calculator.NORMALIZATION_BOUNDS:
+                continue
+            low, high = calculator.NORMALIZATION_BOUNDS[indicator]
+            if indicator in self.LOG_SCALE_INDICATORS:
+                low, high = np.log10(low), np.log10(high)
+                log_scale[i] = True
+            lower_bounds[i], upper_bounds[i] = low, high
+
+        pillar_matrix = np.zeros((n_indicators, len(pillars)))
+        for i, indicator in enumerate(indicators):
+            pillar_matrix[
+                i, pillars.index(calculator.INDICATOR_PILLAR_MAPPING[indicator])
+            ] = 1.0
+        pillar_sizes = pillar_matrix.sum(axis=0)
+        pillar_matrix = np.divide(
+            pillar_matrix,
+            pillar_sizes,
+            out=np.zeros_like(pillar_matrix),
+            where=pillar_sizes > 0,
+        )
+
+        return ScoringModel(
+            country_codes=countries["country_code"].tolist(),
+            country_names=countries["country_name"].tolist(),
+            indicators=indicators,
+            pillars=pillars,
+            observations=observations,
+            confidences=confidences,
+            observation_counts=counts,
+            lower_bounds=lower_bounds,
+            upper_bounds=upper_bounds,
+            log_scale=log_scale,
+            pillar_matrix=pillar_matrix,
+            pillar_weights=np.array(
+                [calculator.PILLAR_WEIGHTS[p] for p in pillars], dtype=float
+            ),
+        )
+
+    def point_estimates(self, model: ScoringModel) -> np.ndarray:
+        """Unperturbed total scores using the latest observation per indicator"""
+        values = np.where(
+            model.observation_counts > 0, model.observations[:, :, 0], np.nan
+        )
+        normalized = _normalize(
+            values[None],
+            model.lower_bounds[None, None],
+            model.upper_bounds[None, None],
+            model.log_scale,
+        )
+        pillar_scores = normalized @ model.pillar_matrix
+        return (pillar_scores @ model.pillar_weights)[0]
+
+    def simulate(self, model: ScoringModel) -> np.ndarray:
+        """
+        Draw total scores for every country
+
+        Args:
+            model: ScoringModel from build_model
+
+        Returns:
+            Array of shape (n_draws, countries)
+        """
+        config = self.config
+        batch_sizes = [
+            min(config.batch_size, config.n_draws - start)
+            for start in range(0, config.n_draws, config.batch_size)
+        ]
+        seeds = np.random.SeedSequence(config.seed).spawn(len(batch_sizes))
+        tasks = [(model, config, seed, size) for seed, size in zip(seeds, batch_sizes)]
+
+        n_workers = config.n_workers or os.cpu_count() or 1
+        n_workers = min(n_workers, len(tasks))
+
+        if n_workers <= 1:
+            batches = [_simulate_batch(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                batches = list(executor.map(_simulate_batch, *zip(*tasks)))
+
+        return np.concatenate(batches, axis=0)
+
+    def run(self, data: pd.DataFrame) -> UncertaintyResult:
+        """
+        Run the full Monte Carlo analysis on an indicator panel
+
+        Args:
+            data: Indicator data (same format as AHAIICalculator input)
+
+        Returns:
+            UncertaintyResult with per-country intervals and rank statistics
+        """
+        config = self.config
+        logger.info(
+            f"Running Monte Carlo uncertainty analysis ({config.n_draws} draws)"
+        )
+
+        model = self.build_model(data)
+        if not model.country_codes:
+            return UncertaintyResult(
+                n_draws=0,
+                seed=config.seed,
+                confidence_level=config.confidence_level,
+                mean_rank_correlation=float("nan"),
+            )
+
+        point = self.point_estimates(model)
+        draws = self.simulate(model)
+
+        alpha = (1 - config.confidence_level) / 2
+        lower, upper = np.percentile(draws, [alpha * 100, (1 - alpha) * 100], axis=0)
+
+        point_ranks = _rank_descending(point[None])[0]
+        draw_ranks = _rank_descending(draws)
+        rank_lower, rank_upper = np.percentile(
+            draw_ranks, [alpha * 100, (1 - alpha) * 100], axis=0
+        )
+        rank_shift = np.abs(draw_ranks - point_ranks)
+
+        n_countries = len(model.country_codes)
+        if n_countries > 1:
+            # Spearman correlation between each draw's ranking and the point ranking
+            rank_corr = 1 - 6 * (rank_shift**2).sum(axis=1) / (
+                n_countries * (n_countries**2 - 1)
+            )
+            mean_rank_correlation = float(rank_corr.mean())
+        else:
+            mean_rank_correlation = 1.0
+
+        countries = [
+            CountryUncertainty(
+                country_code=code,
+                country_name=name,
+                point_estimate=round(float(point[c]), 2),
+                mean_score=round(float(draws[:, c].mean()), 2),
+                std_score=round(float(draws[:, c].std()), 2),
+                lower_bound=round(float(lower[c]), 1),
+                upper_bound=round(float(upper[c]), 1),
+                confidence_level=config.confidence_level,
+                point_rank=int(point_ranks[c]),
+                median_rank=float(np.median(draw_ranks[:, c])),
+                rank_lower=int(np.floor(rank_lower[c])),
+                rank_upper=int(np.ceil(rank_upper[c])),
+                rank_probability=round(float((rank_shift[:, c] == 0).mean()), 3),
+                rank_within_one=round(float((rank_shift[:, c] <= 1).mean()), 3),
+            )
+            for c, (code, name) in enumerate(
+                zip(model.country_codes, model.country_names)
+            )
+        ]
+        countries.sort(key=lambda item: item.point_rank)
+
+        return UncertaintyResult(
+            n_draws=int(draws.shape[0]),
+            seed=config.seed,
+            confidence_level=config.confidence_level,
+            mean_rank_correlation=round(mean_rank_correlation, 4),
+            countries=countries,
+        )
+
+
+def _normalize(
+    values: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    log_scale: np.ndarray,
+) -> np.ndarray:
+    """Min-max normalize to 0-100, treating missing values as 0"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled = np.where(log_scale, np.log10(np.maximum(values, 1e-12)), values)
+        normalized = (scaled - lower_bounds) / (upper_bounds - lower_bounds) * 100
+    return np.nan_to_num(np.clip(normalized, 0, 100), nan=0.0)
+
+
+def _rank_descending(scores: np.ndarray) -> np.ndarray:
+    """Rank each row of scores (1 = highest)"""
+    order = np.argsort(-scores, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, scores.shape[1] + 1)[None, :], axis=1)
+    return ranks
+
+
+def _simulate_batch(
+    model: ScoringModel,
+    config: UncertaintyConfig,
+    seed: np.random.SeedSequence,
+    n_draws: int,
+) -> np.ndarray:
+    """Simulate one batch of draws; module-level so it can run in a worker"""
+    rng = np.random.default_rng(seed)
+    n_countries, n_indicators, _ = model.observations.shape
+    counts = model.observation_counts
+
+    # Bootstrap one of the recent observations per draw/country/indicator
+    slot = np.floor(
+        rng.random((n_draws, n_countries, n_indicators)) * np.maximum(counts, 1)
+    ).astype(np.int64)
+    country_idx = np.arange(n_countries)[None, :, None]
+    indicator_idx = np.arange(n_indicators)[None, None, :]
+    values = model.observations[country_idx, indicator_idx, slot]
+    confidence = model.confidences[country_idx, indicator_idx, slot]
+
+    # Measurement noise grows as data confidence falls
+    noise_scale = config.confidence_noise * (1 - confidence)
+    values = values * (1 + noise_scale * rng.standard_normal(values.shape))
+    values = np.where(counts[None] > 0, values, np.nan)
+
+    # Shift normalization bounds by up to bound_jitter of their range
+    span = model.upper_bounds - model.lower_bounds
+    jitter = config.bound_jitter * span
+    lower_bounds = model.lower_bounds + jitter * rng.uniform(
+        -1, 1, (n_draws, n_indicators)
+    )
+    upper_bounds = model.upper_bounds + jitter * rng.uniform(
+        -1, 1, (n_draws, n_indicators)
+    )
+    upper_bounds = np.maximum(upper_bounds, lower_bounds + 0.5 * span)
+
+    normalized = _normalize(
+        values, lower_bounds[:, None, :], upper_bounds[:, None, :], model.log_scale
+    )
+    pillar_scores = normalized @ model.pillar_matrix
+
+    weights = rng.dirichlet(
+        model.pillar_weights / model.pillar_weights.sum() * config.weight_concentration,
+        size=n_draws,
+    )
+    return np.einsum("dcp,dp->dc", pillar_scores, weights)
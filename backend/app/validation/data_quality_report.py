@@ -20,6 +20,12 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 import plotly.offline as pyo
 
+from app.scoring.uncertainty_engine import (
+    AHAIIUncertaintyEngine,
+    UncertaintyConfig,
+    UncertaintyResult,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -113,6 +119,10 @@ class DataQualityReporter:
         """
         Assess data quality for all indicator/country combinations
 
+        Completeness, confidence, recency and outlier statistics are computed
+        in a single grouped aggregation over the whole panel; per-row outlier
+        flags are vectorized masks against the broadcast group statistics.
+
         Args:
             data: Combined DataFrame with indicator data
 
@@ -121,77 +131,124 @@ class DataQualityReporter:
         """
         logger.info("Assessing data quality across all indicators and countries")
 
-        quality_metrics = []
+        if data.empty:
+            return []
+
+        keys = ["country_code", "indicator_name"]
         current_year = datetime.now().year
 
-        # Group by country and indicator
-        for (country_code, indicator_name), group in data.groupby(
-            ["country_code", "indicator_name"]
-        ):
-            country_name = group["country_name"].iloc[0]
-            indicator_code = group["indicator_code"].iloc[0]
-
-            # Calculate completeness
-            total_years = len(group)
-            available_years = len(group[group["value"].notna()])
-            completeness_pct = (
-                (available_years / total_years * 100) if total_years > 0 else 0
-            )
+        values = data["value"]
+        valid = values.notna().to_numpy()
+        panel = pd.DataFrame(
+            {
+                "country_code": data["country_code"],
+                "indicator_name": data["indicator_name"],
+                "value": values,
+                "confidence": data["confidence_score"].where(valid),
+                "year": data["year"].where(valid),
+            }
+        )
 
-            # Calculate average confidence
-            valid_data = group[group["value"].notna()]
-            avg_confidence = (
-                valid_data["confidence_score"].mean() if len(valid_data) > 0 else 0
-            )
+        grouped = panel.groupby(keys, sort=True)
+        stats = grouped.agg(
+            total=("value", "size"),
+            available=("value", "count"),
+            confidence=("confidence", "mean"),
+            latest_year=("year", "max"),
+            mean=("value", "mean"),
+            std=("value", "std"),
+        )
 
-            # Calculate data freshness (how recent is the latest data)
-            if len(valid_data) > 0:
-                latest_year = valid_data["year"].max()
-                freshness_score = max(
-                    0, 1 - (current_year - latest_year) / 5
-                )  # Decay over 5 years
-            else:
-                freshness_score = 0
-
-            # Count outliers (values > 2 std from mean)
-            outlier_count = 0
-            if len(valid_data) > 2:
-                mean_val = valid_data["value"].mean()
-                std_val = valid_data["value"].std()
-                if std_val > 0:
-                    outliers = valid_data[
-                        abs(valid_data["value"] - mean_val) > 2 * std_val
-                    ]
-                    outlier_count = len(outliers)
-
-            # Calculate overall quality grade
-            quality_score = (
-                completeness_pct / 100 * 0.4
-                + avg_confidence * 0.3
-                + freshness_score * 0.2
-                + max(0, 1 - outlier_count / available_years) * 0.1
-                if available_years > 0
-                else 0
+        # Broadcast group statistics back onto rows to flag outliers
+        # (values > 2 std from the group mean) without a per-group loop
+        codes = grouped.ngroup().to_numpy()
+        in_group = codes >= 0
+        total = stats["total"].to_numpy()
+        available = stats["available"].to_numpy()
+        group_mean = stats["mean"].to_numpy()
+        group_std = stats["std"].to_numpy()
+        eligible = (available > 2) & (group_std > 0)
+
+        row_codes = np.where(in_group, codes, 0)
+        is_outlier = (
+            valid
+            & in_group
+            & eligible[row_codes]
+            & (
+                np.abs(values.to_numpy(dtype=float) - group_mean[row_codes])
+                > 2 * group_std[row_codes]
             )
+        )
+        outlier_count = np.bincount(row_codes[is_outlier], minlength=len(stats))
+
+        has_data = available > 0
+        completeness_pct = np.where(total > 0, available / total * 100, 0.0)
+        avg_confidence = np.where(has_data, stats["confidence"].to_numpy(), 0.0)
+        freshness_score = np.where(
+            has_data,
+            np.maximum(
+                0, 1 - (current_year - stats["latest_year"].to_numpy()) / 5
+            ),  # Decay over 5 years
+            0.0,
+        )
+        outlier_ratio = np.divide(
+            outlier_count,
+            available,
+            out=np.zeros(len(stats)),
+            where=has_data,
+        )
 
-            quality_grade = self._assign_quality_grade(quality_score)
+        quality_score = np.where(
+            has_data,
+            completeness_pct / 100 * 0.4
+            + avg_confidence * 0.3
+            + freshness_score * 0.2
+            + np.maximum(0, 1 - outlier_ratio) * 0.1,
+            0.0,
+        )
+        quality_grades = self._assign_quality_grades(quality_score)
+
+        # Country name and indicator code come from each group's first row
+        _, first_rows = np.unique(codes[in_group], return_index=True)
+        first_positions = np.flatnonzero(in_group)[first_rows]
+        country_names = data["country_name"].to_numpy()[first_positions]
+        indicator_codes = data["indicator_code"].to_numpy()[first_positions]
 
-            metrics = DataQualityMetrics(
+        return [
+            DataQualityMetrics(
                 country_code=country_code,
                 country_name=country_name,
                 indicator_code=indicator_code,
                 indicator_name=indicator_name,
-                completeness_pct=round(completeness_pct, 1),
-                confidence_score=round(avg_confidence, 2),
-                data_freshness_score=round(freshness_score, 2),
-                temporal_coverage=available_years,
-                outlier_count=outlier_count,
-                overall_quality_grade=quality_grade,
+                completeness_pct=round(completeness, 1),
+                confidence_score=confidence,
+                data_freshness_score=freshness,
+                temporal_coverage=int(coverage),
+                outlier_count=int(outliers),
+                overall_quality_grade=grade,
             )
-
-            quality_metrics.append(metrics)
-
-        return quality_metrics
+            for (
+                (country_code, indicator_name),
+                country_name,
+                indicator_code,
+                completeness,
+                confidence,
+                freshness,
+                coverage,
+                outliers,
+                grade,
+            ) in zip(
+                stats.index,
+                country_names,
+                indicator_codes,
+                completeness_pct.tolist(),
+                np.round(avg_confidence, 2).tolist(),
+                np.round(freshness_score, 2).tolist(),
+                available,
+                outlier_count,
+                quality_grades,
+            )
+        ]
 
     def _assign_quality_grade(self, quality_score: float) -> str:
         """Assign letter grade based on quality score"""
@@ -200,6 +257,15 @@ class DataQualityReporter:
                 return grade
         return "F"
 
+    def _assign_quality_grades(self, quality_scores: np.ndarray) -> List[str]:
+        """Assign letter grades to an array of quality scores"""
+        grades = list(self.QUALITY_THRESHOLDS.keys())
+        conditions = [
+            quality_scores >= threshold
+            for threshold in self.QUALITY_THRESHOLDS.values()
+        ]
+        return np.select(conditions, grades, default="F").tolist()
+
     def generate_completeness_matrix(
         self, quality_metrics: List[DataQualityMetrics]
     ) -> pd.DataFrame:
@@ -239,6 +305,9 @@ class DataQualityReporter:
         logger.info("Identifying proxy indicators for missing data")
 
         suggestions = []
+        metrics_by_key = {
+            (m.country_code, m.indicator_name): m for m in quality_metrics
+        }
 
         # Find indicators with poor data quality
         poor_quality_indicators = [
@@ -257,15 +326,7 @@ class DataQualityReporter:
                     missing_indicator
                 ].items():
                     # Check if proxy indicator has better data quality for this country
-                    proxy_quality = next(
-                        (
-                            m
-                            for m in quality_metrics
-                            if m.country_code == country_code
-                            and m.indicator_name == proxy_indicator
-                        ),
-                        None,
-                    )
+                    proxy_quality = metrics_by_key.get((country_code, proxy_indicator))
 
                     if (
                         proxy_quality
@@ -289,8 +350,27 @@ class DataQualityReporter:
 
         return suggestions
 
+    def run_uncertainty_analysis(
+        self, data: pd.DataFrame, config: Optional[UncertaintyConfig] = None
+    ) -> UncertaintyResult:
+        """
+        Run Monte Carlo uncertainty analysis over the indicator panel
+
+        Args:
+            data: Raw indicator data
+            config: Simulation settings (draws, workers, seed, perturbations)
+
+        Returns:
+            UncertaintyResult with percentile intervals and rank stability
+        """
+        return AHAIIUncertaintyEngine(config=config).run(data)
+
     def calculate_confidence_intervals(
-        self, ahaii_results: List, data: pd.DataFrame
+        self,
+        ahaii_results: List,
+        data: pd.DataFrame,
+        method: str = "heuristic",
+        uncertainty_result: Optional[UncertaintyResult] = None,
     ) -> List[ConfidenceInterval]:
         """
         Calculate confidence intervals for country scores
@@ -298,47 +378,70 @@ class DataQualityReporter:
         Args:
             ahaii_results: List of AHAII scoring results
             data: Raw indicator data for uncertainty analysis
+            method: "heuristic" for data-quality based margins or
+                "monte_carlo" for simulated percentile intervals
+            uncertainty_result: Precomputed Monte Carlo result to reuse
 
         Returns:
             List of confidence intervals
         """
+        if method == "monte_carlo":
+            return self._monte_carlo_confidence_intervals(
+                ahaii_results, uncertainty_result or self.run_uncertainty_analysis(data)
+            )
+        if method != "heuristic":
+            raise ValueError(f"Unknown confidence interval method: {method}")
+
         logger.info("Calculating confidence intervals for country scores")
 
         confidence_intervals = []
+        current_year = datetime.now().year
+
+        # Aggregate uncertainty inputs for every country up front instead of
+        # filtering and regrouping the panel once per result
+        valid = data["value"].notna()
+        indicator_stats = (
+            data.assign(_valid=valid)
+            .groupby(["country_code", "indicator_name"])
+            .agg(completeness=("_valid", "mean"), latest_year=("year", "max"))
+        )
+        country_stats = indicator_stats.groupby(level="country_code").mean()
+        country_confidence = (
+            data.loc[valid].groupby("country_code")["confidence_score"].mean()
+        )
 
         for result in ahaii_results:
             country_code = result.country_code
             country_name = result.country_name
             point_estimate = result.total_score
 
-            # Analyze uncertainty sources
-            country_data = data[data["country_code"] == country_code]
-
             uncertainty_sources = []
             uncertainty_factors = []
 
             # Data completeness uncertainty
-            completeness_by_indicator = country_data.groupby("indicator_name").apply(
-                lambda x: len(x[x["value"].notna()]) / len(x)
+            avg_completeness = (
+                country_stats.at[country_code, "completeness"]
+                if country_code in country_stats.index
+                else np.nan
             )
-            avg_completeness = completeness_by_indicator.mean()
 
             if avg_completeness < 0.8:
                 uncertainty_sources.append("Incomplete data coverage")
                 uncertainty_factors.append(1 - avg_completeness)
 
             # Confidence score uncertainty
-            valid_data = country_data[country_data["value"].notna()]
-            if len(valid_data) > 0:
-                avg_confidence = valid_data["confidence_score"].mean()
+            if country_code in country_confidence.index:
+                avg_confidence = country_confidence[country_code]
                 if avg_confidence < 0.8:
                     uncertainty_sources.append("Low data confidence scores")
                     uncertainty_factors.append(1 - avg_confidence)
 
             # Data freshness uncertainty
-            current_year = datetime.now().year
-            latest_data_years = country_data.groupby("indicator_name")["year"].max()
-            avg_data_age = current_year - latest_data_years.mean()
+            avg_data_age = current_year - (
+                country_stats.at[country_code, "latest_year"]
+                if country_code in country_stats.index
+                else np.nan
+            )
 
             if avg_data_age > 2:
                 uncertainty_sources.append("Outdated data (average age > 2 years)")
@@ -370,6 +473,46 @@ class DataQualityReporter:
 
         return confidence_intervals
 
+    def _monte_carlo_confidence_intervals(
+        self, ahaii_results: List, uncertainty_result: UncertaintyResult
+    ) -> List[ConfidenceInterval]:
+        """Map Monte Carlo percentile intervals onto AHAII results"""
+        by_country = {c.country_code: c for c in uncertainty_result.countries}
+        confidence_intervals = []
+
+        for result in ahaii_results:
+            country = by_country.get(result.country_code)
+            if country is None:
+                logger.warning(
+                    f"No simulated interval for {result.country_name} ({result.country_code})"
+                )
+                continue
+
+            uncertainty_sources = [
+                "Indicator resampling and measurement noise",
+                "Pillar weight perturbation",
+                "Normalization bound perturbation",
+            ]
+            if country.rank_probability < 0.5:
+                uncertainty_sources.append(
+                    f"Unstable rank (held in {country.rank_probability:.0%} of draws, "
+                    f"range {country.rank_lower}-{country.rank_upper})"
+                )
+
+            confidence_intervals.append(
+                ConfidenceInterval(
+                    country_code=result.country_code,
+                    country_name=result.country_name,
+                    point_estimate=result.total_score,
+                    lower_bound=country.lower_bound,
+                    upper_bound=country.upper_bound,
+                    confidence_level=country.confidence_level,
+                    uncertainty_sources=uncertainty_sources,
+                )
+            )
+
+        return confidence_intervals
+
     def create_interactive_heatmap(self, completeness_matrix: pd.DataFrame) -> str:
         """
         Create interactive data quality heatmap
@@ -588,7 +731,10 @@ class DataQualityReporter:
         return comparison_analysis
 
     def generate_comprehensive_report(
-        self, data: pd.DataFrame, ahaii_results: List
+        self,
+        data: pd.DataFrame,
+        ahaii_results: List,
+        uncertainty_method: str = "heuristic",
     ) -> str:
         """
         Generate comprehensive data quality validation report
@@ -596,6 +742,7 @@ class DataQualityReporter:
         Args:
             data: Raw indicator data
             ahaii_results: AHAII scoring results
+            uncertainty_method: "heuristic" or "monte_carlo" confidence intervals
 
         Returns:
             Path to saved report
@@ -606,7 +753,17 @@ class DataQualityReporter:
         quality_metrics = self.assess_data_quality(data)
         completeness_matrix = self.generate_completeness_matrix(quality_metrics)
         proxy_suggestions = self.identify_proxy_indicators(data, quality_metrics)
-        confidence_intervals = self.calculate_confidence_intervals(ahaii_results, data)
+        uncertainty_result = (
+            self.run_uncertainty_analysis(data)
+            if uncertainty_method == "monte_carlo"
+            else None
+        )
+        confidence_intervals = self.calculate_confidence_intervals(
+            ahaii_results,
+            data,
+            method=uncertainty_method,
+            uncertainty_result=uncertainty_result,
+        )
         index_comparison = self.compare_with_existing_indices(ahaii_results)
 
         # Create interactive visualizations
@@ -641,6 +798,9 @@ class DataQualityReporter:
             "proxy_suggestions": [asdict(p) for p in proxy_suggestions],
             "confidence_intervals": [asdict(ci) for ci in confidence_intervals],
             "index_comparison": index_comparison,
+            "rank_stability": (
+                asdict(uncertainty_result) if uncertainty_result else None
+            ),
             "visualizations": {
                 "data_quality_heatmap": heatmap_path,
                 "confidence_intervals": confidence_viz_path,
@@ -796,5 +956,77 @@ def main():
     print("Interactive visualizations created for data quality assessment")
 
 
+def generate_synthetic_panel(
+    n_countries: int = 54,
+    n_indicators: int = 200,
+    n_years: int = 20,
+    missing_rate: float = 0.3,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """Build a synthetic country x indicator x year panel for benchmarking"""
+    rng = np.random.default_rng(seed)
+    end_year = datetime.now().year - 1
+
+    country_idx, indicator_idx, year_idx = np.meshgrid(
+        np.arange(n_countries),
+        np.arange(n_indicators),
+        np.arange(n_years),
+        indexing="ij",
+    )
+    country_idx = country_idx.ravel()
+    indicator_idx = indicator_idx.ravel()
+    n_rows = country_idx.size
+
+    values = rng.lognormal(mean=2.0, sigma=0.75, size=n_rows)
+    values[rng.random(n_rows) < missing_rate] = np.nan
+
+    country_codes = np.array([f"C{i:02d}" for i in range(n_countries)], dtype=object)
+    indicator_names = np.array(
+        [f"indicator_{i:03d}" for i in range(n_indicators)], dtype=object
+    )
+
+    return pd.DataFrame(
+        {
+            "country_code": country_codes[country_idx],
+            "country_name": country_codes[country_idx],
+            "indicator_code": indicator_names[indicator_idx],
+            "indicator_name": indicator_names[indicator_idx],
+            "year": end_year - n_years + 1 + year_idx.ravel(),
+            "value": values,
+            "confidence_score": rng.uniform(0.5, 1.0, size=n_rows),
+        }
+    )
+
+
+def benchmark_quality_assessment(
+    n_countries: int = 54, n_indicators: int = 200, n_years: int = 20, repeats: int = 3
+) -> Dict[str, Any]:
+    """Time assess_data_quality on a synthetic panel"""
+    import tempfile
+    import time
+
+    data = generate_synthetic_panel(n_countries, n_indicators, n_years)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        reporter = DataQualityReporter(output_dir=output_dir)
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            quality_metrics = reporter.assess_data_quality(data)
+            timings.append(time.perf_counter() - start)
+
+    return {
+        "rows": len(data),
+        "combinations": len(quality_metrics),
+        "best_seconds": round(min(timings), 4),
+        "mean_seconds": round(float(np.mean(timings)), 4),
+    }
+
+
 if __name__ == "__main__":
-    main()
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        print(json.dumps(benchmark_quality_assessment(), indent=2))
+    else:
+        main()
@@ -8,7 +8,6 @@ Generates validation confidence scores and uncertainty bounds
 
 import json
 import logging
-import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
@@ -18,6 +17,8 @@ import pandas as pd
 import numpy as np
 from statistics import mode, median
 
+from app.local_cache import LocalCache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -190,81 +191,94 @@ class ExpertValidationSystem:
         """Initialize expert validation database"""
         cache_db_path = self.expert_cache_dir / "validation_cache.db"
 
-        with sqlite3.connect(cache_db_path) as conn:
-            # Expert profiles table
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS expert_profiles (
-                    expert_id TEXT PRIMARY KEY,
-                    name TEXT,
-                    affiliation TEXT,
-                    country_expertise TEXT,
-                    domain_expertise TEXT,
-                    years_experience INTEGER,
-                    validation_history INTEGER,
-                    reliability_score REAL,
-                    contact_email TEXT,
-                    registration_date TEXT
-                )
+        self.cache = LocalCache(cache_db_path)
+
+        # Expert profiles table
+        self.cache.create_table(
             """
+            CREATE TABLE IF NOT EXISTS expert_profiles (
+                expert_id TEXT PRIMARY KEY,
+                name TEXT,
+                affiliation TEXT,
+                country_expertise TEXT,
+                domain_expertise TEXT,
+                years_experience INTEGER,
+                validation_history INTEGER,
+                reliability_score REAL,
+                contact_email TEXT,
+                registration_date TEXT
             )
+        """
+        )
 
-            # Validation requests table
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS validation_requests (
-                    request_id TEXT PRIMARY KEY,
-                    country_code TEXT,
-                    indicator_name TEXT,
-                    indicator_type TEXT,
-                    current_value TEXT,
-                    confidence_score REAL,
-                    evidence_provided TEXT,
-                    validation_question TEXT,
-                    target_experts TEXT,
-                    priority_level TEXT,
-                    deadline TEXT,
-                    status TEXT,
-                    creation_date TEXT
-                )
+        # Validation requests table
+        self.cache.create_table(
             """
+            CREATE TABLE IF NOT EXISTS validation_requests (
+                request_id TEXT PRIMARY KEY,
+                country_code TEXT,
+                indicator_name TEXT,
+                indicator_type TEXT,
+                current_value TEXT,
+                confidence_score REAL,
+                evidence_provided TEXT,
+                validation_question TEXT,
+                target_experts TEXT,
+                priority_level TEXT,
+                deadline TEXT,
+                status TEXT,
+                creation_date TEXT
             )
+        """,
+            indexes=[
+                ("validation_requests", ["country_code", "indicator_name"]),
+                ("validation_requests", ["status"]),
+            ],
+        )
 
-            # Expert responses table
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS expert_responses (
-                    response_id TEXT PRIMARY KEY,
-                    request_id TEXT,
-                    expert_id TEXT,
-                    validated_value TEXT,
-                    confidence_rating REAL,
-                    reasoning TEXT,
-                    additional_evidence TEXT,
-                    certainty_level TEXT,
-                    response_date TEXT
-                )
+        # Expert responses table
+        self.cache.create_table(
             """
+            CREATE TABLE IF NOT EXISTS expert_responses (
+                response_id TEXT PRIMARY KEY,
+                request_id TEXT,
+                expert_id TEXT,
+                validated_value TEXT,
+                confidence_rating REAL,
+                reasoning TEXT,
+                additional_evidence TEXT,
+                certainty_level TEXT,
+                response_date TEXT
             )
+        """,
+            indexes=[
+                ("expert_responses", ["request_id"]),
+                ("expert_responses", ["expert_id"]),
+            ],
+        )
 
-            # Consensus results table
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS validation_consensus (
-                    request_id TEXT PRIMARY KEY,
-                    country_code TEXT,
-                    indicator_name TEXT,
-                    original_value TEXT,
-                    consensus_value TEXT,
-                    consensus_confidence REAL,
-                    expert_agreement REAL,
-                    response_count INTEGER,
-                    validation_method TEXT,
-                    final_status TEXT,
-                    consensus_date TEXT
-                )
+        # Consensus results table
+        self.cache.create_table(
             """
+            CREATE TABLE IF NOT EXISTS validation_consensus (
+                request_id TEXT PRIMARY KEY,
+                country_code TEXT,
+                indicator_name TEXT,
+                original_value TEXT,
+                consensus_value TEXT,
+                consensus_confidence REAL,
+                expert_agreement REAL,
+                response_count INTEGER,
+                validation_method TEXT,
+                final_status TEXT,
+                consensus_date TEXT
             )
+        """,
+            indexes=[
+                ("validation_consensus", ["country_code", "indicator_name"]),
+                ("validation_consensus", ["final_status"]),
+            ],
+        )
 
         self.cache_db_path = cache_db_path
 
@@ -543,20 +557,9 @@ class ExpertValidationSystem:
         """
         logger.info("Calculating expert consensus for validation requests")
 
-        consensus_results = []
-
-        # Group responses by request
-        responses_by_request = {}
-        for response in expert_responses:
-            if response.request_id not in responses_by_request:
-                responses_by_request[response.request_id] = []
-            responses_by_request[response.request_id].append(response)
-
-        for request in validation_requests:
-            if request.request_id in responses_by_request:
-                responses = responses_by_request[request.request_id]
-                consensus = self._calculate_request_consensus(request, responses)
-                consensus_results.append(consensus)
+        consensus_results = self._compute_consensus(
+            validation_requests, expert_responses
+        )
 
         # Cache consensus results
         self._cache_consensus_results(consensus_results)
@@ -564,6 +567,167 @@ class ExpertValidationSystem:
         logger.info(f"Generated {len(consensus_results)} consensus results")
         return consensus_results
 
+    def _compute_consensus(
+        self,
+        validation_requests: List[ValidationRequest],
+        expert_responses: List[ExpertResponse],
+    ) -> List[ValidationConsensus]:
+        """
+        Compute consensus for all requests at once
+
+        Responses are loaded into a columnar frame ordered by request. Requests
+        with the same response count are stacked into a dense matrix, so
+        weighted confidence, median, dispersion and agreement are row-wise
+        NumPy reductions. Binary majorities come from one grouped count over
+        (request, value). Results match _calculate_request_consensus.
+        """
+        if not validation_requests or not expert_responses:
+            return []
+
+        requests_by_id = {}
+        for request in validation_requests:
+            requests_by_id.setdefault(request.request_id, request)
+        request_index = pd.Index(list(requests_by_id.keys()))
+        is_policy = np.array(
+            [r.indicator_type == "policy" for r in requests_by_id.values()]
+        )
+
+        reliability = {
+            expert_id: info["reliability_score"]
+            for expert_id, info in self.EXPERT_NETWORK.items()
+        }
+        frame = pd.DataFrame(
+            {
+                "code": request_index.get_indexer(
+                    [r.request_id for r in expert_responses]
+                ),
+                "value": pd.Series(
+                    [r.validated_value for r in expert_responses], dtype=object
+                ),
+                "confidence": [r.confidence_rating for r in expert_responses],
+                "weight": [reliability.get(r.expert_id, 0.8) for r in expert_responses],
+            }
+        )
+        frame = frame[frame["code"] >= 0].sort_values("code", kind="stable")
+
+        n_requests = len(request_index)
+        codes = frame["code"].to_numpy()
+        counts = np.bincount(codes, minlength=n_requests)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        frame["position"] = np.arange(len(frame)) - starts[codes]
+
+        confidence = frame["confidence"].to_numpy(dtype=float)
+        weight = frame["weight"].to_numpy(dtype=float)
+        values = frame["value"].to_numpy()
+
+        consensus_confidence = np.full(n_requests, np.nan)
+        agreement = np.full(n_requests, np.nan)
+        rounded_agreement = np.empty(n_requests, dtype=object)
+        consensus_values = np.empty(n_requests, dtype=object)
+
+        minimum = self.CONSENSUS_THRESHOLDS["minimum_responses"]
+        for size in np.unique(counts[counts >= minimum]):
+            rows = np.flatnonzero(counts == size)
+            cells = starts[rows][:, None] + np.arange(size)
+
+            consensus_confidence[rows] = (confidence[cells] * weight[cells]).sum(
+                axis=1
+            ) / weight[cells].sum(axis=1)
+
+            numeric_rows = rows[~is_policy[rows]]
+            if len(numeric_rows):
+                numeric = values[starts[numeric_rows][:, None] + np.arange(size)]
+                numeric = numeric.astype(float)
+                mean_val = numeric.mean(axis=1)
+                std_val = numeric.std(axis=1)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    numeric_agreement = np.where(
+                        mean_val > 0,
+                        np.maximum(0, 1 - std_val / mean_val),
+                        np.where(std_val == 0, 1.0, 0.5),
+                    )
+                agreement[numeric_rows] = numeric_agreement
+                rounded_agreement[numeric_rows] = np.round(numeric_agreement, 2)
+                consensus_values[numeric_rows] = np.median(numeric, axis=1).tolist()
+
+        # Binary majority: most common value, ties broken by first response
+        policy_mask = is_policy[codes] & (counts[codes] >= minimum)
+        if policy_mask.any():
+            tallies = (
+                frame[policy_mask]
+                .groupby(["code", "value"], sort=False)["position"]
+                .agg(["size", "min"])
+                .reset_index()
+                .sort_values(["code", "size", "min"], ascending=[True, False, True])
+                .drop_duplicates("code")
+            )
+            policy_rows = tallies["code"].to_numpy()
+            policy_agreement = tallies["size"].to_numpy() / counts[policy_rows]
+            agreement[policy_rows] = policy_agreement
+            rounded_agreement[policy_rows] = [
+                round(a, 2) for a in policy_agreement.tolist()
+            ]
+            consensus_values[policy_rows] = tallies["value"].tolist()
+
+        final_status = np.select(
+            [
+                (agreement >= self.CONSENSUS_THRESHOLDS["agreement_threshold"])
+                & (
+                    consensus_confidence
+                    >= self.CONSENSUS_THRESHOLDS["confidence_threshold"]
+                ),
+                agreement < 0.5,
+            ],
+            [ValidationStatus.VALIDATED, ValidationStatus.DISPUTED],
+            default=ValidationStatus.IN_REVIEW,
+        )
+
+        consensus_date = datetime.now().isoformat()
+        consensus_results = []
+        rows_by_id = {request_id: row for row, request_id in enumerate(requests_by_id)}
+        for request in validation_requests:
+            row = rows_by_id[request.request_id]
+            response_count = int(counts[row])
+            if response_count == 0:
+                continue
+
+            if response_count < minimum:
+                # Insufficient responses
+                consensus_results.append(
+                    ValidationConsensus(
+                        request_id=request.request_id,
+                        country_code=request.country_code,
+                        indicator_name=request.indicator_name,
+                        original_value=request.current_value,
+                        consensus_value=request.current_value,
+                        consensus_confidence=request.confidence_score,
+                        expert_agreement=0.0,
+                        response_count=response_count,
+                        validation_method="insufficient_responses",
+                        final_status=ValidationStatus.PENDING,
+                        consensus_date=consensus_date,
+                    )
+                )
+                continue
+
+            consensus_results.append(
+                ValidationConsensus(
+                    request_id=request.request_id,
+                    country_code=request.country_code,
+                    indicator_name=request.indicator_name,
+                    original_value=request.current_value,
+                    consensus_value=consensus_values[row],
+                    consensus_confidence=round(float(consensus_confidence[row]), 2),
+                    expert_agreement=rounded_agreement[row],
+                    response_count=response_count,
+                    validation_method="expert_consensus",
+                    final_status=final_status[row],
+                    consensus_date=consensus_date,
+                )
+            )
+
+        return consensus_results
+
     def _calculate_request_consensus(
         self, request: ValidationRequest, responses: List[ExpertResponse]
     ) -> ValidationConsensus:
@@ -682,88 +846,111 @@ class ExpertValidationSystem:
 
     def _cache_validation_requests(self, requests: List[ValidationRequest]):
         """Cache validation requests to database"""
-        with sqlite3.connect(self.cache_db_path) as conn:
-            for request in requests:
-                evidence_json = json.dumps(request.evidence_provided)
-                target_experts_json = json.dumps(request.target_experts)
-
-                conn.execute(
-                    """
-                    INSERT INTO validation_requests 
-                    (request_id, country_code, indicator_name, indicator_type, current_value,
-                     confidence_score, evidence_provided, validation_question, target_experts,
-                     priority_level, deadline, status, creation_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        request.request_id,
-                        request.country_code,
-                        request.indicator_name,
-                        request.indicator_type,
-                        str(request.current_value),
-                        request.confidence_score,
-                        evidence_json,
-                        request.validation_question,
-                        target_experts_json,
-                        request.priority_level,
-                        request.deadline,
-                        request.status.value,
-                        request.creation_date,
-                    ),
+        self.cache.upsert_many(
+            "validation_requests",
+            [
+                "request_id",
+                "country_code",
+                "indicator_name",
+                "indicator_type",
+                "current_value",
+                "confidence_score",
+                "evidence_provided",
+                "validation_question",
+                "target_experts",
+                "priority_level",
+                "deadline",
+                "status",
+                "creation_date",
+            ],
+            (
+                (
+                    request.request_id,
+                    request.country_code,
+                    request.indicator_name,
+                    request.indicator_type,
+                    str(request.current_value),
+                    request.confidence_score,
+                    json.dumps(request.evidence_provided),
+                    request.validation_question,
+                    json.dumps(request.target_experts),
+                    request.priority_level,
+                    request.deadline,
+                    request.status.value,
+                    request.creation_date,
                 )
+                for request in requests
+            ),
+            conflict_columns=["request_id"],
+        )
 
     def _cache_expert_responses(self, responses: List[ExpertResponse]):
         """Cache expert responses to database"""
-        with sqlite3.connect(self.cache_db_path) as conn:
-            for response in responses:
-                evidence_json = json.dumps(response.additional_evidence)
-
-                conn.execute(
-                    """
-                    INSERT INTO expert_responses 
-                    (response_id, request_id, expert_id, validated_value, confidence_rating,
-                     reasoning, additional_evidence, certainty_level, response_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        response.response_id,
-                        response.request_id,
-                        response.expert_id,
-                        str(response.validated_value),
-                        response.confidence_rating,
-                        response.reasoning,
-                        evidence_json,
-                        response.certainty_level,
-                        response.response_date,
-                    ),
+        self.cache.upsert_many(
+            "expert_responses",
+            [
+                "response_id",
+                "request_id",
+                "expert_id",
+                "validated_value",
+                "confidence_rating",
+                "reasoning",
+                "additional_evidence",
+                "certainty_level",
+                "response_date",
+            ],
+            (
+                (
+                    response.response_id,
+                    response.request_id,
+                    response.expert_id,
+                    str(response.validated_value),
+                    response.confidence_rating,
+                    response.reasoning,
+                    json.dumps(response.additional_evidence),
+                    response.certainty_level,
+                    response.response_date,
                 )
+                for response in responses
+            ),
+            conflict_columns=["response_id"],
+        )
 
     def _cache_consensus_results(self, consensus_results: List[ValidationConsensus]):
         """Cache consensus results to database"""
-        with sqlite3.connect(self.cache_db_path) as conn:
-            for consensus in consensus_results:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO validation_consensus 
-                    (request_id, country_code, indicator_name, original_value, consensus_value,
-                     consensus_confidence, expert_agreement, response_count, validation_method,
-                     final_status, consensus_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        consensus.request_id,
-                        consensus.country_code,
-                        consensus.indicator_name,
-                        str(consensus.original_value),
-                        str(consensus.consensus_value),
-                        consensus.consensus_confidence,
-                        consensus.expert_agreement,
-                        consensus.response_count,
-                        consensus.validation_method,
-                        consensus.final_status.value,
-                        consensus.consensus_date,
-                    ),
+        self.cache.upsert_many(
+            "validation_consensus",
+            [
+                "request_id",
+                "country_code",
+                "indicator_name",
+                "original_value",
+                "consensus_value",
+                "consensus_confidence",
+                "expert_agreement",
+                "response_count",
+                "validation_method",
+                "final_status",
+                "consensus_date",
+            ],
+            (
+                (
+                    consensus.request_id,
+                    consensus.country_code,
+                    consensus.indicator_name,
+                    str(consensus.original_value),
+                    str(consensus.consensus_value),
+                    consensus.consensus_confidence,
+                    consensus.expert_agreement,
+                    consensus.response_count,
+                    consensus.validation_method,
+                    consensus.final_status.value,
+                    consensus.consensus_date,
                 )
+                for consensus in consensus_results
+            ),
+            conflict_columns=["request_id"],
+        )
 
     def generate_validation_report(
         self,
@@ -955,5 +1142,116 @@ def main():
     print(f"\nDetailed validation report saved to: {report_path}")
 
 
+def generate_synthetic_validation_batch(
+    n_requests: int = 10000, responses_per_request: int = 5, seed: int = 42
+) -> Tuple[List[ValidationRequest], List[ExpertResponse]]:
+    """Build synthetic validation requests and responses for benchmarking"""
+    rng = np.random.default_rng(seed)
+    expert_ids = list(ExpertValidationSystem.EXPERT_NETWORK.keys()) + ["expert_999"]
+    now = datetime.now().isoformat()
+
+    requests = []
+    responses = []
+    for i in range(n_requests):
+        is_policy = i % 2 == 0
+        current_value = bool(rng.random() < 0.5) if is_policy else rng.uniform(0, 100)
+        request = ValidationRequest(
+            request_id=f"request_{i:06d}",
+            country_code="KEN",
+            indicator_name="national_ai_strategy" if is_policy else "ecosystem_score",
+            indicator_type="policy" if is_policy else "ecosystem",
+            current_value=current_value,
+            confidence_score=float(rng.uniform(0.4, 1.0)),
+            evidence_provided=[],
+            validation_question="",
+            target_experts=[],
+            priority_level="medium",
+            deadline=now,
+            status=ValidationStatus.PENDING,
+            creation_date=now,
+        )
+        requests.append(request)
+
+        for j in range(responses_per_request):
+            if is_policy:
+                validated_value = (
+                    current_value if rng.random() < 0.7 else not current_value
+                )
+            else:
+                validated_value = float(
+                    np.clip(current_value + rng.normal(0, 10), 0, 100)
+                )
+            responses.append(
+                ExpertResponse(
+                    response_id=f"response_{i:06d}_{j}",
+                    request_id=request.request_id,
+                    expert_id=expert_ids[rng.integers(len(expert_ids))],
+                    validated_value=validated_value,
+                    confidence_rating=float(rng.uniform(0.5, 1.0)),
+                    reasoning="",
+                    additional_evidence=[],
+                    certainty_level="certain",
+                    response_date=now,
+                )
+            )
+
+    return requests, responses
+
+
+def benchmark_consensus(
+    n_requests: int = 10000, responses_per_request: int = 5
+) -> Dict[str, Any]:
+    """Compare vectorized consensus against the per-request implementation"""
+    import tempfile
+    import time
+
+    requests, responses = generate_synthetic_validation_batch(
+        n_requests, responses_per_request
+    )
+
+    with tempfile.TemporaryDirectory() as validation_dir:
+        system = ExpertValidationSystem(validation_dir=validation_dir)
+
+        start = time.perf_counter()
+        responses_by_request = {}
+        for response in responses:
+            responses_by_request.setdefault(response.request_id, []).append(response)
+        reference = [
+            system._calculate_request_consensus(
+                request, responses_by_request[request.request_id]
+            )
+            for request in requests
+            if request.request_id in responses_by_request
+        ]
+        reference_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectorized = system._compute_consensus(requests, responses)
+        vectorized_seconds = time.perf_counter() - start
+
+    def comparable(consensus: ValidationConsensus) -> Dict[str, Any]:
+        result = asdict(consensus)
+        result.pop("consensus_date")
+        return result
+
+    mismatches = sum(
+        comparable(a) != comparable(b) for a, b in zip(reference, vectorized)
+    ) + abs(len(reference) - len(vectorized))
+
+    return {
+        "requests": n_requests,
+        "responses": len(responses),
+        "reference_seconds": round(reference_seconds, 4),
+        "vectorized_seconds": round(vectorized_seconds, 4),
+        "speedup": round(reference_seconds / vectorized_seconds, 1),
+        "mismatches": mismatches,
+    }
+
+
 if __name__ == "__main__":
-    main()
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        print(json.dumps(benchmark_consensus(), indent=2))
+    else:
+        main()
@@ -14,9 +14,7 @@ from config.settings import settings
 from loguru import logger
 from pydantic import BaseModel
 from services.database_service import DatabaseService
-from services.deduplication_service import DeduplicationService
-
-from services.etl_deduplication import check_and_handle_publication_duplicates
+from services.deduplication_service import DeduplicationService, generate_paper_id
 
 
 class ArxivPaper(BaseModel):
@@ -430,64 +428,45 @@ class ArxivScraper:
 
         # Store papers in database
         if result_papers:
-            stored_papers = await self._store_papers_in_database(result_papers)
-            logger.info(f"✅ Stored {len(stored_papers)} papers in database")
+            await self._store_papers_in_database(result_papers)
 
         return result_papers
 
     async def _store_papers_in_database(
         self, papers: List[ArxivPaper]
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, int]:
         """Store ArXiv papers in Supabase database as publications"""
 
-        stored_records = []
-
-        for paper in papers:
-            try:
-                # Convert ArXiv paper to publication format
-                publication_data = {
-                    "title": paper.title,
-                    "publication_type": "preprint",
-                    "publication_date": (
-                        paper.published_date.date() if paper.published_date else None
-                    ),
-                    "year": paper.published_date.year if paper.published_date else None,
-                    "url": paper.url,
-                    "venue": "arXiv",
-                    "abstract": paper.abstract,
-                    "keywords": paper.keywords + paper.categories,
-                    "source": "arxiv",
-                    "source_id": paper.arxiv_id,
-                    "african_relevance_score": paper.african_relevance_score,
-                    "ai_relevance_score": paper.ai_relevance_score,
-                    "african_entities": paper.african_entities,
-                    "data_type": "Academic Paper",
-                }
-
-                # Store in database with deduplication
-                success, stored_record = await check_and_handle_publication_duplicates(
-                    publication_data
-                )
-                action = "processed"
-
-                if success and stored_record:
-                    stored_records.append(stored_record)
-                    logger.info(
-                        f"✅ Stored ArXiv paper ({action}): {paper.title[:50]}..."
-                    )
-                elif not success:
-                    logger.info(
-                        f"ℹ️ ArXiv paper handling ({action}): {paper.title[:50]}..."
-                    )
+        publications = [
+            {
+                "title": paper.title,
+                "publication_type": "preprint",
+                "publication_date": (
+                    paper.published_date.date() if paper.published_date else None
+                ),
+                "year": paper.published_date.year if paper.published_date else None,
+                "url": paper.url,
+                "venue": "arXiv",
+                "abstract": paper.abstract,
+                "keywords": paper.keywords + paper.categories,
+                "source": "arxiv",
+                "source_id": generate_paper_id({"arxiv_id": paper.arxiv_id}),
+                "arxiv_id": paper.arxiv_id,
+                "african_relevance_score": paper.african_relevance_score,
+                "ai_relevance_score": paper.ai_relevance_score,
+                "african_entities": paper.african_entities,
+                "data_type": "Academic Paper",
+            }
+            for paper in papers
+        ]
 
-            except Exception as e:
-                logger.error(f"❌ Error storing ArXiv paper {paper.title[:50]}: {e}")
-                continue
+        counts = await self.db_service.bulk_upsert_publications(publications)
 
         logger.info(
-            f"📊 ArXiv database storage complete: {len(stored_records)}/{len(papers)} papers stored"
+            f"📊 ArXiv database storage complete: {counts['inserted']} inserted, "
+            f"{counts['updated']} updated, {counts['skipped']} skipped of {len(papers)} papers"
         )
-        return stored_records
+        return counts
 
 
 async def scrape_arxiv_papers(
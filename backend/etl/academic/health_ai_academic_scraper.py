@@ -13,6 +13,8 @@ import feedparser
 from config.settings import settings
 from loguru import logger
 from pydantic import BaseModel
+from services.database_service import DatabaseService
+from services.deduplication_service import generate_paper_id
 
 
 class HealthAIPaper(BaseModel):
@@ -229,6 +231,8 @@ class HealthAIAcademicScraper:
             "crossref": settings.CROSSREF_BASE_URL,
         }
 
+        self.db_service = DatabaseService()
+
     async def __aenter__(self):
         self.session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=settings.CRAWL4AI_TIMEOUT)
@@ -549,6 +553,61 @@ class HealthAIAcademicScraper:
 
         return list(set(keywords))[:20]  # Limit to 20 most relevant
 
+    async def _store_papers_in_database(
+        self, papers: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """Store health AI papers in Supabase database as publications"""
+
+        publications = []
+        for paper in papers:
+            published_date = paper.get("published_date")
+            publications.append(
+                {
+                    "title": paper.get("title", ""),
+                    "publication_type": (
+                        "preprint"
+                        if paper.get("source") == "arxiv"
+                        else "journal_paper"
+                    ),
+                    "publication_date": (
+                        published_date.date() if published_date else None
+                    ),
+                    "year": published_date.year if published_date else None,
+                    "doi": paper.get("doi"),
+                    "url": paper.get("url"),
+                    "abstract": paper.get("abstract", ""),
+                    "keywords": paper.get("keywords", []) + paper.get("categories", []),
+                    "source": paper.get("source", "arxiv"),
+                    "source_id": generate_paper_id(
+                        {
+                            "doi": paper.get("doi"),
+                            "arxiv_id": (
+                                paper.get("paper_id")
+                                if paper.get("source") == "arxiv"
+                                else None
+                            ),
+                            "title": paper.get("title"),
+                            "year": published_date.year if published_date else None,
+                        }
+                    ),
+                    # Scores here are 0-100; publications store 0-1
+                    "african_relevance_score": paper.get("african_relevance_score", 0)
+                    / 100,
+                    "ai_relevance_score": paper.get("health_ai_infrastructure_score", 0)
+                    / 100,
+                    "african_entities": paper.get("african_entities", []),
+                    "data_type": "Academic Paper",
+                }
+            )
+
+        counts = await self.db_service.bulk_upsert_publications(publications)
+
+        logger.info(
+            f"📊 Health AI database storage complete: {counts['inserted']} inserted, "
+            f"{counts['updated']} updated, {counts['skipped']} skipped of {len(papers)} papers"
+        )
+        return counts
+
     def parse_pubmed_response(self, xml_content: str) -> List[Dict[str, Any]]:
         """Parse PubMed XML response (simplified implementation)"""
         # This would require more sophisticated XML parsing for PubMed
@@ -567,6 +626,9 @@ async def scrape_health_ai_infrastructure_papers(
 
         logger.info(f"Scraped {len(papers)} health AI infrastructure papers")
 
+        if papers:
+            await scraper._store_papers_in_database(papers)
+
         return papers
 
 
@@ -12,7 +12,10 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 from loguru import logger
 from services.database_service import DatabaseService
-from services.deduplication_service import DeduplicationService
+from services.deduplication_service import (
+    DeduplicationService,
+    generate_paper_id,
+)
 from services.etl_deduplication import check_and_handle_publication_duplicates
 
 
@@ -506,7 +509,7 @@ async def main():
                         "abstract": study.get("abstract", ""),
                         "keywords": study.get("keywords", []),
                         "source": "systematic_review",
-                        "source_id": f"sr_{hash(study.get('title', ''))}_{study.get('year', 'unknown')}",
+                        "source_id": generate_paper_id(study),
                         "project_domain": study.get("project_domain", ""),
                         "ai_techniques": study.get("ai_techniques", ""),
                         "geographic_scope": study.get("geographic_scope", ""),
@@ -4,16 +4,18 @@ Medical and health AI research scraper
 """
 
 import asyncio
+import io
+import time
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import aiohttp
+from config.settings import settings
 from loguru import logger
 from pydantic import BaseModel
 from services.database_service import DatabaseService
-from services.deduplication_service import DeduplicationService
-from services.etl_deduplication import check_and_handle_publication_duplicates
+from services.deduplication_service import DeduplicationService, generate_paper_id
 
 
 class PubMedPaper(BaseModel):
@@ -37,9 +39,28 @@ class PubMedScraper:
     """PubMed API scraper for African health AI research"""
 
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+    TOOL = "taifa-fiala"
+    EMAIL = "research@taifa-fiala.org"  # Required by PubMed
 
-    def __init__(self):
+    # NCBI E-utilities allow 3 requests/second without a key, 10 with one
+    REQUESTS_PER_SECOND = 3
+    REQUESTS_PER_SECOND_WITH_KEY = 10
+
+    FETCH_BATCH_SIZE = 500
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, api_key: Optional[str] = None):
         self.session = None
+        self.api_key = api_key if api_key is not None else settings.PUBMED_API_KEY
+
+        rate = (
+            self.REQUESTS_PER_SECOND_WITH_KEY
+            if self.api_key
+            else self.REQUESTS_PER_SECOND
+        )
+        self.min_request_interval = 1.0 / rate
+        self._rate_lock = asyncio.Lock()
+        self._last_request_at = 0.0
 
         # Initialize database and deduplication services
         self.db_service = DatabaseService()
@@ -122,17 +143,22 @@ class PubMedScraper:
 
         logger.info(f"Searching PubMed with query: {full_query[:100]}...")
 
-        # Search for PMIDs
-        pmids = await self._search_pmids(full_query, max_results)
+        # Search on the history server, then page through the stored results
+        history = await self._esearch(full_query, max_results)
 
-        if not pmids:
+        if not history.get("count"):
             logger.info("No PMIDs found")
             return []
 
-        logger.info(f"Found {len(pmids)} PMIDs, fetching details...")
+        history["total"] = min(history["count"], max_results)
+        logger.info(
+            f"Found {history['count']} PMIDs, fetching details for {history['total']}..."
+        )
 
         # Fetch paper details
-        papers = await self._fetch_paper_details(pmids)
+        papers = await self._fetch_paper_details(
+            history["idlist"][: history["total"]], history=history
+        )
 
         # Score for African and AI relevance
         scored_papers = []
@@ -152,94 +178,148 @@ class PubMedScraper:
         logger.info(f"Filtered to {len(scored_papers)} highly relevant papers")
         return scored_papers
 
-    async def _search_pmids(self, query: str, max_results: int) -> List[str]:
-        """Search PubMed for PMIDs"""
+    def _base_params(self) -> Dict[str, Any]:
+        """Parameters sent with every E-utilities request"""
+        params = {"db": "pubmed", "tool": self.TOOL, "email": self.EMAIL}
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return params
+
+    async def _wait_for_rate_limit(self):
+        """Space requests according to the NCBI rate limit for this key"""
+        async with self._rate_lock:
+            wait = self._last_request_at + self.min_request_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request_at = time.monotonic()
+
+    async def _esearch(self, query: str, max_results: int) -> Dict[str, Any]:
+        """Run esearch on the history server, returning count, WebEnv and query_key"""
         search_url = f"{self.BASE_URL}/esearch.fcgi"
 
         params = {
-            "db": "pubmed",
+            **self._base_params(),
             "term": query,
-            "retmax": max_results,
+            "retmax": min(max_results, self.FETCH_BATCH_SIZE),
             "retmode": "json",
             "sort": "pub_date",
-            "tool": "taifa-fiala",
-            "email": "research@taifa-fiala.org",  # Required by PubMed
+            "usehistory": "y",
         }
 
         try:
+            await self._wait_for_rate_limit()
             async with self.session.get(search_url, params=params) as response:
                 if response.status == 200:
                     data = await response.json()
-                    return data.get("esearchresult", {}).get("idlist", [])
+                    result = data.get("esearchresult", {})
+                    return {
+                        "count": int(result.get("count", 0)),
+                        "webenv": result.get("webenv"),
+                        "query_key": result.get("querykey"),
+                        "idlist": result.get("idlist", []),
+                    }
                 else:
                     logger.error(f"PubMed search failed: {response.status}")
-                    return []
+                    return {}
 
         except Exception as e:
             logger.error(f"Error searching PubMed: {e}")
-            return []
+            return {}
 
-    async def _fetch_paper_details(self, pmids: List[str]) -> List[PubMedPaper]:
-        """Fetch detailed paper information"""
-        if not pmids:
-            return []
+    async def _search_pmids(self, query: str, max_results: int) -> List[str]:
+        """Search PubMed for PMIDs"""
+        result = await self._esearch(query, max_results)
+        return result.get("idlist", [])[:max_results]
 
-        fetch_url = f"{self.BASE_URL}/efetch.fcgi"
+    async def _fetch_paper_details(
+        self, pmids: Optional[List[str]] = None, history: Optional[Dict] = None
+    ) -> List[PubMedPaper]:
+        """Fetch detailed paper information
+
+        With ``history`` (an esearch result), pages through the stored result
+        set with WebEnv/query_key; otherwise posts explicit PMID batches.
+        """
+        if history and history.get("webenv") and history.get("query_key"):
+            total = history.get("total", history.get("count", 0))
+            requests = [
+                {
+                    "WebEnv": history["webenv"],
+                    "query_key": history["query_key"],
+                    "retstart": start,
+                    "retmax": min(self.FETCH_BATCH_SIZE, total - start),
+                }
+                for start in range(0, total, self.FETCH_BATCH_SIZE)
+            ]
+        elif pmids:
+            requests = [
+                {"id": ",".join(pmids[i : i + self.FETCH_BATCH_SIZE])}
+                for i in range(0, len(pmids), self.FETCH_BATCH_SIZE)
+            ]
+        else:
+            return []
 
-        # Process in batches to avoid overwhelming the API
-        batch_size = 20
         all_papers = []
+        for batch_params in requests:
+            batch = await self._fetch_batch(batch_params)
+            all_papers.extend(batch)
+            logger.info(f"Fetched {len(all_papers)} PubMed records so far")
 
-        for i in range(0, len(pmids), batch_size):
-            batch_pmids = pmids[i : i + batch_size]
+        return all_papers
 
-            params = {
-                "db": "pubmed",
-                "id": ",".join(batch_pmids),
-                "retmode": "xml",
-                "tool": "taifa-fiala",
-                "email": "research@taifa-fiala.org",
-            }
+    async def _fetch_batch(self, batch_params: Dict[str, Any]) -> List[PubMedPaper]:
+        """Fetch one efetch page, parsing articles as the response streams in"""
+        fetch_url = f"{self.BASE_URL}/efetch.fcgi"
+        data = {**self._base_params(), **batch_params, "retmode": "xml"}
 
-            try:
-                await asyncio.sleep(0.5)  # Respectful rate limiting
+        papers = []
+        try:
+            await self._wait_for_rate_limit()
+
+            # POST keeps long PMID lists out of the URL
+            async with self.session.post(fetch_url, data=data) as response:
+                if response.status != 200:
+                    logger.error(f"PubMed fetch failed: {response.status}")
+                    return []
 
-                async with self.session.get(fetch_url, params=params) as response:
-                    if response.status == 200:
-                        xml_content = await response.text()
-                        papers = self._parse_pubmed_xml(xml_content)
-                        all_papers.extend(papers)
-                    else:
-                        logger.error(f"PubMed fetch failed: {response.status}")
+                parser = ET.XMLPullParser(events=("end",))
+                async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                    parser.feed(chunk)
+                    papers.extend(self._iter_articles(parser.read_events()))
+                parser.close()
+                papers.extend(self._iter_articles(parser.read_events()))
 
-            except Exception as e:
-                logger.error(f"Error fetching PubMed batch: {e}")
-                continue
+        except Exception as e:
+            logger.error(f"Error fetching PubMed batch: {e}")
 
-        return all_papers
+        return papers
 
     def _parse_pubmed_xml(self, xml_content: str) -> List[PubMedPaper]:
         """Parse PubMed XML response"""
         papers = []
 
         try:
-            root = ET.fromstring(xml_content)
-            articles = root.findall("PubmedArticle")
-
-            for article in articles:
-                try:
-                    paper = self._extract_paper_data_from_xml(article)
-                    if paper:
-                        papers.append(paper)
-                except Exception as e:
-                    logger.warning(f"Error parsing paper: {e}")
-                    continue
-
+            events = ET.iterparse(io.BytesIO(xml_content.encode("utf-8")))
+            papers.extend(self._iter_articles(events))
         except Exception as e:
             logger.error(f"Error parsing PubMed XML: {e}")
 
         return papers
 
+    def _iter_articles(self, events) -> Iterator[PubMedPaper]:
+        """Yield papers from (event, element) pairs, clearing each article once read"""
+        for _, elem in events:
+            if elem.tag != "PubmedArticle":
+                continue
+
+            try:
+                paper = self._extract_paper_data_from_xml(elem)
+                if paper:
+                    yield paper
+            except Exception as e:
+                logger.warning(f"Error parsing paper: {e}")
+            finally:
+                elem.clear()
+
     def _extract_paper_data_from_xml(
         self, article: ET.Element
     ) -> Optional[PubMedPaper]:
@@ -483,64 +563,39 @@ class PubMedScraper:
 
     async def _store_papers_in_database(
         self, papers: List[PubMedPaper]
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, int]:
         """Store PubMed papers in Supabase database as publications"""
 
-        stored_records = []
-
-        for paper in papers:
-            try:
-                # Convert PubMed paper to publication format
-                publication_data = {
-                    "title": paper.title,
-                    "publication_type": "journal_paper",
-                    "publication_date": paper.publication_date,
-                    "year": (
-                        paper.publication_date.year if paper.publication_date else None
-                    ),
-                    "doi": paper.doi,
-                    "url": paper.url,
-                    "journal": paper.journal,
-                    "abstract": paper.abstract,
-                    "keywords": paper.keywords,
-                    "source": "pubmed",
-                    "source_id": paper.pubmed_id,
-                    "african_relevance_score": paper.african_relevance_score,
-                    "ai_relevance_score": paper.ai_relevance_score,
-                    "african_entities": paper.african_entities,
-                    "data_type": "Academic Paper",
-                }
-
-                # Store in database with deduplication
-                (
-                    success,
-                    stored_record,
-                    action,
-                ) = await check_and_handle_publication_duplicates(
-                    publication_data,
-                    self.db_service,
-                    self.dedup_service,
-                    action="reject",  # Can be configured: reject, merge, update, link
-                )
-
-                if success and stored_record:
-                    stored_records.append(stored_record)
-                    logger.info(
-                        f"✅ Stored PubMed paper ({action}): {paper.title[:50]}..."
-                    )
-                elif not success:
-                    logger.info(
-                        f"ℹ️ PubMed paper handling ({action}): {paper.title[:50]}..."
-                    )
+        publications = [
+            {
+                "title": paper.title,
+                "publication_type": "journal_paper",
+                "publication_date": paper.publication_date,
+                "year": (
+                    paper.publication_date.year if paper.publication_date else None
+                ),
+                "doi": paper.doi,
+                "url": paper.url,
+                "journal": paper.journal,
+                "abstract": paper.abstract,
+                "keywords": paper.keywords or paper.mesh_terms,
+                "source": "pubmed",
+                "source_id": generate_paper_id({"doi": paper.doi, "pmid": paper.pmid}),
+                "pmid": paper.pmid,
+                "african_relevance_score": paper.african_relevance_score,
+                "ai_relevance_score": paper.ai_relevance_score,
+                "data_type": "Academic Paper",
+            }
+            for paper in papers
+        ]
 
-            except Exception as e:
-                logger.error(f"❌ Error storing PubMed paper {paper.title[:50]}: {e}")
-                continue
+        counts = await self.db_service.bulk_upsert_publications(publications)
 
         logger.info(
-            f"📊 PubMed database storage complete: {len(stored_records)}/{len(papers)} papers stored"
+            f"📊 PubMed database storage complete: {counts['inserted']} inserted, "
+            f"{counts['updated']} updated, {counts['skipped']} skipped of {len(papers)} papers"
         )
-        return stored_records
+        return counts
 
 
 # Main scraping function
@@ -553,10 +608,7 @@ async def scrape_pubmed_papers(
 
         # Store papers in database with deduplication
         if papers:
-            stored_papers = await scraper._store_papers_in_database(papers)
-            logger.info(
-                f"📊 PubMed database storage complete: {len(stored_papers)}/{len(papers)} papers stored"
-            )
+            await scraper._store_papers_in_database(papers)
 
     logger.info(f"PubMed scraper found {len(papers)} relevant African health AI papers")
     return papers
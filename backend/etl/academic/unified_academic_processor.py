@@ -8,8 +8,9 @@ Adapted from TAIFA-FIALA for African Health AI Infrastructure Index
 import asyncio
 import json
 import re
+import time
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
 
 from loguru import logger
 
@@ -17,6 +18,11 @@ from loguru import logger
 from .arxiv_scraper import ArxivScraper
 from .pubmed_scraper import PubMedScraper
 from .systematic_review_processor import SystematicReviewProcessor
+from services.deduplication_service import (
+    PaperDedupIndex,
+    generate_paper_id,
+    normalize_title,
+)
 from services.serpapi_service import SerpAPIService  # Google Scholar via SerpAPI
 
 
@@ -220,80 +226,118 @@ class HealthAIInfrastructureExtractor:
 class UnifiedAcademicProcessor:
     """Unified processor combining all academic data sources"""
 
-    def __init__(self):
+    def __init__(self, source_timeout: float = 600.0):
         self.all_papers = []
         self.source_statistics = {}
+        self.source_timings = {}
+        self.source_timeout = source_timeout
 
     async def collect_all_academic_data(
         self, max_results_per_source: int = 200
     ) -> List[Dict[str, Any]]:
-        """Collect data from all academic sources"""
+        """Collect data from all academic sources concurrently"""
         logger.info("🚀 Starting Unified Academic Data Collection...")
 
-        all_papers = []
-
-        # 1. Process Systematic Review Data (existing curated studies)
-        logger.info("📚 Processing Systematic Review...")
-        try:
-            systematic_papers = await self.process_systematic_review()
-            all_papers.extend(systematic_papers)
-            self.source_statistics["systematic_review"] = len(systematic_papers)
-            logger.info(
-                f"   ✅ Added {len(systematic_papers)} systematic review studies"
-            )
-        except Exception as e:
-            logger.error(f"   ❌ Error processing systematic review: {e}")
-            self.source_statistics["systematic_review"] = 0
+        # Sources share no state, so they run concurrently; each is bounded by
+        # its own timeout and a failure in one does not affect the others
+        sources: List[
+            Tuple[str, str, Callable[[], Awaitable[List[Dict[str, Any]]]]]
+        ] = [
+            (
+                "systematic_review",
+                "📚 Systematic Review",
+                self.process_systematic_review,
+            ),
+            (
+                "arxiv",
+                "📄 ArXiv Papers",
+                lambda: self.process_arxiv_papers(max_results_per_source),
+            ),
+            (
+                "pubmed",
+                "🏥 PubMed Medical Papers",
+                lambda: self.process_pubmed_papers(max_results_per_source),
+            ),
+            (
+                "google_scholar",
+                "🎓 Google Scholar Papers",
+                # Reduced due to API limits
+                lambda: self.process_scholar_papers(max_results_per_source // 4),
+            ),
+        ]
 
-        # 2. Collect ArXiv Papers
-        logger.info("📄 Processing ArXiv Papers...")
-        try:
-            arxiv_papers = await self.process_arxiv_papers(max_results_per_source)
-            all_papers.extend(arxiv_papers)
-            self.source_statistics["arxiv"] = len(arxiv_papers)
-            logger.info(f"   ✅ Added {len(arxiv_papers)} ArXiv papers")
-        except Exception as e:
-            logger.error(f"   ❌ Error processing ArXiv: {e}")
-            self.source_statistics["arxiv"] = 0
+        self.source_statistics = {}
+        self.source_timings = {}
+        dedup_index = PaperDedupIndex(self.is_better_paper)
+        duplicate_count = 0
 
-        # 3. Collect PubMed Papers
-        logger.info("🏥 Processing PubMed Medical Papers...")
-        try:
-            pubmed_papers = await self.process_pubmed_papers(max_results_per_source)
-            all_papers.extend(pubmed_papers)
-            self.source_statistics["pubmed"] = len(pubmed_papers)
-            logger.info(f"   ✅ Added {len(pubmed_papers)} PubMed papers")
-        except Exception as e:
-            logger.error(f"   ❌ Error processing PubMed: {e}")
-            self.source_statistics["pubmed"] = 0
+        tasks = [
+            asyncio.create_task(self._collect_source(name, label, collector))
+            for name, label, collector in sources
+        ]
 
-        # 4. Collect Google Scholar Papers
-        logger.info("🎓 Processing Google Scholar Papers...")
-        try:
-            scholar_papers = await self.process_scholar_papers(
-                max_results_per_source // 4
-            )  # Reduced due to API limits
-            all_papers.extend(scholar_papers)
-            self.source_statistics["google_scholar"] = len(scholar_papers)
-            logger.info(f"   ✅ Added {len(scholar_papers)} Google Scholar papers")
-        except Exception as e:
-            logger.error(f"   ❌ Error processing Google Scholar: {e}")
-            self.source_statistics["google_scholar"] = 0
+        # Deduplicate incrementally as each source finishes
+        for finished in asyncio.as_completed(tasks):
+            name, papers = await finished
+            duplicate_count += self.merge_papers(dedup_index, papers)
+            logger.info(f"   🔧 Merged {name}: {len(dedup_index)} unique papers so far")
 
-        # 5. Deduplicate and clean
-        logger.info("🔧 Deduplicating and cleaning data...")
-        cleaned_papers = self.deduplicate_papers(all_papers)
+        cleaned_papers = dedup_index.papers()
+        logger.info(
+            f"Removed {duplicate_count} duplicates, {len(cleaned_papers)} unique papers remain"
+        )
 
         self.all_papers = cleaned_papers
 
         logger.info(f"🎉 Unified Academic Collection Complete!")
         logger.info(f"   Total Papers Collected: {len(cleaned_papers)}")
         logger.info(f"   Sources: {self.source_statistics}")
+        logger.info(f"   Source timings: {self.source_timings}")
 
         return cleaned_papers
 
+    async def _collect_source(
+        self,
+        name: str,
+        label: str,
+        collector: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Run one source collector with a timeout, recording count and timing"""
+        logger.info(f"{label}: starting...")
+        start_time = time.perf_counter()
+        papers: List[Dict[str, Any]] = []
+        status = "completed"
+        error = None
+
+        try:
+            papers = await asyncio.wait_for(collector(), timeout=self.source_timeout)
+            logger.info(f"   ✅ Added {len(papers)} from {label}")
+        except asyncio.TimeoutError:
+            status = "timeout"
+            error = f"timed out after {self.source_timeout:g}s"
+            logger.error(f"   ❌ {label} {error}")
+        except Exception as e:
+            status = "failed"
+            error = str(e)
+            logger.error(f"   ❌ Error processing {label}: {e}")
+
+        self.source_statistics[name] = len(papers)
+        self.source_timings[name] = {
+            "status": status,
+            "papers": len(papers),
+            "duration_seconds": round(time.perf_counter() - start_time, 3),
+        }
+        if error:
+            self.source_timings[name]["error"] = error
+
+        return name, papers
+
     async def process_systematic_review(self) -> List[Dict[str, Any]]:
         """Process systematic review data"""
+        # CSV loading and cleaning is blocking work; keep it off the event loop
+        return await asyncio.to_thread(self._load_systematic_review)
+
+    def _load_systematic_review(self) -> List[Dict[str, Any]]:
         csv_path = "/Users/drjforrest/dev/devprojects/TAIFA-FIALA/data/Elicit - extract-results-review-b8c80b4e-9037-459f-9afb-d4c8b22f8553.csv"
 
         processor = SystematicReviewProcessor(csv_path)
@@ -446,61 +490,32 @@ class UnifiedAcademicProcessor:
             return None
 
     def generate_source_id(self, paper: Dict[str, Any], source: str) -> str:
-        """Generate a unique source ID"""
-        if source == "arxiv":
-            return f"arxiv:{paper.get('arxiv_id', '')}"
-        elif source == "pubmed":
-            return f"pubmed:{paper.get('pmid', '')}"
-        elif source == "google_scholar":
-            return f"scholar:{hash(paper.get('title', ''))}"
-        elif source == "systematic_review":
-            return f"review:{hash(paper.get('title', ''))}"
-        else:
-            return f"{source}:{hash(paper.get('title', ''))}"
+        """Generate a stable, content-addressed source ID"""
+        return generate_paper_id(paper)
 
     def deduplicate_papers(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate papers based on title similarity"""
+        """Remove duplicate papers by stable ID and near-duplicate title"""
         logger.info(f"Deduplicating {len(papers)} papers...")
 
-        unique_papers = {}
-        duplicate_count = 0
+        dedup_index = PaperDedupIndex(self.is_better_paper)
+        duplicate_count = self.merge_papers(dedup_index, papers)
 
-        for paper in papers:
-            # Create a normalized title for comparison
-            title_key = self.normalize_title_for_dedup(paper["title"])
-
-            if title_key in unique_papers:
-                # Keep the one with higher relevance or more complete data
-                existing = unique_papers[title_key]
-
-                if self.is_better_paper(paper, existing):
-                    unique_papers[title_key] = paper
-
-                duplicate_count += 1
-            else:
-                unique_papers[title_key] = paper
-
-        result = list(unique_papers.values())
+        result = dedup_index.papers()
         logger.info(
             f"Removed {duplicate_count} duplicates, {len(result)} unique papers remain"
         )
 
         return result
 
+    def merge_papers(
+        self, dedup_index: PaperDedupIndex, papers: List[Dict[str, Any]]
+    ) -> int:
+        """Merge papers into a dedup index in place, returning duplicates found"""
+        return sum(dedup_index.add(paper) for paper in papers)
+
     def normalize_title_for_dedup(self, title: str) -> str:
         """Normalize title for deduplication"""
-        import re
-
-        # Convert to lowercase and remove special characters
-        normalized = re.sub(r"[^\w\s]", "", title.lower())
-
-        # Remove common words and extra spaces
-        normalized = re.sub(
-            r"\b(the|a|an|and|or|but|in|on|at|to|for|of|with|by)\b", "", normalized
-        )
-        normalized = re.sub(r"\s+", " ", normalized).strip()
-
-        return normalized
+        return normalize_title(title)
 
     def is_better_paper(self, paper1: Dict[str, Any], paper2: Dict[str, Any]) -> bool:
         """Determine if paper1 is better than paper2"""
@@ -590,6 +605,7 @@ class UnifiedAcademicProcessor:
 
         return {
             "total_papers": total_papers,
+            "source_timings": self.source_timings,
             "source_distribution": dict(
                 sorted(source_dist.items(), key=lambda x: x[1], reverse=True)
             ),
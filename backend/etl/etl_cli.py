@@ -163,7 +163,14 @@ def status():
     is_flag=True,
     help="Enable government document processing (use with caution)",
 )
-def snowball(max_depth, max_citations, government_docs):
+@click.option("--run-id", default=None, help="Resume an interrupted sampling run")
+@click.option(
+    "--recrawl-after-days",
+    type=float,
+    default=30.0,
+    help="Only revisit pages crawled longer ago than this",
+)
+def snowball(max_depth, max_citations, government_docs, run_id, recrawl_after_days):
     """Run snowball sampling to discover new health AI infrastructure resources"""
     click.echo(
         f"🔬 Starting Snowball Sampling (depth: {max_depth}, citations: {max_citations})..."
@@ -187,11 +194,13 @@ def snowball(max_depth, max_citations, government_docs):
                 if government_docs
                 else set()
             ),
+            recrawl_after_days=recrawl_after_days,
         )
 
         sampler = HealthAISnowballSampler(config)
-        results = await sampler.run_sampling_session()
+        results = await sampler.run_sampling_session(run_id=run_id)
 
+        click.echo(f"\n🆔 Run ID: {results.get('session_id')}")
         click.echo(f"\n📊 Snowball Sampling Results:")
         click.echo(
             f"   🔗 Citations processed: {results.get('citations_processed', 0)}"
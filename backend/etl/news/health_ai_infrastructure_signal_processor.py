@@ -3,8 +3,74 @@ Health AI Infrastructure Signal Processor for AHAII
 Classifies news articles by infrastructure pillar impact and significance
 """
 
+import os
 import re
-from typing import Dict, Any, List, Optional
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# Sentence terminators used to attach a context sentence to each pillar signal
+SENTENCE_BOUNDARY = re.compile(r"[.!?]+(?:\s+|$)")
+
+# Quantitative infrastructure indicator patterns, compiled once per process
+INDICATOR_PATTERNS = {
+    name: re.compile(pattern, re.IGNORECASE)
+    for name, pattern in {
+        "emr_adoption_rate": r"(\d+(?:\.\d+)?)%?\s*(?:of\s+)?(?:hospitals|facilities|clinics)\s*(?:have|use|implemented|adopted)\s*(?:emr|electronic medical record|electronic health record)",
+        "ai_training_programs": r"(\d+)\s*(?:new\s+)?(?:ai|artificial intelligence)\s*(?:training|certification|education)\s*programs?",
+        "telemedicine_capability": r"(\d+(?:\.\d+)?)%?\s*(?:of\s+)?(?:hospitals|facilities)\s*(?:offer|provide|support)\s*(?:telemedicine|telehealth)",
+        "health_data_centers": r"(\d+)\s*(?:new\s+)?(?:health|medical)\s*(?:data\s+centers?|cloud\s+facilities)",
+        "medical_devices_connected": r"(\d+(?:,\d{3})*)\s*(?:medical\s+devices?|iot\s+devices?)\s*(?:connected|networked)",
+        "clinical_ai_implementations": r"(\d+)\s*(?:clinical\s+ai|medical\s+ai|health\s+ai)\s*(?:implementations?|deployments?|systems?)",
+        "health_ai_budget": r"\$(\d+(?:\.\d+)?)\s*(?:million|billion|thousand|k)\s*(?:allocated|budgeted|invested)\s*(?:for|in|on)\s*(?:health\s+ai|medical\s+ai|digital\s+health)",
+        "medical_staff_trained": r"(\d+(?:,\d{3})*)\s*(?:medical\s+staff|healthcare\s+workers|clinicians)\s*(?:trained|certified)\s*(?:in|on)\s*(?:ai|digital\s+health|health\s+informatics)",
+    }.items()
+}
+
+AMOUNT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)")
+
+# Articles below this count are classified in-process; the pool start-up cost
+# outweighs the gain for small batches
+PROCESS_POOL_MIN_BATCH = 200
+
+
+@lru_cache(maxsize=8)
+def _compile_keyword_scanner(
+    vocabulary: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Tuple["re.Pattern", Dict[str, Tuple[str, float]]]:
+    """Compile all pillar keywords into a single scanning pattern.
+
+    The alternation is wrapped in a lookahead so that nested phrases
+    ("medical training" inside "ai medical training") are still counted
+    separately, matching the previous one-regex-per-keyword behaviour.
+    Returns the pattern and a keyword -> (pillar, phrase weight) lookup.
+    """
+    lookup = {}
+    for pillar, keywords in vocabulary:
+        for keyword in keywords:
+            # Weight longer, more specific phrases higher
+            lookup[keyword.lower()] = (pillar, min(len(keyword.split()) * 0.1, 0.5))
+
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(lookup, key=len, reverse=True)
+    )
+    pattern = re.compile(rf"(?=\b({alternation})\b)", re.IGNORECASE)
+    return pattern, lookup
+
+
+_worker_processor: Optional["HealthAIInfrastructureSignalProcessor"] = None
+
+
+def _init_worker(processor: "HealthAIInfrastructureSignalProcessor") -> None:
+    """Install the parent's processor in a pool worker"""
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _classify_in_worker(article: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_processor.classify_infrastructure_signal(article)
 
 
 class HealthAIInfrastructureSignalProcessor:
@@ -114,6 +180,27 @@ class HealthAIInfrastructureSignalProcessor:
             r"quality\s+assurance\s+(?:standard|certification|audit)",
         ]
 
+        self._compile_patterns()
+
+    def _compile_patterns(self):
+        """Compile keyword vocabularies and signal patterns once per instance"""
+        vocabulary = tuple(
+            (pillar, tuple(keywords))
+            for pillar, keywords in self.infrastructure_keywords.items()
+        )
+        self._keyword_scanner, self._keyword_lookup = _compile_keyword_scanner(
+            vocabulary
+        )
+        self._organization_res = [
+            re.compile(p, re.IGNORECASE) for p in self.organization_patterns
+        ]
+        self._funding_res = [
+            re.compile(p, re.IGNORECASE) for p in self.funding_indicators
+        ]
+        self._regulatory_res = [
+            re.compile(p, re.IGNORECASE) for p in self.regulatory_signals
+        ]
+
     def classify_infrastructure_signal(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """Classify news article by infrastructure pillar impact"""
         title = article.get("title", "").lower()
@@ -134,17 +221,17 @@ class HealthAIInfrastructureSignalProcessor:
             "health_organizations": [],
             "regulatory_signals": [],
             "funding_mentions": [],
+            "pillar_signals": [],
         }
 
-        # Analyze each pillar
-        pillar_scores = {}
-        for pillar, keywords in self.infrastructure_keywords.items():
-            score = self._calculate_pillar_score(full_text, keywords)
-            pillar_scores[pillar] = score
+        # Analyze all pillars in a single scan of the text
+        pillar_scores, pillar_signals = self._scan_pillar_signals(full_text)
+        for pillar, score in pillar_scores.items():
             if score > 0.3:  # Threshold for pillar activation
                 classification[pillar] = True
 
         classification["pillar_scores"] = pillar_scores
+        classification["pillar_signals"] = pillar_signals
 
         # Extract infrastructure indicators
         classification["infrastructure_indicators"] = (
@@ -193,20 +280,84 @@ class HealthAIInfrastructureSignalProcessor:
 
         return classification
 
+    def process_batch(
+        self,
+        articles: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        chunksize: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Classify many articles, using a process pool for large backfills
+
+        Results are returned in the same order as ``articles``. Batches smaller
+        than ``PROCESS_POOL_MIN_BATCH`` or ``max_workers=1`` run in-process.
+        """
+        if not articles:
+            return []
+
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(articles) < PROCESS_POOL_MIN_BATCH:
+            return [self.classify_infrastructure_signal(a) for a in articles]
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            return list(
+                executor.map(_classify_in_worker, articles, chunksize=chunksize)
+            )
+
+    def _scan_pillar_signals(
+        self, text: str
+    ) -> Tuple[Dict[str, float], List[Dict[str, Any]]]:
+        """Score every pillar and collect its signals in one pass over the text"""
+        raw_scores = {pillar: 0.0 for pillar in self.infrastructure_keywords}
+        signals = []
+        sentence_starts = None
+
+        for match in self._keyword_scanner.finditer(text):
+            keyword = match.group(1).lower()
+            pillar, phrase_weight = self._keyword_lookup[keyword]
+            raw_scores[pillar] += phrase_weight
+
+            if sentence_starts is None:
+                sentence_starts = [0] + [
+                    m.end() for m in SENTENCE_BOUNDARY.finditer(text)
+                ]
+            start = match.start(1)
+            idx = bisect_right(sentence_starts, start) - 1
+            sentence_end = (
+                sentence_starts[idx + 1]
+                if idx + 1 < len(sentence_starts)
+                else len(text)
+            )
+            signals.append(
+                {
+                    "pillar": pillar,
+                    "keyword": keyword,
+                    "position": start,
+                    "context": text[sentence_starts[idx] : sentence_end].strip(),
+                }
+            )
+
+        # Normalize by text length (per 100 words)
+        text_length = len(text.split())
+        pillar_scores = {}
+        for pillar, score in raw_scores.items():
+            if text_length > 0:
+                score = score / (text_length / 100)
+            pillar_scores[pillar] = min(score, 1.0)
+
+        return pillar_scores, signals
+
     def _calculate_pillar_score(self, text: str, keywords: List[str]) -> float:
         """Calculate score for a specific infrastructure pillar"""
+        keywords = {keyword.lower() for keyword in keywords}
         score = 0.0
         text_length = len(text.split())
 
-        for keyword in keywords:
-            # Count exact phrase matches
-            phrase_count = len(
-                re.findall(rf"\b{re.escape(keyword)}\b", text, re.IGNORECASE)
-            )
-            if phrase_count > 0:
-                # Weight longer, more specific phrases higher
-                phrase_weight = min(len(keyword.split()) * 0.1, 0.5)
-                score += phrase_count * phrase_weight
+        for match in self._keyword_scanner.finditer(text):
+            keyword = match.group(1).lower()
+            if keyword in keywords:
+                score += self._keyword_lookup[keyword][1]
 
         # Normalize by text length
         if text_length > 0:
@@ -218,20 +369,8 @@ class HealthAIInfrastructureSignalProcessor:
         """Extract specific infrastructure indicators from text"""
         indicators = []
 
-        # Quantitative indicators patterns
-        patterns = {
-            "emr_adoption_rate": r"(\d+(?:\.\d+)?)%?\s*(?:of\s+)?(?:hospitals|facilities|clinics)\s*(?:have|use|implemented|adopted)\s*(?:emr|electronic medical record|electronic health record)",
-            "ai_training_programs": r"(\d+)\s*(?:new\s+)?(?:ai|artificial intelligence)\s*(?:training|certification|education)\s*programs?",
-            "telemedicine_capability": r"(\d+(?:\.\d+)?)%?\s*(?:of\s+)?(?:hospitals|facilities)\s*(?:offer|provide|support)\s*(?:telemedicine|telehealth)",
-            "health_data_centers": r"(\d+)\s*(?:new\s+)?(?:health|medical)\s*(?:data\s+centers?|cloud\s+facilities)",
-            "medical_devices_connected": r"(\d+(?:,\d{3})*)\s*(?:medical\s+devices?|iot\s+devices?)\s*(?:connected|networked)",
-            "clinical_ai_implementations": r"(\d+)\s*(?:clinical\s+ai|medical\s+ai|health\s+ai)\s*(?:implementations?|deployments?|systems?)",
-            "health_ai_budget": r"\$(\d+(?:\.\d+)?)\s*(?:million|billion|thousand|k)\s*(?:allocated|budgeted|invested)\s*(?:for|in|on)\s*(?:health\s+ai|medical\s+ai|digital\s+health)",
-            "medical_staff_trained": r"(\d+(?:,\d{3})*)\s*(?:medical\s+staff|healthcare\s+workers|clinicians)\s*(?:trained|certified)\s*(?:in|on)\s*(?:ai|digital\s+health|health\s+informatics)",
-        }
-
-        for indicator_type, pattern in patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for indicator_type, pattern in INDICATOR_PATTERNS.items():
+            matches = pattern.finditer(text)
             for match in matches:
                 try:
                     value = match.group(1).replace(",", "")
@@ -262,8 +401,8 @@ class HealthAIInfrastructureSignalProcessor:
         """Extract health organization mentions"""
         organizations = set()
 
-        for pattern in self.organization_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in self._organization_res:
+            matches = pattern.finditer(text)
             for match in matches:
                 org_name = match.group(0).strip()
                 if len(org_name) > 5:
@@ -275,8 +414,8 @@ class HealthAIInfrastructureSignalProcessor:
         """Extract regulatory signals and approvals"""
         signals = []
 
-        for pattern in self.regulatory_signals:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in self._regulatory_res:
+            matches = pattern.finditer(text)
             for match in matches:
                 signals.append(
                     {
@@ -293,12 +432,12 @@ class HealthAIInfrastructureSignalProcessor:
         """Extract funding and investment mentions"""
         funding_mentions = []
 
-        for pattern in self.funding_indicators:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in self._funding_res:
+            matches = pattern.finditer(text)
             for match in matches:
                 try:
                     # Extract amount and convert to standard format
-                    amount_match = re.search(r"(\d+(?:\.\d+)?)", match.group(0))
+                    amount_match = AMOUNT_PATTERN.search(match.group(0))
                     if amount_match:
                         amount = float(amount_match.group(1))
 
@@ -5,7 +5,9 @@ Health AI Infrastructure news monitoring pipeline for African health tech intell
 
 import asyncio
 import re
+import sqlite3
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict, Any, Optional, Set
 from urllib.parse import urljoin, urlparse
 
@@ -47,9 +49,31 @@ class NewsArticle(BaseModel):
 class RSSMonitor:
     """RSS feed monitor for African health AI infrastructure news"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        state_dir: str = "data/raw/news",
+        max_concurrent_requests: Optional[int] = None,
+        per_host_limit: int = 2,
+    ):
         self.rss_feeds = self.get_health_ai_infrastructure_feeds()
         self.session = None
+
+        # Concurrency limits: one global cap plus a small per-host cap so that
+        # feeds and articles on different sites are fetched in parallel
+        self.max_concurrent_requests = (
+            max_concurrent_requests or settings.CRAWL4AI_MAX_CONCURRENT
+        )
+        self.per_host_limit = per_host_limit
+        self._request_semaphore = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        # Validators of fetched feeds, saved once their entries are processed
+        self._pending_validators: Dict[str, Dict[str, Optional[str]]] = {}
+
+        # Persistent feed validators (ETag/Last-Modified) and seen entries
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self._init_state_db()
         self.african_countries = set(settings.AFRICAN_COUNTRIES)
         self.signal_processor = HealthAIInfrastructureSignalProcessor()
         self.infrastructure_pillars = {
@@ -77,13 +101,148 @@ class RSSMonitor:
             "https://www.bizcommunity.com/RSS/196/149/1.html",  # Healthcare IT in Africa
         ]
 
+    def _init_state_db(self):
+        """Initialize the feed state and seen-entry database"""
+        state_db_path = self.state_dir / "rss_monitor_state.db"
+
+        with sqlite3.connect(state_db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS feed_state (
+                    feed_url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    last_status INTEGER,
+                    last_checked TEXT
+                )
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS seen_entries (
+                    entry_key TEXT PRIMARY KEY,
+                    feed_url TEXT,
+                    first_seen TEXT
+                )
+            """
+            )
+
+        self.state_db_path = state_db_path
+
+    def _get_feed_validators(self, feed_url: str) -> Dict[str, str]:
+        """Build conditional-GET headers from the stored feed validators"""
+        with sqlite3.connect(self.state_db_path) as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified FROM feed_state WHERE feed_url = ?",
+                (feed_url,),
+            ).fetchone()
+
+        headers = {}
+        if row:
+            etag, last_modified = row
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _save_feed_state(
+        self,
+        feed_url: str,
+        status: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Record the latest validators for a feed (kept as-is on a 304)"""
+        with sqlite3.connect(self.state_db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO feed_state
+                    (feed_url, etag, last_modified, last_status, last_checked)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(feed_url) DO UPDATE SET
+                    etag = COALESCE(excluded.etag, feed_state.etag),
+                    last_modified = COALESCE(
+                        excluded.last_modified, feed_state.last_modified
+                    ),
+                    last_status = excluded.last_status,
+                    last_checked = excluded.last_checked
+            """,
+                (feed_url, etag, last_modified, status, datetime.now().isoformat()),
+            )
+
+    @staticmethod
+    def _entry_keys(article_data: Dict[str, Any]) -> List[str]:
+        """Keys identifying an entry in the seen store (GUID and URL)"""
+        keys = [str(article_data["url"])]
+        guid = article_data.get("guid")
+        if guid and guid not in keys:
+            keys.append(str(guid))
+        return keys
+
+    def filter_unseen_entries(
+        self, articles_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Drop entries whose GUID or URL has already been processed"""
+        if not articles_data:
+            return []
+
+        all_keys = {key for a in articles_data for key in self._entry_keys(a)}
+        seen = set()
+        with sqlite3.connect(self.state_db_path) as conn:
+            keys = list(all_keys)
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT entry_key FROM seen_entries WHERE entry_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                seen.update(row[0] for row in rows)
+
+        return [
+            a
+            for a in articles_data
+            if not any(key in seen for key in self._entry_keys(a))
+        ]
+
+    def mark_entries_seen(self, articles_data: List[Dict[str, Any]], feed_url: str):
+        """Record processed entries so later runs skip them before fetching"""
+        if not articles_data:
+            return
+
+        now = datetime.now().isoformat()
+        rows = [
+            (key, feed_url, now) for a in articles_data for key in self._entry_keys(a)
+        ]
+        with sqlite3.connect(self.state_db_path) as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO seen_entries (entry_key, feed_url, first_seen) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Per-host semaphore limiting parallel requests to a single site"""
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
     async def __aenter__(self):
         self.session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=settings.CRAWL4AI_TIMEOUT),
             headers={
                 "User-Agent": "AHAII Health AI Infrastructure Monitor/1.0 (Research Bot)"
             },
+            connector=aiohttp.TCPConnector(
+                limit=self.max_concurrent_requests,
+                limit_per_host=self.per_host_limit,
+            ),
         )
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        self._host_semaphores = {}
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -91,15 +250,32 @@ class RSSMonitor:
             await self.session.close()
 
     async def fetch_rss_feed(self, feed_url: str) -> List[Dict[str, Any]]:
-        """Fetch and parse RSS feed"""
+        """Fetch and parse RSS feed, returning nothing if it is unchanged
+
+        New ETag/Last-Modified validators are held back until ``process_feed``
+        has processed the entries, so a crash mid-run does not turn the next
+        run into a 304 that hides unprocessed entries.
+        """
+        headers = self._get_feed_validators(feed_url)
         try:
-            async with self.session.get(feed_url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    return self.parse_rss_feed(content, feed_url)
-                else:
-                    logger.error(f"RSS fetch error for {feed_url}: {response.status}")
-                    return []
+            async with self._request_semaphore, self._host_semaphore(feed_url):
+                async with self.session.get(feed_url, headers=headers) as response:
+                    if response.status == 304:
+                        logger.debug(f"Feed not modified since last run: {feed_url}")
+                        self._save_feed_state(feed_url, 304)
+                        return []
+                    elif response.status == 200:
+                        content = await response.text()
+                        self._pending_validators[feed_url] = {
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified"),
+                        }
+                    else:
+                        logger.error(
+                            f"RSS fetch error for {feed_url}: {response.status}"
+                        )
+                        return []
+            return self.parse_rss_feed(content, feed_url)
         except Exception as e:
             logger.error(f"Error fetching RSS feed {feed_url}: {e}")
             return []
@@ -196,6 +372,7 @@ class RSSMonitor:
             return {
                 "title": title,
                 "url": url,
+                "guid": entry.get("id"),
                 "published_date": published_date,
                 "author": author,
                 "source": source_name,
@@ -229,15 +406,16 @@ class RSSMonitor:
     async def fetch_full_article_content(self, article_url: str) -> Optional[str]:
         """Fetch full article content from URL using Crawl4AI approach"""
         try:
-            async with self.session.get(article_url) as response:
-                if response.status == 200:
-                    html_content = await response.text()
-                    return self.extract_article_content(html_content)
-                else:
-                    logger.warning(
-                        f"Failed to fetch article content from {article_url}: {response.status}"
-                    )
-                    return None
+            async with self._request_semaphore, self._host_semaphore(article_url):
+                async with self.session.get(article_url) as response:
+                    if response.status == 200:
+                        html_content = await response.text()
+                    else:
+                        logger.warning(
+                            f"Failed to fetch article content from {article_url}: {response.status}"
+                        )
+                        return None
+            return self.extract_article_content(html_content)
         except Exception as e:
             logger.error(f"Error fetching article content from {article_url}: {e}")
             return None
@@ -537,99 +715,146 @@ class RSSMonitor:
 
         return funding_mentions[:5]
 
-    async def monitor_feeds(self, hours_back: int = 24) -> List[NewsArticle]:
-        """Monitor all RSS feeds for new articles"""
-        logger.info(f"Starting RSS monitoring for last {hours_back} hours...")
+    async def process_article(
+        self, article_data: Dict[str, Any]
+    ) -> Optional[NewsArticle]:
+        """Fetch, analyze and filter a single feed entry
+
+        Entries whose page cannot be fetched (paywalls, 403s, timeouts) are
+        analyzed from their RSS title and summary instead.
+        """
+        # Fetch full content
+        full_content = await self.fetch_full_article_content(article_data["url"])
+        if full_content:
+            article_data["content"] = full_content
+
+        # Analyze relevance and health AI infrastructure signals
+        analysis = self.analyze_article_relevance(article_data)
+        infrastructure_analysis = self.signal_processor.classify_infrastructure_signal(
+            article_data
+        )
 
-        all_articles = []
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
+        # Combine analyses
+        article_data.update(analysis)
+        article_data.update(
+            {
+                "health_ai_relevance_score": max(
+                    analysis["ai_relevance_score"],
+                    (
+                        max(infrastructure_analysis["pillar_scores"].values())
+                        if infrastructure_analysis["pillar_scores"]
+                        else 0
+                    ),
+                ),
+                "infrastructure_pillar": self.signal_processor.get_primary_pillar(
+                    infrastructure_analysis
+                ),
+                "infrastructure_indicators": infrastructure_analysis[
+                    "infrastructure_indicators"
+                ],
+                "mentioned_health_organizations": infrastructure_analysis[
+                    "health_organizations"
+                ],
+                "regulatory_signals": infrastructure_analysis["regulatory_signals"],
+            }
+        )
 
-        for feed_url in self.rss_feeds:
+        # Filter by health AI infrastructure relevance
+        is_relevant = (
+            analysis["ai_relevance_score"] >= 0.3
+            or infrastructure_analysis["significance"] in ["high", "medium"]
+            or infrastructure_analysis["confidence_score"] > 0.4
+        )
+
+        is_african_relevant = analysis["african_relevance_score"] >= 0.2 or any(
+            country in analysis["mentioned_countries"]
+            for country in self.african_countries
+        )
+
+        if is_relevant and is_african_relevant:
             try:
-                logger.info(f"Processing feed: {feed_url}")
-                articles_data = await self.fetch_rss_feed(feed_url)
-
-                for article_data in articles_data:
-                    # Filter by date
-                    pub_date = article_data.get("published_date")
-                    if pub_date and pub_date < cutoff_time:
-                        continue
-
-                    # Fetch full content
-                    full_content = await self.fetch_full_article_content(
-                        article_data["url"]
-                    )
-                    if full_content:
-                        article_data["content"] = full_content
-
-                    # Analyze relevance and health AI infrastructure signals
-                    analysis = self.analyze_article_relevance(article_data)
-                    infrastructure_analysis = (
-                        self.signal_processor.classify_infrastructure_signal(
-                            article_data
-                        )
-                    )
+                return NewsArticle(**article_data)
+            except Exception as e:
+                logger.error(f"Error creating NewsArticle model: {e}")
 
-                    # Combine analyses
-                    article_data.update(analysis)
-                    article_data.update(
-                        {
-                            "health_ai_relevance_score": max(
-                                analysis["ai_relevance_score"],
-                                (
-                                    max(
-                                        infrastructure_analysis[
-                                            "pillar_scores"
-                                        ].values()
-                                    )
-                                    if infrastructure_analysis["pillar_scores"]
-                                    else 0
-                                ),
-                            ),
-                            "infrastructure_pillar": self.signal_processor.get_primary_pillar(
-                                infrastructure_analysis
-                            ),
-                            "infrastructure_indicators": infrastructure_analysis[
-                                "infrastructure_indicators"
-                            ],
-                            "mentioned_health_organizations": infrastructure_analysis[
-                                "health_organizations"
-                            ],
-                            "regulatory_signals": infrastructure_analysis[
-                                "regulatory_signals"
-                            ],
-                        }
-                    )
+        return None
 
-                    # Filter by health AI infrastructure relevance
-                    is_relevant = (
-                        analysis["ai_relevance_score"] >= 0.3
-                        or infrastructure_analysis["significance"] in ["high", "medium"]
-                        or infrastructure_analysis["confidence_score"] > 0.4
-                    )
+    async def process_feed(
+        self, feed_url: str, cutoff_time: datetime, claimed_urls: Set[str]
+    ) -> List[NewsArticle]:
+        """Fetch one feed and process its new, unseen entries concurrently"""
+        logger.info(f"Processing feed: {feed_url}")
+        articles_data = await self.fetch_rss_feed(feed_url)
+
+        # Filter by date
+        articles_data = [
+            a
+            for a in articles_data
+            if not (a.get("published_date") and a["published_date"] < cutoff_time)
+        ]
 
-                    is_african_relevant = analysis[
-                        "african_relevance_score"
-                    ] >= 0.2 or any(
-                        country in analysis["mentioned_countries"]
-                        for country in self.african_countries
-                    )
+        # Skip entries processed in earlier runs before fetching any HTML
+        fresh = self.filter_unseen_entries(articles_data)
 
-                    if is_relevant and is_african_relevant:
+        # Skip entries another feed already claimed in this run
+        pending = []
+        for article_data in fresh:
+            url = str(article_data["url"])
+            if url not in claimed_urls:
+                claimed_urls.add(url)
+                pending.append(article_data)
 
-                        try:
-                            article = NewsArticle(**article_data)
-                            all_articles.append(article)
-                        except Exception as e:
-                            logger.error(f"Error creating NewsArticle model: {e}")
-                            continue
+        if len(pending) < len(articles_data):
+            logger.info(
+                f"Skipping {len(articles_data) - len(pending)} already seen entries from {feed_url}"
+            )
 
-                # Rate limiting
-                await asyncio.sleep(2)
+        results = await asyncio.gather(
+            *(self.process_article(a) for a in pending), return_exceptions=True
+        )
 
-            except Exception as e:
-                logger.error(f"Error processing feed {feed_url}: {e}")
+        articles = []
+        for article_data, result in zip(pending, results):
+            if isinstance(result, Exception):
+                # Retrying would fail the same way, so the entry still counts
+                # as processed
+                logger.error(
+                    f"Error processing article {article_data['url']}: {result}"
+                )
+            elif result is not None:
+                articles.append(result)
+
+        # Entries and validators are only recorded once the whole feed has
+        # been processed, so an interrupted run sees the same entries again
+        self.mark_entries_seen(pending, feed_url)
+        validators = self._pending_validators.pop(feed_url, None)
+        if validators is not None:
+            self._save_feed_state(feed_url, 200, **validators)
+        return articles
+
+    async def monitor_feeds(self, hours_back: int = 24) -> List[NewsArticle]:
+        """Monitor all RSS feeds for new articles"""
+        logger.info(f"Starting RSS monitoring for last {hours_back} hours...")
+
+        cutoff_time = datetime.now() - timedelta(hours=hours_back)
+        claimed_urls: Set[str] = set()
+
+        # Feeds run concurrently; the global and per-host semaphores keep
+        # request rates polite to each site
+        results = await asyncio.gather(
+            *(
+                self.process_feed(feed_url, cutoff_time, claimed_urls)
+                for feed_url in self.rss_feeds
+            ),
+            return_exceptions=True,
+        )
+
+        all_articles = []
+        for feed_url, result in zip(self.rss_feeds, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing feed {feed_url}: {result}")
                 continue
+            all_articles.extend(result)
 
         logger.info(f"Found {len(all_articles)} relevant articles")
         return all_articles
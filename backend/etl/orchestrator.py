@@ -496,8 +496,8 @@ class AHAIIETLOrchestrator:
 
             # Get all African countries
             countries_result = (
-                await supabase.table("countries")
-                .select("*")
+                supabase.table("countries")
+                .select("id, name")
                 .eq("continent", "Africa")
                 .execute()
             )
@@ -505,40 +505,22 @@ class AHAIIETLOrchestrator:
 
             run.records_processed = len(countries)
 
-            for country in countries:
-                try:
-                    # Calculate AHAII scores for this country
-                    scores = (
-                        await self.scoring_service.calculate_comprehensive_ahaii_score(
-                            country_id=country["id"],
-                            assessment_year=datetime.now().year,
-                            assessment_quarter=(datetime.now().month - 1) // 3 + 1,
-                        )
-                    )
-
-                    if scores:
-                        # Update scores in database
-                        stored_scores = await self.db_service.update_ahaii_scores(
-                            country["id"], scores
-                        )
-                        if stored_scores:
-                            run.records_created += 1
-                        else:
-                            run.records_failed += 1
-                    else:
-                        run.records_failed += 1
+            # Score every country in one vectorized pass and one bulk upsert
+            bulk_result = await self.scoring_service.score_countries_bulk(
+                self.db_service,
+                country_ids=[country["id"] for country in countries],
+            )
 
-                except Exception as e:
-                    logger.error(
-                        f"Error calculating scores for {country.get('name', 'Unknown')}: {e}"
-                    )
-                    run.records_failed += 1
-                    continue
+            run.records_created = bulk_result["countries_stored"]
+            run.records_failed = len(countries) - run.records_created
 
             run.metadata = {
                 "countries_scored": run.records_created,
-                "scoring_year": datetime.now().year,
-                "scoring_quarter": (datetime.now().month - 1) // 3 + 1,
+                "countries_without_indicators": len(
+                    bulk_result["countries_without_indicators"]
+                ),
+                "scoring_year": bulk_result["assessment_year"],
+                "scoring_quarter": bulk_result["assessment_quarter"],
             }
 
             run.status = PipelineStatus.COMPLETED
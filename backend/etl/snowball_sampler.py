@@ -5,21 +5,59 @@ Enhanced citation discovery and reference extraction for health AI infrastructur
 """
 
 import asyncio
+import hashlib
+import heapq
+import itertools
+import math
 import re
 import json
+import sqlite3
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
 
 import aiohttp
-from bs4 import BeautifulSoup
 from loguru import logger
+from lxml import html as lxml_html
 
 from services.database_service import DatabaseService
 from config.database import supabase
 
 
+USER_AGENT = "AHAII-Research-Bot/1.0 (+https://ahaii.org/research) - Academic research on African health AI infrastructure"
+ROBOTS_USER_AGENT = "AHAII-Research-Bot"
+
+HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml"}
+PDF_CONTENT_TYPES = {"application/pdf", "application/x-pdf"}
+
+REFERENCE_HEADING_PATTERNS = [
+    "references",
+    "bibliography",
+    "citations",
+    "sources",
+    "further reading",
+    "related work",
+    "see also",
+    "additional resources",
+]
+
+ACADEMIC_LINK_PATTERNS = [
+    # DOI, PubMed and ArXiv links anywhere in the document
+    re.compile(r'https?://(?:dx\.)?doi\.org/[^\s\'"<>]+', re.IGNORECASE),
+    re.compile(
+        r'https?://(?:www\.)?pubmed\.ncbi\.nlm\.nih\.gov/[^\s\'"<>]+', re.IGNORECASE
+    ),
+    re.compile(r'https?://(?:www\.)?arxiv\.org/[^\s\'"<>]+', re.IGNORECASE),
+]
+
+XPATH_NAMESPACES = {"re": "http://exslt.org/regular-expressions"}
+
+
 class SamplingStrategy(Enum):
     """Different snowball sampling strategies"""
 
@@ -53,8 +91,9 @@ class SamplingConfig:
     strategy: SamplingStrategy = SamplingStrategy.HEALTH_AI_FOCUSED
 
     # Rate limiting for respectful scraping
-    delay_between_requests: float = 3.0
+    delay_between_requests: float = 3.0  # per host; robots.txt may raise it
     max_requests_per_minute: int = 15
+    max_concurrent_requests: int = 5  # global cap across all hosts
 
     # Health AI quality filters
     require_health_relevance: bool = True
@@ -65,8 +104,16 @@ class SamplingConfig:
     # Government document handling (IMPORTANT)
     government_domains_allowed: Set[str] = None
     respect_robots_txt: bool = True
+    max_response_bytes: int = 2_000_000  # stop reading bodies past this size
+    max_text_chars: int = 25000  # text passed to relevance scoring
+    robots_cache_ttl: float = 3600.0  # seconds before robots.txt is refetched
     max_government_docs_per_country: int = 3
 
+    # Persistent crawl state (frontier, visited URLs, per-URL outcomes)
+    state_db_path: str = "data/raw/snowball/crawl_state.db"
+    recrawl_after_days: float = 30.0  # pages crawled more recently are skipped
+    use_bloom_filter: bool = True
+
     def __post_init__(self):
         if self.government_domains_allowed is None:
             # Conservative list of clearly public government domains
@@ -124,17 +171,408 @@ class HealthAICitation:
             self.reference_links = []
 
 
+@dataclass
+class FetchedPage:
+    """A fetched document: raw markup plus the parsed tree and extracted text"""
+
+    url: str
+    content_type: str
+    raw: str
+    text: str
+    title: Optional[str] = None
+    tree: Any = None  # lxml element for HTML pages, None for PDFs
+    truncated: bool = False
+
+
+@dataclass
+class RobotsCacheEntry:
+    """Parsed robots.txt for one host"""
+
+    parser: Optional[RobotFileParser]
+    fetched_at: float
+    crawl_delay: Optional[float] = None
+    allow_all: bool = False
+    disallow_all: bool = False
+
+    def can_fetch(self, url: str) -> bool:
+        if self.disallow_all:
+            return False
+        if self.allow_all or self.parser is None:
+            return True
+        return self.parser.can_fetch(ROBOTS_USER_AGENT, url)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter used for fast negative visited-URL checks"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+class CrawlStateStore:
+    """SQLite-backed frontier, visited set and per-URL outcomes for sampling runs"""
+
+    # Outcomes that may succeed on a later attempt (timeouts, 5xx, 429); they
+    # are recorded but do not count as a crawl, so the URL is not held back
+    # for the recrawl window. Robots.txt disallows, 4xx responses and pages
+    # without usable content are terminal until the window passes.
+    RETRYABLE_OUTCOMES = ("error", "http_5xx", "rate_limited")
+
+    def __init__(self, db_path: str, use_bloom_filter: bool = True):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.use_bloom_filter = use_bloom_filter
+        self._bloom: Optional[BloomFilter] = None
+        self._init_state_db()
+
+    def _init_state_db(self):
+        """Initialize crawl state tables"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crawl_runs (
+                    run_id TEXT PRIMARY KEY,
+                    status TEXT,
+                    started_at TEXT,
+                    updated_at TEXT
+                )
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crawl_frontier (
+                    run_id TEXT,
+                    url TEXT,
+                    depth INTEGER,
+                    priority_score REAL,
+                    item TEXT,
+                    PRIMARY KEY (run_id, url)
+                )
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crawl_visited (
+                    url TEXT PRIMARY KEY,
+                    run_id TEXT,
+                    depth INTEGER,
+                    outcome TEXT,
+                    discoveries INTEGER,
+                    references_extracted INTEGER,
+                    last_crawled_at TEXT
+                )
+            """
+            )
+
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_crawl_visited_crawled_at ON crawl_visited (last_crawled_at)"
+            )
+
+    def start_run(self, run_id: str) -> None:
+        now = datetime.now().isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO crawl_runs (run_id, status, started_at, updated_at)
+                VALUES (?, 'running', ?, ?)
+                ON CONFLICT(run_id) DO UPDATE SET
+                    status = 'running', updated_at = excluded.updated_at
+            """,
+                (run_id, now, now),
+            )
+
+    def finish_run(self, run_id: str, status: str) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE crawl_runs SET status = ?, updated_at = ? WHERE run_id = ?",
+                (status, datetime.now().isoformat(), run_id),
+            )
+
+    def add_to_frontier(self, run_id: str, item: Dict[str, Any], depth: int) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO crawl_frontier
+                    (run_id, url, depth, priority_score, item)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (
+                    run_id,
+                    item["url"],
+                    depth,
+                    item.get("priority_score", 0.0),
+                    json.dumps(item, default=str),
+                ),
+            )
+
+    def load_frontier(self, run_id: str) -> List[Tuple[Dict[str, Any], int]]:
+        """Items queued but not yet completed by an earlier, interrupted run"""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT item, depth FROM crawl_frontier WHERE run_id = ?", (run_id,)
+            ).fetchall()
+        return [(json.loads(item), depth) for item, depth in rows]
+
+    def remove_from_frontier(self, run_id: str, url: str) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "DELETE FROM crawl_frontier WHERE run_id = ? AND url = ?",
+                (run_id, url),
+            )
+
+    def record_outcome(
+        self,
+        run_id: str,
+        url: str,
+        depth: int,
+        outcome: str,
+        discoveries: int = 0,
+        references_extracted: int = 0,
+    ) -> None:
+        """Record a URL's outcome and remove it from the run's frontier atomically
+
+        Only successful or terminal outcomes mark the URL visited; a
+        retryable outcome keeps any earlier crawl time.
+        """
+        visited = outcome not in self.RETRYABLE_OUTCOMES
+        crawled_at = datetime.now().isoformat() if visited else None
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO crawl_visited
+                    (url, run_id, depth, outcome, discoveries,
+                     references_extracted, last_crawled_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    run_id = excluded.run_id,
+                    depth = excluded.depth,
+                    outcome = excluded.outcome,
+                    discoveries = excluded.discoveries,
+                    references_extracted = excluded.references_extracted,
+                    last_crawled_at = COALESCE(
+                        excluded.last_crawled_at, crawl_visited.last_crawled_at
+                    )
+            """,
+                (
+                    url,
+                    run_id,
+                    depth,
+                    outcome,
+                    discoveries,
+                    references_extracted,
+                    crawled_at,
+                ),
+            )
+            conn.execute(
+                "DELETE FROM crawl_frontier WHERE run_id = ? AND url = ?",
+                (run_id, url),
+            )
+
+        if visited and self._bloom is not None:
+            self._bloom.add(url)
+
+    def load_visited_filter(self, max_age_days: float) -> None:
+        """Build the Bloom filter from URLs crawled within ``max_age_days``"""
+        if not self.use_bloom_filter:
+            return
+
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            urls = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT url FROM crawl_visited WHERE last_crawled_at >= ?",
+                    (cutoff,),
+                )
+            ]
+
+        self._bloom = BloomFilter(capacity=max(len(urls) * 2, 10_000))
+        for url in urls:
+            self._bloom.add(url)
+
+    def was_recently_crawled(self, url: str, max_age_days: float) -> bool:
+        """True if ``url`` was crawled within ``max_age_days`` by any run"""
+        if self._bloom is not None and url not in self._bloom:
+            return False
+
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM crawl_visited WHERE url = ? AND last_crawled_at >= ?",
+                (url, cutoff),
+            ).fetchone()
+        return row is not None
+
+
+class CrawlFrontier:
+    """Priority frontier of citations awaiting a fetch
+
+    Ordering follows the sampling strategy: breadth-first and health-AI-focused
+    runs take shallower depths first and the highest priority within a depth,
+    depth-first runs prefer the deepest items, and priority-based runs ignore
+    depth except as a tie-breaker.
+    """
+
+    def __init__(
+        self,
+        strategy: SamplingStrategy = SamplingStrategy.HEALTH_AI_FOCUSED,
+        state_store: Optional[CrawlStateStore] = None,
+        run_id: Optional[str] = None,
+    ):
+        self.strategy = strategy
+        self.state_store = state_store
+        self.run_id = run_id
+        self._heap: List[Tuple] = []
+        self._counter = itertools.count()
+        self._queued_urls: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _sort_key(self, item: Dict[str, Any], depth: int) -> Tuple[float, float]:
+        priority = item.get("priority_score", 0.0)
+        if self.strategy == SamplingStrategy.DEPTH_FIRST:
+            return (-depth, -priority)
+        if self.strategy == SamplingStrategy.PRIORITY_BASED:
+            return (-priority, depth)
+        return (depth, -priority)
+
+    def push(self, item: Dict[str, Any], depth: int, persist: bool = True) -> bool:
+        """Queue a citation; URLs already queued in this run are ignored"""
+        url = item.get("url")
+        if not url or url in self._queued_urls:
+            return False
+
+        self._queued_urls.add(url)
+        if persist and self.state_store is not None:
+            self.state_store.add_to_frontier(self.run_id, item, depth)
+        heapq.heappush(
+            self._heap, (*self._sort_key(item, depth), next(self._counter), depth, item)
+        )
+        return True
+
+    def requeue(self, item: Dict[str, Any], depth: int) -> bool:
+        """Put a popped item back once (e.g. after a 429); False if already retried"""
+        if item.get("requeued"):
+            return False
+
+        item = {**item, "requeued": True}
+        heapq.heappush(
+            self._heap, (*self._sort_key(item, depth), next(self._counter), depth, item)
+        )
+        return True
+
+    def pop_ready(self, is_ready) -> Optional[Tuple[Dict[str, Any], int]]:
+        """Pop the best item whose URL ``is_ready``; others keep their place"""
+        skipped = []
+        found = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if is_ready(entry[-1]["url"]):
+                found = entry
+                break
+            skipped.append(entry)
+
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+
+        if found is None:
+            return None
+        return found[-1], found[-2]
+
+
+class DomainScheduler:
+    """Per-host politeness: one request in flight per host, spaced by its crawl delay"""
+
+    def __init__(self):
+        self._in_flight: Set[str] = set()
+        self._next_allowed: Dict[str, float] = {}
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def is_ready(self, url: str) -> bool:
+        host = self.host(url)
+        return (
+            host not in self._in_flight
+            and time.monotonic() >= self._next_allowed.get(host, 0.0)
+        )
+
+    def seconds_until_next_slot(self) -> float:
+        """Shortest wait until an idle host becomes available again"""
+        now = time.monotonic()
+        waits = [
+            allowed - now
+            for host, allowed in self._next_allowed.items()
+            if host not in self._in_flight and allowed > now
+        ]
+        return min(waits) if waits else 0.0
+
+    def acquire(self, url: str) -> None:
+        self._in_flight.add(self.host(url))
+
+    def release(self, url: str, started_at: float, delay: float) -> None:
+        host = self.host(url)
+        self._in_flight.discard(host)
+        self._next_allowed[host] = max(
+            self._next_allowed.get(host, 0.0), started_at + delay
+        )
+
+    def back_off(self, url: str, seconds: float) -> None:
+        """Keep a host idle for ``seconds`` (e.g. after a 429)"""
+        host = self.host(url)
+        self._next_allowed[host] = max(
+            self._next_allowed.get(host, 0.0), time.monotonic() + seconds
+        )
+
+
 class HealthAISnowballSampler:
     """Enhanced snowball sampler for health AI infrastructure intelligence"""
 
+    # Seconds a host is left idle after a 429 without a numeric Retry-After
+    RATE_LIMIT_BACKOFF = 30.0
+
     def __init__(self, config: SamplingConfig = None):
         self.config = config or SamplingConfig()
         self.db_service = DatabaseService()
         self.processed_urls: Set[str] = set()
-        self.session_id = (
-            f"health_ai_snowball_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        # One pooled HTTP session per sampling run, plus per-host robots.txt
+        # cache and politeness scheduling
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.robots_cache: Dict[str, RobotsCacheEntry] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+        self.scheduler = DomainScheduler()
+
+        # Persistent crawl state so interrupted runs can resume
+        self.state_store = CrawlStateStore(
+            self.config.state_db_path, use_bloom_filter=self.config.use_bloom_filter
         )
 
+        self.session_id = self._new_run_id()
+
         # Health AI patterns for extraction
         self.health_ai_patterns = {
             "health_terms": [
@@ -238,8 +676,22 @@ class HealthAISnowballSampler:
             "sao tome and principe",
         }
 
-    async def run_sampling_session(self) -> Dict[str, Any]:
-        """Run a complete health AI snowball sampling session"""
+    @staticmethod
+    def _new_run_id() -> str:
+        return f"health_ai_snowball_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+    async def run_sampling_session(
+        self, run_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run a complete health AI snowball sampling session
+
+        Passing the ``run_id`` of an interrupted session resumes it from its
+        persisted frontier instead of reseeding.
+        """
+
+        self.session_id = run_id or self._new_run_id()
+        self.processed_urls = set()
+        self.scheduler = DomainScheduler()
 
         logger.info(f"🔬 Starting Health AI Snowball Sampling: {self.session_id}")
 
@@ -263,61 +715,43 @@ class HealthAISnowballSampler:
             },
         }
 
+        run_status = "failed"
         try:
-            # Get initial seed from infrastructure intelligence
-            discovery_queue = await self._create_health_ai_discovery_queue()
-
-            if not discovery_queue:
-                logger.info("No health AI citations available for snowball sampling")
-                return session_stats
-
-            logger.info(f"📊 Initial discovery queue: {len(discovery_queue)} citations")
+            await self._open_session()
+            self.state_store.start_run(self.session_id)
+            self.state_store.load_visited_filter(self.config.recrawl_after_days)
 
-            # Process by depth with health AI focus
-            current_depth = 0
-            current_queue = discovery_queue
+            frontier = CrawlFrontier(
+                self.config.strategy, self.state_store, self.session_id
+            )
 
-            while current_queue and current_depth < self.config.max_depth:
+            pending = self.state_store.load_frontier(self.session_id)
+            if pending:
                 logger.info(
-                    f"🔍 Processing depth {current_depth} with {len(current_queue)} items"
+                    f"♻️ Resuming {self.session_id} with {len(pending)} queued citations"
                 )
+                session_stats["resumed"] = True
+                for citation_item, depth in pending:
+                    frontier.push(citation_item, depth, persist=False)
+            else:
+                # Get initial seed from infrastructure intelligence
+                discovery_queue = await self._create_health_ai_discovery_queue()
 
-                depth_results = await self._process_depth_level(
-                    current_queue, current_depth
+                if not discovery_queue:
+                    logger.info(
+                        "No health AI citations available for snowball sampling"
+                    )
+                    run_status = "completed"
+                    return session_stats
+
+                logger.info(
+                    f"📊 Initial discovery queue: {len(discovery_queue)} citations"
                 )
+                for citation_item in discovery_queue:
+                    frontier.push(citation_item, 0)
 
-                # Update session stats
-                session_stats["citations_processed"] += depth_results["processed_count"]
-                session_stats["health_ai_discoveries"] += depth_results[
-                    "discoveries_count"
-                ]
-                session_stats["reference_links_extracted"] += depth_results[
-                    "references_extracted"
-                ]
-                session_stats["government_docs_processed"] += depth_results[
-                    "government_docs_count"
-                ]
-                session_stats["african_relevant_findings"] += depth_results[
-                    "african_relevant_count"
-                ]
-                session_stats["failed_extractions"] += depth_results["failed_count"]
-                session_stats["discoveries_by_depth"][current_depth] = depth_results[
-                    "discoveries_count"
-                ]
-                session_stats["quality_scores"].extend(depth_results["quality_scores"])
-
-                # Update pillar distribution
-                for pillar, count in depth_results.get("pillar_counts", {}).items():
-                    session_stats["pillar_distribution"][pillar] += count
-
-                # Prepare next depth queue
-                current_queue = depth_results["next_depth_queue"]
-                current_depth += 1
-                session_stats["depth_reached"] = current_depth
-
-                # Rate limiting between depths
-                if current_queue:
-                    await asyncio.sleep(self.config.delay_between_requests * 2)
+            # Hosts are fetched in parallel; each host keeps its own crawl delay
+            await self._process_frontier(frontier, session_stats)
 
             # Calculate final statistics
             session_stats["end_time"] = datetime.now()
@@ -333,6 +767,7 @@ class HealthAISnowballSampler:
 
             # Store session results
             await self._store_session_results(session_stats)
+            run_status = "completed"
 
             logger.info(
                 f"🎉 Snowball sampling completed: {session_stats['health_ai_discoveries']} new health AI discoveries"
@@ -343,8 +778,28 @@ class HealthAISnowballSampler:
             session_stats["error"] = str(e)
             session_stats["end_time"] = datetime.now()
 
+        finally:
+            self.state_store.finish_run(self.session_id, run_status)
+            await self._close_session()
+
         return session_stats
 
+    async def _open_session(self) -> aiohttp.ClientSession:
+        """Create the pooled HTTP session shared by every request in a run"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers={"User-Agent": USER_AGENT},
+                connector=aiohttp.TCPConnector(
+                    limit=self.config.max_concurrent_requests, limit_per_host=2
+                ),
+            )
+        return self.session
+
+    async def _close_session(self) -> None:
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
     async def _create_health_ai_discovery_queue(self) -> List[Dict[str, Any]]:
         """Create discovery queue from existing intelligence and citations"""
 
@@ -363,7 +818,13 @@ class HealthAISnowballSampler:
 
         for record in intelligence_result.data or []:
             source_url = record.get("source_url")
-            if source_url and source_url not in self.processed_urls:
+            if (
+                source_url
+                and source_url not in self.processed_urls
+                and not self.state_store.was_recently_crawled(
+                    source_url, self.config.recrawl_after_days
+                )
+            ):
 
                 # Calculate priority based on health AI relevance
                 key_findings = record.get("key_findings", {})
@@ -393,75 +854,114 @@ class HealthAISnowballSampler:
         )
         return discovery_queue[: self.config.max_citations_per_batch]
 
-    async def _process_depth_level(
-        self, queue: List[Dict[str, Any]], depth: int
-    ) -> Dict[str, Any]:
-        """Process all citations at a specific depth level"""
-
-        results = {
-            "processed_count": 0,
-            "discoveries_count": 0,
-            "references_extracted": 0,
-            "government_docs_count": 0,
-            "african_relevant_count": 0,
-            "failed_count": 0,
-            "quality_scores": [],
-            "next_depth_queue": [],
-            "pillar_counts": {
-                "human_capital": 0,
-                "physical_infrastructure": 0,
-                "regulatory": 0,
-                "economic": 0,
-            },
-        }
+    async def _process_frontier(
+        self, frontier: CrawlFrontier, session_stats: Dict[str, Any]
+    ) -> None:
+        """Drain the frontier with a bounded pool of concurrent workers"""
+
+        active = 0
+
+        async def worker():
+            nonlocal active
+            while True:
+                popped = frontier.pop_ready(self.scheduler.is_ready)
+                if popped is None:
+                    if not frontier and active == 0:
+                        return
+                    # Every queued host is busy or cooling down
+                    wait = self.scheduler.seconds_until_next_slot()
+                    await asyncio.sleep(min(max(wait, 0.05), 1.0))
+                    continue
 
-        for citation_item in queue:
-            try:
-                citation_results = await self._process_single_citation(
-                    citation_item, depth
-                )
+                citation_item, depth = popped
+                url = citation_item["url"]
+                self.scheduler.acquire(url)
+                active += 1
+                started_at = time.monotonic()
+                delay = self.config.delay_between_requests
 
-                results["processed_count"] += 1
-
-                if citation_results["success"]:
-                    results["discoveries_count"] += citation_results[
-                        "discoveries_count"
-                    ]
-                    results["references_extracted"] += citation_results[
-                        "references_extracted"
-                    ]
-                    results["government_docs_count"] += citation_results[
-                        "government_docs_count"
-                    ]
-                    results["african_relevant_count"] += citation_results[
-                        "african_relevant_count"
-                    ]
-                    results["quality_scores"].append(
-                        citation_results["average_quality"]
+                try:
+                    delay = await self._get_crawl_delay(url)
+                    citation_results = await self._process_single_citation(
+                        citation_item, depth
                     )
+                    if citation_results["outcome"] == "rate_limited" and (
+                        frontier.requeue(citation_item, depth)
+                    ):
+                        # Retried once the host's back-off has passed
+                        self.processed_urls.discard(url)
+                        continue
+
+                    self._record_citation_result(session_stats, citation_results, depth)
+                    if citation_results["outcome"] == "duplicate":
+                        self.state_store.remove_from_frontier(self.session_id, url)
+                    else:
+                        self.state_store.record_outcome(
+                            self.session_id,
+                            url,
+                            depth,
+                            citation_results["outcome"],
+                            citation_results["discoveries_count"],
+                            citation_results["references_extracted"],
+                        )
 
-                    # Update pillar counts
-                    for pillar in citation_results.get("pillars_found", []):
-                        if pillar in results["pillar_counts"]:
-                            results["pillar_counts"][pillar] += 1
-
-                    # Add high-quality references to next depth queue
-                    for ref_citation in citation_results["reference_citations"]:
-                        if self._should_include_in_next_depth(ref_citation):
-                            results["next_depth_queue"].append(ref_citation)
-                else:
-                    results["failed_count"] += 1
+                    # Add high-quality references to the frontier at the next depth
+                    if depth + 1 < self.config.max_depth:
+                        for ref_citation in citation_results["reference_citations"]:
+                            if self._should_include_in_next_depth(ref_citation):
+                                frontier.push(ref_citation, depth + 1)
 
-                # Respectful rate limiting
-                await asyncio.sleep(self.config.delay_between_requests)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to process citation {citation_item.get('citation_id')}: {e}"
+                    )
+                    session_stats["citations_processed"] += 1
+                    session_stats["failed_extractions"] += 1
+                    self.state_store.record_outcome(
+                        self.session_id, url, depth, "error"
+                    )
 
-            except Exception as e:
-                logger.error(
-                    f"Failed to process citation {citation_item.get('citation_id')}: {e}"
-                )
-                results["failed_count"] += 1
+                finally:
+                    self.scheduler.release(url, started_at, delay)
+                    active -= 1
+
+        workers = max(1, self.config.max_concurrent_requests)
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    def _record_citation_result(
+        self,
+        session_stats: Dict[str, Any],
+        citation_results: Dict[str, Any],
+        depth: int,
+    ) -> None:
+        """Fold one citation's results into the session statistics"""
+
+        session_stats["citations_processed"] += 1
+        session_stats["depth_reached"] = max(session_stats["depth_reached"], depth + 1)
+        discoveries_by_depth = session_stats["discoveries_by_depth"]
+        discoveries_by_depth.setdefault(depth, 0)
+
+        if not citation_results["success"]:
+            session_stats["failed_extractions"] += 1
+            return
+
+        session_stats["health_ai_discoveries"] += citation_results["discoveries_count"]
+        session_stats["reference_links_extracted"] += citation_results[
+            "references_extracted"
+        ]
+        session_stats["government_docs_processed"] += citation_results[
+            "government_docs_count"
+        ]
+        session_stats["african_relevant_findings"] += citation_results[
+            "african_relevant_count"
+        ]
+        discoveries_by_depth[depth] += citation_results["discoveries_count"]
+        session_stats["quality_scores"].append(citation_results["average_quality"])
 
-        return results
+        # Update pillar distribution
+        for pillar in citation_results.get("pillars_found", []):
+            if pillar in session_stats["pillar_distribution"]:
+                session_stats["pillar_distribution"][pillar] += 1
 
     async def _process_single_citation(
         self, citation_item: Dict[str, Any], depth: int
@@ -477,6 +977,7 @@ class HealthAISnowballSampler:
             "average_quality": 0.0,
             "reference_citations": [],
             "pillars_found": [],
+            "outcome": "duplicate",
         }
 
         citation_url = citation_item.get("url")
@@ -485,12 +986,19 @@ class HealthAISnowballSampler:
         if not citation_url or citation_url in self.processed_urls:
             return result
 
+        # Skip pages crawled by any run within the re-crawl window
+        if self.state_store.was_recently_crawled(
+            citation_url, self.config.recrawl_after_days
+        ):
+            return result
+
         # Check if this is a government domain and apply restrictions
         if self._is_government_domain(citation_url):
             if not self._should_process_government_doc(citation_url):
                 logger.info(
                     f"⚠️ Skipping government document (policy restrictions): {citation_url}"
                 )
+                result["outcome"] = "policy_skipped"
                 return result
             else:
                 result["government_docs_count"] = 1
@@ -502,7 +1010,10 @@ class HealthAISnowballSampler:
             self.processed_urls.add(citation_url)
 
             # Fetch content with respect to robots.txt
-            content = await self._fetch_citation_content_respectfully(citation_url)
+            content, fetch_outcome = await self._fetch_citation_content_respectfully(
+                citation_url
+            )
+            result["outcome"] = fetch_outcome if not content else "below_threshold"
 
             if content:
                 # Extract health AI relevant information
@@ -529,6 +1040,7 @@ class HealthAISnowballSampler:
 
                     if stored_citation:
                         result["success"] = True
+                        result["outcome"] = "discovered"
                         result["discoveries_count"] = 1
                         result["average_quality"] = health_ai_citation.confidence_score
 
@@ -560,85 +1072,256 @@ class HealthAISnowballSampler:
 
         except Exception as e:
             logger.error(f"Error processing citation {citation_id}: {e}")
+            result["outcome"] = "error"
 
         return result
 
-    async def _fetch_citation_content_respectfully(self, url: str) -> Optional[str]:
-        """Fetch content while respecting robots.txt and rate limits"""
+    async def _fetch_citation_content_respectfully(
+        self, url: str
+    ) -> Tuple[Optional[FetchedPage], str]:
+        """Fetch content while respecting robots.txt, rate limits and size caps
+
+        Returns the page (None if nothing usable was fetched) and the fetch
+        outcome: "fetched", "no_content", "robots_disallowed", "http_4xx" (or
+        another status class), "http_5xx", "rate_limited" or "error".
+        """
 
         # Check robots.txt if enabled
         if self.config.respect_robots_txt and not await self._check_robots_txt(url):
             logger.info(f"🤖 Robots.txt disallows access: {url}")
-            return None
+            return None, "robots_disallowed"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "User-Agent": "AHAII-Research-Bot/1.0 (+https://ahaii.org/research) - Academic research on African health AI infrastructure"
-                }
+            session = await self._open_session()
+
+            async with session.get(
+                url, timeout=aiohttp.ClientTimeout(total=15)
+            ) as response:
+                if response.status == 200:
+                    page = await self._read_page(url, response)
+                    return page, "fetched" if page else "no_content"
+
+                elif response.status == 403:
+                    logger.warning(f"🚫 Access denied: {url}")
+                    return None, "http_4xx"
+
+                elif response.status == 429:
+                    # Back off the whole host instead of holding its slot
+                    retry_after = response.headers.get("Retry-After", "")
+                    backoff = (
+                        float(retry_after)
+                        if retry_after.isdigit()
+                        else self.RATE_LIMIT_BACKOFF
+                    )
+                    logger.warning(f"⏰ Rate limited for {backoff:.0f}s: {url}")
+                    self.scheduler.back_off(url, backoff)
+                    return None, "rate_limited"
 
-                async with session.get(
-                    url, timeout=aiohttp.ClientTimeout(total=15), headers=headers
-                ) as response:
-                    if response.status == 200:
-                        content = await response.text()
+                else:
+                    logger.warning(f"⚠️ HTTP {response.status}: {url}")
+                    return None, f"http_{response.status // 100}xx"
 
-                        # Filter out very short or clearly non-content pages
-                        if len(content.strip()) < 500:
-                            return None
+        except Exception as e:
+            logger.warning(f"Failed to fetch {url}: {e}")
+            return None, "error"
 
-                        return content[:25000]  # Reasonable limit
+    async def _read_page(
+        self, url: str, response: aiohttp.ClientResponse
+    ) -> Optional[FetchedPage]:
+        """Stream a response body up to the byte cap and parse it"""
 
-                    elif response.status == 403:
-                        logger.warning(f"🚫 Access denied: {url}")
-                        return None
+        content_type = response.content_type.lower()
+        is_pdf = content_type in PDF_CONTENT_TYPES
+        if content_type not in HTML_CONTENT_TYPES and not is_pdf:
+            logger.debug(f"Skipping unsupported content type {content_type}: {url}")
+            return None
 
-                    elif response.status == 429:
-                        logger.warning(f"⏰ Rate limited: {url}")
-                        await asyncio.sleep(30)  # Back off significantly
-                        return None
+        max_bytes = self.config.max_response_bytes
+        if response.content_length and response.content_length > max_bytes and is_pdf:
+            # A truncated PDF cannot be parsed, so do not download it at all
+            logger.debug(
+                f"Skipping oversized PDF ({response.content_length} bytes): {url}"
+            )
+            return None
 
-                    else:
-                        logger.warning(f"⚠️ HTTP {response.status}: {url}")
-                        return None
+        body = bytearray()
+        truncated = False
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            body.extend(chunk)
+            if len(body) >= max_bytes:
+                truncated = True
+                break
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch {url}: {e}")
+        if truncated and is_pdf:
+            logger.debug(f"Skipping oversized PDF: {url}")
             return None
 
-    async def _check_robots_txt(self, url: str) -> bool:
-        """Check robots.txt for the domain (simplified)"""
+        # Filter out very short or clearly non-content pages
+        if len(body.strip()) < 500:
+            return None
+
+        if is_pdf:
+            return self._parse_pdf_page(url, content_type, bytes(body))
+
+        return self._parse_html_page(
+            url, content_type, bytes(body[:max_bytes]), response.charset, truncated
+        )
+
+    def _parse_html_page(
+        self,
+        url: str,
+        content_type: str,
+        body: bytes,
+        charset: Optional[str],
+        truncated: bool,
+    ) -> Optional[FetchedPage]:
+        """Parse HTML with lxml and extract visible text"""
+
+        raw = body.decode(charset or "utf-8", errors="replace")
         try:
-            from urllib.parse import urljoin, urlparse
+            # Parse the bytes so lxml honours the HTTP charset or, failing
+            # that, the document's own meta charset / XML declaration
+            parser = lxml_html.HTMLParser(encoding=charset) if charset else None
+            tree = lxml_html.document_fromstring(body, parser=parser)
+        except Exception as e:
+            # Usually an empty document or a stray XML encoding declaration
+            logger.debug(f"lxml could not parse {url}: {e}")
+            return None
 
-            parsed_url = urlparse(url)
-            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
+        title = tree.findtext(".//title")
+
+        # Text for relevance scoring excludes script and style contents
+        for element in tree.xpath("//script|//style|//noscript"):
+            element.drop_tree()
+        text = " ".join(" ".join(tree.xpath("//text()")).split())
+
+        return FetchedPage(
+            url=url,
+            content_type=content_type,
+            raw=raw,
+            text=text[: self.config.max_text_chars],
+            title=title.strip() if title else None,
+            tree=tree,
+            truncated=truncated,
+        )
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    robots_url, timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    if response.status == 200:
-                        robots_content = await response.text()
+    def _parse_pdf_page(
+        self, url: str, content_type: str, body: bytes
+    ) -> Optional[FetchedPage]:
+        """Extract PDF text when the optional PyPDF2 package is installed"""
+        try:
+            from io import BytesIO
 
-                        # Very basic robots.txt parsing
-                        if (
-                            "Disallow: /" in robots_content
-                            and "User-agent: *" in robots_content
-                        ):
-                            return False
+            from PyPDF2 import PdfReader
+        except ImportError:
+            logger.debug(f"PyPDF2 not installed, skipping PDF: {url}")
+            return None
+
+        try:
+            reader = PdfReader(BytesIO(body))
+            parts = []
+            length = 0
+            for page in reader.pages:
+                page_text = page.extract_text() or ""
+                parts.append(page_text)
+                length += len(page_text)
+                if length >= self.config.max_text_chars:
+                    break
+        except Exception as e:
+            logger.debug(f"Could not extract PDF text from {url}: {e}")
+            return None
 
-                        # Check for specific disallows that might affect our path
-                        lines = robots_content.lower().split("\n")
-                        for line in lines:
-                            if "disallow:" in line and parsed_url.path in line:
-                                return False
+        text = " ".join(" ".join(parts).split())
+        title = reader.metadata.title if reader.metadata else None
 
-            return True  # Allow if can't determine or no robots.txt
+        return FetchedPage(
+            url=url,
+            content_type=content_type,
+            raw=text,
+            text=text[: self.config.max_text_chars],
+            title=title,
+        )
 
+    async def _check_robots_txt(self, url: str) -> bool:
+        """Check robots.txt for the domain using the per-host cache"""
+        try:
+            entry = await self._get_robots_entry(url)
+            return entry.can_fetch(url)
         except Exception:
             return True  # Allow if can't check
 
+    async def _get_robots_entry(self, url: str) -> RobotsCacheEntry:
+        """Return the cached robots.txt for a host, fetching it at most once per TTL"""
+        parsed_url = urlparse(url)
+        origin = f"{parsed_url.scheme}://{parsed_url.netloc}".lower()
+
+        entry = self.robots_cache.get(origin)
+        if entry and time.monotonic() - entry.fetched_at < self.config.robots_cache_ttl:
+            return entry
+
+        # Concurrent requests to the same host wait for a single fetch
+        lock = self._robots_locks.setdefault(origin, asyncio.Lock())
+        async with lock:
+            entry = self.robots_cache.get(origin)
+            if (
+                entry
+                and time.monotonic() - entry.fetched_at < self.config.robots_cache_ttl
+            ):
+                return entry
+
+            entry = await self._fetch_robots_entry(origin)
+            self.robots_cache[origin] = entry
+            return entry
+
+    async def _fetch_robots_entry(self, origin: str) -> RobotsCacheEntry:
+        """Fetch and parse robots.txt with urllib.robotparser"""
+        robots_url = f"{origin}/robots.txt"
+        fetched_at = time.monotonic()
+
+        try:
+            session = await self._open_session()
+            async with session.get(
+                robots_url, timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status == 200:
+                    robots_content = await response.text()
+                elif response.status in (401, 403):
+                    # Same convention as RobotFileParser.read()
+                    return RobotsCacheEntry(
+                        parser=None, fetched_at=fetched_at, disallow_all=True
+                    )
+                else:
+                    return RobotsCacheEntry(
+                        parser=None, fetched_at=fetched_at, allow_all=True
+                    )
+        except Exception as e:
+            logger.debug(f"Could not fetch robots.txt for {origin}: {e}")
+            return RobotsCacheEntry(parser=None, fetched_at=fetched_at, allow_all=True)
+
+        parser = RobotFileParser(robots_url)
+        parser.parse(robots_content.splitlines())
+        parser.modified()  # crawl_delay()/request_rate() require a fetch time
+
+        crawl_delay = parser.crawl_delay(ROBOTS_USER_AGENT)
+        request_rate = parser.request_rate(ROBOTS_USER_AGENT)
+        if crawl_delay is None and request_rate and request_rate.requests:
+            crawl_delay = request_rate.seconds / request_rate.requests
+
+        return RobotsCacheEntry(
+            parser=parser,
+            fetched_at=fetched_at,
+            crawl_delay=float(crawl_delay) if crawl_delay is not None else None,
+        )
+
+    async def _get_crawl_delay(self, url: str) -> float:
+        """Delay between requests to this URL's host (robots.txt or config)"""
+        delay = self.config.delay_between_requests
+        if self.config.respect_robots_txt:
+            entry = await self._get_robots_entry(url)
+            if entry.crawl_delay is not None:
+                delay = max(delay, entry.crawl_delay)
+        return delay
+
     def _is_government_domain(self, url: str) -> bool:
         """Check if URL is from a government domain"""
         from urllib.parse import urlparse
@@ -685,15 +1368,12 @@ class HealthAISnowballSampler:
         return False
 
     async def _extract_health_ai_info(
-        self, content: str, citation_item: Dict[str, Any], depth: int
+        self, content: FetchedPage, citation_item: Dict[str, Any], depth: int
     ) -> Optional[HealthAICitation]:
         """Extract health AI infrastructure information from content"""
 
-        # Create soup for parsing
-        soup = BeautifulSoup(content, "html.parser")
-
         # Extract text content
-        text_content = soup.get_text()
+        text_content = content.text
         text_lower = text_content.lower()
 
         # Calculate health AI relevance scores
@@ -715,8 +1395,8 @@ class HealthAISnowballSampler:
 
         # Extract title
         title = citation_item.get("title", "")
-        if soup.title:
-            title = soup.title.get_text().strip()[:200]
+        if content.title:
+            title = content.title[:200]
 
         # Determine infrastructure pillar
         pillar = self._determine_infrastructure_pillar(text_lower)
@@ -751,79 +1431,36 @@ class HealthAISnowballSampler:
 
         return citation
 
-    async def _extract_reference_links(self, content: str, base_url: str) -> List[str]:
+    async def _extract_reference_links(
+        self, content: FetchedPage, base_url: str
+    ) -> List[str]:
         """Extract reference links from academic papers and reports (KEY FEATURE)"""
 
-        soup = BeautifulSoup(content, "html.parser")
         reference_links = []
 
-        # Common patterns for reference sections
-        reference_patterns = [
-            "references",
-            "bibliography",
-            "citations",
-            "sources",
-            "further reading",
-            "related work",
-            "see also",
-            "additional resources",
-        ]
-
-        # Find reference sections
-        reference_sections = []
-
-        for pattern in reference_patterns:
-            # Look for headings with reference-like text
-            headings = soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
-            for heading in headings:
-                if pattern in heading.get_text().lower():
-                    # Get content after this heading
-                    reference_sections.append(heading.find_next_siblings())
+        if content.tree is not None:
+            tree = content.tree
 
-        # Also look for common reference list patterns
-        reference_lists = soup.find_all(
-            ["ol", "ul"], class_=re.compile(r"ref|citation|bibliography", re.I)
-        )
-        reference_sections.extend(reference_lists)
-
-        # Extract links from reference sections
-        for section in reference_sections:
-            if isinstance(section, list):
-                for element in section:
-                    links = (
-                        element.find_all("a", href=True)
-                        if hasattr(element, "find_all")
-                        else []
-                    )
-                    for link in links:
-                        href = link.get("href")
+            # Links following headings with reference-like text
+            for heading in tree.xpath("//h1|//h2|//h3|//h4|//h5|//h6"):
+                heading_text = heading.text_content().lower()
+                if any(p in heading_text for p in REFERENCE_HEADING_PATTERNS):
+                    for href in heading.xpath("following-sibling::*//a/@href"):
                         if self._is_academic_reference(href):
                             reference_links.append(href)
-            else:
-                links = (
-                    section.find_all("a", href=True)
-                    if hasattr(section, "find_all")
-                    else []
-                )
-                for link in links:
-                    href = link.get("href")
-                    if self._is_academic_reference(href):
-                        reference_links.append(href)
-
-        # Extract DOI links from anywhere in the document
-        doi_pattern = r'https?://(?:dx\.)?doi\.org/[^\s\'"<>]+'
-        doi_matches = re.findall(doi_pattern, content, re.IGNORECASE)
-        reference_links.extend(doi_matches)
-
-        # Extract PubMed links
-        pubmed_pattern = r'https?://(?:www\.)?pubmed\.ncbi\.nlm\.nih\.gov/[^\s\'"<>]+'
-        pubmed_matches = re.findall(pubmed_pattern, content, re.IGNORECASE)
-        reference_links.extend(pubmed_matches)
-
-        # Extract ArXiv links
-        arxiv_pattern = r'https?://(?:www\.)?arxiv\.org/[^\s\'"<>]+'
-        arxiv_matches = re.findall(arxiv_pattern, content, re.IGNORECASE)
-        reference_links.extend(arxiv_matches)
+
+            # Also look for common reference list patterns
+            for href in tree.xpath(
+                "//*[self::ol or self::ul]"
+                "[re:test(@class, 'ref|citation|bibliography', 'i')]//a/@href",
+                namespaces=XPATH_NAMESPACES,
+            ):
+                if self._is_academic_reference(href):
+                    reference_links.append(href)
+
+        # DOI, PubMed and ArXiv links from anywhere in the document
+        for pattern in ACADEMIC_LINK_PATTERNS:
+            reference_links.extend(pattern.findall(content.raw))
 
         # Clean and deduplicate links
         cleaned_links = []
@@ -1171,6 +1808,7 @@ class HealthAISnowballSampler:
 
         priority_score = citation.get("priority_score", 0)
         citation_type = citation.get("citation_type", "")
+        url = citation.get("url")
 
         # Higher threshold for deeper levels
         min_threshold = self.config.min_confidence_threshold + (
@@ -1181,7 +1819,11 @@ class HealthAISnowballSampler:
             priority_score >= min_threshold
             and citation_type
             in ["academic_paper", "policy_document", "health_ai_report"]
-            and citation.get("url") not in self.processed_urls
+            and url is not None
+            and url not in self.processed_urls
+            and not self.state_store.was_recently_crawled(
+                url, self.config.recrawl_after_days
+            )
         )
 
     async def _store_session_results(self, session_stats: Dict[str, Any]) -> None:
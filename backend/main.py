@@ -194,6 +194,9 @@ async def root():
             "country_details": "/api/countries/{country_id}/details",
             "regional_overview": "/api/countries/regions",
             "statistics": "/api/countries/statistics",
+            "scores_as_of": "/api/countries/score-history/as-of",
+            "score_deltas": "/api/countries/score-history/deltas",
+            "score_history": "/api/countries/score-history/series",
             "ahaii_assessment": "/api/ahaii/",
             "ahaii_health": "/api/ahaii/health",
             "ahaii_scores": "/api/ahaii/scores",
@@ -4,12 +4,18 @@ African Health AI Infrastructure Index scoring algorithm and methodology
 """
 
 import json
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
 import statistics
 from datetime import datetime, date
 
+import numpy as np
+import pandas as pd
+
+# Python's round() per element, so bulk scores match the scalar path exactly
+_round2 = np.vectorize(lambda x: round(float(x), 2), otypes=[float])
+
 
 @dataclass
 class AHAIIWeights:
@@ -69,9 +75,52 @@ class AHAIIScoringService:
     Implements the comprehensive scoring methodology for health AI infrastructure assessment
     """
 
+    PILLARS = (
+        "human_capital",
+        "physical_infrastructure",
+        "regulatory_infrastructure",
+        "economic_market",
+    )
+
+    # Column prefix used for sub-pillar scores in the ahaii_scores table
+    SUB_PILLAR_COLUMN_PREFIXES = {
+        "human_capital": "human_capital",
+        "physical_infrastructure": "physical",
+        "regulatory_infrastructure": "regulatory",
+        "economic_market": "economic",
+    }
+
     def __init__(self):
         self.weights = AHAIIWeights()
         self.indicator_definitions = self._initialize_indicator_definitions()
+        self.indicator_index = self._build_indicator_index()
+
+    def _build_indicator_index(
+        self,
+    ) -> Dict[str, Dict[str, Dict[str, IndicatorDefinition]]]:
+        """Index indicator definitions as pillar -> sub-pillar -> name"""
+        index: Dict[str, Dict[str, Dict[str, IndicatorDefinition]]] = {}
+        for name, definition in self.indicator_definitions.items():
+            index.setdefault(definition.pillar, {}).setdefault(
+                definition.sub_pillar, {}
+            )[name] = definition
+        return index
+
+    def _get_pillar_weights(self) -> Dict[str, float]:
+        return {
+            "human_capital": self.weights.HUMAN_CAPITAL,
+            "physical_infrastructure": self.weights.PHYSICAL_INFRASTRUCTURE,
+            "regulatory_infrastructure": self.weights.REGULATORY_INFRASTRUCTURE,
+            "economic_market": self.weights.ECONOMIC_MARKET,
+        }
+
+    def _get_sub_pillar_weights(self, pillar: str) -> Dict[str, float]:
+        return {
+            "human_capital": self.weights.HUMAN_CAPITAL_SUB,
+            "physical_infrastructure": self.weights.PHYSICAL_INFRASTRUCTURE_SUB,
+            "regulatory_infrastructure": self.weights.REGULATORY_INFRASTRUCTURE_SUB,
+            "economic_market": self.weights.ECONOMIC_MARKET_SUB,
+        }.get(pillar, {})
 
     def _initialize_indicator_definitions(self) -> Dict[str, IndicatorDefinition]:
         """Initialize the comprehensive indicator definitions"""
@@ -382,11 +431,7 @@ class AHAIIScoringService:
     ) -> Tuple[float, Dict]:
         """Calculate weighted score for a sub-pillar"""
 
-        relevant_indicators = {
-            name: definition
-            for name, definition in self.indicator_definitions.items()
-            if definition.pillar == pillar and definition.sub_pillar == sub_pillar
-        }
+        relevant_indicators = self.indicator_index.get(pillar, {}).get(sub_pillar, {})
 
         if not relevant_indicators:
             return 0.0, {}
@@ -423,15 +468,8 @@ class AHAIIScoringService:
         """Calculate weighted score for an entire pillar"""
 
         # Get sub-pillar weights for this pillar
-        if pillar == "human_capital":
-            sub_pillar_weights = self.weights.HUMAN_CAPITAL_SUB
-        elif pillar == "physical_infrastructure":
-            sub_pillar_weights = self.weights.PHYSICAL_INFRASTRUCTURE_SUB
-        elif pillar == "regulatory_infrastructure":
-            sub_pillar_weights = self.weights.REGULATORY_INFRASTRUCTURE_SUB
-        elif pillar == "economic_market":
-            sub_pillar_weights = self.weights.ECONOMIC_MARKET_SUB
-        else:
+        sub_pillar_weights = self._get_sub_pillar_weights(pillar)
+        if not sub_pillar_weights:
             return 0.0, {}
 
         pillar_weighted_scores = []
@@ -461,27 +499,24 @@ class AHAIIScoringService:
         return round(pillar_score, 2), sub_pillar_results
 
     def calculate_ahaii_score(
-        self, indicators_data: Dict[str, float], country_id: str, assessment_year: int
+        self,
+        indicators_data: Dict[str, float],
+        country_id: str,
+        assessment_year: int,
+        precomputed_pillars: Optional[Dict[str, Tuple[float, Dict]]] = None,
     ) -> Dict:
         """
         Calculate complete AHAII score for a country
 
-        Returns comprehensive scoring breakdown with confidence metrics
+        Returns comprehensive scoring breakdown with confidence metrics.
+        Pillars present in ``precomputed_pillars`` reuse the given
+        (score, breakdown) pair instead of being recalculated.
         """
+        precomputed_pillars = precomputed_pillars or {}
 
         # Calculate each pillar score
-        pillars = [
-            "human_capital",
-            "physical_infrastructure",
-            "regulatory_infrastructure",
-            "economic_market",
-        ]
-        pillar_weights = {
-            "human_capital": self.weights.HUMAN_CAPITAL,
-            "physical_infrastructure": self.weights.PHYSICAL_INFRASTRUCTURE,
-            "regulatory_infrastructure": self.weights.REGULATORY_INFRASTRUCTURE,
-            "economic_market": self.weights.ECONOMIC_MARKET,
-        }
+        pillars = self.PILLARS
+        pillar_weights = self._get_pillar_weights()
 
         pillar_scores = {}
         pillar_details = {}
@@ -490,9 +525,12 @@ class AHAIIScoringService:
         total_indicators_count = len(self.indicator_definitions)
 
         for pillar in pillars:
-            pillar_score, pillar_breakdown = self.calculate_pillar_score(
-                indicators_data, pillar
-            )
+            if pillar in precomputed_pillars:
+                pillar_score, pillar_breakdown = precomputed_pillars[pillar]
+            else:
+                pillar_score, pillar_breakdown = self.calculate_pillar_score(
+                    indicators_data, pillar
+                )
             pillar_scores[f"{pillar}_score"] = pillar_score
             pillar_details[pillar] = pillar_breakdown
 
@@ -576,6 +614,191 @@ class AHAIIScoringService:
             ],
         }
 
+    def score_indicator_frame(
+        self,
+        indicators: pd.DataFrame,
+        assessment_year: int,
+        assessment_quarter: Optional[int] = None,
+    ) -> List[Dict]:
+        """Score many countries at once from a long indicator table
+
+        ``indicators`` has country_id, indicator_name and indicator_value
+        columns, one row per latest observation. Indicator, sub-pillar, pillar
+        and total scores are computed as whole-matrix operations; the result
+        holds one ahaii_scores-shaped dict per country, matching
+        calculate_ahaii_score for the same data.
+        """
+        if indicators.empty:
+            return []
+
+        names = list(self.indicator_definitions.keys())
+        values = (
+            indicators[indicators["indicator_name"].isin(names)]
+            .pivot_table(
+                index="country_id",
+                columns="indicator_name",
+                values="indicator_value",
+                aggfunc="last",
+            )
+            .reindex(columns=names)
+            .astype(float)
+        )
+        raw = values.to_numpy()
+        present = ~np.isnan(raw)
+
+        definitions = [self.indicator_definitions[name] for name in names]
+        targets = np.array([d.target_value for d in definitions])
+        minimums = np.array([d.minimum_value for d in definitions])
+        weights = np.array([d.weight for d in definitions])
+        methods = np.array([d.calculation_method for d in definitions])
+
+        # Indicator scores (0-100), mirroring calculate_indicator_score
+        with np.errstate(divide="ignore", invalid="ignore"):
+            linear = np.minimum(100.0, raw / targets * 100.0)
+            logarithmic = np.where(
+                raw > 0,
+                np.minimum(100.0, np.log1p(raw) / np.log1p(targets) * 100.0),
+                0.0,
+            )
+            threshold = np.where(raw >= targets, 100.0, raw / targets * 100.0)
+        scores = np.select(
+            [methods == "linear", methods == "logarithmic", methods == "threshold"],
+            [linear, logarithmic, threshold],
+            default=0.0,
+        )
+        scores = np.where(present & (raw >= minimums), scores, 0.0)
+        scores = _round2(np.nan_to_num(scores))
+
+        pillar_weights = self._get_pillar_weights()
+        total = np.zeros(len(values))
+        pillar_scores = {}
+        sub_pillar_scores = {}
+        indicators_counted = np.zeros(len(values))
+
+        for pillar in self.PILLARS:
+            weighted_sum = np.zeros(len(values))
+            weight_sum = np.zeros(len(values))
+
+            for sub_pillar, sub_weight in self._get_sub_pillar_weights(pillar).items():
+                columns = [
+                    names.index(name)
+                    for name in self.indicator_index.get(pillar, {}).get(sub_pillar, {})
+                ]
+                if columns:
+                    w = weights[columns] * present[:, columns]
+                    total_w = w.sum(axis=1)
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        sub_score = np.where(
+                            total_w > 0,
+                            (scores[:, columns] * w).sum(axis=1) / total_w,
+                            0.0,
+                        )
+                    sub_score = _round2(sub_score)
+                    counted = present[:, columns].sum(axis=1)
+                else:
+                    sub_score = np.zeros(len(values))
+                    counted = np.zeros(len(values))
+
+                sub_pillar_scores[(pillar, sub_pillar)] = sub_score
+
+                # Only sub-pillars with data contribute, as in calculate_pillar_score
+                has_data = sub_score > 0
+                weighted_sum += np.where(has_data, sub_score * sub_weight, 0.0)
+                weight_sum += np.where(has_data, sub_weight, 0.0)
+                indicators_counted += np.where(has_data, counted, 0)
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                pillar_score = np.where(weight_sum > 0, weighted_sum / weight_sum, 0.0)
+            pillar_scores[pillar] = _round2(pillar_score)
+            total += pillar_scores[pillar] * pillar_weights[pillar]
+
+        total = _round2(total)
+        completeness = indicators_counted / len(names) * 100
+
+        results = []
+        for row, country_id in enumerate(values.index):
+            country_pillars = {
+                f"{pillar}_score": float(pillar_scores[pillar][row])
+                for pillar in self.PILLARS
+            }
+            total_score = float(total[row])
+            tier = self._determine_readiness_tier(total_score, country_pillars)
+
+            result = {
+                "country_id": country_id,
+                "assessment_year": assessment_year,
+                "assessment_quarter": assessment_quarter,
+                "total_score": total_score,
+                "readiness_tier": tier,
+                "tier_justification": self._generate_tier_justification(
+                    total_score, country_pillars, tier
+                ),
+                **country_pillars,
+                "overall_confidence_score": self._calculate_confidence_score(
+                    float(completeness[row]), country_pillars
+                ),
+                "data_completeness_percentage": round(float(completeness[row]), 2),
+                "peer_review_status": "pending",
+                "key_strengths": self._identify_key_strengths(country_pillars),
+                "priority_improvement_areas": self._identify_improvement_areas(
+                    country_pillars
+                ),
+                "assessment_methodology_version": "1.0",
+            }
+            for (pillar, sub_pillar), sub_score in sub_pillar_scores.items():
+                prefix = self.SUB_PILLAR_COLUMN_PREFIXES[pillar]
+                result[f"{prefix}_{sub_pillar}"] = float(sub_score[row])
+
+            results.append(result)
+
+        return results
+
+    async def score_countries_bulk(
+        self,
+        db_service=None,
+        country_ids: Optional[List[str]] = None,
+        assessment_year: Optional[int] = None,
+        assessment_quarter: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Score all (or the given) countries and bulk upsert into ahaii_scores
+
+        Indicators for every country are fetched in one paged query, scored
+        with score_indicator_frame and written back in a single upsert.
+        """
+        if db_service is None:
+            from services.database_service import db_service
+
+        now = datetime.now()
+        assessment_year = assessment_year or now.year
+        assessment_quarter = assessment_quarter or (now.month - 1) // 3 + 1
+
+        rows = await db_service.get_infrastructure_indicators_bulk(country_ids)
+        frame = pd.DataFrame(
+            rows, columns=["country_id", "indicator_name", "indicator_value"]
+        )
+        frame["indicator_value"] = pd.to_numeric(
+            frame["indicator_value"], errors="coerce"
+        )
+
+        scores = self.score_indicator_frame(
+            frame.dropna(subset=["indicator_value"]),
+            assessment_year,
+            assessment_quarter,
+        )
+        stored = await db_service.bulk_upsert_ahaii_scores(scores)
+
+        scored_ids = {s["country_id"] for s in scores}
+        return {
+            "countries_scored": len(scores),
+            "countries_stored": stored,
+            "countries_without_indicators": [
+                c for c in (country_ids or []) if c not in scored_ids
+            ],
+            "assessment_year": assessment_year,
+            "assessment_quarter": assessment_quarter,
+            "scores": scores,
+        }
+
     def _determine_readiness_tier(self, total_score: float, pillar_scores: Dict) -> int:
         """Determine AHAII readiness tier based on total score and pillar balance"""
 
@@ -32,55 +32,77 @@ class DatabaseService:
             return str(date_obj)
 
     # PUBLICATIONS
+    PUBLICATION_UPSERT_CHUNK_SIZE = 500
+
+    # Fields compared against the stored row to decide whether to update it
+    PUBLICATION_CONTENT_FIELDS = (
+        "title",
+        "abstract",
+        "doi",
+        "url",
+        "pdf_url",
+        "journal",
+        "venue",
+        "keywords",
+        "african_entities",
+        "african_relevance_score",
+        "ai_relevance_score",
+    )
+
+    # Fields an update must not overwrite on an existing row
+    PUBLICATION_INSERT_ONLY_FIELDS = ("id", "created_at", "verification_status")
+
+    def _build_publication_record(
+        self, publication_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Map publication data onto the publications table schema"""
+        publication_date = publication_data.get("publication_date")
+        return {
+            "id": str(uuid4()),
+            "title": publication_data.get("title", ""),
+            "abstract": publication_data.get("abstract"),
+            "publication_type": publication_data.get(
+                "publication_type", "journal_paper"
+            ),
+            "publication_date": self.serialize_date(publication_date),
+            "year": publication_data.get("year")
+            or (publication_date.year if hasattr(publication_date, "year") else None),
+            "doi": publication_data.get("doi"),
+            "url": publication_data.get("url"),
+            "pdf_url": publication_data.get("pdf_url"),
+            "journal": publication_data.get("journal") or publication_data.get("venue"),
+            "venue": publication_data.get("venue"),
+            "citation_count": publication_data.get("citation_count", 0),
+            "project_domain": publication_data.get("project_domain"),
+            "ai_techniques": publication_data.get("ai_techniques"),
+            "geographic_scope": publication_data.get("geographic_scope"),
+            "funding_source": publication_data.get("funding_source"),
+            "key_outcomes": publication_data.get("key_outcomes"),
+            "african_relevance_score": publication_data.get(
+                "african_relevance_score", 0.0
+            ),
+            "ai_relevance_score": publication_data.get("ai_relevance_score", 0.0),
+            "african_entities": publication_data.get("african_entities", []),
+            "keywords": publication_data.get("keywords", []),
+            "source": publication_data.get("source", "systematic_review"),
+            "source_id": publication_data.get("source_id")
+            or publication_data.get("arxiv_id")
+            or publication_data.get("pubmed_id"),
+            "data_type": publication_data.get("data_type", "Academic Paper"),
+            "processed_at": datetime.utcnow().isoformat(),
+            "verification_status": publication_data.get(
+                "verification_status", "pending"
+            ),
+            "created_at": datetime.utcnow().isoformat(),
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+
     async def create_publication(
         self, publication_data: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Create a new publication record"""
         try:
-            # Prepare publication data according to current schema
-            publication_date = publication_data.get("publication_date")
-            pub_record = {
-                "id": str(uuid4()),
-                "title": publication_data.get("title", ""),
-                "abstract": publication_data.get("abstract"),
-                "publication_type": publication_data.get(
-                    "publication_type", "journal_paper"
-                ),
-                "publication_date": self.serialize_date(publication_date),
-                "year": publication_data.get("year")
-                or (
-                    publication_date.year if hasattr(publication_date, "year") else None
-                ),
-                "doi": publication_data.get("doi"),
-                "url": publication_data.get("url"),
-                "pdf_url": publication_data.get("pdf_url"),
-                "journal": publication_data.get("journal")
-                or publication_data.get("venue"),
-                "venue": publication_data.get("venue"),
-                "citation_count": publication_data.get("citation_count", 0),
-                "project_domain": publication_data.get("project_domain"),
-                "ai_techniques": publication_data.get("ai_techniques"),
-                "geographic_scope": publication_data.get("geographic_scope"),
-                "funding_source": publication_data.get("funding_source"),
-                "key_outcomes": publication_data.get("key_outcomes"),
-                "african_relevance_score": publication_data.get(
-                    "african_relevance_score", 0.0
-                ),
-                "ai_relevance_score": publication_data.get("ai_relevance_score", 0.0),
-                "african_entities": publication_data.get("african_entities", []),
-                "keywords": publication_data.get("keywords", []),
-                "source": publication_data.get("source", "systematic_review"),
-                "source_id": publication_data.get("source_id")
-                or publication_data.get("arxiv_id")
-                or publication_data.get("pubmed_id"),
-                "data_type": publication_data.get("data_type", "Academic Paper"),
-                "processed_at": datetime.utcnow().isoformat(),
-                "verification_status": publication_data.get(
-                    "verification_status", "pending"
-                ),
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
+            pub_record = self._build_publication_record(publication_data)
 
             # Remove None values
             pub_record = {k: v for k, v in pub_record.items() if v is not None}
@@ -116,6 +138,175 @@ class DatabaseService:
         )
         return created_publications
 
+    async def bulk_upsert_publications(
+        self,
+        publications: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Insert new and update changed publications in batches
+
+        The batch is deduplicated locally (stable source ID, then near-duplicate
+        title), existing rows are fetched with a single ``in_`` lookup on
+        ``source_id`` and the legacy IDs rows were stored under before stable
+        IDs (raw arXiv ID, PMID), new rows are upserted in chunks keyed on
+        ``source_id`` and changed rows by ``id``. A row found under a legacy
+        ID is rewritten to the stable ID rather than inserted again. Inserts
+        never overwrite a row another run stored in the meantime, and updates
+        leave fields the batch does not know (None) untouched. Returns
+        inserted/updated/skipped/failed counts.
+        """
+        from services.deduplication_service import PaperDedupIndex, generate_paper_id
+
+        chunk_size = chunk_size or self.PUBLICATION_UPSERT_CHUNK_SIZE
+        counts = {"inserted": 0, "updated": 0, "skipped": 0, "failed": 0}
+
+        def relevance(pub: Dict[str, Any]) -> float:
+            return (pub.get("african_relevance_score") or 0.0) + (
+                pub.get("ai_relevance_score") or 0.0
+            )
+
+        dedup_index = PaperDedupIndex(lambda new, old: relevance(new) > relevance(old))
+        for pub_data in publications:
+            if not pub_data.get("source_id"):
+                pub_data = {**pub_data, "source_id": generate_paper_id(pub_data)}
+            if dedup_index.add(pub_data):
+                counts["skipped"] += 1
+
+        records, legacy_ids = [], {}
+        for source_id, pub_data in dedup_index.items():
+            records.append(
+                self._build_publication_record({**pub_data, "source_id": source_id})
+            )
+            legacy_ids[source_id] = self._legacy_publication_ids(pub_data, source_id)
+        if not records:
+            return counts
+
+        try:
+            existing = await self._get_publications_by_source_ids(
+                [r["source_id"] for r in records]
+                + [i for ids in legacy_ids.values() for i in ids],
+                chunk_size,
+            )
+        except Exception as e:
+            logger.error(f"❌ Error looking up existing publications: {e}")
+            counts["failed"] += len(records)
+            return counts
+
+        to_insert, to_update = [], []
+        for record in records:
+            stored = existing.get(record["source_id"])
+            if stored is None:
+                legacy_id = next(
+                    (i for i in legacy_ids[record["source_id"]] if i in existing),
+                    None,
+                )
+                # A legacy row is claimed by one record only
+                stored = existing.pop(legacy_id) if legacy_id else None
+            if stored is None:
+                to_insert.append(record)
+            elif stored["source_id"] != record["source_id"] or (
+                self._publication_changed(stored, record)
+            ):
+                to_update.append(
+                    {
+                        **{
+                            k: v
+                            for k, v in record.items()
+                            if v is not None
+                            and k not in self.PUBLICATION_INSERT_ONLY_FIELDS
+                        },
+                        "id": stored["id"],
+                    }
+                )
+            else:
+                counts["skipped"] += 1
+
+        # A row inserted by a concurrent run since the lookup is left as is
+        for i in range(0, len(to_insert), chunk_size):
+            chunk = to_insert[i : i + chunk_size]
+            try:
+                result = (
+                    self.client.table("publications")
+                    .upsert(chunk, on_conflict="source_id", ignore_duplicates=True)
+                    .execute()
+                )
+                inserted = len(result.data or [])
+                counts["inserted"] += inserted
+                counts["skipped"] += len(chunk) - inserted
+            except Exception as e:
+                logger.error(f"❌ Error upserting publications chunk: {e}")
+                counts["failed"] += len(chunk)
+
+        # Bulk upserts need uniform keys, so updates are grouped by the set of
+        # fields they carry
+        update_groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        for row in to_update:
+            update_groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        for rows in update_groups.values():
+            for i in range(0, len(rows), chunk_size):
+                chunk = rows[i : i + chunk_size]
+                try:
+                    self.client.table("publications").upsert(
+                        chunk, on_conflict="id"
+                    ).execute()
+                    counts["updated"] += len(chunk)
+                except Exception as e:
+                    logger.error(f"❌ Error upserting publications chunk: {e}")
+                    counts["failed"] += len(chunk)
+
+        logger.info(
+            f"✅ Publications upsert: {counts['inserted']} inserted, "
+            f"{counts['updated']} updated, {counts['skipped']} skipped, "
+            f"{counts['failed']} failed"
+        )
+        return counts
+
+    async def _get_publications_by_source_ids(
+        self, source_ids: List[str], chunk_size: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch stored publications keyed by source_id"""
+        columns = ",".join(("id", "source_id") + self.PUBLICATION_CONTENT_FIELDS)
+        existing = {}
+        for i in range(0, len(source_ids), chunk_size):
+            result = (
+                self.client.table("publications")
+                .select(columns)
+                .in_("source_id", source_ids[i : i + chunk_size])
+                .execute()
+            )
+            for row in result.data or []:
+                existing[row["source_id"]] = row
+        return existing
+
+    @staticmethod
+    def _legacy_publication_ids(
+        publication_data: Dict[str, Any], source_id: str
+    ) -> List[str]:
+        """source_ids a publication was stored under before stable paper IDs"""
+        legacy_ids = []
+        for field in ("arxiv_id", "pmid"):
+            value = publication_data.get(field)
+            value = str(value).strip() if value is not None else ""
+            if value and value != source_id:
+                legacy_ids.append(value)
+        return legacy_ids
+
+    def _publication_changed(
+        self, stored: Dict[str, Any], record: Dict[str, Any]
+    ) -> bool:
+        """Whether any content field the record sets differs from the stored row"""
+        for field in self.PUBLICATION_CONTENT_FIELDS:
+            old, new = stored.get(field), record.get(field)
+            if new is None:
+                continue
+            if isinstance(old, float) or isinstance(new, float):
+                if round(old or 0.0, 4) != round(new or 0.0, 4):
+                    return True
+            elif (old or None) != (new or None):
+                return True
+        return False
+
     # INNOVATIONS
     async def create_innovation(
         self, innovation_data: Dict[str, Any]
@@ -539,74 +730,73 @@ class DatabaseService:
             logger.error(f"❌ Error creating infrastructure indicator: {e}")
             return None
 
+    def _build_ahaii_score_record(
+        self, country_id: str, scores: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Map a scoring result onto the ahaii_scores table schema"""
+        return {
+            "country_id": country_id,
+            "assessment_year": scores.get("assessment_year"),
+            "assessment_quarter": scores.get("assessment_quarter"),
+            "total_score": scores.get("total_score"),
+            "global_ranking": scores.get("global_ranking"),
+            "regional_ranking": scores.get("regional_ranking"),
+            "sub_regional_ranking": scores.get("sub_regional_ranking"),
+            # Pillar scores
+            "human_capital_score": scores.get("human_capital_score"),
+            "human_capital_clinical_literacy": scores.get(
+                "human_capital_clinical_literacy"
+            ),
+            "human_capital_informatics_capacity": scores.get(
+                "human_capital_informatics_capacity"
+            ),
+            "human_capital_workforce_pipeline": scores.get(
+                "human_capital_workforce_pipeline"
+            ),
+            "physical_infrastructure_score": scores.get(
+                "physical_infrastructure_score"
+            ),
+            "physical_digitization_level": scores.get("physical_digitization_level"),
+            "physical_computational_capacity": scores.get(
+                "physical_computational_capacity"
+            ),
+            "physical_connectivity_reliability": scores.get(
+                "physical_connectivity_reliability"
+            ),
+            "regulatory_infrastructure_score": scores.get(
+                "regulatory_infrastructure_score"
+            ),
+            "regulatory_approval_pathways": scores.get("regulatory_approval_pathways"),
+            "regulatory_data_governance": scores.get("regulatory_data_governance"),
+            "regulatory_market_access": scores.get("regulatory_market_access"),
+            "economic_market_score": scores.get("economic_market_score"),
+            "economic_market_maturity": scores.get("economic_market_maturity"),
+            "economic_financial_sustainability": scores.get(
+                "economic_financial_sustainability"
+            ),
+            "economic_research_funding": scores.get("economic_research_funding"),
+            "readiness_tier": scores.get("readiness_tier"),
+            "tier_justification": scores.get("tier_justification"),
+            "overall_confidence_score": scores.get("overall_confidence_score"),
+            "data_completeness_percentage": scores.get("data_completeness_percentage"),
+            "expert_validation_score": scores.get("expert_validation_score"),
+            "peer_review_status": scores.get("peer_review_status", "pending"),
+            "development_trajectory": scores.get("development_trajectory"),
+            "key_strengths": scores.get("key_strengths", []),
+            "priority_improvement_areas": scores.get("priority_improvement_areas", []),
+            "assessment_methodology_version": scores.get(
+                "assessment_methodology_version", "1.0"
+            ),
+            "indicator_weights_used": scores.get("indicator_weights_used"),
+            "created_at": datetime.utcnow().isoformat(),
+        }
+
     async def update_ahaii_scores(
         self, country_id: str, scores: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Update AHAII scores for a country"""
         try:
-            score_record = {
-                "country_id": country_id,
-                "assessment_year": scores.get("assessment_year"),
-                "assessment_quarter": scores.get("assessment_quarter"),
-                "total_score": scores.get("total_score"),
-                "global_ranking": scores.get("global_ranking"),
-                "regional_ranking": scores.get("regional_ranking"),
-                "sub_regional_ranking": scores.get("sub_regional_ranking"),
-                # Pillar scores
-                "human_capital_score": scores.get("human_capital_score"),
-                "human_capital_clinical_literacy": scores.get(
-                    "human_capital_clinical_literacy"
-                ),
-                "human_capital_informatics_capacity": scores.get(
-                    "human_capital_informatics_capacity"
-                ),
-                "human_capital_workforce_pipeline": scores.get(
-                    "human_capital_workforce_pipeline"
-                ),
-                "physical_infrastructure_score": scores.get(
-                    "physical_infrastructure_score"
-                ),
-                "physical_digitization_level": scores.get(
-                    "physical_digitization_level"
-                ),
-                "physical_computational_capacity": scores.get(
-                    "physical_computational_capacity"
-                ),
-                "physical_connectivity_reliability": scores.get(
-                    "physical_connectivity_reliability"
-                ),
-                "regulatory_infrastructure_score": scores.get(
-                    "regulatory_infrastructure_score"
-                ),
-                "regulatory_approval_pathways": scores.get(
-                    "regulatory_approval_pathways"
-                ),
-                "regulatory_data_governance": scores.get("regulatory_data_governance"),
-                "regulatory_market_access": scores.get("regulatory_market_access"),
-                "economic_market_score": scores.get("economic_market_score"),
-                "economic_market_maturity": scores.get("economic_market_maturity"),
-                "economic_financial_sustainability": scores.get(
-                    "economic_financial_sustainability"
-                ),
-                "economic_research_funding": scores.get("economic_research_funding"),
-                "readiness_tier": scores.get("readiness_tier"),
-                "tier_justification": scores.get("tier_justification"),
-                "overall_confidence_score": scores.get("overall_confidence_score"),
-                "data_completeness_percentage": scores.get(
-                    "data_completeness_percentage"
-                ),
-                "expert_validation_score": scores.get("expert_validation_score"),
-                "peer_review_status": scores.get("peer_review_status", "pending"),
-                "development_trajectory": scores.get("development_trajectory"),
-                "key_strengths": scores.get("key_strengths", []),
-                "priority_improvement_areas": scores.get(
-                    "priority_improvement_areas", []
-                ),
-                "assessment_methodology_version": scores.get(
-                    "assessment_methodology_version", "1.0"
-                ),
-                "created_at": datetime.utcnow().isoformat(),
-            }
+            score_record = self._build_ahaii_score_record(country_id, scores)
 
             # Remove None values
             score_record = {k: v for k, v in score_record.items() if v is not None}
@@ -639,6 +829,7 @@ class DatabaseService:
                 logger.info(f"✅ Created AHAII scores for country {country_id}")
 
             if result.data:
+                await self.append_score_history([score_record])
                 return result.data[0]
             else:
                 logger.error(f"❌ Failed to update AHAII scores: {result}")
@@ -851,6 +1042,226 @@ class DatabaseService:
             logger.error(f"❌ Error fetching latest AHAII scores for {country_id}: {e}")
             return None
 
+    async def bulk_upsert_ahaii_scores(
+        self, scores_list: List[Dict[str, Any]], chunk_size: int = 500
+    ) -> int:
+        """Upsert AHAII scores for many countries, returning rows written"""
+        records = [
+            self._build_ahaii_score_record(scores["country_id"], scores)
+            for scores in scores_list
+        ]
+        if not records:
+            return 0
+
+        # Bulk upserts need uniform keys: drop columns no record sets, so
+        # e.g. rankings computed elsewhere are left untouched
+        columns = [k for k in records[0] if any(r[k] is not None for r in records)]
+        records = [{k: r[k] for k in columns} for r in records]
+
+        stored = 0
+        written = []
+        for i in range(0, len(records), chunk_size):
+            chunk = records[i : i + chunk_size]
+            try:
+                result = (
+                    self.client.table("ahaii_scores")
+                    .upsert(
+                        chunk,
+                        on_conflict="country_id,assessment_year,assessment_quarter",
+                    )
+                    .execute()
+                )
+                stored += len(result.data or [])
+                if result.data:
+                    written.extend(chunk)
+            except Exception as e:
+                logger.error(f"❌ Error bulk upserting AHAII scores: {e}")
+
+        logger.info(
+            f"✅ Bulk upserted AHAII scores for {stored}/{len(records)} countries"
+        )
+        await self.append_score_history(written, chunk_size=chunk_size)
+        return stored
+
+    # SCORE HISTORY
+    SCORE_HISTORY_FIELDS = (
+        "country_id",
+        "assessment_year",
+        "assessment_quarter",
+        "total_score",
+        "human_capital_score",
+        "physical_infrastructure_score",
+        "regulatory_infrastructure_score",
+        "economic_market_score",
+        "readiness_tier",
+        "overall_confidence_score",
+        "data_completeness_percentage",
+        "assessment_methodology_version",
+    )
+
+    # date_trunc() units accepted for downsampled history
+    SCORE_HISTORY_INTERVALS = ("week", "month")
+
+    async def append_score_history(
+        self,
+        score_records: List[Dict[str, Any]],
+        computed_at: Optional[datetime] = None,
+        chunk_size: int = 500,
+    ) -> int:
+        """Append recalculated scores to ahaii_score_history, returning rows written
+
+        Every record gets the same computed_at, so one recalculation forms
+        one point in time across all countries.
+        """
+        computed_at = self.serialize_date(computed_at or datetime.utcnow())
+        rows = [
+            {
+                **{field: record.get(field) for field in self.SCORE_HISTORY_FIELDS},
+                "computed_at": computed_at,
+            }
+            for record in score_records
+            if record.get("country_id") and record.get("total_score") is not None
+        ]
+
+        written = 0
+        for i in range(0, len(rows), chunk_size):
+            try:
+                result = (
+                    self.client.table("ahaii_score_history")
+                    .insert(rows[i : i + chunk_size])
+                    .execute()
+                )
+                written += len(result.data or [])
+            except Exception as e:
+                logger.error(f"❌ Error appending AHAII score history: {e}")
+
+        return written
+
+    async def get_scores_as_of(
+        self, as_of: datetime, country_ids: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get each country's latest score computed at or before as_of"""
+        try:
+            result = self.client.rpc(
+                "ahaii_scores_as_of",
+                {
+                    "p_as_of": self.serialize_date(as_of),
+                    "p_country_ids": country_ids,
+                },
+            ).execute()
+            return result.data or []
+
+        except Exception as e:
+            logger.error(f"❌ Error fetching AHAII scores as of {as_of}: {e}")
+            return []
+
+    async def get_score_deltas(
+        self,
+        start: datetime,
+        end: Optional[datetime] = None,
+        country_ids: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the change in each country's scores between two points in time
+
+        Countries first scored after start are compared against a baseline
+        of None.
+        """
+        end = end or datetime.utcnow()
+        before = {
+            row["country_id"]: row
+            for row in await self.get_scores_as_of(start, country_ids)
+        }
+        after = await self.get_scores_as_of(end, country_ids)
+
+        score_fields = [f for f in self.SCORE_HISTORY_FIELDS if f.endswith("_score")]
+        deltas = []
+        for row in after:
+            baseline = before.get(row["country_id"])
+            delta = {
+                "country_id": row["country_id"],
+                "from_computed_at": baseline["computed_at"] if baseline else None,
+                "to_computed_at": row["computed_at"],
+                "from_readiness_tier": baseline["readiness_tier"] if baseline else None,
+                "to_readiness_tier": row["readiness_tier"],
+            }
+            for field in score_fields:
+                new = row.get(field)
+                old = baseline.get(field) if baseline else None
+                delta[field] = new
+                delta[f"{field}_change"] = (
+                    round(float(new) - float(old), 2)
+                    if new is not None and old is not None
+                    else None
+                )
+            deltas.append(delta)
+
+        return deltas
+
+    async def get_score_history_downsampled(
+        self,
+        interval: str,
+        start: datetime,
+        end: Optional[datetime] = None,
+        country_ids: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the last score of each week or month per country"""
+        if interval not in self.SCORE_HISTORY_INTERVALS:
+            raise ValueError(
+                f"interval must be one of {self.SCORE_HISTORY_INTERVALS}, got '{interval}'"
+            )
+
+        try:
+            result = self.client.rpc(
+                "ahaii_score_history_downsampled",
+                {
+                    "p_bucket": interval,
+                    "p_start": self.serialize_date(start),
+                    "p_end": self.serialize_date(end or datetime.utcnow()),
+                    "p_country_ids": country_ids,
+                },
+            ).execute()
+            return result.data or []
+
+        except Exception as e:
+            logger.error(f"❌ Error fetching downsampled AHAII score history: {e}")
+            return []
+
+    async def get_infrastructure_indicators_bulk(
+        self,
+        country_ids: Optional[List[str]] = None,
+        columns: str = "country_id, indicator_name, indicator_value, created_at",
+        page_size: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """Get indicators for all (or the given) countries, oldest first
+
+        Pages through the result with range() since PostgREST caps rows per
+        response.
+        """
+        rows: List[Dict[str, Any]] = []
+        try:
+            start = 0
+            while True:
+                query = self.client.table("infrastructure_indicators").select(columns)
+                if country_ids:
+                    query = query.in_("country_id", country_ids)
+                result = (
+                    query.order("created_at")
+                    .range(start, start + page_size - 1)
+                    .execute()
+                )
+                page = result.data or []
+                rows.extend(page)
+                if len(page) < page_size:
+                    break
+                start += page_size
+
+        except Exception as e:
+            # A partial page set would score countries on incomplete data
+            logger.error(f"❌ Error fetching infrastructure indicators: {e}")
+            return []
+
+        return rows
+
     async def get_infrastructure_indicators_by_pillar(
         self, country_id: str, pillar: str, data_year: int = None
     ) -> List[Dict[str, Any]]:
@@ -15,9 +15,11 @@ import hashlib
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set
 from urllib.parse import urlparse
 
+import numpy as np
 from loguru import logger
 
 try:
@@ -164,6 +166,256 @@ class ContentHasher:
         return text
 
 
+DOI_PREFIX_PATTERN = re.compile(
+    r"^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)", re.IGNORECASE
+)
+ARXIV_PREFIX_PATTERN = re.compile(
+    r"^(?:arxiv:\s*|https?://arxiv\.org/(?:abs|pdf)/)", re.IGNORECASE
+)
+ARXIV_VERSION_PATTERN = re.compile(r"v\d+$")
+TITLE_STOPWORDS_PATTERN = re.compile(
+    r"\b(the|a|an|and|or|but|in|on|at|to|for|of|with|by)\b"
+)
+
+
+def _clean_identifier(value: Any) -> str:
+    """Stringify an identifier field, treating NaN/None placeholders as empty"""
+    if value is None:
+        return ""
+    text = str(value).strip()
+    return "" if text.lower() in ("", "nan", "none", "null") else text
+
+
+def normalize_doi(doi: Any) -> str:
+    """Canonical lowercase DOI without resolver prefixes"""
+    doi = _clean_identifier(doi)
+    return DOI_PREFIX_PATTERN.sub("", doi).strip().lower()
+
+
+def normalize_arxiv_id(arxiv_id: Any) -> str:
+    """Canonical arXiv identifier without prefix or version suffix"""
+    arxiv_id = _clean_identifier(arxiv_id)
+    arxiv_id = ARXIV_PREFIX_PATTERN.sub("", arxiv_id).strip().lower()
+    if arxiv_id.endswith(".pdf"):
+        arxiv_id = arxiv_id[:-4]
+    return ARXIV_VERSION_PATTERN.sub("", arxiv_id)
+
+
+def normalize_title(title: Any) -> str:
+    """Normalize a paper title for deduplication"""
+    normalized = re.sub(r"[^\w\s]", "", _clean_identifier(title).lower())
+    normalized = TITLE_STOPWORDS_PATTERN.sub("", normalized)
+    return re.sub(r"\s+", " ", normalized).strip()
+
+
+def generate_paper_id(paper: Dict[str, Any]) -> str:
+    """Stable paper ID: DOI, then PMID, then arXiv ID, then a SHA-256 of title+year
+
+    Unlike hash(), the result is identical across processes and runs, so
+    upserts keyed on it match previously stored records.
+    """
+    doi = normalize_doi(paper.get("doi"))
+    if doi:
+        return f"doi:{doi}"
+
+    pmid = re.sub(r"\D", "", _clean_identifier(paper.get("pmid")))
+    if pmid:
+        return f"pubmed:{pmid}"
+
+    arxiv_id = normalize_arxiv_id(paper.get("arxiv_id"))
+    if arxiv_id:
+        return f"arxiv:{arxiv_id}"
+
+    year = _clean_identifier(paper.get("year"))
+    if year.endswith(".0"):
+        year = year[:-2]
+    key = f"{normalize_title(paper.get('title'))}|{year}"
+    return f"sha256:{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}"
+
+
+class MinHashLSHIndex:
+    """MinHash signatures with LSH banding for near-duplicate text lookup
+
+    Texts are reduced to character shingles; candidates sharing any LSH band
+    bucket are verified by exact Jaccard similarity, so each lookup only
+    touches a handful of entries instead of the whole index.
+    """
+
+    MERSENNE_PRIME = (1 << 31) - 1
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 120,
+        bands: int = 20,
+        shingle_size: int = 4,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, self.MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, self.MERSENNE_PRIME, num_perm, dtype=np.uint64)
+
+        self._buckets: Dict[tuple, List[str]] = defaultdict(list)
+        self._shingles: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def shingle(self, text: str) -> Set[int]:
+        """Hash character shingles of a text to 31-bit integers"""
+        text = text or ""
+        k = self.shingle_size
+        grams = (
+            {text[i : i + k] for i in range(len(text) - k + 1)}
+            if len(text) > k
+            else {text}
+        )
+        return {
+            int.from_bytes(
+                hashlib.blake2b(gram.encode("utf-8"), digest_size=4).digest(), "big"
+            )
+            & self.MERSENNE_PRIME
+            for gram in grams
+        }
+
+    def signature(self, shingles: Set[int]) -> np.ndarray:
+        """MinHash signature of a shingle set"""
+        hashes = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        permuted = (
+            self._a[:, None] * hashes[None, :] + self._b[:, None]
+        ) % self.MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[tuple]:
+        return [
+            (band, signature[band * self.rows : (band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _best_match(
+        self,
+        shingles: Set[int],
+        band_keys: List[tuple],
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> Optional[str]:
+        candidates = set()
+        for band_key in band_keys:
+            candidates.update(self._buckets.get(band_key, ()))
+
+        best_key, best_score = None, 0.0
+        for key in candidates:
+            if accept is not None and not accept(key):
+                continue
+            existing = self._shingles[key]
+            score = len(shingles & existing) / len(shingles | existing)
+            if score >= self.threshold and score > best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def _insert(self, key: str, shingles: Set[int], band_keys: List[tuple]):
+        self._shingles[key] = shingles
+        for band_key in band_keys:
+            self._buckets[band_key].append(key)
+
+    def query(self, text: str) -> Optional[str]:
+        """Return the key of the most similar indexed text above the threshold"""
+        shingles = self.shingle(text)
+        return self._best_match(shingles, self._band_keys(self.signature(shingles)))
+
+    def add(self, key: str, text: str):
+        """Index a text under a key"""
+        shingles = self.shingle(text)
+        self._insert(key, shingles, self._band_keys(self.signature(shingles)))
+
+    def find_or_add(
+        self, key: str, text: str, accept: Optional[Callable[[str], bool]] = None
+    ) -> Optional[str]:
+        """Return the matching indexed key, or index the text under key and return None
+
+        ``accept`` can veto candidate keys before similarity is considered.
+        """
+        shingles = self.shingle(text)
+        band_keys = self._band_keys(self.signature(shingles))
+        match = self._best_match(shingles, band_keys, accept)
+        if match is None:
+            self._insert(key, shingles, band_keys)
+        return match
+
+
+class PaperDedupIndex:
+    """Incremental paper deduplication by stable ID and near-duplicate title
+
+    Papers sharing a DOI/PMID/arXiv-derived ID merge directly; otherwise a
+    MinHash/LSH lookup on the normalized title finds near-duplicates, except
+    that two different identifier-derived IDs are never merged on title alone.
+    When two papers collide, ``is_better`` decides which record is kept.
+    """
+
+    def __init__(
+        self,
+        is_better: Callable[[Dict[str, Any], Dict[str, Any]], bool],
+        threshold: float = 0.8,
+    ):
+        self.is_better = is_better
+        self.lsh = MinHashLSHIndex(threshold=threshold)
+        self._papers: Dict[str, Dict[str, Any]] = {}
+        self._aliases: Dict[str, str] = {}
+        self._identified: Dict[str, str] = {}  # cluster -> identifier-derived ID
+
+    def __len__(self) -> int:
+        return len(self._papers)
+
+    def add(self, paper: Dict[str, Any]) -> bool:
+        """Add a paper, returning True if it duplicated an indexed one"""
+        paper_id = paper.get("source_id") or generate_paper_id(paper)
+        title_key = normalize_title(paper.get("title"))
+
+        identified = not paper_id.startswith("sha256:")
+
+        cluster = self._aliases.get(paper_id)
+        if cluster is None and title_key:
+            accept = (
+                (lambda key: self._identified.get(key, paper_id) == paper_id)
+                if identified
+                else None
+            )
+            cluster = self.lsh.find_or_add(paper_id, title_key, accept)
+
+        if cluster is None:
+            cluster = paper_id
+            self._papers[cluster] = paper
+            self._aliases[paper_id] = cluster
+            if identified:
+                self._identified[cluster] = paper_id
+            return False
+
+        self._aliases.setdefault(paper_id, cluster)
+        if identified:
+            self._identified.setdefault(cluster, paper_id)
+        if self.is_better(paper, self._papers[cluster]):
+            self._papers[cluster] = paper
+        return True
+
+    def papers(self) -> List[Dict[str, Any]]:
+        return list(self._papers.values())
+
+    def items(self) -> List[tuple]:
+        """(canonical ID, kept paper) pairs, preferring identifier-derived IDs"""
+        return [
+            (self._identified.get(cluster, cluster), paper)
+            for cluster, paper in self._papers.items()
+        ]
+
+
 class DeduplicationService:
     """Main deduplication service for TAIFA-FIALA ETL pipeline"""
 
@@ -6,9 +6,11 @@ and real-time updating of country AHAII scores
 
 import asyncio
 import json
+import math
 import re
+import time
 from datetime import datetime, date
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
 from loguru import logger
@@ -16,6 +18,7 @@ from pydantic import BaseModel
 
 from config.database import get_supabase
 from services.ahaii_scoring_service import AHAIIScoringService
+from services.database_service import DatabaseService
 
 
 class InfrastructureSignal(BaseModel):
@@ -43,71 +46,401 @@ class InfrastructureSignal(BaseModel):
     verification_status: str = "pending"  # 'pending', 'verified', 'disputed'
 
 
+# Country vocabulary by ISO alpha-3 code, grouped by term type
+AFRICAN_COUNTRY_TERMS: Dict[str, Dict[str, List[str]]] = {
+    "DZA": {
+        "names": ["algeria"],
+        "demonyms": ["algerian"],
+        "capitals": ["algiers"],
+        "cities": ["oran"],
+    },
+    "AGO": {"names": ["angola"], "demonyms": ["angolan"], "capitals": ["luanda"]},
+    "BEN": {
+        "names": ["benin"],
+        "demonyms": ["beninese"],
+        "capitals": ["porto-novo"],
+        "cities": ["cotonou"],
+    },
+    "BWA": {
+        "names": ["botswana"],
+        "demonyms": ["motswana", "batswana"],
+        "capitals": ["gaborone"],
+    },
+    "BFA": {
+        "names": ["burkina faso"],
+        "demonyms": ["burkinabe"],
+        "capitals": ["ouagadougou"],
+    },
+    "BDI": {
+        "names": ["burundi"],
+        "demonyms": ["burundian"],
+        "capitals": ["gitega"],
+        "cities": ["bujumbura"],
+    },
+    "CPV": {
+        "names": ["cabo verde"],
+        "aliases": ["cape verde"],
+        "demonyms": ["cape verdean", "cabo verdean"],
+        "capitals": ["praia"],
+    },
+    "CMR": {
+        "names": ["cameroon"],
+        "demonyms": ["cameroonian"],
+        "capitals": ["yaounde"],
+        "cities": ["douala"],
+    },
+    "CAF": {"names": ["central african republic"], "capitals": ["bangui"]},
+    "TCD": {
+        "names": ["chad"],
+        "demonyms": ["chadian"],
+        "capitals": ["n'djamena", "ndjamena"],
+    },
+    "COM": {"names": ["comoros"], "demonyms": ["comorian"], "capitals": ["moroni"]},
+    "COG": {
+        "names": ["republic of the congo", "republic of congo"],
+        "aliases": ["congo-brazzaville", "congo republic"],
+        "capitals": ["brazzaville"],
+    },
+    "COD": {
+        "names": ["democratic republic of the congo", "democratic republic of congo"],
+        "aliases": ["dr congo", "drc", "congo-kinshasa"],
+        "capitals": ["kinshasa"],
+        "cities": ["lubumbashi", "goma"],
+    },
+    "CIV": {
+        "names": ["cote d'ivoire"],
+        "aliases": ["ivory coast"],
+        "demonyms": ["ivorian"],
+        "capitals": ["yamoussoukro"],
+        "cities": ["abidjan"],
+    },
+    "DJI": {"names": ["djibouti"], "demonyms": ["djiboutian"]},
+    "EGY": {
+        "names": ["egypt"],
+        "demonyms": ["egyptian"],
+        "capitals": ["cairo"],
+        "cities": ["alexandria", "giza"],
+    },
+    "GNQ": {
+        "names": ["equatorial guinea"],
+        "demonyms": ["equatoguinean"],
+        "capitals": ["malabo"],
+    },
+    "ERI": {"names": ["eritrea"], "demonyms": ["eritrean"], "capitals": ["asmara"]},
+    "SWZ": {
+        "names": ["eswatini"],
+        "aliases": ["swaziland"],
+        "demonyms": ["swazi"],
+        "capitals": ["mbabane"],
+    },
+    "ETH": {
+        "names": ["ethiopia"],
+        "demonyms": ["ethiopian"],
+        "capitals": ["addis ababa"],
+        "cities": ["dire dawa"],
+    },
+    "GAB": {"names": ["gabon"], "demonyms": ["gabonese"], "capitals": ["libreville"]},
+    "GMB": {"names": ["gambia"], "demonyms": ["gambian"], "capitals": ["banjul"]},
+    "GHA": {
+        "names": ["ghana"],
+        "demonyms": ["ghanaian"],
+        "capitals": ["accra"],
+        "cities": ["kumasi", "tamale"],
+    },
+    "GIN": {
+        "names": ["guinea"],
+        "aliases": ["guinea-conakry"],
+        "demonyms": ["guinean"],
+        "capitals": ["conakry"],
+    },
+    "GNB": {
+        "names": ["guinea-bissau", "guinea bissau"],
+        "demonyms": ["bissau-guinean"],
+        "capitals": ["bissau"],
+    },
+    "KEN": {
+        "names": ["kenya"],
+        "demonyms": ["kenyan"],
+        "capitals": ["nairobi"],
+        "cities": ["mombasa", "kisumu", "kenyatta"],
+    },
+    "LSO": {
+        "names": ["lesotho"],
+        "demonyms": ["basotho", "mosotho"],
+        "capitals": ["maseru"],
+    },
+    "LBR": {"names": ["liberia"], "demonyms": ["liberian"], "capitals": ["monrovia"]},
+    "LBY": {
+        "names": ["libya"],
+        "demonyms": ["libyan"],
+        "capitals": ["tripoli"],
+        "cities": ["benghazi"],
+    },
+    "MDG": {
+        "names": ["madagascar"],
+        "demonyms": ["malagasy"],
+        "capitals": ["antananarivo"],
+    },
+    "MWI": {
+        "names": ["malawi"],
+        "demonyms": ["malawian"],
+        "capitals": ["lilongwe"],
+        "cities": ["blantyre"],
+    },
+    "MLI": {"names": ["mali"], "demonyms": ["malian"], "capitals": ["bamako"]},
+    "MRT": {
+        "names": ["mauritania"],
+        "demonyms": ["mauritanian"],
+        "capitals": ["nouakchott"],
+    },
+    "MUS": {
+        "names": ["mauritius"],
+        "demonyms": ["mauritian"],
+        "capitals": ["port louis"],
+    },
+    "MAR": {
+        "names": ["morocco"],
+        "demonyms": ["moroccan"],
+        "capitals": ["rabat"],
+        "cities": ["casablanca", "marrakech"],
+    },
+    "MOZ": {
+        "names": ["mozambique"],
+        "demonyms": ["mozambican"],
+        "capitals": ["maputo"],
+    },
+    "NAM": {"names": ["namibia"], "demonyms": ["namibian"], "capitals": ["windhoek"]},
+    "NER": {"names": ["niger"], "demonyms": ["nigerien"], "capitals": ["niamey"]},
+    "NGA": {
+        "names": ["nigeria"],
+        "aliases": ["niger delta"],
+        "demonyms": ["nigerian"],
+        "capitals": ["abuja"],
+        "cities": ["lagos", "kano", "ibadan"],
+    },
+    "RWA": {"names": ["rwanda"], "demonyms": ["rwandan"], "capitals": ["kigali"]},
+    "STP": {"names": ["sao tome and principe"], "demonyms": ["santomean"]},
+    "SEN": {"names": ["senegal"], "demonyms": ["senegalese"], "capitals": ["dakar"]},
+    "SYC": {"names": ["seychelles"], "demonyms": ["seychellois"]},
+    "SLE": {
+        "names": ["sierra leone"],
+        "demonyms": ["sierra leonean"],
+        "capitals": ["freetown"],
+    },
+    "SOM": {"names": ["somalia"], "demonyms": ["somali"], "capitals": ["mogadishu"]},
+    "ZAF": {
+        "names": ["south africa"],
+        "demonyms": ["south african"],
+        "capitals": ["pretoria", "cape town"],
+        "cities": ["johannesburg", "durban"],
+    },
+    "SSD": {
+        "names": ["south sudan"],
+        "demonyms": ["south sudanese"],
+        "capitals": ["juba"],
+    },
+    "SDN": {"names": ["sudan"], "demonyms": ["sudanese"], "capitals": ["khartoum"]},
+    "TZA": {
+        "names": ["tanzania"],
+        "demonyms": ["tanzanian"],
+        "capitals": ["dodoma"],
+        "cities": ["dar es salaam", "arusha"],
+    },
+    "TGO": {"names": ["togo"], "demonyms": ["togolese"], "capitals": ["lome"]},
+    "TUN": {
+        "names": ["tunisia"],
+        "demonyms": ["tunisian"],
+        "capitals": ["tunis"],
+        "cities": ["sfax"],
+    },
+    "UGA": {
+        "names": ["uganda"],
+        "demonyms": ["ugandan"],
+        "capitals": ["kampala"],
+        "cities": ["gulu"],
+    },
+    "ZMB": {"names": ["zambia"], "demonyms": ["zambian"], "capitals": ["lusaka"]},
+    "ZWE": {
+        "names": ["zimbabwe"],
+        "demonyms": ["zimbabwean"],
+        "capitals": ["harare"],
+        "cities": ["bulawayo"],
+    },
+}
+
+# Terms shared by several countries; their weight is split between them
+SHARED_COUNTRY_TERMS: Dict[str, List[str]] = {
+    "congo": ["COD", "COG"],
+    "congolese": ["COD", "COG"],
+}
+
+COUNTRY_TERM_WEIGHTS = {
+    "names": 10.0,
+    "aliases": 8.0,
+    "demonyms": 6.0,
+    "capitals": 6.0,
+    "cities": 5.0,
+}
+
+# Non-African names containing an African country term; they are matched so
+# the longer phrase consumes the text, but they score nothing
+NON_AFRICAN_COUNTRY_TERMS = [
+    "papua new guinea",
+    "new guinea",
+    "guinea pig",
+    "guinea pigs",
+    "guinea fowl",
+]
+
+# Terms that are also common English words only count when capitalized
+CASE_SENSITIVE_COUNTRY_TERMS = {"chad", "guinea"}
+
+# Sentence and paragraph breaks used to attribute report text to countries
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+# Index-preserving fold of accents and typographic apostrophes
+_COUNTRY_TEXT_FOLD = str.maketrans(
+    "ÉÈÊËÔÖÓÃÁÀÂÍÎÏÚÜÇéèêëôöóãáàâíîïúüç’‘",
+    "EEEEOOOAAAAIIIUUCeeeeoooaaaaiiiuuc''",
+)
+
+
 class CountryIntelligenceMatcher:
-    """Matches intelligence content to African countries"""
+    """Matches intelligence content to African countries
+
+    All country names, aliases, demonyms, capitals and major cities are
+    compiled into a single alternation with word-boundary guards, so each
+    document is scanned once and "Niger" no longer matches inside "Nigeria".
+    """
+
+    MIN_DETECTION_SCORE = 5.0
 
     def __init__(self):
         self.country_patterns = self._build_country_patterns()
+        self.term_index = self._build_term_index()
+        self.country_regex = self._compile_country_regex(self.term_index)
 
     def _build_country_patterns(self) -> Dict[str, List[str]]:
         """Build country detection patterns including variations and cities"""
-
-        patterns = {
-            # Major countries with cities and variations
-            "ZAF": [
-                "south africa",
-                "south african",
-                "johannesburg",
-                "cape town",
-                "durban",
-                "pretoria",
-            ],
-            "KEN": ["kenya", "kenyan", "nairobi", "mombasa", "kenyatta"],
-            "NGA": ["nigeria", "nigerian", "lagos", "abuja", "kano", "ibadan"],
-            "EGY": ["egypt", "egyptian", "cairo", "alexandria", "giza"],
-            "MAR": ["morocco", "moroccan", "rabat", "casablanca", "marrakech"],
-            "GHA": ["ghana", "ghanaian", "accra", "kumasi", "tamale"],
-            "ETH": ["ethiopia", "ethiopian", "addis ababa", "dire dawa"],
-            "TUN": ["tunisia", "tunisian", "tunis", "sfax"],
-            "UGA": ["uganda", "ugandan", "kampala", "gulu"],
-            "TZA": ["tanzania", "tanzanian", "dar es salaam", "dodoma", "arusha"],
-            "RWA": ["rwanda", "rwandan", "kigali"],
-            "BWA": ["botswana", "gaborone"],
-            "SEN": ["senegal", "senegalese", "dakar"],
-            "ZWE": ["zimbabwe", "zimbabwean", "harare", "bulawayo"],
+        return {
+            iso_code: [term for terms in groups.values() for term in terms]
+            for iso_code, groups in AFRICAN_COUNTRY_TERMS.items()
         }
 
-        return patterns
+    def _build_term_index(self) -> Dict[str, List[Tuple[str, float]]]:
+        """Map each lowercase term to the (country, weight) pairs it signals"""
+        index: Dict[str, List[Tuple[str, float]]] = {}
+        for iso_code, groups in AFRICAN_COUNTRY_TERMS.items():
+            for term_type, terms in groups.items():
+                for term in terms:
+                    index.setdefault(term, []).append(
+                        (iso_code, COUNTRY_TERM_WEIGHTS[term_type])
+                    )
 
-    def detect_country(self, text: str) -> Optional[str]:
-        """Detect country from text content"""
-        text_lower = text.lower()
+        for term, iso_codes in SHARED_COUNTRY_TERMS.items():
+            weight = COUNTRY_TERM_WEIGHTS["names"] / len(iso_codes)
+            index[term] = [(iso_code, weight) for iso_code in iso_codes]
+
+        for term in NON_AFRICAN_COUNTRY_TERMS:
+            index[term] = []
+
+        return index
+
+    @staticmethod
+    def _compile_country_regex(term_index: Dict[str, Any]) -> re.Pattern:
+        # Longest first so "south sudan" wins over "sudan" at the same position
+        alternation = "|".join(
+            re.escape(term) for term in sorted(term_index, key=len, reverse=True)
+        )
+        return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+    def detect_countries(self, text: str) -> List[Dict[str, Any]]:
+        """Detect every country mentioned in text, with a confidence score
+
+        Returns one entry per country, strongest first. ``confidence``
+        combines the strength of the evidence with the country's share of all
+        country evidence in the document.
+        """
+        if not text:
+            return []
+
+        folded = text.translate(_COUNTRY_TEXT_FOLD)
+        scores: Dict[str, float] = {}
+        mentions: Dict[str, Dict[str, int]] = {}
+
+        for match in self.country_regex.finditer(folded):
+            term = match.group(0).lower()
+            if term in CASE_SENSITIVE_COUNTRY_TERMS and not match.group(0)[0].isupper():
+                continue
+
+            for iso_code, weight in self.term_index[term]:
+                scores[iso_code] = scores.get(iso_code, 0.0) + weight
+                terms = mentions.setdefault(iso_code, {})
+                terms[term] = terms.get(term, 0) + 1
+
+        total = sum(scores.values())
+        results = []
+        for iso_code, score in scores.items():
+            evidence = 1.0 - math.exp(-score / 10.0)
+            results.append(
+                {
+                    "iso_code": iso_code,
+                    "score": round(score, 2),
+                    "confidence": round(evidence * score / total, 3),
+                    "mentions": sum(mentions[iso_code].values()),
+                    "matched_terms": mentions[iso_code],
+                }
+            )
 
-        # Score each country based on pattern matches
-        country_scores = {}
+        results.sort(key=lambda r: (-r["score"], r["iso_code"]))
+        return results
 
-        for iso_code, patterns in self.country_patterns.items():
-            score = 0
-            for pattern in patterns:
-                if pattern in text_lower:
-                    # Weight capital cities and country names higher
-                    if pattern in ["south africa", "kenya", "nigeria", "egypt"]:
-                        score += 10
-                    elif "capital" in pattern or len(pattern.split()) == 1:
-                        score += 5
-                    else:
-                        score += 3
+    def detect_mentioned_countries(self, text: str) -> List[str]:
+        """ISO codes of every country the text clearly mentions, strongest first
 
-            if score > 0:
-                country_scores[iso_code] = score
+        Countries scoring below ``MIN_DETECTION_SCORE`` are dropped, as are
+        countries whose only evidence is a term shared with another country
+        (a bare "Congo"), rather than picking one of them arbitrarily.
+        """
+        return [
+            country["iso_code"]
+            for country in self.detect_countries(text)
+            if country["score"] >= self.MIN_DETECTION_SCORE
+            and not set(country["matched_terms"]) <= set(SHARED_COUNTRY_TERMS)
+        ]
 
-        # Return country with highest score, minimum threshold of 5
-        if country_scores:
-            best_country = max(country_scores.keys(), key=lambda k: country_scores[k])
-            if country_scores[best_country] >= 5:
-                return best_country
+    def detect_country(self, text: str) -> Optional[str]:
+        """Detect the primary country from text content"""
+        countries = self.detect_mentioned_countries(text)
+        return countries[0] if countries else None
+
+    def split_by_country(self, title: str, content: str) -> Dict[str, str]:
+        """Attribute the text of a report to each country it mentions
+
+        A single-country report keeps its full text. Otherwise each sentence
+        goes to the countries it mentions, or to those of the last sentence
+        that mentioned any; sentences before the first mention go to every
+        country.
+        """
+        countries = self.detect_mentioned_countries(f"{title} {content}")
+        if len(countries) <= 1:
+            return {iso_code: f"{title} {content}" for iso_code in countries}
+
+        parts: Dict[str, List[str]] = {iso_code: [] for iso_code in countries}
+        current = countries
+        for sentence in [title, *_SENTENCE_BREAK.split(content)]:
+            if not sentence.strip():
+                continue
+            mentioned = [
+                iso_code
+                for iso_code in self.detect_mentioned_countries(sentence)
+                if iso_code in parts
+            ]
+            current = mentioned or current
+            for iso_code in current:
+                parts[iso_code].append(sentence.strip())
 
-        return None
+        return {iso_code: " ".join(text) for iso_code, text in parts.items()}
 
 
 class IndicatorExtractor:
@@ -238,81 +571,216 @@ class IndicatorExtractor:
 
 
 class IntelligenceProcessingService:
-    """Main service for processing intelligence and updating AHAII scores"""
-
-    def __init__(self):
+    """Main service for processing intelligence and updating AHAII scores
+
+    Score updates are debounced: each processed report marks its country and
+    changed indicators dirty, and a single rescore per country runs once the
+    ``rescore_window`` (seconds) has elapsed. A window of 0 rescores inline.
+
+    The window runs as a background task on the caller's event loop, so
+    callers must ``await close()`` (or use the service as an async context
+    manager) before the loop shuts down; otherwise queued rescores are lost.
+    ``process_intelligence_batch`` flushes on its own.
+
+    Cached per-country indicators are reloaded in full once they are older
+    than ``state_ttl`` seconds, so rows written by other processes are picked
+    up.
+    """
+
+    PILLARS = (
+        "human_capital",
+        "physical_infrastructure",
+        "regulatory_infrastructure",
+        "economic_market",
+    )
+
+    def __init__(self, rescore_window: float = 5.0, state_ttl: float = 3600.0):
         self.country_matcher = CountryIntelligenceMatcher()
         self.indicator_extractor = IndicatorExtractor()
         self.scoring_service = AHAIIScoringService()
         self.supabase = get_supabase()
+        self.db_service = DatabaseService()
+
+        self.rescore_window = rescore_window
+        self.state_ttl = state_ttl
+        self._dirty_countries: Dict[str, Set[str]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        # Per-country cache: country row, latest indicator values, pillar results
+        self._countries: Dict[str, Dict[str, Any]] = {}
+        self._country_state: Dict[str, Dict[str, Any]] = {}
 
     async def process_intelligence_report(
         self, report_data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Process an intelligence report and extract infrastructure signals"""
+        """Process an intelligence report and extract infrastructure signals
+
+        Signals are extracted for every country the report mentions, each
+        from the part of the report that concerns it. ``country`` is the
+        most strongly mentioned country and ``updated_scores`` maps each
+        inline-rescored country to its scores.
+        """
 
         report_title = report_data.get("title", "")
         report_content = report_data.get("content", "")
         report_url = report_data.get("url", "")
         source_type = report_data.get("source_type", "unknown")
 
-        # Detect country
-        country_iso = self.country_matcher.detect_country(
-            f"{report_title} {report_content}"
+        # Detect countries and the text about each of them
+        country_texts = self.country_matcher.split_by_country(
+            report_title, report_content
         )
 
-        if not country_iso:
+        if not country_texts:
             logger.info(f"No African country detected in report: {report_title}")
-            return {"signals_extracted": 0, "country": None}
+            return {"signals_extracted": 0, "country": None, "countries": []}
 
-        # Extract infrastructure signals
-        signals = self.indicator_extractor.extract_indicators(
-            f"{report_title} {report_content}", country_iso
-        )
+        signals = []
+        for country_iso, text in country_texts.items():
+            # Extract infrastructure signals
+            country_signals = self.indicator_extractor.extract_indicators(
+                text, country_iso
+            )
 
-        # Update signals with source information
-        for signal in signals:
-            signal.source_url = report_url
-            signal.source_title = report_title
-            signal.source_type = source_type
+            # Update signals with source information
+            for signal in country_signals:
+                signal.source_url = report_url
+                signal.source_title = report_title
+                signal.source_type = source_type
+
+            signals.extend(country_signals)
 
-        # Store signals and update scores
+        # Store signals and queue the countries for rescoring
         updated_scores = None
         if signals:
             await self._store_infrastructure_signals(signals)
-            updated_scores = await self._update_country_scores(country_iso)
+            for country_iso in country_texts:
+                indicator_names = {
+                    signal.indicator_name
+                    for signal in signals
+                    if signal.country_iso_code == country_iso
+                }
+                if indicator_names:
+                    self._mark_country_dirty(country_iso, indicator_names)
+            if self.rescore_window <= 0:
+                updated_scores = await self.flush_pending_rescores()
 
+        countries = list(country_texts)
         result = {
-            "country": country_iso,
+            "country": countries[0],
+            "countries": countries,
             "signals_extracted": len(signals),
             "signals": [signal.dict() for signal in signals],
             "updated_scores": updated_scores,
+            "rescore_pending": any(c in self._dirty_countries for c in countries),
         }
 
         logger.info(
-            f"Processed intelligence for {country_iso}: {len(signals)} signals extracted"
+            f"Processed intelligence for {', '.join(countries)}: "
+            f"{len(signals)} signals extracted"
         )
 
         return result
 
+    async def process_intelligence_batch(
+        self, reports: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Process many reports, then rescore each affected country once"""
+
+        results = [await self.process_intelligence_report(r) for r in reports]
+        updated_scores = await self.flush_pending_rescores()
+
+        return {
+            "reports_processed": len(results),
+            "signals_extracted": sum(r["signals_extracted"] for r in results),
+            "results": results,
+            "updated_scores": updated_scores,
+        }
+
+    def _mark_country_dirty(self, country_iso: str, indicator_names: Set[str]):
+        """Queue a country rescore, coalescing with any pending one"""
+        self._dirty_countries.setdefault(country_iso, set()).update(indicator_names)
+
+        if self.rescore_window > 0 and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.rescore_window)
+        try:
+            await self.flush_pending_rescores()
+        except Exception as e:
+            logger.error(f"Error flushing pending rescores: {e}")
+
+    async def flush_pending_rescores(self) -> Dict[str, Optional[Dict]]:
+        """Rescore every dirty country now, returning results by ISO code"""
+        async with self._flush_lock:
+            dirty, self._dirty_countries = self._dirty_countries, {}
+
+            results = {}
+            for country_iso, indicator_names in dirty.items():
+                results[country_iso] = await self._update_country_scores(
+                    country_iso, indicator_names
+                )
+
+            if dirty:
+                logger.info(f"Rescored {len(dirty)} countries from pending updates")
+            return results
+
+    async def close(self):
+        """Cancel the pending window and rescore anything still queued"""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        await self.flush_pending_rescores()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _get_country(self, country_iso: str) -> Optional[Dict[str, Any]]:
+        """Look up (and cache) a country's id and name by ISO alpha-3 code"""
+        if country_iso not in self._countries:
+            country_result = (
+                self.supabase.table("countries")
+                .select("id, name")
+                .eq("iso_code_alpha3", country_iso)
+                .execute()
+            )
+            if not country_result.data:
+                return None
+            self._countries[country_iso] = country_result.data[0]
+
+        return self._countries[country_iso]
+
+    def _indicator_pillar(self, indicator_name: str) -> str:
+        """Pillar an indicator is scored under"""
+        definition = self.scoring_service.indicator_definitions.get(indicator_name)
+        if definition:
+            return definition.pillar
+        return self.indicator_extractor._get_indicator_pillar(indicator_name)
+
     async def _store_infrastructure_signals(self, signals: List[InfrastructureSignal]):
         """Store extracted signals in the database"""
 
         for signal in signals:
             try:
                 # Get country ID
-                country_result = (
-                    self.supabase.table("countries")
-                    .select("id")
-                    .eq("iso_code_alpha3", signal.country_iso_code)
-                    .execute()
-                )
+                country = await self._get_country(signal.country_iso_code)
 
-                if not country_result.data:
+                if not country:
                     logger.warning(f"Country not found: {signal.country_iso_code}")
                     continue
 
-                country_id = country_result.data[0]["id"]
+                country_id = country["id"]
 
                 # Insert infrastructure indicator
                 indicator_data = {
@@ -380,95 +848,102 @@ class IntelligenceProcessingService:
                 logger.error(f"Error storing signal {signal.signal_id}: {e}")
                 continue
 
-    async def _update_country_scores(self, country_iso: str) -> Optional[Dict]:
-        """Recalculate and update AHAII scores for a country"""
+    async def _update_country_scores(
+        self, country_iso: str, changed_indicators: Optional[Set[str]] = None
+    ) -> Optional[Dict]:
+        """Recalculate and update AHAII scores for a country
+
+        The first rescore of a country loads all of its indicators. After that,
+        only ``changed_indicators`` are refetched, and only the pillars they
+        belong to are rescored; other pillars reuse their cached results.
+        Cached state older than ``state_ttl`` triggers a full reload.
+        """
 
         try:
             # Get country ID
-            country_result = (
-                self.supabase.table("countries")
-                .select("id, name")
-                .eq("iso_code_alpha3", country_iso)
-                .execute()
-            )
+            country = await self._get_country(country_iso)
 
-            if not country_result.data:
+            if not country:
                 logger.warning(f"Country not found: {country_iso}")
                 return None
 
-            country_id = country_result.data[0]["id"]
-            country_name = country_result.data[0]["name"]
+            country_id = country["id"]
+            country_name = country["name"]
+
+            state = self._country_state.get(country_iso)
+            full_refresh = (
+                state is None
+                or changed_indicators is None
+                or time.monotonic() - state["loaded_at"] > self.state_ttl
+            )
 
-            # Fetch current indicators for this country
-            indicators_result = (
+            # Fetch current indicators for this country, oldest first so the
+            # most recent value of each indicator wins
+            query = (
                 self.supabase.table("infrastructure_indicators")
-                .select("*")
+                .select("indicator_name, indicator_value, created_at")
                 .eq("country_id", country_id)
-                .execute()
             )
+            if not full_refresh:
+                query = query.in_("indicator_name", sorted(changed_indicators))
+            indicators_result = query.order("created_at").execute()
+
+            if full_refresh:
+                state = {
+                    "indicators": {},
+                    "pillar_results": {},
+                    "loaded_at": time.monotonic(),
+                }
 
-            if not indicators_result.data:
-                logger.info(f"No indicators found for {country_name}")
-                return None
+            fetched = {}
+            for indicator in indicators_result.data or []:
+                fetched[indicator["indicator_name"]] = float(
+                    indicator["indicator_value"]
+                )
 
-            # Build indicators dictionary for scoring
-            indicators_data = {}
-            for indicator in indicators_result.data:
-                indicator_name = indicator["indicator_name"]
-                indicator_value = float(indicator["indicator_value"])
+            if full_refresh:
+                changed_pillars = set(self.PILLARS)
+            else:
+                changed_pillars = {
+                    self._indicator_pillar(name) for name in changed_indicators
+                }
 
-                # Use most recent value if multiple exist
-                if indicator_name not in indicators_data:
-                    indicators_data[indicator_name] = indicator_value
-                else:
-                    # Compare dates and use most recent
-                    current_date = datetime.fromisoformat(
-                        indicator["created_at"].replace("Z", "+00:00")
-                    )
-                    # For simplicity, just overwrite with latest processing
-                    indicators_data[indicator_name] = indicator_value
+            state["indicators"].update(fetched)
+            indicators_data = state["indicators"]
 
-            # Calculate new AHAII scores
+            if not indicators_data:
+                logger.info(f"No indicators found for {country_name}")
+                return None
+
+            # Calculate new AHAII scores, reusing unchanged pillars
             current_year = datetime.now().year
+            precomputed = {
+                pillar: result
+                for pillar, result in state["pillar_results"].items()
+                if pillar not in changed_pillars
+            }
             new_scores = self.scoring_service.calculate_ahaii_score(
-                indicators_data, country_id, current_year
+                indicators_data,
+                country_id,
+                current_year,
+                precomputed_pillars=precomputed,
             )
 
-            # Store updated scores
-            scores_data = {
-                "country_id": country_id,
-                "assessment_year": current_year,
-                "total_score": new_scores["total_score"],
-                "human_capital_score": new_scores["human_capital_score"],
-                "physical_infrastructure_score": new_scores[
-                    "physical_infrastructure_score"
-                ],
-                "regulatory_infrastructure_score": new_scores[
-                    "regulatory_infrastructure_score"
-                ],
-                "economic_market_score": new_scores["economic_market_score"],
-                "readiness_tier": new_scores["readiness_tier"],
-                "tier_justification": new_scores["tier_justification"],
-                "overall_confidence_score": new_scores["overall_confidence_score"],
-                "data_completeness_percentage": new_scores[
-                    "data_completeness_percentage"
-                ],
-                "key_strengths": new_scores["key_strengths"],
-                "priority_improvement_areas": new_scores["priority_improvement_areas"],
-                "assessment_methodology_version": new_scores[
-                    "assessment_methodology_version"
-                ],
-                "indicator_weights_used": new_scores["indicator_weights_used"],
+            state["pillar_results"] = {
+                pillar: (
+                    new_scores[f"{pillar}_score"],
+                    new_scores["pillar_breakdown"][pillar],
+                )
+                for pillar in self.PILLARS
             }
+            self._country_state[country_iso] = state
 
-            # Upsert scores (insert or update)
-            upsert_result = (
-                self.supabase.table("ahaii_scores")
-                .upsert(scores_data, on_conflict="country_id,assessment_year")
-                .execute()
-            )
+            # Store updated scores; DatabaseService keys the row on
+            # (country, year, quarter) and appends it to the score history
+            new_scores["assessment_quarter"] = (datetime.now().month - 1) // 3 + 1
+            stored = await self.db_service.update_ahaii_scores(country_id, new_scores)
 
-            if upsert_result.data:
+            if stored:
                 logger.info(
                     f"Updated AHAII scores for {country_name}: {new_scores['total_score']:.1f} (Tier {new_scores['readiness_tier']})"
                 )
@@ -478,6 +953,7 @@ class IntelligenceProcessingService:
                     "previous_score": None,  # Could be fetched from history
                     "new_score": new_scores["total_score"],
                     "tier": new_scores["readiness_tier"],
+                    "rescored_pillars": sorted(changed_pillars),
                     "updated_pillars": {
                         "human_capital": new_scores["human_capital_score"],
                         "physical_infrastructure": new_scores[
@@ -495,6 +971,8 @@ class IntelligenceProcessingService:
 
         except Exception as e:
             logger.error(f"Error updating scores for {country_iso}: {e}")
+            # Cached pillar results may no longer match; reload on next rescore
+            self._country_state.pop(country_iso, None)
             return None
 
 
@@ -518,9 +996,9 @@ async def process_sample_intelligence():
         "source_type": "government_report",
     }
 
-    # Process the report
-    service = IntelligenceProcessingService()
-    result = await service.process_intelligence_report(sample_report)
+    # Process the report and rescore the affected country
+    async with IntelligenceProcessingService() as service:
+        result = await service.process_intelligence_batch([sample_report])
 
     print("Intelligence Processing Result:")
     print(json.dumps(result, indent=2, default=str))
@@ -0,0 +1,182 @@
+"""
+Data Lake Tests
+Tests partition pruning, run selection and compaction of the Parquet lake
+"""
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.data_lake import DataLake
+
+DATASET = "worldbank_indicators"
+
+
+def indicators(countries, value):
+    return pd.DataFrame(
+        {
+            "country_code": countries,
+            "indicator": ["gdp"] * len(countries),
+            "value": [value] * len(countries),
+        }
+    )
+
+
+@pytest.fixture
+def lake(tmp_path):
+    lake = DataLake(tmp_path / "lake")
+    lake.append(
+        DATASET,
+        indicators(["KEN", "NGA"], 1.0),
+        source="world_bank",
+        run_id="20250101_000000",
+        run_date=date(2025, 1, 1),
+    )
+    lake.append(
+        DATASET,
+        indicators(["KEN", "NGA", "GHA"], 2.0),
+        source="world_bank",
+        run_id="20250102_000000",
+        run_date=date(2025, 1, 2),
+    )
+    lake.append(
+        DATASET,
+        indicators(["EGY"], 3.0),
+        source="policy",
+        run_id="20250102_000000",
+        run_date=date(2025, 1, 2),
+    )
+    return lake
+
+
+def test_append_layout_and_manifest(lake):
+    """Files land in hive partitions and are indexed in the manifest"""
+    manifest = lake.manifest(DATASET)
+    assert len(manifest) == 3
+    assert manifest["source"].tolist() == ["policy", "world_bank", "world_bank"]
+    assert manifest["rows"].tolist() == [1, 2, 3]
+    for path in manifest["path"]:
+        assert (lake.lake_dir / path).exists()
+        assert "source=" in path and "run_date=" in path
+
+
+def test_append_rejects_reserved_columns_and_skips_empty(lake):
+    """Partition and run columns cannot be overwritten; empty frames are skipped"""
+    with pytest.raises(ValueError):
+        lake.append(DATASET, indicators(["KEN"], 1.0).assign(run_id="x"), "world_bank")
+    assert lake.append(DATASET, indicators([], 1.0), "world_bank") is None
+    assert len(lake.manifest(DATASET)) == 3
+
+
+def test_read_all_with_partition_columns(lake):
+    """A full read returns every row with source, run_date and run_id"""
+    df = lake.read(DATASET)
+    assert len(df) == 6
+    assert {"source", "run_date", "run_id"} <= set(df.columns)
+    assert sorted(df["source"].unique()) == ["policy", "world_bank"]
+
+
+def test_read_prunes_by_source_date_and_columns(lake):
+    """Source, date range and column selection narrow the result"""
+    df = lake.read(
+        DATASET,
+        columns=["country_code", "value"],
+        sources=["world_bank"],
+        start_date=date(2025, 1, 2),
+    )
+    assert list(df.columns) == ["country_code", "value"]
+    assert sorted(df["country_code"]) == ["GHA", "KEN", "NGA"]
+    assert set(df["value"]) == {2.0}
+
+
+def test_read_run_selection_and_filters(lake):
+    """run_id, latest and value filters select the matching rows"""
+    first = lake.read(DATASET, run_id="20250101_000000")
+    assert sorted(first["country_code"]) == ["KEN", "NGA"]
+
+    latest = lake.read(DATASET, sources=["world_bank"], latest=True)
+    assert set(latest["run_id"]) == {"20250102_000000"}
+    assert len(latest) == 3
+
+    filtered = lake.read(DATASET, filters={"country_code": ["KEN"]})
+    assert sorted(filtered["value"]) == [1.0, 2.0]
+
+    assert lake.latest_run_id(DATASET) == "20250102_000000"
+    assert lake.latest_run_id("missing") is None
+
+
+def test_read_missing_dataset_returns_requested_columns(lake):
+    """Reading an empty dataset yields an empty frame with the asked-for columns"""
+    df = lake.read("missing", columns=["country_code"])
+    assert df.empty
+    assert list(df.columns) == ["country_code"]
+
+
+def test_read_unifies_all_null_columns(tmp_path):
+    """A column that is all-null in one run still reads alongside typed runs"""
+    lake = DataLake(tmp_path / "lake")
+    lake.append(
+        DATASET,
+        pd.DataFrame({"country_code": ["KEN"], "note": [None]}),
+        source="world_bank",
+        run_id="r1",
+    )
+    lake.append(
+        DATASET,
+        pd.DataFrame({"country_code": ["NGA"], "note": ["estimated"]}),
+        source="world_bank",
+        run_id="r2",
+    )
+    df = lake.read(DATASET, columns=["country_code", "note"])
+    notes = df.set_index("country_code")["note"]
+    assert pd.isna(notes["KEN"])
+    assert notes["NGA"] == "estimated"
+
+
+def test_compact_merges_partition_files(tmp_path):
+    """Compaction merges a partition's files and keeps every run's rows"""
+    lake = DataLake(tmp_path / "lake")
+    for i, run_id in enumerate(["r1", "r2", "r3"]):
+        lake.append(
+            DATASET,
+            indicators(["KEN"], float(i)),
+            source="world_bank",
+            run_id=run_id,
+            run_date=date(2025, 1, 1),
+        )
+    lake.append(
+        DATASET,
+        indicators(["NGA"], 9.0),
+        source="world_bank",
+        run_id="r4",
+        run_date=date(2025, 1, 2),
+    )
+    before = lake.read(DATASET).sort_values(["run_id"]).reset_index(drop=True)
+    old_paths = list(lake.manifest(DATASET)["path"])
+
+    stats = lake.compact(DATASET)
+
+    assert stats == {"partitions_compacted": 1, "files_removed": 3}
+    manifest = lake.manifest(DATASET)
+    assert len(manifest) == 2
+    compacted = manifest[manifest["run_date"] == "2025-01-01"].iloc[0]
+    assert compacted["rows"] == 3
+    assert json.loads(compacted["run_ids"]) == ["r1", "r2", "r3"]
+    for path in old_paths[:3]:
+        assert not (lake.lake_dir / path).exists()
+
+    after = lake.read(DATASET).sort_values(["run_id"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(before, after[before.columns], check_dtype=False)
+
+    # Run selection still works on the merged file
+    assert lake.read(DATASET, run_id="r2")["value"].tolist() == [1.0]
+
+    # Nothing left to compact
+    assert lake.compact(DATASET) == {"partitions_compacted": 0, "files_removed": 0}
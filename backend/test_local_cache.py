@@ -0,0 +1,142 @@
+"""
+Local Cache Tests
+Tests the SQLite cache helper's unique-index dedup and batched upserts
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.local_cache import LocalCache
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS indicators (
+        country_code TEXT,
+        indicator TEXT,
+        value REAL,
+        source TEXT
+    )
+"""
+KEY = ("indicators", ["country_code", "indicator"])
+
+
+def rows(cache, table="indicators"):
+    with cache.transaction() as conn:
+        return conn.execute(
+            f"SELECT country_code, indicator, value, source FROM {table} "
+            "ORDER BY country_code, indicator"
+        ).fetchall()
+
+
+def test_connection_pragmas(tmp_path):
+    """Connections use WAL journaling"""
+    cache = LocalCache(tmp_path / "nested" / "cache.db")
+    with cache.transaction() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert cache.db_path.exists()
+
+
+def test_create_table_collapses_duplicates_to_latest(tmp_path):
+    """Existing duplicate keys keep only the most recently inserted row"""
+    db_path = tmp_path / "cache.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(SCHEMA)
+        conn.executemany(
+            "INSERT INTO indicators VALUES (?, ?, ?, ?)",
+            [
+                ("KEN", "gdp", 1.0, "old"),
+                ("KEN", "gdp", 2.0, "newer"),
+                ("NGA", "gdp", 3.0, "only"),
+                ("KEN", "gdp", 4.0, "latest"),
+            ],
+        )
+
+    cache = LocalCache(db_path)
+    cache.create_table(SCHEMA, unique_indexes=[KEY])
+
+    assert rows(cache) == [
+        ("KEN", "gdp", 4.0, "latest"),
+        ("NGA", "gdp", 3.0, "only"),
+    ]
+    with cache.transaction() as conn:
+        index = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND name = 'uq_indicators_country_code_indicator'"
+        ).fetchone()
+    assert index is not None
+
+
+def test_create_table_is_idempotent(tmp_path):
+    """Re-running create_table keeps data and indexes intact"""
+    cache = LocalCache(tmp_path / "cache.db")
+    cache.create_table(
+        SCHEMA, indexes=[("indicators", ["source"])], unique_indexes=[KEY]
+    )
+    cache.upsert_many(
+        "indicators",
+        ["country_code", "indicator", "value", "source"],
+        [("KEN", "gdp", 1.0, "wb")],
+        ["country_code", "indicator"],
+    )
+    cache.create_table(
+        SCHEMA, indexes=[("indicators", ["source"])], unique_indexes=[KEY]
+    )
+    assert rows(cache) == [("KEN", "gdp", 1.0, "wb")]
+
+
+def test_upsert_many_inserts_and_updates(tmp_path):
+    """Conflicting keys update in place; new keys are inserted"""
+    cache = LocalCache(tmp_path / "cache.db")
+    cache.create_table(SCHEMA, unique_indexes=[KEY])
+    columns = ["country_code", "indicator", "value", "source"]
+
+    assert (
+        cache.upsert_many(
+            "indicators",
+            columns,
+            [("KEN", "gdp", 1.0, "wb"), ("NGA", "gdp", 2.0, "wb")],
+            ["country_code", "indicator"],
+        )
+        == 2
+    )
+    cache.upsert_many(
+        "indicators",
+        columns,
+        (row for row in [("KEN", "gdp", 5.0, "imf"), ("GHA", "gdp", 3.0, "wb")]),
+        ["country_code", "indicator"],
+    )
+
+    assert rows(cache) == [
+        ("GHA", "gdp", 3.0, "wb"),
+        ("KEN", "gdp", 5.0, "imf"),
+        ("NGA", "gdp", 2.0, "wb"),
+    ]
+
+
+def test_upsert_many_update_columns(tmp_path):
+    """Only the listed columns are refreshed on conflict"""
+    cache = LocalCache(tmp_path / "cache.db")
+    cache.create_table(SCHEMA, unique_indexes=[KEY])
+    columns = ["country_code", "indicator", "value", "source"]
+    key = ["country_code", "indicator"]
+
+    cache.upsert_many("indicators", columns, [("KEN", "gdp", 1.0, "wb")], key)
+    cache.upsert_many(
+        "indicators", columns, [("KEN", "gdp", 9.0, "imf")], key, ["value"]
+    )
+    assert rows(cache) == [("KEN", "gdp", 9.0, "wb")]
+
+    # No update columns means existing rows are left alone
+    cache.upsert_many("indicators", columns, [("KEN", "gdp", 0.0, "x")], key, [])
+    assert rows(cache) == [("KEN", "gdp", 9.0, "wb")]
+
+
+def test_upsert_many_empty(tmp_path):
+    """An empty batch writes nothing"""
+    cache = LocalCache(tmp_path / "cache.db")
+    cache.create_table(SCHEMA, unique_indexes=[KEY])
+    assert cache.upsert_many("indicators", ["country_code"], [], ["country_code"]) == 0
+    assert rows(cache) == []
@@ -0,0 +1,153 @@
+"""
+Report Pipeline Tests
+Tests which report stages the staged pipeline reuses after code and input changes
+"""
+
+import ast
+import importlib.util
+import inspect
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.analysis.pilot_assessment.report_pipeline import (
+    ReportStage,
+    StagedReportPipeline,
+)
+
+STAGES_SOURCE = """
+def scale(value):
+    return value * 2
+
+
+def scaled_values(values):
+    return [scale(v) for v in values]
+
+
+def summary(scaled):
+    return {"total": sum(scaled), "count": len(scaled)}
+
+
+def write_report(scaled, summary):
+    return f"Total: {summary['total']} over {summary['count']} values"
+"""
+
+
+def load_stages(tmp_path, source, version):
+    """Import a stage module from source and declare its stages"""
+    path = tmp_path / f"stages_v{version}.py"
+    path.write_text(textwrap.dedent(source))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [
+        ReportStage("scaled", module.scaled_values, ["values"], deps=[module.scale]),
+        ReportStage("summary", module.summary, ["scaled"]),
+        ReportStage("report", module.write_report, ["scaled", "summary"], cache=False),
+    ]
+
+
+def test_rerun_reuses_cached_stages(tmp_path):
+    """An unchanged rerun loads every cached stage and still writes the report"""
+    pipeline = StagedReportPipeline(tmp_path / "artifacts")
+    stages = load_stages(tmp_path, STAGES_SOURCE, 1)
+
+    first = pipeline.run(stages, {"values": [1, 2, 3]})
+    assert first["report"] == "Total: 12 over 3 values"
+    assert set(pipeline.last_run.values()) == {"computed"}
+
+    second = pipeline.run(stages, {"values": [1, 2, 3]})
+    assert second["summary"] == first["summary"]
+    assert pipeline.last_run == {
+        "scaled": "cached",
+        "summary": "cached",
+        "report": "computed",
+    }
+
+
+def test_writer_edit_keeps_upstream_stages_cached(tmp_path):
+    """Changing only the report writer recomputes nothing upstream"""
+    pipeline = StagedReportPipeline(tmp_path / "artifacts")
+    pipeline.run(load_stages(tmp_path, STAGES_SOURCE, 1), {"values": [1, 2, 3]})
+
+    edited = STAGES_SOURCE.replace("Total:", "Grand total:")
+    outputs = pipeline.run(load_stages(tmp_path, edited, 2), {"values": [1, 2, 3]})
+
+    assert outputs["report"] == "Grand total: 12 over 3 values"
+    assert pipeline.last_run == {
+        "scaled": "cached",
+        "summary": "cached",
+        "report": "computed",
+    }
+
+
+def test_helper_edit_recomputes_dependent_stage(tmp_path):
+    """Editing a declared helper recomputes its stage and, if the output
+    changed, the stages downstream of it"""
+    pipeline = StagedReportPipeline(tmp_path / "artifacts")
+    pipeline.run(load_stages(tmp_path, STAGES_SOURCE, 1), {"values": [1, 2, 3]})
+
+    # Same output: downstream stays cached
+    reworded = STAGES_SOURCE.replace("return value * 2", "return 2 * value")
+    pipeline.run(load_stages(tmp_path, reworded, 2), {"values": [1, 2, 3]})
+    assert pipeline.last_run["scaled"] == "computed"
+    assert pipeline.last_run["summary"] == "cached"
+
+    # Different output: downstream is recomputed
+    tripled = STAGES_SOURCE.replace("return value * 2", "return value * 3")
+    outputs = pipeline.run(load_stages(tmp_path, tripled, 3), {"values": [1, 2, 3]})
+    assert pipeline.last_run["summary"] == "computed"
+    assert outputs["summary"] == {"total": 18, "count": 3}
+
+
+def test_input_change_and_missing_artifact_recompute(tmp_path):
+    """New inputs and deleted artifacts are recomputed"""
+    pipeline = StagedReportPipeline(tmp_path / "artifacts")
+    stages = load_stages(tmp_path, STAGES_SOURCE, 1)
+    pipeline.run(stages, {"values": [1, 2, 3]})
+
+    pipeline.run(stages, {"values": [1, 2, 4]})
+    assert pipeline.last_run["scaled"] == "computed"
+
+    for artifact in (tmp_path / "artifacts" / "summary").glob("*.pkl"):
+        artifact.unlink()
+    pipeline.run(stages, {"values": [1, 2, 4]})
+    assert pipeline.last_run["scaled"] == "cached"
+    assert pipeline.last_run["summary"] == "computed"
+
+
+def test_missing_stage_input_raises(tmp_path):
+    """A stage whose inputs are unavailable is rejected"""
+    pipeline = StagedReportPipeline(tmp_path / "artifacts")
+    with pytest.raises(ValueError):
+        pipeline.run(load_stages(tmp_path, STAGES_SOURCE, 1), {})
+
+
+def test_report_stages_declare_their_helpers(tmp_path):
+    """Every helper a cached report stage calls is part of its cache key"""
+    for module in ("matplotlib", "seaborn", "plotly"):
+        pytest.importorskip(module)
+    from app.analysis.pilot_assessment.ahaii_pilot_report import (
+        AHAIIPilotReportGenerator,
+    )
+
+    generator = AHAIIPilotReportGenerator(output_dir=str(tmp_path / "pilot"))
+    for stage in generator._build_report_stages():
+        if not stage.cache:
+            continue
+        tree = ast.parse(textwrap.dedent(inspect.getsource(stage.func)))
+        called = {
+            node.func.attr
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "self"
+        }
+        declared = {dep.__name__ for dep in stage.deps}
+        assert called <= declared, (stage.name, called - declared)
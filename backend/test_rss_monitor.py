@@ -0,0 +1,159 @@
+"""
+RSS Monitor Tests
+Tests the seen-entry store and conditional GET validators of the RSS monitor
+"""
+
+import asyncio
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from etl.news.rss_monitor import RSSMonitor
+
+FEED_URL = "https://feed.example/rss"
+FEED = """<?xml version="1.0"?><rss version="2.0"><channel><title>Health</title>
+<item><title>Kenya hospitals deploy AI triage</title><link>https://a.example/ok</link>
+<guid>g1</guid><description>Artificial intelligence in Kenya health care</description></item>
+<item><title>Nigeria health AI regulation</title><link>https://b.example/paywalled</link>
+<guid>g2</guid><description>Machine learning in Nigeria health</description></item>
+</channel></rss>"""
+
+
+class FakeResponse:
+    def __init__(self, status, body="", headers=None):
+        self.status, self.body, self.headers = status, body, headers or {}
+
+    async def text(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Serves the feed with an ETag and answers 304 to a matching If-None-Match"""
+
+    def __init__(self, article_status=None):
+        self.article_status = article_status or {}
+        self.requests = []
+
+    def get(self, url, headers=None):
+        self.requests.append((url, headers or {}))
+        if url == FEED_URL:
+            if (headers or {}).get("If-None-Match") == '"v1"':
+                return FakeResponse(304)
+            return FakeResponse(200, FEED, {"ETag": '"v1"'})
+        status = self.article_status.get(url, 200)
+        return FakeResponse(
+            status, "<html><article><p>Health AI in Africa</p></article></html>"
+        )
+
+
+def make_monitor(tmp_path, session):
+    monitor = RSSMonitor(state_dir=str(tmp_path))
+    monitor.session = session
+    monitor._request_semaphore = asyncio.Semaphore(4)
+    return monitor
+
+
+def process(monitor):
+    cutoff = datetime.now() - timedelta(days=1)
+    return asyncio.run(monitor.process_feed(FEED_URL, cutoff, set()))
+
+
+def stored_state(monitor):
+    with sqlite3.connect(monitor.state_db_path) as conn:
+        etags = [row[0] for row in conn.execute("SELECT etag FROM feed_state")]
+        seen = sorted(
+            row[0] for row in conn.execute("SELECT entry_key FROM seen_entries")
+        )
+    return etags, seen
+
+
+def test_processed_feed_saves_validators_and_seen_entries(tmp_path):
+    """After a full pass the feed is revalidated with a 304 and nothing is refetched"""
+    session = FakeSession()
+    monitor = make_monitor(tmp_path, session)
+    process(monitor)
+
+    assert stored_state(monitor) == (
+        ['"v1"'],
+        ["g1", "g2", "https://a.example/ok", "https://b.example/paywalled"],
+    )
+
+    session.requests.clear()
+    assert process(monitor) == []
+    assert session.requests == [(FEED_URL, {"If-None-Match": '"v1"'})]
+
+
+def test_failed_article_fetch_is_analyzed_from_summary(tmp_path):
+    """A 403 on the article page still processes the entry and saves the ETag"""
+    session = FakeSession({"https://b.example/paywalled": 403})
+    monitor = make_monitor(tmp_path, session)
+
+    entry = {
+        "title": "Nigeria health AI regulation",
+        "url": "https://b.example/paywalled",
+        "summary": "Machine learning in Nigeria health",
+    }
+    asyncio.run(monitor.process_article(entry))
+    assert "content" not in entry
+    assert "ai_relevance_score" in entry
+
+    process(monitor)
+    etags, seen = stored_state(monitor)
+    assert etags == ['"v1"']
+    assert "https://b.example/paywalled" in seen
+
+
+def test_processing_error_does_not_block_validators(tmp_path):
+    """An entry that raises is not retried forever and the ETag is still saved"""
+    monitor = make_monitor(tmp_path, FakeSession())
+
+    async def broken(article_data):
+        raise RuntimeError("analysis failed")
+
+    monitor.process_article = broken
+    process(monitor)
+
+    etags, seen = stored_state(monitor)
+    assert etags == ['"v1"']
+    assert len(seen) == 4
+
+
+def test_unprocessed_feed_keeps_old_validators(tmp_path):
+    """Validators of a fetched but unprocessed feed are not persisted"""
+    session = FakeSession()
+    monitor = make_monitor(tmp_path, session)
+
+    entries = asyncio.run(monitor.fetch_rss_feed(FEED_URL))
+    assert len(entries) == 2
+    assert stored_state(monitor) == ([], [])
+
+    # A fresh monitor after the interrupted run fetches the full feed again
+    session.requests.clear()
+    rerun = make_monitor(tmp_path, session)
+    assert len(asyncio.run(rerun.fetch_rss_feed(FEED_URL))) == 2
+    assert session.requests == [(FEED_URL, {})]
+
+
+def test_filter_unseen_entries_matches_guid_or_url(tmp_path):
+    """Entries seen under either their GUID or their URL are dropped"""
+    monitor = make_monitor(tmp_path, FakeSession())
+    monitor.mark_entries_seen([{"url": "https://a.example/1", "guid": "g1"}], FEED_URL)
+
+    fresh = monitor.filter_unseen_entries(
+        [
+            {"url": "https://a.example/moved", "guid": "g1"},
+            {"url": "https://a.example/1", "guid": "other"},
+            {"url": "https://a.example/2", "guid": "g2"},
+        ]
+    )
+    assert [a["url"] for a in fresh] == ["https://a.example/2"]
@@ -0,0 +1,192 @@
+"""
+Pipeline Run Store Tests
+Tests stored phases, resumed runs and partial results of failed collection
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.run_store import PipelineRunStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PipelineRunStore(tmp_path / "runs")
+
+
+def test_phase_round_trip_keeps_key_paths_and_indexes(store):
+    """Keys containing the separator and non-default indexes survive a reload"""
+    by_country = pd.DataFrame(
+        {"score": [61.5, 48.0]}, index=pd.Index(["KEN", "NGA"], name="iso")
+    )
+    mixed = pd.DataFrame({"value": [1, 2], "detail": [{"x": 1}, "text"]}, index=[5, 7])
+    multi = pd.DataFrame(
+        {"value": [1, 2]},
+        index=pd.MultiIndex.from_tuples(
+            [("KEN", 2022), ("NGA", 2023)], names=["iso", "year"]
+        ),
+    )
+    results = {
+        "policy__data": {"frame": by_country},
+        "policy": {"data__frame": mixed, "status": "success"},
+        "panel": multi,
+    }
+
+    run_id = store.create_run()
+    store.save_phase(run_id, "data_collection", results)
+    loaded = store.load_phase(run_id, "data_collection")
+
+    assert loaded["policy"]["status"] == "success"
+    pd.testing.assert_frame_equal(loaded["policy__data"]["frame"], by_country)
+    pd.testing.assert_frame_equal(loaded["policy"]["data__frame"], mixed)
+    pd.testing.assert_frame_equal(loaded["panel"], multi)
+    assert store.get_run(run_id)["phases"] == ["data_collection"]
+
+
+def test_saving_a_phase_replaces_the_earlier_copy(store):
+    """A second save drops frames that are no longer part of the phase"""
+    run_id = store.create_run()
+    store.save_phase(run_id, "scoring", {"a": pd.DataFrame({"x": [1]}), "n": 1})
+    store.save_phase(run_id, "scoring", {"b": pd.DataFrame({"y": [2]}), "n": 2})
+
+    loaded = store.load_phase(run_id, "scoring")
+    assert set(loaded) == {"b", "n"}
+    assert loaded["n"] == 2
+    assert store.load_phase(run_id, "reporting") is None
+
+
+def make_manager(store):
+    """Integration manager on the given store, without building the collectors"""
+    for module in ("matplotlib", "seaborn", "plotly"):
+        pytest.importorskip(module)
+    from app.main_integration import AHAIIIntegrationManager
+
+    manager = AHAIIIntegrationManager.__new__(AHAIIIntegrationManager)
+    manager.run_store = store
+    manager.pipeline_results = {}
+    manager.run_id = None
+    return manager
+
+
+def test_resume_run_uses_stored_snapshot(store):
+    """Resuming hands the stored collection to the pipeline without collecting"""
+    wb_data = pd.DataFrame({"country_code": ["KEN"], "value": [1.0]})
+    run_id = store.create_run()
+    store.save_phase(
+        run_id,
+        "data_collection",
+        {
+            "world_bank": {"status": "success", "data": wb_data},
+            "policy": {"status": "failed", "error": "timeout"},
+        },
+    )
+
+    manager = make_manager(store)
+    executed = []
+    manager._execute_pipeline = lambda collection: executed.append(collection) or {}
+
+    manager.resume_run(run_id)
+
+    assert manager.run_id == run_id
+    pd.testing.assert_frame_equal(manager._wb_data, wb_data)
+    assert executed == [
+        {
+            "world_bank": {"status": "success"},
+            "policy": {"status": "failed", "error": "timeout"},
+        }
+    ]
+    with pytest.raises(ValueError):
+        manager.resume_run("missing_run")
+
+
+def test_resume_run_rebuilds_collection_from_partials(store):
+    """A run interrupted before its snapshot resumes from the stored partials"""
+    run_id = store.create_run()
+    store.save_partial(
+        run_id,
+        "data_collection",
+        "world_bank",
+        "KEN",
+        {"data": pd.DataFrame({"v": [1]})},
+    )
+    store.save_partial(
+        run_id,
+        "data_collection",
+        "world_bank",
+        "NGA",
+        {"data": pd.DataFrame({"v": [2]})},
+    )
+    store.save_partial(
+        run_id,
+        "data_collection",
+        "ecosystem",
+        "KEN",
+        {
+            "organizations": pd.DataFrame({"name": ["Lab"]}),
+            "metrics": pd.DataFrame({"count": [1]}),
+        },
+    )
+    store.record_progress(run_id, "data_collection", "world_bank", "*", "success")
+
+    manager = make_manager(store)
+    executed = []
+    manager._execute_pipeline = lambda collection: executed.append(collection) or {}
+    manager.resume_run(run_id)
+
+    assert manager._wb_data["v"].tolist() == [1, 2]
+    [collection] = executed
+    assert collection["world_bank"] == {
+        "status": "success",
+        "recovered_from_partials": True,
+    }
+    assert collection["ecosystem"]["status"] == "partial"
+    assert collection["ecosystem"]["organizations"]["name"].tolist() == ["Lab"]
+
+
+def test_failing_collector_does_not_block_the_others(store):
+    """One source raising still collects, streams and stores the other two"""
+    manager = make_manager(store)
+
+    def collect_world_bank(max_workers, on_country_complete):
+        on_country_complete("KEN", {"data": pd.DataFrame({"v": [1.0]})})
+        manager._wb_data = pd.DataFrame({"v": [1.0]})
+        return {"status": "success", "data_points": 1}
+
+    def collect_policy(max_workers, on_country_complete):
+        raise RuntimeError("policy source down")
+
+    def collect_ecosystem(max_workers, on_country_complete):
+        on_country_complete("NGA", {"organizations": pd.DataFrame({"name": ["Hub"]})})
+        return {"status": "success", "organizations": pd.DataFrame({"name": ["Hub"]})}
+
+    manager._collect_world_bank = collect_world_bank
+    manager._collect_policy = collect_policy
+    manager._collect_ecosystem = collect_ecosystem
+
+    results = manager.run_data_collection_phase()
+
+    assert list(results) == ["world_bank", "policy", "ecosystem"]
+    assert results["world_bank"]["status"] == "success"
+    assert results["ecosystem"]["status"] == "success"
+    assert results["policy"] == {"status": "failed", "error": "policy source down"}
+
+    progress = {
+        (record["source"], record["item"]): record["status"]
+        for record in store.get_progress(manager.run_id, "data_collection")
+    }
+    assert progress == {
+        ("world_bank", "KEN"): "complete",
+        ("world_bank", "*"): "success",
+        ("policy", "*"): "failed",
+        ("ecosystem", "NGA"): "complete",
+        ("ecosystem", "*"): "success",
+    }
+    stored = store.load_phase(manager.run_id, "data_collection")
+    assert stored["policy"]["status"] == "failed"
+    assert stored["world_bank"]["data"]["v"].tolist() == [1.0]
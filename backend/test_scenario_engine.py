@@ -0,0 +1,132 @@
+"""
+Scenario Engine Tests
+Tests that the framework scenario reproduces AHAIICalculator scores
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.scoring.ahaii_calculator import AHAIICalculator
+from app.scoring.scenario_engine import ScenarioConfig, ScenarioEngine
+
+
+@pytest.fixture
+def calculator(tmp_path):
+    return AHAIICalculator(tmp_path / "indicators", lake_dir=tmp_path / "lake")
+
+
+def build_panel(calculator, seed: int = 0, countries: int = 8):
+    """Indicator panel with gaps, year-to-year noise and out-of-bound values"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for c in range(countries):
+        for indicator, (low, high) in calculator.NORMALIZATION_BOUNDS.items():
+            if indicator == "total_population":
+                base = 10 ** rng.uniform(5, 9)
+            else:
+                base = rng.uniform(low, high * 1.2)
+            for year in range(2015, 2024):
+                value = base * (1 + 0.05 * rng.standard_normal())
+                rows.append(
+                    {
+                        "country_code": f"C{c:02d}",
+                        "country_name": f"Country {c}",
+                        "indicator_name": indicator,
+                        "year": year,
+                        "value": value if rng.random() > 0.3 else np.nan,
+                        "confidence_score": rng.uniform(0.5, 1.0),
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def test_base_scores_match_calculator(calculator):
+    """Framework weights and bounds give the calculator's total scores"""
+    data = build_panel(calculator)
+    expected = {
+        result.country_code: result.total_score
+        for result in calculator.calculate_all_countries(data)
+    }
+
+    engine = ScenarioEngine.from_data(data, calculator)
+    base = dict(
+        zip(
+            engine.model.country_codes,
+            engine.base_pillar_scores @ engine.base_weights,
+        )
+    )
+
+    assert set(base) == set(expected)
+    for code, score in base.items():
+        assert score == pytest.approx(expected[code], abs=0.01), code
+
+
+def test_framework_scenario_summary_matches_calculator(calculator):
+    """Base scores and ranks in a run equal the calculator's scores and ranks"""
+    data = build_panel(calculator, seed=3)
+    results = calculator.calculate_all_countries(data)
+
+    result = ScenarioEngine.from_data(data, calculator).run(
+        config=ScenarioConfig(n_weight_samples=50)
+    )
+
+    by_code = {country.country_code: country for country in result.countries}
+    for expected in results:
+        country = by_code[expected.country_code]
+        assert country.base_score == pytest.approx(expected.total_score, abs=0.01)
+        assert country.base_rank == expected.regional_rank
+    assert result.n_scenarios == 51
+    assert result.base_weights == {
+        pillar: pytest.approx(weight, abs=1e-4)
+        for pillar, weight in calculator.PILLAR_WEIGHTS.items()
+    }
+
+
+def test_named_scenarios_and_validation(calculator):
+    """Named weightings score as rescaled pillar products; bad input is rejected"""
+    engine = ScenarioEngine.from_data(build_panel(calculator), calculator)
+    pillars = engine.model.pillars
+
+    result = engine.run(
+        weights={"equal": {pillar: 1 for pillar in pillars}},
+        config=ScenarioConfig(n_weight_samples=0),
+    )
+    equal = result.named_scenarios[0]
+    expected = engine.base_pillar_scores @ (np.ones(len(pillars)) / len(pillars))
+    assert equal.weights == {pillar: 0.25 for pillar in pillars}
+    assert [equal.scores[code] for code in engine.model.country_codes] == list(
+        expected.round(2)
+    )
+
+    with pytest.raises(ValueError):
+        engine.run(weights={"bad": {"not_a_pillar": 1}})
+    with pytest.raises(ValueError):
+        engine.run(config=ScenarioConfig(n_weight_samples=ScenarioEngine.MAX_SCENARIOS))
+
+
+def test_bound_variants_are_capped(calculator):
+    """Bound variants are limited on their own, before any tensor is built"""
+    engine = ScenarioEngine.from_data(build_panel(calculator), calculator)
+
+    with pytest.raises(ValueError, match="bound variants"):
+        engine.run(
+            config=ScenarioConfig(
+                n_weight_samples=0,
+                n_bound_variants=ScenarioEngine.MAX_BOUND_VARIANTS,
+            )
+        )
+
+    result = engine.run(
+        config=ScenarioConfig(
+            n_weight_samples=0,
+            n_bound_variants=ScenarioEngine.MAX_BOUND_VARIANTS - 1,
+        )
+    )
+    assert result.n_scenarios == ScenarioEngine.MAX_BOUND_VARIANTS
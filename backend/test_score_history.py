@@ -0,0 +1,260 @@
+"""
+Score History Tests
+Tests that score writes are appended to the history and how history is queried
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import api.countries as countries_api
+from services.database_service import DatabaseService
+
+COUNTRIES = [
+    {"id": "c-ken", "name": "Kenya", "iso_code_alpha3": "KEN"},
+    {"id": "c-nga", "name": "Nigeria", "iso_code_alpha3": "NGA"},
+]
+
+
+class FakeResult:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeQuery:
+    """Just enough of the Supabase query builder for score writes and reads"""
+
+    def __init__(self, client, name):
+        self.client, self.name = client, name
+        self.op, self.payload, self.filters = "select", None, []
+
+    def select(self, columns="*"):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append((column, value))
+        return self
+
+    def insert(self, rows):
+        self.op, self.payload = "insert", rows
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self.op, self.payload = "insert", rows
+        return self
+
+    def update(self, record):
+        self.op, self.payload = "update", record
+        return self
+
+    def execute(self):
+        table = self.client.tables.setdefault(self.name, [])
+        if self.op == "insert":
+            rows = self.payload if isinstance(self.payload, list) else [self.payload]
+            table.extend(dict(row) for row in rows)
+            return FakeResult(rows)
+        matched = [r for r in table if all(r.get(k) == v for k, v in self.filters)]
+        if self.op == "update":
+            for row in matched:
+                row.update(self.payload)
+        return FakeResult(matched)
+
+
+class FakeRPC:
+    def __init__(self, client, name, params):
+        self.client, self.name, self.params = client, name, params
+
+    def execute(self):
+        ids = self.params["p_country_ids"]
+        history = sorted(
+            (
+                row
+                for row in self.client.tables.get("ahaii_score_history", [])
+                if ids is None or row["country_id"] in ids
+            ),
+            key=lambda row: row["computed_at"],
+        )
+        latest = {}
+        if self.name == "ahaii_scores_as_of":
+            for row in history:
+                if row["computed_at"] <= self.params["p_as_of"]:
+                    latest[row["country_id"]] = row
+        else:
+            for row in history:
+                if self.params["p_start"] <= row["computed_at"] <= self.params["p_end"]:
+                    bucket = row["computed_at"][:7] + "-01"
+                    latest[(row["country_id"], bucket)] = {
+                        "country_id": row["country_id"],
+                        "bucket_start": bucket,
+                        "total_score": row["total_score"],
+                    }
+        return FakeResult(list(latest.values()))
+
+
+class FakeClient:
+    def __init__(self):
+        self.tables = {"countries": [dict(country) for country in COUNTRIES]}
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params):
+        return FakeRPC(self, name, params)
+
+
+@pytest.fixture
+def service():
+    service = DatabaseService()
+    service.client = FakeClient()
+    return service
+
+
+def history(service):
+    return service.client.tables.get("ahaii_score_history", [])
+
+
+def record_history(service, computed_at, scores):
+    records = [
+        {"country_id": country_id, "total_score": total, "readiness_tier": 2}
+        for country_id, total in scores.items()
+    ]
+    asyncio.run(
+        service.append_score_history(
+            records, computed_at=datetime.fromisoformat(computed_at)
+        )
+    )
+
+
+def test_update_ahaii_scores_appends_history(service):
+    """Inserting and then updating a country's scores adds a history row each time"""
+    scores = {"assessment_year": 2025, "assessment_quarter": 1, "total_score": 40.0}
+    asyncio.run(service.update_ahaii_scores("c-ken", scores))
+    asyncio.run(service.update_ahaii_scores("c-ken", {**scores, "total_score": 44.0}))
+
+    assert len(service.client.tables["ahaii_scores"]) == 1
+    assert [row["total_score"] for row in history(service)] == [40.0, 44.0]
+    assert all(row["country_id"] == "c-ken" for row in history(service))
+
+
+def test_bulk_upsert_appends_one_point_in_time(service):
+    """A bulk upsert appends every written country under a single computed_at"""
+    stored = asyncio.run(
+        service.bulk_upsert_ahaii_scores(
+            [
+                {"country_id": "c-ken", "assessment_year": 2025, "total_score": 50.0},
+                {"country_id": "c-nga", "assessment_year": 2025, "total_score": 45.0},
+            ]
+        )
+    )
+
+    assert stored == 2
+    assert [row["country_id"] for row in history(service)] == ["c-ken", "c-nga"]
+    assert len({row["computed_at"] for row in history(service)}) == 1
+
+
+def test_deltas_for_country_without_earlier_row(service):
+    """A country first scored after the baseline gets a None baseline and change"""
+    record_history(service, "2025-01-10T12:00:00", {"c-ken": 40.0})
+    record_history(service, "2025-03-10T12:00:00", {"c-ken": 46.5, "c-nga": 38.0})
+
+    deltas = {
+        row["country_id"]: row
+        for row in asyncio.run(
+            service.get_score_deltas(
+                datetime(2025, 2, 1), datetime(2025, 4, 1), ["c-ken", "c-nga"]
+            )
+        )
+    }
+
+    assert deltas["c-ken"]["total_score_change"] == 6.5
+    assert deltas["c-ken"]["from_computed_at"] == "2025-01-10T12:00:00"
+    assert deltas["c-nga"]["total_score"] == 38.0
+    assert deltas["c-nga"]["total_score_change"] is None
+    assert deltas["c-nga"]["from_computed_at"] is None
+    assert deltas["c-nga"]["from_readiness_tier"] is None
+
+
+@pytest.fixture
+def api_client(service, monkeypatch):
+    monkeypatch.setattr(countries_api, "supabase", service.client)
+    monkeypatch.setattr(countries_api, "db_service", service)
+    app = FastAPI()
+    app.include_router(countries_api.router)
+
+    record_history(service, "2025-01-05T12:00:00", {"c-ken": 40.0})
+    record_history(service, "2025-01-20T12:00:00", {"c-ken": 42.0})
+    record_history(service, "2025-02-10T12:00:00", {"c-ken": 45.0, "c-nga": 47.0})
+    return TestClient(app)
+
+
+def test_as_of_endpoint(api_client):
+    """Scores as of a date use the latest row on or before that day; unknown
+    countries are rejected"""
+    response = api_client.get(
+        "/api/countries/score-history/as-of", params={"as_of": "2025-01-31"}
+    )
+
+    assert response.status_code == 200
+    [score] = response.json()["scores"]
+    assert (score["iso_code_alpha3"], score["total_score"]) == ("KEN", 42.0)
+
+    response = api_client.get(
+        "/api/countries/score-history/as-of",
+        params={"as_of": "2025-02-10", "countries": "XXX"},
+    )
+    assert response.status_code == 404
+
+
+def test_deltas_endpoint(api_client):
+    """Deltas are labelled and countries without a baseline sort last"""
+    response = api_client.get(
+        "/api/countries/score-history/deltas",
+        params={"start": "2025-01-10", "end": "2025-02-28"},
+    )
+
+    assert response.status_code == 200
+    deltas = response.json()["deltas"]
+    assert [(d["iso_code_alpha3"], d["total_score_change"]) for d in deltas] == [
+        ("KEN", 5.0),
+        ("NGA", None),
+    ]
+
+    response = api_client.get(
+        "/api/countries/score-history/deltas",
+        params={"start": "2025-03-01", "end": "2025-01-01"},
+    )
+    assert response.status_code == 400
+
+
+def test_series_endpoint(api_client):
+    """The series groups downsampled points per country"""
+    response = api_client.get(
+        "/api/countries/score-history/series",
+        params={
+            "interval": "month",
+            "start": "2025-01-01",
+            "end": "2025-03-01",
+            "countries": "ken",
+        },
+    )
+
+    assert response.status_code == 200
+    [series] = response.json()["series"]
+    assert series["iso_code_alpha3"] == "KEN"
+    assert [(p["bucket_start"], p["total_score"]) for p in series["points"]] == [
+        ("2025-01-01", 42.0),
+        ("2025-02-01", 45.0),
+    ]
+
+    response = api_client.get(
+        "/api/countries/score-history/series", params={"interval": "day"}
+    )
+    assert response.status_code == 422
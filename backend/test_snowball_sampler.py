@@ -0,0 +1,157 @@
+"""
+Snowball Sampler Tests
+Tests fetch outcomes, retry bookkeeping and 429 host back-off of the sampler
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from etl.snowball_sampler import (
+    CrawlFrontier,
+    CrawlStateStore,
+    HealthAISnowballSampler,
+    SamplingConfig,
+)
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None):
+        self.status, self.headers = status, headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self, responses):
+        self.responses = responses
+
+    def get(self, url, timeout=None):
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def make_sampler(tmp_path, responses=None, allowed=True):
+    sampler = HealthAISnowballSampler(
+        SamplingConfig(state_db_path=str(tmp_path / "crawl_state.db"))
+    )
+    sampler.session = FakeSession(responses or {})
+
+    async def check_robots(url):
+        return allowed
+
+    sampler._check_robots_txt = check_robots
+    return sampler
+
+
+def fetch(sampler, url):
+    return asyncio.run(sampler._fetch_citation_content_respectfully(url))
+
+
+@pytest.mark.parametrize(
+    "response, outcome",
+    [
+        (FakeResponse(403), "http_4xx"),
+        (FakeResponse(404), "http_4xx"),
+        (FakeResponse(503), "http_5xx"),
+        (asyncio.TimeoutError(), "error"),
+    ],
+)
+def test_fetch_outcomes(tmp_path, response, outcome):
+    """Each failure mode is reported with its own outcome"""
+    sampler = make_sampler(tmp_path, {"https://a.example/p": response})
+    assert fetch(sampler, "https://a.example/p") == (None, outcome)
+
+
+def test_robots_disallowed_outcome(tmp_path):
+    """A robots.txt disallow is reported without requesting the page"""
+    sampler = make_sampler(tmp_path, allowed=False)
+    assert fetch(sampler, "https://a.example/private") == (None, "robots_disallowed")
+
+
+def test_rate_limit_backs_off_host_without_sleeping(tmp_path):
+    """A 429 reschedules the host through the scheduler instead of sleeping"""
+    sampler = make_sampler(
+        tmp_path,
+        {"https://a.example/p": FakeResponse(429, {"Retry-After": "120"})},
+    )
+
+    started = time.monotonic()
+    assert fetch(sampler, "https://a.example/p") == (None, "rate_limited")
+    assert time.monotonic() - started < 1.0
+
+    assert not sampler.scheduler.is_ready("https://a.example/other")
+    assert sampler.scheduler.is_ready("https://b.example/p")
+    assert sampler.scheduler.seconds_until_next_slot() > 100
+
+
+def test_terminal_and_retryable_outcomes(tmp_path):
+    """Disallowed, 4xx and empty pages count as crawled; transient failures do not"""
+    store = CrawlStateStore(str(tmp_path / "state.db"))
+    store.load_visited_filter(max_age_days=30)
+
+    for outcome in ("robots_disallowed", "http_4xx", "no_content"):
+        store.record_outcome("run", f"https://a.example/{outcome}", 0, outcome)
+        assert store.was_recently_crawled(f"https://a.example/{outcome}", 30)
+
+    for outcome in CrawlStateStore.RETRYABLE_OUTCOMES:
+        store.record_outcome("run", f"https://a.example/{outcome}", 0, outcome)
+        assert not store.was_recently_crawled(f"https://a.example/{outcome}", 30)
+
+    # A later transient failure keeps the earlier crawl time
+    store.record_outcome("run", "https://a.example/page", 0, "discovered")
+    store.record_outcome("run", "https://a.example/page", 0, "http_5xx")
+    assert store.was_recently_crawled("https://a.example/page", 30)
+
+
+def test_rate_limited_citation_is_requeued_once(tmp_path):
+    """A rate-limited URL is retried after the back-off, then recorded"""
+    sampler = make_sampler(tmp_path)
+    sampler.state_store.start_run(sampler.session_id)
+    frontier = CrawlFrontier(state_store=sampler.state_store, run_id=sampler.session_id)
+    frontier.push({"url": "https://a.example/p", "citation_id": "c1"}, 0)
+    attempts = []
+
+    async def process(citation_item, depth):
+        attempts.append(citation_item["url"])
+        sampler.scheduler.back_off(citation_item["url"], 0.1)
+        return {
+            "success": False,
+            "discoveries_count": 0,
+            "references_extracted": 0,
+            "reference_citations": [],
+            "outcome": "rate_limited",
+        }
+
+    async def crawl_delay(url):
+        return 0.0
+
+    sampler._process_single_citation = process
+    sampler._get_crawl_delay = crawl_delay
+    stats = {
+        "citations_processed": 0,
+        "failed_extractions": 0,
+        "depth_reached": 0,
+        "discoveries_by_depth": {},
+    }
+
+    asyncio.run(sampler._process_frontier(frontier, stats))
+
+    assert attempts == ["https://a.example/p", "https://a.example/p"]
+    assert stats["citations_processed"] == 1
+    assert sampler.state_store.load_frontier(sampler.session_id) == []
+    assert not sampler.state_store.was_recently_crawled("https://a.example/p", 30)
@@ -8,6 +8,7 @@ import logging
 from typing import Any, Dict, List, Union
 from datetime import datetime, date
 from decimal import Decimal
+from enum import Enum
 import pandas as pd
 import numpy as np
 
@@ -167,6 +168,10 @@ def make_json_serializable(obj: Any) -> Any:
     elif isinstance(obj, list):
         return [make_json_serializable(item) for item in obj]
     
+    # Handle Enums (before __dict__, which would recurse into the enum class)
+    elif isinstance(obj, Enum):
+        return make_json_serializable(obj.value)
+    
     # Handle dataclasses
     elif hasattr(obj, '__dataclass_fields__'):
         return make_json_serializable(obj.__dict__)
@@ -83,6 +83,26 @@ CREATE TABLE ahaii_scores (
   UNIQUE(country_id, assessment_year, assessment_quarter)
 );
 
+-- AHAII Score History (append-only; one row per country per recalculation)
+CREATE TABLE ahaii_score_history (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  country_id UUID NOT NULL REFERENCES countries(id),
+  computed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  assessment_year INTEGER,
+  assessment_quarter INTEGER,
+
+  total_score DECIMAL(5,2) NOT NULL, -- 0-100 scale
+  human_capital_score DECIMAL(5,2),
+  physical_infrastructure_score DECIMAL(5,2),
+  regulatory_infrastructure_score DECIMAL(5,2),
+  economic_market_score DECIMAL(5,2),
+  readiness_tier INTEGER CHECK (readiness_tier IN (1,2,3)),
+
+  overall_confidence_score DECIMAL(3,2), -- 0-1 scale
+  data_completeness_percentage DECIMAL(5,2),
+  assessment_methodology_version TEXT
+);
+
 -- Infrastructure Indicators (Raw data feeding into scores)
 CREATE TABLE infrastructure_indicators (
   id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -400,6 +420,10 @@ CREATE INDEX idx_ahaii_scores_country_year ON ahaii_scores(country_id, assessmen
 CREATE INDEX idx_ahaii_scores_total_score ON ahaii_scores(total_score DESC);
 CREATE INDEX idx_ahaii_scores_tier ON ahaii_scores(readiness_tier);
 
+-- AHAII score history indexes (point-in-time lookups per country)
+CREATE INDEX idx_ahaii_score_history_country_time ON ahaii_score_history(country_id, computed_at DESC);
+CREATE INDEX idx_ahaii_score_history_time ON ahaii_score_history(computed_at);
+
 -- Infrastructure indicators indexes
 CREATE INDEX idx_infrastructure_indicators_country_pillar ON infrastructure_indicators(country_id, pillar);
 CREATE INDEX idx_infrastructure_indicators_indicator_name ON infrastructure_indicators(indicator_name);
@@ -414,6 +438,135 @@ CREATE INDEX idx_infrastructure_intelligence_country ON infrastructure_intellige
 CREATE INDEX idx_infrastructure_intelligence_report_type ON infrastructure_intelligence(report_type);
 CREATE INDEX idx_infrastructure_intelligence_date ON infrastructure_intelligence(publication_date);
 
+-- Publications (shared table) are upserted on their stable source ID.
+-- Rows stored before stable IDs carry the raw arXiv ID or PMID; they are
+-- rewritten to the generate_paper_id format (doi:, pubmed:, arxiv:) and the
+-- duplicates this exposes are merged into the most relevant row before the
+-- unique index is built.
+DO $$
+BEGIN
+  IF to_regclass('public.publications') IS NOT NULL THEN
+    UPDATE publications
+    SET source_id = 'doi:' || LOWER(BTRIM(REGEXP_REPLACE(BTRIM(doi), '^(https?://(dx\.)?doi\.org/|doi:\s*)', '', 'i')))
+    WHERE source = 'pubmed'
+      AND source_id !~ '^(doi|pubmed|arxiv|sha256):'
+      AND LOWER(COALESCE(BTRIM(doi), '')) NOT IN ('', 'nan', 'none', 'null');
+
+    UPDATE publications
+    SET source_id = 'pubmed:' || REGEXP_REPLACE(source_id, '\D', '', 'g')
+    WHERE source = 'pubmed'
+      AND source_id !~ '^(doi|pubmed|arxiv|sha256):'
+      AND source_id ~ '\d';
+
+    UPDATE publications
+    SET source_id = 'arxiv:' || REGEXP_REPLACE(
+      REGEXP_REPLACE(
+        LOWER(BTRIM(REGEXP_REPLACE(BTRIM(source_id), '^(arxiv:\s*|https?://arxiv\.org/(abs|pdf)/)', '', 'i'))),
+        '\.pdf$', ''
+      ),
+      'v\d+$', ''
+    )
+    WHERE source = 'arxiv'
+      AND source_id !~ '^(doi|pubmed|arxiv|sha256):'
+      AND BTRIM(source_id) <> '';
+
+    CREATE TEMP TABLE publication_duplicates ON COMMIT DROP AS
+    SELECT id, keep_id
+    FROM (
+      SELECT
+        id,
+        FIRST_VALUE(id) OVER w AS keep_id,
+        ROW_NUMBER() OVER w AS position
+      FROM publications
+      WHERE source_id IS NOT NULL
+      WINDOW w AS (
+        PARTITION BY source_id
+        ORDER BY COALESCE(african_relevance_score, 0) + COALESCE(ai_relevance_score, 0) DESC,
+          updated_at DESC NULLS LAST,
+          id
+      )
+    ) ranked
+    WHERE position > 1;
+
+    IF to_regclass('public.innovation_publications') IS NOT NULL THEN
+      UPDATE innovation_publications ip
+      SET publication_id = d.keep_id
+      FROM publication_duplicates d
+      WHERE ip.publication_id = d.id
+        AND NOT EXISTS (
+          SELECT 1 FROM innovation_publications kept
+          WHERE kept.publication_id = d.keep_id
+            AND kept.innovation_id = ip.innovation_id
+        );
+      DELETE FROM innovation_publications
+      WHERE publication_id IN (SELECT id FROM publication_duplicates);
+    END IF;
+
+    DELETE FROM publications
+    WHERE id IN (SELECT id FROM publication_duplicates);
+
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_publications_source_id ON publications(source_id);
+  END IF;
+END $$;
+
+-- =============================================================================
+-- SCORE HISTORY QUERIES
+-- =============================================================================
+
+-- Latest history row per country at or before p_as_of (one index probe per country)
+CREATE OR REPLACE FUNCTION ahaii_scores_as_of(
+  p_as_of TIMESTAMP WITH TIME ZONE,
+  p_country_ids UUID[] DEFAULT NULL
+)
+RETURNS SETOF ahaii_score_history AS $$
+  SELECT h.*
+  FROM countries c
+  CROSS JOIN LATERAL (
+    SELECT *
+    FROM ahaii_score_history sh
+    WHERE sh.country_id = c.id
+      AND sh.computed_at <= p_as_of
+    ORDER BY sh.computed_at DESC
+    LIMIT 1
+  ) h
+  WHERE p_country_ids IS NULL OR c.id = ANY(p_country_ids);
+$$ LANGUAGE sql STABLE;
+
+-- Last history row per country in each week or month bucket
+CREATE OR REPLACE FUNCTION ahaii_score_history_downsampled(
+  p_bucket TEXT, -- 'week' or 'month'
+  p_start TIMESTAMP WITH TIME ZONE,
+  p_end TIMESTAMP WITH TIME ZONE,
+  p_country_ids UUID[] DEFAULT NULL
+)
+RETURNS TABLE(
+  country_id UUID,
+  bucket_start TIMESTAMP WITH TIME ZONE,
+  computed_at TIMESTAMP WITH TIME ZONE,
+  total_score DECIMAL(5,2),
+  human_capital_score DECIMAL(5,2),
+  physical_infrastructure_score DECIMAL(5,2),
+  regulatory_infrastructure_score DECIMAL(5,2),
+  economic_market_score DECIMAL(5,2),
+  readiness_tier INTEGER
+) AS $$
+  SELECT DISTINCT ON (h.country_id, date_trunc(p_bucket, h.computed_at))
+    h.country_id,
+    date_trunc(p_bucket, h.computed_at) AS bucket_start,
+    h.computed_at,
+    h.total_score,
+    h.human_capital_score,
+    h.physical_infrastructure_score,
+    h.regulatory_infrastructure_score,
+    h.economic_market_score,
+    h.readiness_tier
+  FROM ahaii_score_history h
+  WHERE h.computed_at >= p_start
+    AND h.computed_at <= p_end
+    AND (p_country_ids IS NULL OR h.country_id = ANY(p_country_ids))
+  ORDER BY h.country_id, date_trunc(p_bucket, h.computed_at), h.computed_at DESC;
+$$ LANGUAGE sql STABLE;
+
 -- =============================================================================
 -- INITIAL DATA - AFRICAN COUNTRIES
 -- =============================================================================
@@ -486,6 +639,7 @@ INSERT INTO countries (name, iso_code_alpha3, region, population, gdp_usd, healt
 
 COMMENT ON TABLE countries IS 'African countries with basic demographic and economic indicators';
 COMMENT ON TABLE ahaii_scores IS 'AHAII infrastructure readiness scores and assessments by country and time period';
+COMMENT ON TABLE ahaii_score_history IS 'Append-only history of AHAII scores, one row per country each time scores are recalculated';
 COMMENT ON TABLE infrastructure_indicators IS 'Raw infrastructure indicators feeding into AHAII scoring methodology';
 COMMENT ON TABLE health_ai_organizations IS 'Health AI organizations, companies, universities, and institutions across Africa';
 COMMENT ON TABLE infrastructure_intelligence IS 'Intelligence reports from ETL pipeline monitoring health AI infrastructure developments';